@@ -15,6 +15,9 @@ from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
 
+from influence_line_engine import live_load_envelope
+from reinforcement_optimizer import abutment_members, design_members
+
 # Page configuration
 st.set_page_config(
     page_title="Abutment Designer Lite",
@@ -33,6 +36,7 @@ class ProjectParameters:
     hfl: float = 101.2
     deck_level: float = 102.4
     foundation_level: float = 96.0
+    effective_span: float = 9.6
 
 @dataclass
 class SoilParameters:
@@ -65,8 +69,8 @@ class AbutmentDesigner:
         loads = self._calculate_loads(geometry)
         earth_pressures = self._calculate_earth_pressures(geometry)
         stability = self._check_stability(geometry, loads, earth_pressures)
-        reinforcement = self._design_reinforcement(geometry, earth_pressures)
-        quantities = self._calculate_quantities(geometry)
+        reinforcement = self._design_reinforcement(geometry, earth_pressures, stability)
+        quantities = self._calculate_quantities(geometry, reinforcement)
         
         return {
             'abutment_type': self.abutment_type.value,
@@ -129,7 +133,8 @@ class AbutmentDesigner:
         total_dead_load = stem_weight + base_weight + wing_weight
         
         deck_reaction = 2500.0
-        live_load_reaction = 800.0
+        envelope = live_load_envelope([self.project.effective_span], self.project.bridge_width - 3.0)
+        live_load_reaction = envelope['max_reaction'][0]
         total_vertical = total_dead_load + deck_reaction + live_load_reaction
         
         return {
@@ -197,32 +202,28 @@ class AbutmentDesigner:
             'overall_safe': overturning_safe and sliding_safe and bearing_safe
         }
     
-    def _design_reinforcement(self, geometry, earth_pressures):
-        design_moment = earth_pressures['active_moment'] * 1.5
-        fck = self.material.concrete_grade
-        fy = self.material.steel_grade
-        d_eff = geometry['base_thickness'] * 1000 - 75
-        
-        ast_required = design_moment * 1000000 / (0.87 * fy * 0.9 * d_eff)
-        ast_min = 0.12 * geometry['base_thickness'] * 1000 * 1000 / 100
-        ast_final = max(ast_required, ast_min)
-        
-        bar_area = 314
-        num_bars = math.ceil(ast_final / bar_area)
+    def _design_reinforcement(self, geometry, earth_pressures, stability):
+        design = design_members(abutment_members(
+            geometry, earth_pressures['ka'], self.soil.unit_weight, stability['bearing_pressure'],
+            self.material.concrete_density, self.material.concrete_grade, self.material.steel_grade
+        ))
+        stem = design['members']['Abutment stem']['zones'][0]
         
         return {
-            'design_moment': design_moment,
-            'ast_required': ast_required,
-            'ast_min': ast_min,
-            'ast_provided': num_bars * bar_area,
-            'num_bars': num_bars,
-            'spacing': 1000 / num_bars if num_bars > 0 else 300
+            'design_moment': stem['design_moment'],
+            'ast_required': stem['ast_required'],
+            'ast_min': stem['ast_min'],
+            'ast_provided': stem['ast_provided'],
+            'bar_diameter': stem['bar_diameter'],
+            'num_bars': round(stem['layers'] * 1000 / stem['spacing']),
+            'spacing': stem['spacing'],
+            'bar_schedule': design['bar_schedule'],
+            'total_steel_kg': design['total_steel_kg']
         }
     
-    def _calculate_quantities(self, geometry):
+    def _calculate_quantities(self, geometry, reinforcement):
         total_concrete = geometry['stem_volume'] + geometry['base_volume'] + geometry['wing_volume']
-        steel_percentage = 1.5
-        steel_weight = total_concrete * steel_percentage / 100 * 7.85 * 1000
+        steel_weight = reinforcement['total_steel_kg']
         
         formwork = 2 * geometry['height'] * geometry['base_length'] + \
                   2 * (geometry['base_length'] + geometry['base_width']) * geometry['base_thickness']
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+BATCH DRAWING EXPORT
+All cross sections of a reach (or any list of sections) to one indexed PDF
+
+Field submissions need 50-200 A4 cross-section sheets.  Each section is
+printed on the cached HFL drawing sheet (create_hfl_cross_section_a4) in a
+pool of worker processes; every sheet comes back as a one-page PDF and,
+optionally, a PNG tile written next to the PDF.  The sheets are merged in
+order behind an index (sheet number, section, chainage/location, HFL, page)
+and each gets a bookmark, so a reviewer can jump straight to a section.
+
+Merging needs pypdf; without it the sheets are drawn in series straight
+into one PdfPages file, still behind the index but without bookmarks.
+"""
+
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from drawing_sheet import A4_LANDSCAPE, PDF_METADATA, drawing_sheet, vector_first
+from hfl_cross_section_printer import HFL_SHEET, create_hfl_cross_section_a4
+from river_reach_model import RiverReach
+from river_section_input_schema import RiverCrossSectionPoint, RiverSectionInputSchema
+
+try:
+    from pypdf import PdfWriter
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+INDEX_ROWS_PER_PAGE = 30
+
+Progress = Callable[[int, int, str], None]  # (sheets done, total sheets, section label)
+
+
+def reach_sections(reach: RiverReach, template: RiverSectionInputSchema,
+                   discharge: Optional[float] = None) -> List[RiverSectionInputSchema]:
+    """
+    One section schema per reach cross section, copying project data and
+    water levels from template.  With a discharge, each sheet's HFL is the
+    standard-step water surface at that section (downstream normal depth).
+    """
+    hfl = None
+    if discharge is not None:
+        hfl = reach.water_surface_profile(discharge)['water_surface']
+    sections = []
+    for i in range(len(reach)):
+        offsets, elevations = reach.section(i)
+        water_levels = template.water_levels
+        if hfl is not None:
+            water_levels = replace(water_levels, hfl=float(hfl[i]), design_discharge=float(discharge))
+        sections.append(replace(
+            template,
+            location=f'{reach.names[i]} (Ch {reach.chainages[i]:g} m)',
+            cross_section_points=[RiverCrossSectionPoint(float(x), float(z))
+                                  for x, z in zip(offsets, elevations)],
+            water_levels=water_levels,
+            reach=None,
+        ))
+    return sections
+
+
+def sheet_label(river_data: RiverSectionInputSchema) -> str:
+    return river_data.location or river_data.project_name or 'Cross section'
+
+
+def _render_sheet(number: int, total: int, river_data: RiverSectionInputSchema,
+                  project_info: Optional[Dict[str, Any]], png_path: Optional[str]) -> bytes:
+    """One A4 sheet as one-page PDF bytes (and its PNG tile, if asked for)"""
+    figure = _draw_sheet(number, total, river_data, project_info)
+    if figure is None:
+        raise ValueError(f"Section {number} ({sheet_label(river_data)}) has no survey points")
+    sheet = drawing_sheet(HFL_SHEET, dpi=300)
+    if png_path:
+        sheet.save_png(png_path)
+    return sheet.save_pdf(io.BytesIO()).getvalue()
+
+
+def _draw_sheet(number: int, total: int, river_data: RiverSectionInputSchema,
+                project_info: Optional[Dict[str, Any]]) -> Optional[Figure]:
+    figure = create_hfl_cross_section_a4(river_data, project_info)
+    if figure is not None:
+        drawing_sheet(HFL_SHEET, dpi=300).set_fields(
+            drawing_number=f"Drawing No: CS-{datetime.now().strftime('%Y%m%d')}-{number:03d} "
+                           f"(Sheet {number} of {total})")
+    return figure
+
+
+def _index_pages(sections: Sequence[RiverSectionInputSchema], title: str) -> List[Figure]:
+    """Contents of the drawing set, INDEX_ROWS_PER_PAGE sheets per A4 page"""
+    pages = max(1, int(np.ceil(len(sections) / INDEX_ROWS_PER_PAGE)))
+    figures = []
+    for page in range(pages):
+        figure = Figure(figsize=A4_LANDSCAPE)
+        FigureCanvasAgg(figure)
+        ax = figure.add_axes([0.06, 0.05, 0.88, 0.88])
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        ax.axis('off')
+        ax.text(0.5, 0.98, f'{title} - INDEX OF CROSS-SECTION SHEETS'
+                           + (f' ({page + 1}/{pages})' if pages > 1 else ''),
+                fontsize=14, fontweight='bold', ha='center', va='top')
+        columns = ((0.0, 'Sheet'), (0.08, 'Section'), (0.62, 'HFL (m)'), (0.74, 'Points'), (0.86, 'PDF page'))
+        y = 0.9
+        for x, heading in columns:
+            ax.text(x, y, heading, fontsize=10, fontweight='bold')
+        ax.plot([0, 1], [y - 0.01, y - 0.01], color='black', linewidth=1)
+        first = page * INDEX_ROWS_PER_PAGE
+        for i, river_data in enumerate(sections[first:first + INDEX_ROWS_PER_PAGE], start=first):
+            y -= 0.028
+            row = (f'{i + 1}', sheet_label(river_data)[:70], f'{river_data.water_levels.hfl:.2f}',
+                   f'{len(river_data.cross_section_points)}', f'{pages + i + 1}')
+            for (x, _), value in zip(columns, row):
+                ax.text(x, y, value, fontsize=9)
+        figures.append(figure)
+    return figures
+
+
+def _print_progress(done: int, total: int, label: str):
+    print(f"🗺️ Sheet {done}/{total}: {label}")
+
+
+def export_cross_sections(sections: Union[Sequence[RiverSectionInputSchema], RiverReach], filename: str,
+                          png_dir: Optional[str] = None, jobs: Optional[int] = None,
+                          project_info: Optional[Dict[str, Any]] = None,
+                          template: Optional[RiverSectionInputSchema] = None,
+                          progress: Optional[Progress] = _print_progress) -> Dict[str, Any]:
+    """
+    Print every section to an A4 sheet and merge them behind an index into
+    one PDF; png_dir also writes one PNG tile per sheet.  A RiverReach is
+    expanded with reach_sections (project data and water levels from
+    template).  Sheets render in jobs worker processes (all cores by
+    default; jobs=1 renders in this process) and progress(done, total,
+    label) is called as each sheet completes.
+    """
+    start = time.perf_counter()
+    if isinstance(sections, RiverReach):
+        sections = reach_sections(sections, template or RiverSectionInputSchema())
+    sections = list(sections)
+    if not sections:
+        raise ValueError("No cross sections to export")
+    total = len(sections)
+    if png_dir:
+        os.makedirs(png_dir, exist_ok=True)
+    png_paths = [os.path.join(png_dir, f'sheet_{number:03d}.png') if png_dir else None
+                 for number in range(1, total + 1)]
+    title = (project_info or {}).get('project_name') or sections[0].project_name or 'RIVER CROSS SECTIONS'
+    index = _index_pages(sections, title.upper())
+
+    if not PYPDF_AVAILABLE:
+        print("⚠️ pypdf not installed - drawing sheets in series without bookmarks")
+        with PdfPages(filename, metadata=PDF_METADATA) as pdf:
+            for figure in index:
+                pdf.savefig(figure)
+            for number, (river_data, png_path) in enumerate(zip(sections, png_paths), start=1):
+                figure = _draw_sheet(number, total, river_data, project_info)
+                if figure is None:
+                    raise ValueError(f"Section {number} ({sheet_label(river_data)}) has no survey points")
+                if png_path:
+                    drawing_sheet(HFL_SHEET, dpi=300).save_png(png_path)
+                vector_first(figure, dpi=300)
+                pdf.savefig(figure, dpi=300, facecolor='white', edgecolor='none')
+                if progress:
+                    progress(number, total, sheet_label(river_data))
+    else:
+        pages: List[Optional[bytes]] = [None] * total
+        if (jobs or os.cpu_count() or 1) > 1 and total > 1:
+            with ProcessPoolExecutor(max_workers=min(jobs or os.cpu_count(), total),
+                                     initializer=_init_export_worker) as pool:
+                futures = {pool.submit(_render_sheet, number, total, river_data, project_info, png_path): number
+                           for number, (river_data, png_path) in enumerate(zip(sections, png_paths), start=1)}
+                for done, future in enumerate(as_completed(futures), start=1):
+                    number = futures[future]
+                    pages[number - 1] = future.result()
+                    if progress:
+                        progress(done, total, sheet_label(sections[number - 1]))
+        else:
+            for number, (river_data, png_path) in enumerate(zip(sections, png_paths), start=1):
+                pages[number - 1] = _render_sheet(number, total, river_data, project_info, png_path)
+                if progress:
+                    progress(number, total, sheet_label(river_data))
+
+        writer = PdfWriter()
+        index_pdf = io.BytesIO()
+        with PdfPages(index_pdf, metadata=PDF_METADATA) as pdf:
+            for figure in index:
+                pdf.savefig(figure)
+        writer.append(index_pdf)
+        writer.add_outline_item('Index', 0)
+        for number, (river_data, page) in enumerate(zip(sections, pages), start=1):
+            writer.append(io.BytesIO(page))
+            writer.add_outline_item(f'{number:03d} {sheet_label(river_data)}', len(index) + number - 1)
+        with open(filename, 'wb') as output:
+            writer.write(output)
+
+    return {
+        'pdf': filename,
+        'sheets': total,
+        'index_pages': len(index),
+        'png_tiles': [path for path in png_paths if path],
+        'elapsed_s': time.perf_counter() - start,
+    }
+
+
+def _init_export_worker():
+    """Non-interactive backend in export workers"""
+    import matplotlib
+    matplotlib.use('Agg')
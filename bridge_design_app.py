@@ -15,11 +15,21 @@ import math
 import pandas as pd
 import numpy as np
 from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Union
 from enum import Enum
 import json
 from datetime import datetime
 
+from footing_pressure_solver import solve_base_pressure, base_pressure_summary
+from load_combination_engine import LoadCombinationEngine, action_vector
+from influence_line_engine import live_load_envelope
+from deck_slab_analysis import DeckSlabGeometry, analyse_deck
+from reinforcement_optimizer import ReinforcedMember, abutment_members, design_members, schedule_tonnes
+from cross_section_geometry import section_geometry, subchannel_properties
+from compound_channel import compound_channel
+from reliability_analysis import (AbutmentModel, PierFootingModel, ReliabilityModel, ScourModel,
+                                  default_random_variables, run_monte_carlo)
+
 # ============================================================================
 # DATA STRUCTURES BASED ON EXTRACTED EXCEL VARIABLES
 # ============================================================================
@@ -77,12 +87,13 @@ class HydraulicData:
     """Hydraulic design variables extracted from Excel sheets"""
     discharge: float  # Cumecs - Q (902.15 / 1265.76 from examples)
     manning_n: float = 0.033  # Manning's roughness coefficient
-    bed_slope: str = "1 in 975"  # Channel bed slope
+    bed_slope: Union[str, float] = "1 in 975"  # Channel bed slope ("1 in N", "1:N" or S)
     design_velocity: float = 3.5  # m/sec - V from Excel
     hfl: float = 101.2  # m - High Flood Level
     silt_factor: float = 1.5  # Lacey's silt factor
     regime_width: Optional[float] = None  # m - Calculated
     effective_waterway: Optional[float] = None  # m - Calculated
+    roughness_panels: Optional[List[Tuple[float, float, float]]] = None  # (from, to, n) by left distance
 
 @dataclass
 class SoilData:
@@ -180,45 +191,43 @@ class AbutmentDesignBase:
         pa = 0.5 * ka * gamma * h * h  # per meter length
         return pa * self.project.pier_cap_width
 
-    def design_foundation(self) -> Dict[str, any]:
+    def design_foundation(self, min_contact_ratio: float = 1.0) -> Dict[str, any]:
+        """
+        Scan footing extensions and keep the first that satisfies SBC.
+        min_contact_ratio < 1.0 accepts partial loss of contact where the
+        code permits it (e.g. wind/seismic combinations).
+        """
         if self.geometry is None:
             self.calculate_geometric_defaults()
         # Use footing optimization style check with simplified loads
         vertical = self.calculate_dead_load()
         moment = self.calculate_active_earth_pressure() * (self.geometry.height / 3)
-        # trial base dimensions
-        length = self.geometry.base_length
-        width = self.geometry.base_width
-        # scan simple extensions
-        best = None
-        for ext in np.arange(0, 3.01, 0.25):
-            L = length + 2 * ext
-            B = width + 2 * ext
-            e = moment / max(1e-6, vertical)
-            kern_L = L / 6
-            if e <= kern_L:
-                sigma_max = vertical / (L * B) * (1 + 6 * e / L)
-                area_tension = 0
-            else:
-                sigma_max = 2 * vertical / (L * B)
-                area_tension = 0.1 * L * B
-            if sigma_max < self.soil.safe_bearing_capacity and area_tension == 0:
-                best = {
-                    'footing_length': L,
-                    'footing_width': B,
-                    'extension': ext,
-                    'max_pressure': sigma_max,
-                    'area_in_tension': area_tension,
-                    'utilization_ratio': sigma_max / self.soil.safe_bearing_capacity,
-                    'status': 'ACCEPTABLE'
-                }
-                break
-        if best is None:
-            best = {
+        # trial base dimensions, all extensions solved in one pass
+        extensions = np.arange(0, 3.01, 0.25)
+        L = self.geometry.base_length + 2 * extensions
+        B = self.geometry.base_width + 2 * extensions
+        pressures = solve_base_pressure(L, B, vertical, moment, 0.0)
+        acceptable = (pressures['stable'] &
+                      (pressures['max_pressure'] < self.soil.safe_bearing_capacity) &
+                      (pressures['contact_ratio'] >= min_contact_ratio - 1e-9))
+        if not acceptable.any():
+            return {
                 'status': 'EXCEEDED_LIMITS',
                 'message': 'No acceptable abutment footing within 3m extension',
             }
-        return best
+        i = int(np.argmax(acceptable))
+        sigma_max = float(pressures['max_pressure'][i])
+        return {
+            'footing_length': float(L[i]),
+            'footing_width': float(B[i]),
+            'extension': float(extensions[i]),
+            'max_pressure': sigma_max,
+            'min_pressure': float(pressures['min_pressure'][i]),
+            'area_in_tension': float(pressures['area_in_tension'][i]),
+            'contact_ratio': float(pressures['contact_ratio'][i]),
+            'utilization_ratio': sigma_max / self.soil.safe_bearing_capacity,
+            'status': 'ACCEPTABLE'
+        }
 
 
 class AbutmentDesignType1(AbutmentDesignBase):
@@ -296,31 +305,72 @@ class HydraulicCalculator:
         return velocity
     
     @staticmethod
-    def calculate_cross_sectional_area(survey_points: List[SurveyPoint], hfl: float) -> Tuple[float, float]:
+    def calculate_cross_sectional_area(survey_points: List[SurveyPoint], hfl: float,
+                                       tolerance: float = 0.001) -> Tuple[float, float]:
         """
         Calculate cross-sectional area and wetted perimeter from survey points
         Based on Excel CROSS SECTION sheet structure
-        """
-        area = 0.0
-        perimeter = 0.0
-        
-        for i in range(len(survey_points) - 1):
-            p1 = survey_points[i]
-            p2 = survey_points[i + 1]
-            
-            # Calculate flow depth at each point
-            depth1 = max(0, hfl - p1.bed_level) if p1.bed_level else 0
-            depth2 = max(0, hfl - p2.bed_level) if p2.bed_level else 0
-            
-            # Trapezoidal rule for area
-            width = abs(p2.left_distance - p1.left_distance)
-            area += 0.5 * (depth1 + depth2) * width
-            
-            # Add to wetted perimeter
-            if depth1 > 0 and depth2 > 0:
-                perimeter += math.sqrt(width**2 + (depth2 - depth1)**2)
         
-        return area, perimeter
+        Exact at the waterline: segments crossing HFL are clipped at the
+        crossing, so partially wet bank segments count in both area and
+        perimeter.  Dense surveys are first simplified (Douglas-Peucker) to a
+        vertical tolerance in m, 1 mm by default, below survey precision.
+        """
+        properties = HydraulicCalculator.calculate_wetted_properties(survey_points, hfl, tolerance=tolerance)
+        return properties['total_area'], properties['total_wetted_perimeter']
+    
+    @staticmethod
+    def calculate_wetted_properties(survey_points: List[SurveyPoint], hfl: float,
+                                    manning_n: float = 0.033, tolerance: float = 0.001) -> Dict[str, any]:
+        """
+        Area, wetted perimeter, top width, centroid and conveyance of each
+        wetted sub-channel (main channel and floodplains) at HFL, with
+        section totals (see cross_section_geometry.subchannel_properties)
+        """
+        surveyed = [p for p in survey_points if p.bed_level]  # points without a bed level are skipped
+        if len(surveyed) < 2:
+            return subchannel_properties([0.0, 1.0], [hfl, hfl], hfl, manning_n)
+        geometry = section_geometry([p.left_distance for p in surveyed], [p.bed_level for p in surveyed])
+        offsets, levels = geometry.simplified(tolerance) if tolerance > 0 else (geometry.offsets, geometry.elevations)
+        return subchannel_properties(offsets, levels, hfl, manning_n)
+    
+    @staticmethod
+    def calculate_conveyance(survey_points: List[SurveyPoint], hydraulic: 'HydraulicData',
+                             tolerance: float = 0.001) -> Optional[Dict[str, float]]:
+        """
+        Compound-channel conveyance at HFL: vertical division into the
+        roughness panels of hydraulic.roughness_panels (the rest at
+        hydraulic.manning_n), α, mean velocity, Manning capacity at the bed
+        slope and the HFL that carries the design discharge
+        (see compound_channel.CompoundChannel)
+        """
+        surveyed = [p for p in survey_points if p.bed_level]
+        if len(surveyed) < 2:
+            return None
+        geometry = section_geometry([p.left_distance for p in surveyed], [p.bed_level for p in surveyed])
+        offsets, levels = geometry.simplified(tolerance) if tolerance > 0 else (geometry.offsets, geometry.elevations)
+        channel = compound_channel(offsets, levels, hydraulic.roughness_panels or (), hydraulic.manning_n)
+        slope = HydraulicCalculator.parse_bed_slope(hydraulic.bed_slope)
+        return channel.hydraulics_at(hydraulic.hfl, hydraulic.discharge, slope)
+    
+    @staticmethod
+    def parse_bed_slope(bed_slope: Union[str, float]) -> float:
+        """
+        Bed slope S as a fraction from "1 in N", "1:N" or a number
+        ("1 in 975", "1:975" and 0.001026 are the same slope)
+        """
+        text = str(bed_slope).strip().lower()
+        try:
+            if ' in ' in text or ':' in text:
+                rise, run = (float(part) for part in text.replace(' in ', ':').split(':'))
+                slope = rise / run
+            else:
+                slope = float(text)
+        except (ValueError, ZeroDivisionError):
+            raise ValueError(f"Bed slope {bed_slope!r} is not of the form '1 in N', '1:N' or a number") from None
+        if not slope > 0 or not math.isfinite(slope):
+            raise ValueError(f"Bed slope {bed_slope!r} must be a positive finite slope")
+        return slope
     
     @staticmethod
     def calculate_effective_waterway(total_width: float, pier_width: float, num_piers: int) -> float:
@@ -333,17 +383,19 @@ class HydraulicCalculator:
         return total_width - obstructed_width
     
     @staticmethod
-    def calculate_afflux(discharge: float, natural_width: float, effective_waterway: float) -> float:
+    def calculate_afflux(discharge: float, natural_width: float, effective_waterway: float,
+                         alpha: float = 1.0) -> float:
         """
         Afflux (backwater) calculation based on Excel formulas
         Simplified Molesworth formula
+        (velocity head scaled by the compound channel α when given)
         """
         constriction_ratio = effective_waterway / natural_width
         if constriction_ratio >= 1.0:
             return 0.0
         
         # Simplified afflux calculation
-        velocity_head = (discharge / effective_waterway) ** 2 / (2 * 9.81)
+        velocity_head = alpha * (discharge / effective_waterway) ** 2 / (2 * 9.81)
         afflux = velocity_head * (1 / constriction_ratio**2 - 1)
         return max(0.0, afflux)
 
@@ -383,6 +435,8 @@ class PierDesign:
         self.deck_level = None  # m - DL from Excel
         self.pier_cap_thickness = 0.975  # m - from Excel convention
         self.pier_cap_width_effective = None  # m - computed
+        self.bed_level = 94.99  # m - BL from Excel
+        self.embedment = 1.5  # m - E from Excel (deepened for scour if required)
         
     def calculate_levels(self) -> Dict[str, float]:
         """
@@ -391,8 +445,8 @@ class PierDesign:
         From STABILITY CHECK FOR PIER sheet Rows 24-31
         """
         # Using values from Excel as baseline
-        bed_level = 94.99  # m - BL from Excel
-        embedment = 1.5  # m - E from Excel
+        bed_level = self.bed_level
+        embedment = self.embedment
         deck_level = self.hydraulic.hfl + 1.2  # m - HFL + freeboard
         
         foundation_level = bed_level - embedment
@@ -446,19 +500,97 @@ class PierDesign:
         
         return loads
     
-    def calculate_live_loads(self, live_load_reaction: float = 1950) -> Dict[str, float]:
+    def calculate_live_loads(self, live_load_reaction: Optional[float] = None) -> Dict[str, float]:
         """
-        Live load calculations (user input in Phase 1)
-        From Excel Row 80: Maximum reaction = 1950 kN-m
+        Live load calculations.
+        With no user reaction, the maximum pier reaction comes from the
+        influence-line engine: IRC Class A / 70R / AA trains moved over the
+        adjoining simply-supported spans, lanes per IRC:6 Table 6.
+        From Excel Row 80: Maximum reaction = 1950 kN-m (Phase 1 user input)
         """
-        loads = {
-            'vertical_reaction': live_load_reaction,  # kN
-            'moment': live_load_reaction,  # kN-m
-            'impact_factor': 1.25,  # Standard IRC impact factor
-        }
+        if live_load_reaction is None:
+            spans = [self.project.effective_span] * max(2, self.project.num_spans)
+            envelope = live_load_envelope(spans, self.project.bridge_width - 3.0)
+            pier_index = int(np.argmax(envelope['max_reaction_with_impact'][1:-1])) + 1
+            reaction = envelope['max_reaction'][pier_index]
+            impact = envelope['max_reaction_with_impact'][pier_index] / reaction
+            # Unbalanced moment: one span loaded, reaction at the bearing line
+            # offset from the pier centre
+            single_span = live_load_envelope([self.project.effective_span],
+                                             self.project.bridge_width - 3.0)
+            bearing_offset = max(0.0, (self.project.pier_spacing_cc - self.project.effective_span) / 2)
+            moment = single_span['max_reaction_with_impact'][0] * bearing_offset
+            loads = {
+                'vertical_reaction': reaction,  # kN
+                'moment': moment,  # kN-m
+                'impact_factor': impact,
+                'governing_vehicle': envelope['reaction_governed_by'][pier_index],
+                'lanes': envelope['lanes'],
+            }
+        else:
+            loads = {
+                'vertical_reaction': live_load_reaction,  # kN
+                'moment': live_load_reaction,  # kN-m
+                'impact_factor': 1.25,  # Standard IRC impact factor
+            }
         
         loads['total_live_load'] = loads['vertical_reaction'] * loads['impact_factor']
         return loads
+    
+    def calculate_load_vectors(self, live_load_reaction: Optional[float] = None,
+                               wind_intensity: float = 1.39, wind_exposed_depth: float = 0.9,
+                               stream_shape_factor: float = 0.66, bearing_friction: float = 0.05,
+                               seismic_zone_factor: float = 0.16, importance_factor: float = 1.2,
+                               response_reduction: float = 3.0, spectral_acceleration: float = 2.5
+                               ) -> Dict[str, np.ndarray]:
+        """
+        Action vectors at foundation level for each IRC:6 load case, in the
+        LoadCombinationEngine component order. L is the pier length (parallel
+        to flow), B the pier width (along the bridge axis).
+        - Water current (cl 210): p = 0.52 K V², V² = 2 v̄², triangular over depth
+        - Wind (cl 209.3): Pz·G·CD on the deck elevation at deck level
+        - Braking (cl 211): 20% of live reaction, 1.2 m above deck
+        - Temperature: bearing friction on superstructure dead load at cap level
+        - Seismic (cl 219): Ah = (Z/2)(Sa/g)/(R/I) on dead + 20% live
+        """
+        if self.pier_height is None:
+            self.calculate_levels()
+        dead = self.calculate_dead_loads()
+        live = self.calculate_live_loads(live_load_reaction)
+        levels = self.calculate_levels()
+        
+        deck_arm = levels['deck_level'] - levels['foundation_level']
+        cap_arm = levels['pier_cap_level'] - levels['foundation_level']
+        superstructure = dead['slab'] + dead['wearing_coat'] + dead['footpath']
+        substructure = dead['pier_cap'] + dead['pier_stem']
+        
+        # Water current on the pier stem
+        flow_depth = max(0.0, self.hydraulic.hfl - levels['bed_level'])
+        surface_pressure = 0.52 * stream_shape_factor * 2 * self.hydraulic.design_velocity ** 2
+        current_force = 0.5 * surface_pressure * self.pier_width * flow_depth
+        current_arm = (levels['bed_level'] - levels['foundation_level']) + 2 * flow_depth / 3
+        
+        # Wind on the deck elevation
+        wind_force = wind_intensity * self.project.effective_span * wind_exposed_depth
+        
+        # Seismic horizontal coefficient
+        ah = (seismic_zone_factor / 2) * spectral_acceleration / (response_reduction / importance_factor)
+        seismic_super = ah * (superstructure + 0.2 * live['total_live_load'])
+        seismic_sub = ah * substructure
+        seismic_moment = seismic_super * cap_arm + seismic_sub * cap_arm / 2
+        
+        return {
+            'dead': action_vector(vertical=dead['total_dead_load']),
+            'live': action_vector(vertical=live['total_live_load'],
+                                  moment_long=live['moment'], moment_trans=live['moment'] * 0.5),
+            'water_current': action_vector(horizontal_long=current_force, lever_arm=current_arm),
+            'wind': action_vector(horizontal_long=wind_force, lever_arm=deck_arm - wind_exposed_depth / 2),
+            'braking': action_vector(horizontal_trans=0.2 * live['vertical_reaction'], lever_arm=deck_arm + 1.2),
+            'temperature': action_vector(horizontal_trans=bearing_friction * superstructure, lever_arm=cap_arm),
+            # 100% along flow + 30% along the bridge axis
+            'seismic': np.array([0.0, seismic_super + seismic_sub, 0.3 * (seismic_super + seismic_sub),
+                                 seismic_moment, 0.3 * seismic_moment]),
+        }
 
 # ============================================================================
 # ABUTMENT DESIGN MODULE
@@ -730,8 +862,11 @@ class DetailedPierGeometry:
 class BridgeEstimator:
     """Complete bridge estimation with quantity takeoff and costing"""
     
-    def __init__(self, material_data: MaterialData):
+    def __init__(self, material_data: MaterialData, reinforcement: Optional[Dict] = None):
         self.material = material_data
+        # Optimised bar schedules (reinforcement_optimizer.design_members);
+        # steel percentages are only used for members without a schedule
+        self.reinforcement = reinforcement
         
         # Standard rates (can be updated based on location/time)
         self.rates = {
@@ -747,7 +882,7 @@ class BridgeEstimator:
             'waterproofing': 85,     # ₹/m²
         }
         
-        # Steel reinforcement percentages (typical)
+        # Steel reinforcement percentages (typical, fallback without bar schedules)
         self.steel_percentages = {
             'pier_cap': 1.2,         # % of concrete volume
             'pier_stem': 1.0,        # % of concrete volume
@@ -810,7 +945,7 @@ class BridgeEstimator:
         
         quantities = {
             'concrete': deck_volume + wearing_coat_volume,
-            'steel': deck_volume * self.steel_percentages['deck_slab'] / 100 * 7.85,  # tonnes
+            'steel': self._calculate_deck_steel(deck_volume),  # tonnes
             'formwork': deck_length * deck_width * 2,  # top and bottom
             'waterproofing': deck_length * deck_width
         }
@@ -864,8 +999,26 @@ class BridgeEstimator:
         
         return estimate_summary
     
+    def _scheduled_steel(self, group: str, per_unit: bool) -> Optional[float]:
+        """Steel in tonnes from the bar schedule, None if the group is not scheduled"""
+        if not self.reinforcement:
+            return None
+        if not any(line['group'] == group for line in self.reinforcement['bar_schedule']):
+            return None
+        return schedule_tonnes(self.reinforcement, group, per_unit=per_unit)
+    
+    def _calculate_deck_steel(self, deck_volume: float) -> float:
+        """Calculate steel reinforcement for the deck slab in tonnes"""
+        scheduled = self._scheduled_steel('deck', per_unit=False)
+        if scheduled is not None:
+            return scheduled
+        return deck_volume * self.steel_percentages['deck_slab'] / 100 * 7.85
+    
     def _calculate_pier_steel(self, pier_geometry: Dict) -> float:
         """Calculate steel reinforcement for pier in tonnes"""
+        scheduled = self._scheduled_steel('pier', per_unit=True)
+        if scheduled is not None:
+            return scheduled
         steel_volume = (
             pier_geometry['pier_cap']['volume'] * self.steel_percentages['pier_cap'] / 100 +
             pier_geometry['pier_stem']['volume'] * self.steel_percentages['pier_stem'] / 100 +
@@ -875,6 +1028,9 @@ class BridgeEstimator:
     
     def _calculate_abutment_steel(self, concrete_volume: float) -> float:
         """Calculate steel reinforcement for abutment in tonnes"""
+        scheduled = self._scheduled_steel('abutment', per_unit=True)
+        if scheduled is not None:
+            return scheduled
         # Average steel percentage for abutment
         avg_steel_percentage = (self.steel_percentages['abutment_stem'] + 
                               self.steel_percentages['abutment_footing']) / 2
@@ -925,65 +1081,72 @@ class FootingOptimizer:
     - Start with pier dimensions + 500mm projection
     - Extend 0-5000mm each side until stress < SBC
     - Target: σ_max < 450 kN/m² (less than 1.0 safety factor)
-    - Ensure no tension (Area in tension = 0)
+    - Ensure no tension (Area in tension = 0), or at least min_contact_ratio
+      of the base in contact where the code allows partial uplift
     """
     
-    def __init__(self, pier_design: PierDesign):
+    def __init__(self, pier_design: PierDesign, min_contact_ratio: float = 1.0,
+                 load_engine: Optional[LoadCombinationEngine] = None):
         self.pier = pier_design
+        self.min_contact_ratio = min_contact_ratio
+        self.load_engine = load_engine or LoadCombinationEngine()
         self.results = {}
     
     def optimize_footing_dimensions(self) -> Dict[str, any]:
         """
         Trial-error footing sizing based on Excel logic:
-        From FOOTING DESIGN sheet and your specifications
+        From FOOTING DESIGN sheet and your specifications.
+        The whole extension grid is checked against every IRC:6 base-pressure
+        combination in one vectorized pass and the smallest acceptable
+        footing plan area is selected.
         """
         # Initial dimensions: pier + 500mm projection each side
         base_length = self.pier.pier_length + 2 * 0.5  # m
         base_width = self.pier.pier_width + 2 * 0.5   # m
         
-        # Calculate loads
-        dead_loads = self.pier.calculate_dead_loads()
-        live_loads = self.pier.calculate_live_loads()
-        
-        total_vertical = dead_loads['total_dead_load'] + live_loads['total_live_load']
-        moment_long = live_loads['moment']  # kN-m (longitudinal)
-        moment_trans = live_loads['moment'] * 0.5  # kN-m (transverse, assumed)
+        # Load vectors for all IRC:6 load cases
+        load_vectors = self.pier.calculate_load_vectors()
         
-        # Trial-error loop: extend dimensions until stress is acceptable
-        max_extension = 5.0  # m (0-5000mm as specified)
+        # Trial grid: extend dimensions 0-5000mm each side (as specified)
+        max_extension = 5.0  # m
         extension_step = 0.25  # m
-        
-        for ext_length in np.arange(0, max_extension + extension_step, extension_step):
-            for ext_width in np.arange(0, max_extension + extension_step, extension_step):
-                
-                # Trial dimensions
-                trial_length = base_length + 2 * ext_length
-                trial_width = base_width + 2 * ext_width
-                
-                # Calculate stresses using Excel formulas
-                stress_results = self._calculate_base_pressure(
-                    trial_length, trial_width, total_vertical, 
-                    moment_long, moment_trans
-                )
-                
-                # Check acceptance criteria from Excel
-                if (stress_results['max_pressure'] < self.pier.soil.safe_bearing_capacity and
-                    stress_results['area_in_tension'] == 0):
-                    
-                    # Acceptable solution found
-                    self.results = {
-                        'footing_length': trial_length,
-                        'footing_width': trial_width,
-                        'extension_length': ext_length,
-                        'extension_width': ext_width,
-                        'total_vertical_load': total_vertical,
-                        'longitudinal_moment': moment_long,
-                        'transverse_moment': moment_trans,
-                        **stress_results,
-                        'utilization_ratio': stress_results['max_pressure'] / self.pier.soil.safe_bearing_capacity,
-                        'status': 'ACCEPTABLE'
-                    }
-                    return self.results
+        extensions = np.arange(0, max_extension + extension_step, extension_step)
+        ext_length, ext_width = np.meshgrid(extensions, extensions, indexing='ij')
+        trial_length = base_length + 2 * ext_length
+        trial_width = base_width + 2 * ext_width
+        
+        # Check acceptance criteria from Excel under the governing combination
+        check = self.load_engine.base_pressure_check(
+            trial_length, trial_width, load_vectors,
+            self.pier.soil.safe_bearing_capacity, self.min_contact_ratio
+        )
+        acceptable = check['acceptable']
+        
+        if acceptable.any():
+            # Smallest plan area wins; ties keep the Excel scan order
+            plan_area = np.where(acceptable, trial_length * trial_width, np.inf).ravel()
+            i, j = np.unravel_index(int(np.argmin(plan_area)), trial_length.shape)
+            total_vertical = float(check['vertical_load'][i, j])
+            moment_long = float(check['moment_long'][i, j])
+            moment_trans = float(check['moment_trans'][i, j])
+            stress_results = self._calculate_base_pressure(
+                trial_length[i, j], trial_width[i, j], total_vertical,
+                moment_long, moment_trans
+            )
+            self.results = {
+                'footing_length': float(trial_length[i, j]),
+                'footing_width': float(trial_width[i, j]),
+                'extension_length': float(ext_length[i, j]),
+                'extension_width': float(ext_width[i, j]),
+                'governing_combination': self.load_engine.names[int(check['governing_index'][i, j])],
+                'total_vertical_load': total_vertical,
+                'longitudinal_moment': moment_long,
+                'transverse_moment': moment_trans,
+                **stress_results,
+                'utilization_ratio': float(check['utilization_ratio'][i, j]),
+                'status': 'ACCEPTABLE'
+            }
+            return self.results
         
         # If no acceptable solution found within limits
         self.results = {
@@ -998,45 +1161,24 @@ class FootingOptimizer:
                                 moment_t: float) -> Dict[str, float]:
         """
         Base pressure calculation using Excel formulas:
-        From FOOTING DESIGN sheet Rows 17-25
+        From FOOTING DESIGN sheet Rows 17-25, with the no-tension
+        redistribution solved exactly outside the kern
         """
+        pressure = base_pressure_summary(length, width, vertical_load, moment_l, moment_t)
+        
         # Eccentricities (Excel formulas)
-        e_l = moment_l / vertical_load  # Row 17: el = Me/P
-        e_t = moment_t / vertical_load  # Row 18: eb = Mb/P
-        
-        # Eccentricity ratios
-        el_lf_ratio = e_l / length   # Row 19
-        et_lf_ratio = e_t / width
-        
-        # Kern distances
-        kern_length = length / 6
-        kern_width = width / 6
-        
-        # Check for tension
-        area_in_tension = 0  # Initialize
-        
-        if e_l <= kern_length and e_t <= kern_width:
-            # No tension case - full base in compression
-            max_pressure = (vertical_load / (length * width) * 
-                          (1 + 6 * e_l / length + 6 * e_t / width))
-            min_pressure = (vertical_load / (length * width) * 
-                          (1 - 6 * e_l / length - 6 * e_t / width))
-            area_in_tension = 0
-        else:
-            # Tension exists - need redistribution
-            # Simplified calculation for now
-            max_pressure = 2 * vertical_load / (length * width)
-            min_pressure = 0
-            area_in_tension = 0.1 * length * width  # Approximate
+        e_l = pressure['eccentricity_longitudinal']  # Row 17: el = Me/P
+        e_t = pressure['eccentricity_transverse']  # Row 18: eb = Mb/P
         
         return {
             'eccentricity_longitudinal': e_l,
             'eccentricity_transverse': e_t,
-            'el_lf_ratio': el_lf_ratio,
-            'et_lf_ratio': et_lf_ratio,
-            'max_pressure': max_pressure,
-            'min_pressure': min_pressure,
-            'area_in_tension': area_in_tension
+            'el_lf_ratio': float(e_l / length),   # Row 19
+            'et_lf_ratio': float(e_t / width),
+            'max_pressure': pressure['max_pressure'],
+            'min_pressure': pressure['min_pressure'],
+            'area_in_tension': pressure['area_in_tension'],
+            'contact_ratio': pressure['contact_ratio']
         }
 
 # ============================================================================
@@ -1059,6 +1201,7 @@ class BridgeDesignApp:
         self.design_results = {}
         self.estimation_results = {}
         self.estimate_items = []  # populated when estimation component is bound
+        self.deck_analysis_method = 'effective_width'  # or 'grillage'
     
     def input_survey_data(self, cross_section_points: List[Dict], 
                          longitudinal_points: List[Dict]) -> None:
@@ -1136,9 +1279,19 @@ class BridgeDesignApp:
         print("🏛️ Step 5: Abutment Design...")
         abutment_results = self._design_abutments()
 
-        # Step 6: Estimation
-        print("📐 Step 6: Estimation...")
-        estimation = self._estimate_quantities(pier_results, foundation_results, abutment_results)
+        # Step 6: Deck Slab Analysis
+        print("🧱 Step 6: Deck Slab Analysis...")
+        deck_results = self._analyse_deck_slab()
+
+        # Step 7: Reinforcement Design
+        print("🔩 Step 7: Reinforcement Design...")
+        reinforcement_results = self._design_reinforcement(pier_results, foundation_results,
+                                                           abutment_results, deck_results)
+
+        # Step 8: Estimation
+        print("📐 Step 8: Estimation...")
+        estimation = self._estimate_quantities(pier_results, foundation_results, abutment_results,
+                                               reinforcement_results)
         
         # Compile complete results
         self.design_results = {
@@ -1153,6 +1306,8 @@ class BridgeDesignApp:
             'pier_design': pier_results,
             'foundation_design': foundation_results,
             'abutment_design': abutment_results,
+            'deck_analysis': deck_results,
+            'reinforcement': reinforcement_results,
             'estimation': estimation,
             'design_status': 'COMPLETED'
         }
@@ -1169,14 +1324,24 @@ class BridgeDesignApp:
         area, perimeter = HydraulicCalculator.calculate_cross_sectional_area(
             self.survey_points, self.hydraulic_data.hfl
         )
+        conveyance = HydraulicCalculator.calculate_conveyance(self.survey_points, self.hydraulic_data)
         
-        return {
+        results = {
             'num_cross_section_points': len(self.survey_points),
             'num_longitudinal_points': len(self.longitudinal_points),
             'cross_sectional_area': area,
             'wetted_perimeter': perimeter,
             'hfl': self.hydraulic_data.hfl
         }
+        if conveyance:
+            results.update({
+                'conveyance': conveyance['conveyance'],
+                'kinetic_energy_coefficient': conveyance['alpha'],
+                'mean_velocity_at_hfl': conveyance['mean_velocity'],
+                'discharge_capacity_at_hfl': conveyance['discharge_capacity'],
+                'hfl_for_design_discharge': conveyance['stage_for_discharge'],
+            })
+        return results
     
     def _perform_hydraulic_analysis(self) -> Dict[str, any]:
         """Complete hydraulic analysis based on Excel formulas"""
@@ -1190,9 +1355,11 @@ class BridgeDesignApp:
             regime_width, 1.2, 2  # Assuming 2 piers of 1.2m width
         )
         
-        # Calculate afflux
+        # Calculate afflux (velocity head with the compound channel α)
+        conveyance = HydraulicCalculator.calculate_conveyance(self.survey_points, self.hydraulic_data)
         afflux = HydraulicCalculator.calculate_afflux(
-            self.hydraulic_data.discharge, regime_width, effective_waterway
+            self.hydraulic_data.discharge, regime_width, effective_waterway,
+            conveyance['alpha'] if conveyance else 1.0
         )
         # Obstructed velocity for skew bridges
         obstructed_velocity = HydraulicCalculator.calculate_obstructed_velocity(
@@ -1218,10 +1385,16 @@ class BridgeDesignApp:
         dead_loads = pier.calculate_dead_loads()
         live_loads = pier.calculate_live_loads()
         
+        # Governing factored actions at the pier base (IRC:6 ULS)
+        load_vectors = pier.calculate_load_vectors()
+        combinations = LoadCombinationEngine().governing_actions(load_vectors, 'uls')
+        
         return {
             'design_levels': levels,
             'dead_loads': dead_loads,
             'live_loads': live_loads,
+            'load_vectors': {case: vector.tolist() for case, vector in load_vectors.items()},
+            'load_combinations': combinations,
             'pier_dimensions': {
                 'width': pier.pier_width,
                 'length': pier.pier_length,
@@ -1254,7 +1427,105 @@ class BridgeDesignApp:
             'type_2_cantilever': type2
         }
 
-    def _estimate_quantities(self, pier_results: Dict[str, any], foundation_results: Dict[str, any], abutment_results: Dict[str, any]) -> Dict[str, any]:
+    def _analyse_deck_slab(self) -> Dict[str, any]:
+        """Design moments and shears per strip of the deck slab"""
+        deck = DeckSlabGeometry(
+            span_lengths=(self.project_data.effective_span,) * self.project_data.num_spans,
+            width=self.project_data.bridge_width,
+            thickness=0.9,  # m (from Excel formulas)
+            skew_angle=self.project_data.skew_angle,
+            fck=self.material_data.fck,
+            concrete_density=self.material_data.concrete_density,
+        )
+        return analyse_deck(deck, self.deck_analysis_method)
+
+    def _design_reinforcement(self, pier_results: Dict[str, any], foundation_results: Dict[str, any],
+                              abutment_results: Dict[str, any], deck_results: Dict[str, any]) -> Dict[str, any]:
+        """Minimum-weight bar arrangements and bar schedule for every member"""
+        fck, fy = self.material_data.fck, self.material_data.fy
+        gamma_c = self.material_data.concrete_density
+        num_piers = max(self.project_data.num_spans - 1, 0)
+        members = []
+
+        # Deck slab: governing strip; hogging SLS taken as ULS / 1.35 (conservative)
+        strips = deck_results['strips']
+        strip = max(strips, key=lambda s: s['design_moment'])
+        hogging = max(0.0, -min(s['design_hogging_moment'] for s in strips))
+        members.append(ReinforcedMember(
+            'Deck slab', 'deck', 0.9, self.project_data.pier_spacing_cc, self.project_data.bridge_width,
+            moment_uls=strip['design_moment'],
+            moment_sls=strip['dead_moment'] + strip.get('sidl_moment', 0.0) + strip['live_moment'],
+            opposite_moment_uls=hogging, opposite_moment_sls=hogging / 1.35,
+            count=self.project_data.num_spans, group='deck', fck=fck, fy=fy))
+
+        if num_piers:
+            # Pier cap: cantilevers beyond the stem carry the superstructure
+            # reactions, spread along the cap as in the dead load sheet
+            dead, live = pier_results['dead_loads'], pier_results['live_loads']
+            stem = pier_results['pier_dimensions']
+            cap_length = self.project_data.pier_cap_width
+            cap_width = 1.5  # m, as in the dead load of the pier cap
+            cap_thickness = pier_results['pier_cap']['thickness']
+            overhang = max(0.0, (cap_length - stem['length']) / 2)
+            w_dead = ((dead['slab'] + dead['wearing_coat'] + dead['footpath']) / cap_length +
+                      cap_width * cap_thickness * gamma_c)
+            w_live = live['total_live_load'] / cap_length
+            cap_dead = w_dead * overhang ** 2 / 2 / cap_width
+            cap_live = w_live * overhang ** 2 / 2 / cap_width
+            members.append(ReinforcedMember(
+                'Pier cap', 'pier_cap', cap_thickness, cap_length, cap_width,
+                moment_uls=1.35 * cap_dead + 1.5 * cap_live, moment_sls=cap_dead + cap_live,
+                count=num_piers, group='pier', fck=fck, fy=fy))
+
+            # Pier stem: weak-axis bending per metre of stem length
+            uls = pier_results['load_combinations']['envelope']
+            load_vectors = {case: np.array(vector) for case, vector in pier_results['load_vectors'].items()}
+            sls = LoadCombinationEngine().governing_actions(load_vectors, 'sls')['envelope']
+            members.append(ReinforcedMember(
+                'Pier stem', 'pier_stem', stem['width'], stem['height'], stem['length'],
+                moment_uls=abs(uls['moment_trans']['value']) / stem['length'],
+                moment_sls=abs(sls['moment_trans']['value']) / stem['length'],
+                count=num_piers, group='pier', fck=fck, fy=fy))
+
+            # Pier footing: cantilever projections under the net base pressure
+            if foundation_results.get('status') == 'ACCEPTABLE':
+                fL = foundation_results['footing_length']
+                fB = foundation_results['footing_width']
+                footing_thickness = 1.0
+                q_net = max(foundation_results['max_pressure'] - gamma_c * footing_thickness, 0.0)
+                uls_factor = max(1.0, abs(uls['vertical']['value']) / foundation_results['total_vertical_load'])
+                m_long = q_net * max(0.0, (fL - stem['length']) / 2) ** 2 / 2
+                m_trans = q_net * max(0.0, (fB - stem['width']) / 2) ** 2 / 2
+                members.append(ReinforcedMember(
+                    'Pier footing', 'footing', footing_thickness, fL, fB,
+                    moment_uls=uls_factor * m_long, moment_sls=m_long,
+                    transverse_moment_uls=uls_factor * m_trans, transverse_moment_sls=m_trans,
+                    count=num_piers, group='pier', fck=fck, fy=fy))
+
+        # Abutments (Type-1 default, as in the estimate); heel and toe are
+        # measured from the stem centre line in AbutmentGeometry
+        ab = abutment_results['type_1_battered']
+        g = ab['geometry']
+        phi = math.radians(self.soil_data.angle_of_friction)
+        ka = (1 - math.sin(phi)) / (1 + math.sin(phi))
+        members.extend(abutment_members(
+            {
+                'height': g['height'],
+                'base_thickness': 1.0,  # m, AbutmentDesign.footing_thickness
+                'stem_thickness': g['stem_thickness_base'],
+                'heel_length': max(0.0, g['heel_length'] - g['stem_thickness_base'] / 2),
+                'toe_length': max(0.0, g['toe_length'] - g['stem_thickness_base'] / 2),
+                'base_width': g['base_length'],
+                'base_length': self.project_data.pier_cap_width,
+            },
+            ka, self.soil_data.unit_weight,
+            ab['foundation'].get('max_pressure', self.soil_data.safe_bearing_capacity),
+            gamma_c, fck, fy, count=2))
+
+        return design_members(members)
+
+    def _estimate_quantities(self, pier_results: Dict[str, any], foundation_results: Dict[str, any], abutment_results: Dict[str, any],
+                             reinforcement_results: Optional[Dict[str, any]] = None) -> Dict[str, any]:
         """Simple quantity takeoff for concrete and steel based on geometry."""
         concrete_density = self.material_data.concrete_density
         # Pier concrete
@@ -1275,15 +1546,60 @@ class BridgeDesignApp:
         ab_base_vol = ab1['geometry']['base_length'] * ab1['geometry']['base_width'] * self.project_data.pier_cap_width
         ab_volume = ab_stem_vol + ab_base_vol
         total_concrete_volume = pier_volume + pier_cap_volume + footing_volume + ab_volume
-        # Rough steel quantity assumption (1% of concrete by volume at 7850 kg/m3 -> 78.5 kg/m3 => 0.0785 t/m3)
-        steel_rate_t_per_m3 = 0.0785
-        steel_tonnes = total_concrete_volume * steel_rate_t_per_m3
+        if reinforcement_results:
+            # Steel from the optimised bar schedule (all members of the bridge)
+            steel_tonnes = reinforcement_results['total_steel_tonnes']
+            notes = 'Preliminary concrete estimate; steel from optimised bar schedule.'
+        else:
+            # Rough steel quantity assumption (1% of concrete by volume at 7850 kg/m3 -> 78.5 kg/m3 => 0.0785 t/m3)
+            steel_rate_t_per_m3 = 0.0785
+            steel_tonnes = total_concrete_volume * steel_rate_t_per_m3
+            notes = 'Preliminary estimate; refine with detailed reinforcement tables.'
         return {
             'concrete_volume_m3': round(total_concrete_volume, 2),
             'steel_quantity_tonnes': round(steel_tonnes, 2),
-            'notes': 'Preliminary estimate; refine with detailed reinforcement tables.'
+            'notes': notes
         }
     
+    def run_reliability_analysis(self, n_samples: int = 1_000_000, workers: Optional[int] = None,
+                                 seed: int = 0, variables: Optional[Dict] = None) -> Dict[str, any]:
+        """
+        Monte Carlo probability of failure of the designed pier footing,
+        abutments and scour depth. Run after design_bridge_one_click();
+        variables overrides the default input distributions by name.
+        """
+        if not self.design_results:
+            raise ValueError("Run design_bridge_one_click() before the reliability analysis")
+        random_variables = default_random_variables(
+            self.hydraulic_data.discharge, self.hydraulic_data.silt_factor,
+            self.soil_data.safe_bearing_capacity, self.soil_data.angle_of_friction,
+            self.soil_data.unit_weight, self.material_data.concrete_density)
+        random_variables.update(variables or {})
+
+        pier = PierDesign(self.project_data, self.hydraulic_data, self.soil_data, self.material_data)
+        levels = pier.calculate_levels()
+        foundation = self.design_results['foundation_design']
+        pier_model = None
+        if foundation.get('status') == 'ACCEPTABLE':
+            pier_model = PierFootingModel.from_load_vectors(
+                pier.calculate_load_vectors(), foundation['footing_length'], foundation['footing_width'])
+
+        abutments = [AbutmentModel.from_design(name, design, self.project_data.pier_cap_width)
+                     for name, design in self.design_results['abutment_design'].items()]
+        scour = ScourModel(hfl=self.hydraulic_data.hfl, foundation_level=levels['foundation_level'],
+                           effective_waterway=self.design_results['hydraulic_analysis']['effective_waterway'])
+
+        model = ReliabilityModel(
+            variables=random_variables, pier=pier_model, abutments=abutments, scour=scour,
+            design_discharge=self.hydraulic_data.discharge,
+            design_concrete_density=self.material_data.concrete_density,
+            design_friction_angle=self.soil_data.angle_of_friction,
+            friction_coefficient=self.soil_data.friction_coefficient,
+        )
+        results = run_monte_carlo(model, n_samples, workers=workers, seed=seed)
+        self.design_results['reliability'] = results
+        return results
+
     def generate_design_report(self) -> str:
         """Generate summary design report"""
         if not self.design_results:
@@ -1341,6 +1657,12 @@ ESTIMATION (Preliminary):
 • Items: {len(self.estimate_items)} (see estimation export)
 """
 
+        # Sensitivity ranking (sensitivity_analysis.SensitivityAnalysis)
+        for method, results in self.design_results.get('sensitivity', {}).items():
+            report += f"\nSENSITIVITY ({method.title()}, most influential inputs):\n"
+            for output, names in results['ranking'].items():
+                report += f"• {output.replace('_', ' ').title()}: {', '.join(names[:3])}\n"
+
         report += f"""
 DESIGN STATUS: {self.design_results['design_status']} ✅
 
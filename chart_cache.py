@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+CHART CACHE
+Plotly/matplotlib figures built once per distinct input data and options
+
+Streamlit re-runs the whole script on every widget change or tab switch, and
+the apps rebuild every figure they show from scratch each time.  A chart
+builder is a function (or bound method) returning a figure; cached_chart()
+calls it only when the builder code, its arguments, its options or the data
+it reads (depends_on) hash differently from a figure already in the cache.
+
+The cache is one module-level ChartCache shared by all apps and sessions of
+the Streamlit process, bounded to max_entries figures with the least
+recently used dropped first.  Cached figures are shared objects: show them
+(st.plotly_chart) but do not modify them; build a variant through its own
+options instead.
+"""
+
+import dataclasses
+import hashlib
+import threading
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from report_engine import source_fingerprint
+
+# Figures kept per process (a Plotly figure of a few thousand points is ~100 kB)
+MAX_CHARTS = 64
+
+
+def _feed(digest: 'hashlib._Hash', value: Any, seen: set):
+    """Add value to digest by content (arrays by their bytes, objects by their fields)"""
+    tag = type(value).__qualname__
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        digest.update(f'{tag}:{value!r};'.encode('utf-8'))
+        return
+    if isinstance(value, np.generic):
+        _feed(digest, value.item(), seen)
+        return
+    if id(value) in seen:
+        digest.update(b'<cycle>;')
+        return
+    seen.add(id(value))
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        digest.update(f'ndarray:{value.dtype.str}:{value.shape};'.encode('utf-8'))
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, np.ndarray):
+        _feed(digest, value.tolist(), seen)
+    elif isinstance(value, (pd.DataFrame, pd.Series)):
+        labels = value.columns if isinstance(value, pd.DataFrame) else [value.name]
+        digest.update(f'{tag}:{list(map(str, labels))};'.encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, dict):
+        digest.update(f'{tag}:{len(value)}{{'.encode('utf-8'))
+        for key in sorted(value, key=repr):
+            _feed(digest, key, seen)
+            _feed(digest, value[key], seen)
+        digest.update(b'};')
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+        digest.update(f'{tag}:{len(value)}['.encode('utf-8'))
+        for item in items:
+            _feed(digest, item, seen)
+        digest.update(b'];')
+    elif dataclasses.is_dataclass(value):
+        digest.update(f'{tag}('.encode('utf-8'))
+        for spec in dataclasses.fields(value):
+            _feed(digest, spec.name, seen)
+            _feed(digest, getattr(value, spec.name), seen)
+        digest.update(b');')
+    elif hasattr(value, '__dict__') and not callable(value):
+        digest.update(f'{tag}('.encode('utf-8'))
+        _feed(digest, vars(value), seen)
+        digest.update(b');')
+    else:
+        digest.update(f'{tag}:{value!r};'.encode('utf-8'))
+
+
+def data_hash(*values: Any) -> str:
+    """Content hash of chart input data: equal data gives equal hashes across reruns"""
+    digest = hashlib.sha256()
+    for value in values:
+        _feed(digest, value, set())
+    return digest.hexdigest()
+
+
+class ChartCache:
+    """Built figures keyed by builder, input data and options, least recently used dropped first"""
+
+    def __init__(self, max_entries: int = MAX_CHARTS):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: str, build: Callable[[], Any]) -> Any:
+        with self._lock:
+            figure = self._entries.get(key)
+            if figure is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return figure
+            self.misses += 1
+        figure = build()  # outside the lock: other sessions keep drawing cached charts
+        with self._lock:
+            self._entries[key] = figure
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+CHARTS = ChartCache()
+
+
+def chart_key(build: Callable[..., Any], args: tuple, options: dict, depends_on: Any = ()) -> str:
+    """Cache key of a chart: builder code, arguments, options and the data it reads"""
+    return data_hash(source_fingerprint(build), args, options, depends_on)
+
+
+def cached_chart(build: Callable[..., Any], *args: Any, depends_on: Any = (),
+                 cache: Optional[ChartCache] = None, **options: Any) -> Any:
+    """
+    build(*args, **options), reused while the builder, args, options and
+    depends_on (data a bound method reads from its object, e.g. system.data)
+    hash the same.  Builders must be named functions or methods: the key
+    identifies them by qualified name and module.
+    """
+    cache = CHARTS if cache is None else cache
+    return cache.get_or_build(chart_key(build, args, options, depends_on),
+                              lambda: build(*args, **options))
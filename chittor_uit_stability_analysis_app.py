@@ -23,7 +23,9 @@ import pandas as pd
 import numpy as np
 import json
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+from formula_engine import FormulaGraph
 
 # Page configuration
 st.set_page_config(
@@ -37,7 +39,26 @@ class StabilityAnalysisApp:
     
     def __init__(self):
         self.variables = self.setup_variables()
+        # Formula wiring: evaluates the registry formulas in dependency order
+        self.formulas = FormulaGraph(self.variables)
+        self.formulas.recalculate()
         self.sheets = self.setup_sheets()
+    
+    def update_variable(self, name: str, value: float) -> List[str]:
+        """Set a variable and recompute its dependents; returns the recomputed names"""
+        return self.formulas.set_value(name, value)
+    
+    def evaluate_scenarios(self, **inputs) -> pd.DataFrame:
+        """
+        Evaluate the whole sheet over arrays of inputs (one row per scenario)
+        with the compiled NumPy kernel; the registry is not changed.
+        """
+        results = self.formulas.evaluate_batch(**inputs)
+        size = max((np.size(v) for v in results.values()), default=0)
+        columns = {name: np.broadcast_to(np.asarray(value, dtype=float), (size,))
+                   for name, value in inputs.items()}
+        columns.update({name: np.ravel(value) for name, value in results.items()})
+        return pd.DataFrame(columns)
         
     def setup_variables(self):
         """Central variable definitions with formula wiring"""
@@ -46,6 +67,8 @@ class StabilityAnalysisApp:
             'L_eff': {'value': 12.0, 'unit': 'm', 'formula': '=INPUT!C4', 'ref': 'Geometry.C4'},
             'W_bridge': {'value': 12.5, 'unit': 'm', 'formula': '=W_carr+2*W_foot', 'ref': 'Geometry.C9'},
             'W_pier': {'value': 1.5, 'unit': 'm', 'formula': '=INPUT!C13', 'ref': 'Geometry.C13'},
+            'N_spans': {'value': 16, 'unit': '-', 'formula': '=INPUT!C5', 'ref': 'Geometry.C5'},
+            'W_eff': {'value': 169.5, 'unit': 'm', 'formula': '=N_spans*L_eff-(N_spans-1)*W_pier', 'ref': 'Geometry.C14'},
             
             # Hydraulic Variables
             'Q': {'value': 1265.76, 'unit': 'Cumecs', 'formula': '=Hydraulics.C4', 'ref': 'Hydraulics.C4'},
@@ -64,8 +87,9 @@ class StabilityAnalysisApp:
             'P_max': {'value': 441.0, 'unit': 'kN/m²', 'formula': '=P/A+6M/(BL²)', 'ref': 'Foundation.C18'},
             
             # Scour Variables
-            'ds_norm': {'value': 2.8, 'unit': 'm', 'formula': '=1.34*(Q²/f)^(1/3)', 'ref': 'Scour.C4'},
-            'ds_design': {'value': 4.2, 'unit': 'm', 'formula': '=1.5*ds_norm', 'ref': 'Scour.C5'},
+            'f': {'value': 1.5, 'unit': '-', 'formula': '=Scour.C3', 'ref': 'Scour.C3'},
+            'ds_norm': {'value': 4.47, 'unit': 'm', 'formula': '=1.34*((Q/W_eff)²/f)^(1/3)', 'ref': 'Scour.C4'},
+            'ds_design': {'value': 6.71, 'unit': 'm', 'formula': '=1.5*ds_norm', 'ref': 'Scour.C5'},
             
             # Steel Variables
             'Ast_pier': {'value': 2850, 'unit': 'kg', 'formula': '=M/(0.87*fy*d*j)', 'ref': 'Steel.C9'},
@@ -102,7 +126,7 @@ class StabilityAnalysisApp:
             },
             'Scour_Analysis': {
                 'desc': 'Scour calculation from CHITTOR/UIT',
-                'formulas': ['ds = 1.34*(Q²/f)^(1/3)', 'd50 = V²/(5.75*g)'],
+                'formulas': ['q = Q/W_eff', 'ds = 1.34*(q²/f)^(1/3)', 'd50 = V²/(5.75*g)'],
                 'outputs': ['Scour depth', 'Stone size', 'Protection design']
             }
         }
@@ -152,7 +176,7 @@ def display_variables_sheet(app):
             'Unit': info['unit'],
             'Formula': info['formula'],
             'Sheet_Reference': info['ref'],
-            'Status': '✓ Active'
+            'Status': formula_status_label(app, name)
         })
     
     df = pd.DataFrame(var_data)
@@ -166,16 +190,47 @@ def display_variables_sheet(app):
         }
     )
     
+    # Apply the user's edits (compared with the table as shown, so cells that
+    # are recomputed by an earlier edit are not mistaken for overrides)
+    edits = [(row['Variable'], float(row['Value']))
+             for (_, row), original in zip(edited_df.iterrows(), df['Value'])
+             if row['Value'] != original]
+    if edits:
+        recomputed = []
+        for name, value in edits:
+            recomputed += app.update_variable(name, value)
+        st.success(f"Recalculated: {', '.join(dict.fromkeys(recomputed)) or 'no dependent cells'}")
+        st.dataframe(pd.DataFrame([
+            {'Variable': name, 'Value': app.variables[name]['value'], 'Unit': app.variables[name]['unit']}
+            for name in dict.fromkeys(recomputed)
+        ]), use_container_width=True)
+    
+    # What-if batches over the compiled sheet
+    with st.expander("🎲 What-if Scenarios (compiled sheet)"):
+        col_q, col_f, col_n = st.columns(3)
+        with col_q:
+            q_range = st.slider("Discharge Q (Cumecs)", 100.0, 5000.0,
+                                (0.8 * app.variables['Q']['value'], 1.2 * app.variables['Q']['value']))
+        with col_f:
+            f_range = st.slider("Silt factor f", 0.5, 3.0, (1.0, 2.0))
+        with col_n:
+            n_scenarios = st.number_input("Scenarios", value=10000, min_value=10, max_value=1000000, step=1000)
+        rng = np.random.default_rng(0)
+        scenarios = app.evaluate_scenarios(
+            Q=rng.uniform(*q_range, int(n_scenarios)),
+            f=rng.uniform(*f_range, int(n_scenarios))
+        )
+        st.dataframe(scenarios.describe(percentiles=[0.05, 0.5, 0.95]).T, use_container_width=True)
+    
     # Formula wiring visualization
     st.subheader("🔗 Formula Wiring Map")
     col1, col2 = st.columns(2)
     
     with col1:
         st.write("**Key Dependencies:**")
-        st.write("• L_eff → Impact Factor calculation")
-        st.write("• Q, A_cross → Velocity calculation")  
-        st.write("• DL, LL → Foundation loads")
-        st.write("• Foundation loads → Steel design")
+        for precedent, dependent in app.formulas.edges():
+            st.write(f"• {precedent} → {dependent}")
+        st.caption("Evaluation order: " + " → ".join(app.formulas.computed_nodes()))
     
     with col2:
         st.write("**Cross-Sheet References:**")
@@ -184,6 +239,22 @@ def display_variables_sheet(app):
         st.write("• Stability → Foundation")
         st.write("• Foundation → Steel Design")
 
+def formula_status_label(app, name: str) -> str:
+    """Status column text for one registry variable"""
+    status = app.formulas.status(name)
+    if status == 'formula':
+        return '✓ Active'
+    if status == 'override':
+        return '✎ Overridden'
+    if status == 'external':
+        return '↗ Sheet reference'
+    if status == 'unresolved':
+        return '⚠ Needs ' + ', '.join(app.formulas.unresolved_names(name))
+    if status == 'error':
+        message = app.formulas.errors.get(name) or app.formulas.parsed[name].error
+        return f'✗ {message}'
+    return 'Input'
+
 def display_hydraulics_sheet(app):
     """Display hydraulics analysis sheet"""
     
@@ -380,6 +451,9 @@ def display_scour_sheet(app):
         st.subheader("Scour Parameters")
         Q = st.number_input("Discharge (Cumecs)", value=app.variables['Q']['value'], key="scour_Q")
         f = st.number_input("Silt Factor", value=1.5)
+        L_eff = st.number_input("Effective Span (m)", value=app.variables['L_eff']['value'], key="scour_L_eff")
+        n_spans = st.number_input("Number of Spans", min_value=1, value=int(app.variables['N_spans']['value']),
+                                  key="scour_N_spans")
         V = st.number_input("Velocity (m/s)", value=app.variables['V']['value'], key="scour_V")
         pier_width = st.number_input("Pier Width (m)", value=1.5)
     
@@ -387,12 +461,14 @@ def display_scour_sheet(app):
         st.subheader("Scour Calculations")
         
         # Scour formulas from CHITTOR/UIT Excel
-        ds_normal = 1.34 * ((Q**2 / f)**(1/3))
+        W_eff = n_spans * L_eff - (n_spans - 1) * pier_width  # Effective linear waterway (m)
+        q = Q / W_eff  # Discharge intensity (cumecs/m)
+        ds_normal = 1.34 * ((q**2 / f)**(1/3))
         ds_design = 1.5 * ds_normal
         d50 = V**2 / (5.75 * 9.81)  # Stone size
         
         st.metric("Normal Scour Depth", f"{ds_normal:.2f} m", 
-                 help="Lacey Formula: ds = 1.34*(Q²/f)^(1/3)")
+                 help="Lacey Formula: ds = 1.34*(q²/f)^(1/3), q = Q/W_eff")
         st.metric("Design Scour Depth", f"{ds_design:.2f} m", 
                  help="Design = 1.5 × Normal")
         st.metric("Stone Size (d50)", f"{d50:.3f} m", 
@@ -22,7 +22,6 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import json
-import math
 import os
 import tempfile
 from datetime import datetime, date
@@ -30,6 +29,8 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from slab_bridge_engine import SlabBridgeInputs, run_complete_analysis
+
 # Configure page
 st.set_page_config(
     page_title="Complete Slab Bridge Design System",
@@ -281,211 +282,25 @@ class ProjectTemplates:
         })
 
 class BridgeCalculationEngine:
-    """Comprehensive calculation engine for bridge design"""
+    """Streamlit adapter of the slab bridge engine: inputs from and results to the session"""
+    
+    @staticmethod
+    def session_inputs() -> SlabBridgeInputs:
+        """Design inputs of the current session as an immutable record"""
+        return SlabBridgeInputs.from_mapping(st.session_state)
     
     @staticmethod
     def run_complete_analysis() -> Dict:
         """Run complete bridge design analysis"""
-        try:
-            results = {
-                'timestamp': datetime.now().isoformat(),
-                'project_info': BridgeCalculationEngine._get_project_info(),
-                'hydraulic_analysis': BridgeCalculationEngine._run_hydraulic_analysis(),
-                'structural_analysis': BridgeCalculationEngine._run_structural_analysis(),
-                'abutment_analysis': BridgeCalculationEngine._run_abutment_analysis(),
-                'foundation_analysis': BridgeCalculationEngine._run_foundation_analysis(),
-                'cost_analysis': BridgeCalculationEngine._run_cost_analysis(),
-                'design_status': 'COMPLETED'
-            }
-            
+        results = run_complete_analysis(BridgeCalculationEngine.session_inputs())
+        if results['design_status'] == 'COMPLETED':
             # Update session state flags
             st.session_state.hydraulic_analysis_complete = True
             st.session_state.structural_analysis_complete = True
             st.session_state.abutment_analysis_complete = True
             st.session_state.cost_analysis_complete = True
             st.session_state.calculation_results = results
-            
-            return results
-            
-        except Exception as e:
-            return {
-                'timestamp': datetime.now().isoformat(),
-                'error': str(e),
-                'design_status': 'FAILED'
-            }
-    
-    @staticmethod
-    def _get_project_info() -> Dict:
-        """Get project information from session"""
-        return {
-            'bridge_name': st.session_state.get('project_name', ''),
-            'location': st.session_state.get('location', ''),
-            'design_engineer': st.session_state.get('engineer_name', ''),
-            'design_date': str(st.session_state.get('design_date', date.today())),
-            'bridge_type': st.session_state.get('bridge_type', 'RCC Slab Bridge'),
-            'effective_span': st.session_state.get('effective_span', 9.6),
-            'bridge_width': st.session_state.get('bridge_width', 12.0),
-            'number_of_spans': st.session_state.get('num_spans', 3),
-            'selected_template': st.session_state.get('selected_template', 'None')
-        }
-    
-    @staticmethod
-    def _run_hydraulic_analysis() -> Dict:
-        """Run hydraulic analysis"""
-        discharge = st.session_state.get('discharge', 1265.76)
-        velocity = st.session_state.get('design_velocity', 3.5)
-        hfl = st.session_state.get('hfl', 101.2)
-        
-        # Calculate derived parameters
-        regime_width = 4.75 * (discharge ** 0.5)
-        effective_waterway = st.session_state.get('num_spans', 3) * st.session_state.get('effective_span', 9.6)
-        afflux = (velocity ** 2) / (2 * 9.81) * 0.1
-        scour_depth = 1.35 * (discharge / 1000) ** 0.61
-        
-        return {
-            'discharge': discharge,
-            'design_velocity': velocity,
-            'hfl': hfl,
-            'regime_width': regime_width,
-            'effective_waterway': effective_waterway,
-            'afflux': afflux,
-            'scour_depth': scour_depth,
-            'waterway_ratio': effective_waterway / regime_width if regime_width > 0 else 0,
-            'manning_coefficient': st.session_state.get('manning_n', 0.033),
-            'bed_level': st.session_state.get('bed_level', 95.0),
-            'analysis_status': 'COMPLETED'
-        }
-    
-    @staticmethod
-    def _run_structural_analysis() -> Dict:
-        """Run structural analysis"""
-        span = st.session_state.get('effective_span', 9.6)
-        width = st.session_state.get('bridge_width', 12.0)
-        thickness = st.session_state.get('slab_thickness', 0.6)
-        
-        # Slab analysis
-        slab_area = span * width
-        slab_volume = slab_area * thickness
-        slab_weight = slab_volume * 25.0  # kN/m3
-        
-        # Pier analysis
-        pier_height = st.session_state.get('pier_height', 8.0)
-        cap_length = st.session_state.get('pier_cap_length', 15.0)
-        cap_width = st.session_state.get('pier_cap_width', 2.5)
-        cap_thickness = st.session_state.get('pier_cap_thickness', 1.5)
-        
-        pier_cap_volume = cap_length * cap_width * cap_thickness
-        pier_weight = pier_cap_volume * 25.0
-        
-        return {
-            'slab_design': {
-                'span': span,
-                'width': width,
-                'thickness': thickness,
-                'area': slab_area,
-                'volume': slab_volume,
-                'self_weight': slab_weight
-            },
-            'pier_design': {
-                'height': pier_height,
-                'cap_dimensions': {
-                    'length': cap_length,
-                    'width': cap_width,
-                    'thickness': cap_thickness
-                },
-                'cap_volume': pier_cap_volume,
-                'total_load': pier_weight
-            },
-            'analysis_status': 'COMPLETED'
-        }
-    
-    @staticmethod
-    def _run_abutment_analysis() -> Dict:
-        """Run abutment analysis based on selected type"""
-        abutment_type = st.session_state.get('abutment_type', 'Type-1')
-        
-        if abutment_type == 'Type-1':
-            return {
-                'type': 'Type-1 Battered Abutment',
-                'design_based_on': 'UIT Bridges Excel sheets',
-                'stem_height': st.session_state.get('type1_stem_height', 6.0),
-                'batter_ratio': st.session_state.get('type1_batter_ratio', 0.1),
-                'stem_top_width': st.session_state.get('type1_stem_top_width', 0.5),
-                'foundation_length': st.session_state.get('type1_foundation_length', 8.0),
-                'foundation_width': st.session_state.get('type1_foundation_width', 4.0),
-                'foundation_thickness': st.session_state.get('type1_foundation_thickness', 1.5),
-                'stability_ok': True,
-                'analysis_status': 'COMPLETED'
-            }
-        else:
-            return {
-                'type': 'Type-2 Cantilever Abutment',
-                'design_based_on': 'Chittorgarh Excel sheets',
-                'stem_height': st.session_state.get('type2_stem_height', 6.0),
-                'stem_width': st.session_state.get('type2_stem_width', 0.6),
-                'stem_length': st.session_state.get('type2_stem_length', 12.0),
-                'heel_length': st.session_state.get('type2_heel_length', 3.0),
-                'toe_length': st.session_state.get('type2_toe_length', 1.5),
-                'foundation_thickness': st.session_state.get('type2_foundation_thickness', 1.2),
-                'stability_ok': True,
-                'analysis_status': 'COMPLETED'
-            }
-    
-    @staticmethod
-    def _run_foundation_analysis() -> Dict:
-        """Run foundation analysis"""
-        bearing_capacity = st.session_state.get('bearing_capacity', 450.0)
-        
-        # Simplified foundation analysis
-        total_load = 5000.0  # kN (simplified)
-        foundation_area = total_load / bearing_capacity
-        foundation_length = math.sqrt(foundation_area * 1.5)
-        foundation_width = foundation_area / foundation_length
-        
-        return {
-            'foundation_area': foundation_area,
-            'foundation_length': foundation_length,
-            'foundation_width': foundation_width,
-            'foundation_thickness': 1.5,
-            'bearing_capacity_check': {
-                'applied_pressure': total_load / foundation_area,
-                'allowable_pressure': bearing_capacity,
-                'safety_factor': bearing_capacity / (total_load / foundation_area),
-                'check': 'PASS'
-            },
-            'analysis_status': 'COMPLETED'
-        }
-    
-    @staticmethod
-    def _run_cost_analysis() -> Dict:
-        """Run cost analysis"""
-        # Calculate quantities
-        span = st.session_state.get('effective_span', 9.6)
-        width = st.session_state.get('bridge_width', 12.0)
-        thickness = st.session_state.get('slab_thickness', 0.6)
-        
-        concrete_volume = span * width * thickness + 50.0  # Slab + other components
-        steel_weight = concrete_volume * 100  # kg (100 kg/m3 ratio)
-        formwork_area = concrete_volume * 6  # m2 (surface area approximation)
-        
-        # Apply rates
-        concrete_cost = concrete_volume * 5000.0  # Rs/m3
-        steel_cost = steel_weight * 60.0  # Rs/kg
-        formwork_cost = formwork_area * 250.0  # Rs/m2
-        
-        total_cost = concrete_cost + steel_cost + formwork_cost
-        
-        return {
-            'concrete_volume': concrete_volume,
-            'steel_weight': steel_weight,
-            'formwork_area': formwork_area,
-            'concrete_cost': concrete_cost,
-            'steel_cost': steel_cost,
-            'formwork_cost': formwork_cost,
-            'total_cost': total_cost,
-            'cost_per_sqm': total_cost / (span * width),
-            'analysis_status': 'COMPLETED'
-        }
+        return results
 
 class CompleteBridgeDesignApp:
     """Main application for complete slab bridge design"""
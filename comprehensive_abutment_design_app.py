@@ -47,6 +47,9 @@ from typing import Dict, Any, Tuple, List
 from dataclasses import dataclass
 from enum import Enum
 
+from influence_line_engine import live_load_envelope
+from reinforcement_optimizer import abutment_members, design_members
+
 # ----------------------------------------------------------------------------
 # CACHING UTILITIES FOR PERFORMANCE
 # ----------------------------------------------------------------------------
@@ -105,6 +108,7 @@ class ProjectParameters:
     foundation_level: float = 96.0  # m
     design_discharge: float = 1265.76  # cumecs
     design_velocity: float = 3.5  # m/s
+    effective_span: float = 9.6  # m - end span bearing on the abutment
 
 @dataclass
 class SoilParameters:
@@ -275,7 +279,10 @@ class AbutmentDesigner:
         
         # Superstructure loads (from deck)
         loads['deck_reaction'] = 2500.0  # kN (typical)
-        loads['live_load_reaction'] = 800.0  # kN (IRC Class AA)
+        # IRC Class A / 70R / AA trains over the end span (no impact below bed)
+        envelope = live_load_envelope([self.project.effective_span], self.project.bridge_width - 3.0)
+        loads['live_load_reaction'] = envelope['max_reaction'][0]  # kN
+        loads['live_load_vehicle'] = envelope['reaction_governed_by'][0]
         
         # Total vertical load
         loads['total_vertical'] = (loads['total_dead_load'] + 
@@ -380,40 +387,29 @@ class AbutmentDesigner:
             }
     
     def _design_reinforcement(self) -> Dict[str, Any]:
-        """Steel reinforcement design"""
-        
-        reinforcement = {}
-        
-        # Design moments
-        design_moment = self.earth_pressures['active_moment'] * 1.5  # Factor of safety
-        
-        # Material properties
-        fck = self.material.concrete_grade
-        fy = self.material.steel_grade
+        """Steel reinforcement design (minimum-weight bar arrangements per member)"""
         
-        # Effective depth
-        d_eff = self.geometry['base_thickness'] * 1000 - 75  # mm (cover)
+        design = design_members(abutment_members(
+            self.geometry, self.earth_pressures['ka'], self.soil.unit_weight,
+            self.stability['bearing_pressure'], self.material.concrete_density,
+            self.material.concrete_grade, self.material.steel_grade
+        ))
         
-        # Required steel area
-        ast_required = design_moment * 1000000 / (0.87 * fy * 0.9 * d_eff)  # mm²
+        # Summary values from the stem main steel (earth face)
+        stem = design['members']['Abutment stem']['zones'][0]
         
-        # Minimum steel
-        ast_min = 0.12 * self.geometry['base_thickness'] * 1000 * 1000 / 100  # mm²
-        
-        # Final steel area
-        ast_final = max(ast_required, ast_min)
-        
-        # Bar selection (20mm bars)
-        bar_area = 314  # mm²
-        num_bars = math.ceil(ast_final / bar_area)
-        
-        reinforcement['design_moment'] = design_moment
-        reinforcement['ast_required'] = ast_required
-        reinforcement['ast_min'] = ast_min
-        reinforcement['ast_provided'] = num_bars * bar_area
-        reinforcement['bar_diameter'] = 20
-        reinforcement['num_bars'] = num_bars
-        reinforcement['spacing'] = 1000 / num_bars if num_bars > 0 else 300
+        reinforcement = {}
+        reinforcement['design_moment'] = stem['design_moment']
+        reinforcement['ast_required'] = stem['ast_required']
+        reinforcement['ast_min'] = stem['ast_min']
+        reinforcement['ast_provided'] = stem['ast_provided']
+        reinforcement['bar_diameter'] = stem['bar_diameter']
+        reinforcement['num_bars'] = round(stem['layers'] * 1000 / stem['spacing'])  # per metre
+        reinforcement['spacing'] = stem['spacing']
+        reinforcement['members'] = design['members']
+        reinforcement['bar_schedule'] = design['bar_schedule']
+        reinforcement['total_steel_kg'] = design['total_steel_kg']
+        reinforcement['status'] = design['status']
         
         return reinforcement
     
@@ -425,10 +421,9 @@ class AbutmentDesigner:
                          self.geometry['base_volume'] + 
                          self.geometry['wing_volume'])
         
-        # Steel (percentage method)
-        steel_percentage = 1.5  # % typical for abutments
-        steel_volume = total_concrete * steel_percentage / 100
-        steel_weight = steel_volume * 7.85 * 1000  # kg
+        # Steel from the bar schedule
+        steel_weight = self.reinforcement['total_steel_kg']  # kg
+        steel_percentage = steel_weight / (7.85 * 1000) / total_concrete * 100
         
         # Formwork
         stem_formwork = 2 * self.geometry['height'] * self.geometry['base_length']
@@ -832,16 +827,18 @@ def display_reinforcement_design(project: ProjectParameters, soil: SoilParameter
     # Bar bending schedule
     st.subheader("📋 Bar Bending Schedule")
     
-    # Create comprehensive bar schedule
+    # Bar schedule from the reinforcement optimizer
+    schedule = reinforcement['bar_schedule']
     bar_schedule = {
-        'Bar Mark': ['R1', 'R2', 'R3', 'R4', 'R5'],
-        'Component': ['Main Foundation', 'Distribution Foundation', 'Stem Vertical', 'Stem Horizontal', 'Stirrups'],
-        'Diameter (mm)': [20, 16, 20, 12, 10],
-        'Length (m)': [6.0, 4.5, 3.2, 2.8, 1.5],
-        'Spacing (mm)': [200, 300, 150, 250, 200],
-        'Number': [30, 40, 45, 35, 60],
-        'Total Length (m)': [180, 180, 144, 98, 90],
-        'Weight (kg)': [444, 288, 355, 74, 53]
+        'Bar Mark': [line['bar_mark'] for line in schedule],
+        'Component': [f"{line['member']} - {line['zone']}" for line in schedule],
+        'Bars': [line['description'] for line in schedule],
+        'Diameter (mm)': [line['bar_diameter'] for line in schedule],
+        'Length (m)': [line['cut_length'] for line in schedule],
+        'Number': [line['number_of_bars'] * line['member_count'] for line in schedule],
+        'Total Length (m)': [round(line['number_of_bars'] * line['member_count'] * line['cut_length'], 1)
+                             for line in schedule],
+        'Weight (kg)': [round(line['weight_kg']) for line in schedule]
     }
     
     st.dataframe(pd.DataFrame(bar_schedule), use_container_width=True)
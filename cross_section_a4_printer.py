@@ -16,6 +16,8 @@ from dataclasses import dataclass
 from datetime import datetime
 import streamlit as st
 from river_section_input_schema import RiverCrossSectionPoint, WaterLevelData, RiverSectionInputSchema
+from cross_section_geometry import section_geometry, wetted_polygons
+from drawing_sheet import DrawingSheet, SheetTemplate, SheetText, drawing_sheet
 
 @dataclass
 class DrawingConfig:
@@ -43,11 +45,58 @@ class DrawingConfig:
     def drawing_height(self) -> float:
         return self.height_inches - self.margin_top - self.margin_bottom
 
+def cross_section_sheet(config: DrawingConfig) -> SheetTemplate:
+    """Sheet frame and title block of the A4 cross-section drawing"""
+    main_left = config.margin_left / config.width_inches
+    main_width = config.drawing_width / config.width_inches
+    bold = {'fontsize': 9, 'fontweight': 'bold'}
+    normal = {'fontsize': 9}
+    return SheetTemplate(
+        'cross_section_a4',
+        main_rect=(main_left, config.margin_bottom / config.height_inches,
+                   main_width, config.drawing_height / config.height_inches),
+        title_rect=(main_left, 0.02, main_width, (config.title_block_height - 0.1) / config.height_inches),
+        captions=[
+            SheetText(0.05, 0.16, "Scale: As Noted", bold),
+            SheetText(0.65, 0.24, "Drawn By: Bridge Design App", normal),
+            SheetText(0.65, 0.16, "Checked By: Engineer", normal),
+            SheetText(0.98, 0.85, "BRIDGE DESIGN APPLICATION", {'fontsize': 10, 'fontweight': 'bold', 'ha': 'right'}),
+            SheetText(0.98, 0.75, "Professional Engineering Software",
+                      {'fontsize': 8, 'ha': 'right', 'style': 'italic'}),
+        ],
+        fields={
+            # Main title and location line
+            'title': SheetText(0.5, 0.7, style={'fontsize': 14, 'fontweight': 'bold', 'ha': 'center'}),
+            'subtitle': SheetText(0.5, 0.55, style={'fontsize': 11, 'ha': 'center'}),
+            # Left section - Project details
+            'project': SheetText(0.05, 0.4, style=bold),
+            'survey_date': SheetText(0.05, 0.32, style=bold),
+            'drawing_date': SheetText(0.05, 0.24, style=bold),
+            # Center section - Water levels
+            'hfl': SheetText(0.35, 0.4, style=normal),
+            'nwl': SheetText(0.35, 0.32, style=normal),
+            'lwl': SheetText(0.35, 0.24, style=normal),
+            'discharge': SheetText(0.35, 0.16, style=normal),
+            # Right section - Technical details
+            'drawing_number': SheetText(0.65, 0.4, style=normal),
+            'sheet': SheetText(0.65, 0.32, "Sheet: 1 of 1", normal),
+        },
+        width_inches=config.width_inches,
+        height_inches=config.height_inches,
+    )
+
 class CrossSectionA4Printer:
-    """Professional A4 landscape cross-section printer"""
+    """
+    Professional A4 landscape cross-section printer
+
+    The sheet frame and title block come from a cached DrawingSheet, so
+    printing many sections only redraws the data layers; the figure
+    returned by one print is reused by the next.
+    """
     
     def __init__(self, config: Optional[DrawingConfig] = None):
         self.config = config or DrawingConfig()
+        self.sheet: Optional[DrawingSheet] = None
         self.fig: Optional[Figure] = None
         self.ax_main = None
         self.ax_title = None
@@ -56,9 +105,9 @@ class CrossSectionA4Printer:
                                      project_info: Optional[Dict[str, Any]] = None) -> Figure:
         """Create professional A4 landscape cross-section drawing"""
         
-        # Create figure with A4 landscape dimensions
-        self.fig = plt.figure(figsize=(self.config.width_inches, self.config.height_inches), 
-                             dpi=self.config.dpi)
+        # A4 landscape sheet with its frame and title block already drawn
+        self.sheet = drawing_sheet(cross_section_sheet(self.config), self.config.dpi)
+        self.fig = self.sheet.figure
         
         # Set up layout
         self._setup_layout()
@@ -81,27 +130,9 @@ class CrossSectionA4Printer:
         return self.fig
     
     def _setup_layout(self):
-        """Setup drawing layout with main drawing area and title block"""
-        
-        # Calculate positions
-        main_left = self.config.margin_left / self.config.width_inches
-        main_bottom = self.config.margin_bottom / self.config.height_inches
-        main_width = self.config.drawing_width / self.config.width_inches
-        main_height = self.config.drawing_height / self.config.height_inches
-        
-        title_left = main_left
-        title_bottom = 0.02
-        title_width = main_width
-        title_height = (self.config.title_block_height - 0.1) / self.config.height_inches
-        
-        # Create main drawing area
-        self.ax_main = self.fig.add_axes([main_left, main_bottom, main_width, main_height])
-        
-        # Create title block area
-        self.ax_title = self.fig.add_axes([title_left, title_bottom, title_width, title_height])
-        self.ax_title.set_xlim(0, 1)
-        self.ax_title.set_ylim(0, 1)
-        self.ax_title.axis('off')
+        """Clear the main drawing area of the previous print"""
+        self.ax_main = self.sheet.new_print()
+        self.ax_title = self.sheet.ax_title
     
     def _draw_cross_section(self, river_data: RiverSectionInputSchema):
         """Draw the main cross-section with professional styling"""
@@ -109,9 +140,10 @@ class CrossSectionA4Printer:
         if not river_data.cross_section_points:
             return
         
-        # Extract data
-        chainages = [p.chainage for p in river_data.cross_section_points]
-        elevations = [p.elevation for p in river_data.cross_section_points]
+        # Extract data (dense surveys are simplified to drawing tolerance)
+        geometry = section_geometry([p.chainage for p in river_data.cross_section_points],
+                                    [p.elevation for p in river_data.cross_section_points])
+        chainages, elevations = (values.tolist() for values in geometry.for_drawing())
         
         # Draw ground line
         self.ax_main.plot(chainages, elevations, 'k-', linewidth=2.5, label='Ground Level')
@@ -128,9 +160,10 @@ class CrossSectionA4Printer:
         self.ax_main.scatter(chainages, elevations, 
                            color='red', s=30, zorder=5, label='Survey Points')
         
-        # Add point labels
+        # Add point labels (about 20 at most to avoid crowding)
+        label_step = max(2, int(np.ceil(len(chainages) / 20)))
         for i, (x, y) in enumerate(zip(chainages, elevations)):
-            if i % 2 == 0:  # Label every other point to avoid crowding
+            if i % label_step == 0:
                 self.ax_main.annotate(f'{y:.2f}m', 
                                     (x, y), 
                                     xytext=(5, 10), 
@@ -172,30 +205,13 @@ class CrossSectionA4Printer:
                         fontsize=9, 
                         bbox=dict(boxstyle='round,pad=0.3', facecolor='green', alpha=0.1))
         
-        # Water area at HFL (blue transparent fill)
-        chainages = [p.chainage for p in self.ax_main.lines[0].get_xydata()]
-        elevations = [p.elevation for p in self.ax_main.lines[0].get_xydata()]
-        
-        # Create water surface polygon
-        water_chainages = []
-        water_elevations = []
-        
-        for x, y in zip(chainages, elevations):
-            if y <= water_levels.hfl:
-                water_chainages.append(x)
-                water_elevations.append(max(y, water_levels.lwl))  # Don't go below LWL
-        
-        if water_chainages:
-            # Add water surface line
-            water_surface_x = [min(water_chainages), max(water_chainages)]
-            water_surface_y = [water_levels.hfl, water_levels.hfl]
-            
-            # Create water fill
-            fill_x = water_chainages + [max(water_chainages), min(water_chainages)]
-            fill_y = water_elevations + [water_levels.hfl, water_levels.hfl]
-            
-            self.ax_main.fill(fill_x, fill_y, 
-                            color='lightblue', alpha=0.4, label='Water Area at HFL')
+        # Water area at HFL (blue transparent fill), clipped at the waterline
+        ground = self.ax_main.lines[0].get_xydata()
+        for i, (water_chainages, water_elevations) in enumerate(
+                wetted_polygons(ground[:, 0], ground[:, 1], water_levels.hfl)):
+            self.ax_main.fill(water_chainages, water_elevations,
+                            color='lightblue', alpha=0.4,
+                            label='Water Area at HFL' if i == 0 else None)
     
     def _add_dimensions_and_annotations(self, river_data: RiverSectionInputSchema):
         """Add dimensions and engineering annotations"""
@@ -203,8 +219,9 @@ class CrossSectionA4Printer:
         if not river_data.cross_section_points:
             return
         
-        chainages = [p.chainage for p in river_data.cross_section_points]
-        elevations = [p.elevation for p in river_data.cross_section_points]
+        geometry = section_geometry([p.chainage for p in river_data.cross_section_points],
+                                    [p.elevation for p in river_data.cross_section_points])
+        chainages, elevations = geometry.offsets.tolist(), geometry.elevations.tolist()
         
         # River width dimension
         river_width = max(chainages) - min(chainages)
@@ -270,65 +287,24 @@ class CrossSectionA4Printer:
     
     def _create_title_block(self, river_data: RiverSectionInputSchema, 
                           project_info: Dict[str, Any] = None):
-        """Create professional engineering title block"""
+        """Fill the title block fields of the drawing sheet"""
         
         if project_info is None:
             project_info = {}
         
-        # Title block border
-        title_rect = patches.Rectangle((0.02, 0.1), 0.96, 0.8, 
-                                     linewidth=2, edgecolor='black', 
-                                     facecolor='lightgray', alpha=0.1)
-        self.ax_title.add_patch(title_rect)
-        
-        # Title block sections
-        # Main title
-        self.ax_title.text(0.5, 0.7, 
-                         f'RIVER CROSS-SECTION AT {river_data.project_name.upper()}',
-                         fontsize=14, fontweight='bold', ha='center')
-        
-        self.ax_title.text(0.5, 0.55, 
-                         f'Location: {river_data.location} | River: {river_data.river_name}',
-                         fontsize=11, ha='center')
-        
-        # Left section - Project details
-        left_info = [
-            f"Project: {project_info.get('project_name', river_data.project_name)}",
-            f"Survey Date: {river_data.survey_date}",
-            f"Drawing Date: {datetime.now().strftime('%d-%m-%Y')}",
-            f"Scale: As Noted"
-        ]
-        
-        for i, info in enumerate(left_info):
-            self.ax_title.text(0.05, 0.4 - i*0.08, info, fontsize=9, fontweight='bold')
-        
-        # Center section - Water levels
-        center_info = [
-            f"HFL = {river_data.water_levels.hfl:.2f}m",
-            f"NWL = {river_data.water_levels.nwl:.2f}m", 
-            f"LWL = {river_data.water_levels.lwl:.2f}m",
-            f"Discharge = {river_data.water_levels.design_discharge:.0f} cumecs"
-        ]
-        
-        for i, info in enumerate(center_info):
-            self.ax_title.text(0.35, 0.4 - i*0.08, info, fontsize=9)
-        
-        # Right section - Technical details
-        right_info = [
-            f"Drawing No: CS-{datetime.now().strftime('%Y%m%d')}-001",
-            f"Sheet: 1 of 1",
-            f"Drawn By: Bridge Design App",
-            f"Checked By: Engineer"
-        ]
-        
-        for i, info in enumerate(right_info):
-            self.ax_title.text(0.65, 0.4 - i*0.08, info, fontsize=9)
-        
-        # Company/organization section
-        self.ax_title.text(0.98, 0.85, "BRIDGE DESIGN APPLICATION", 
-                         fontsize=10, fontweight='bold', ha='right')
-        self.ax_title.text(0.98, 0.75, "Professional Engineering Software", 
-                         fontsize=8, ha='right', style='italic')
+        water_levels = river_data.water_levels
+        self.sheet.set_fields(
+            title=f'RIVER CROSS-SECTION AT {river_data.project_name.upper()}',
+            subtitle=f'Location: {river_data.location} | River: {river_data.river_name}',
+            project=f"Project: {project_info.get('project_name', river_data.project_name)}",
+            survey_date=f"Survey Date: {river_data.survey_date}",
+            drawing_date=f"Drawing Date: {datetime.now().strftime('%d-%m-%Y')}",
+            hfl=f"HFL = {water_levels.hfl:.2f}m",
+            nwl=f"NWL = {water_levels.nwl:.2f}m",
+            lwl=f"LWL = {water_levels.lwl:.2f}m",
+            discharge=f"Discharge = {water_levels.design_discharge:.0f} cumecs",
+            drawing_number=f"Drawing No: CS-{datetime.now().strftime('%Y%m%d')}-001",
+        )
     
     def _format_drawing(self):
         """Apply final formatting to the drawing"""
@@ -367,16 +343,8 @@ class CrossSectionA4Printer:
         if not filename.endswith('.pdf'):
             filename += '.pdf'
         
-        # Save with high quality
-        self.fig.savefig(filename, 
-                        format='pdf', 
-                        dpi=self.config.dpi,
-                        bbox_inches='tight',
-                        pad_inches=0.1,
-                        facecolor='white',
-                        edgecolor='none')
-        
-        return filename
+        # Vector linework and text; heavy fills and point clouds rasterised at the print dpi
+        return self.sheet.save_pdf(filename, self.config.dpi)
     
     def save_a4_png(self, filename: str = None) -> str:
         """Save as high-resolution PNG"""
@@ -389,16 +357,8 @@ class CrossSectionA4Printer:
         if not filename.endswith('.png'):
             filename += '.png'
         
-        # Save with high quality
-        self.fig.savefig(filename, 
-                        format='png', 
-                        dpi=self.config.dpi,
-                        bbox_inches='tight',
-                        pad_inches=0.1,
-                        facecolor='white',
-                        edgecolor='none')
-        
-        return filename
+        # Full A4 sheet: the cached frame with the drawing blitted on top
+        return self.sheet.save_png(filename)
 
 def create_streamlit_printable_interface(river_data: RiverSectionInputSchema):
     """Streamlit interface for A4 printable cross-sections"""
@@ -555,4 +515,19 @@ def create_streamlit_printable_interface(river_data: RiverSectionInputSchema):
             
             with spec_col2:
                 st.info(f"""
-                **Margins**: Professional
\ No newline at end of file
+                **Margins**: Professional engineering layout
+                **Title Block**: {"Included" if include_title_block else "Omitted"}
+                **Print Ready**: Yes
+                """)
+            
+            with spec_col3:
+                water_levels = river_data.water_levels
+                st.info(f"""
+                **HFL**: {water_levels.hfl:.2f}m
+                **NWL**: {water_levels.nwl:.2f}m
+                **LWL**: {water_levels.lwl:.2f}m
+                """)
+            
+        except Exception as e:
+            progress_bar.empty()
+            status_text.error(f"❌ Error generating drawing: {str(e)}")
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+CROSS SECTION GEOMETRY
+Vectorized kernels for surveyed river cross sections
+
+A cross section is a polyline of (offset, elevation) points ordered across
+the river.  The kernels here work on NumPy arrays of those points and
+evaluate any number of water stages at once, so stage-discharge tables,
+reach models and plots all share one implementation instead of looping over
+point lists.
+
+Dense field surveys (thousands of noisy points) are reduced with
+Douglas-Peucker simplification to a vertical error bound or resampled at a
+uniform spacing; SectionGeometry keeps the simplified versions per
+tolerance so drawings and calculations run on right-sized data.
+"""
+
+import numpy as np
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+def as_section_arrays(offsets: ArrayLike, elevations: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """Validated float arrays of a cross section, sorted by offset"""
+    x = np.asarray(offsets, dtype=float).ravel()
+    z = np.asarray(elevations, dtype=float).ravel()
+    if x.shape != z.shape:
+        raise ValueError("Offsets and elevations must have the same length")
+    if x.size < 2:
+        raise ValueError("A cross section needs at least two points")
+    if np.any(np.diff(x) < 0):
+        order = np.argsort(x, kind='stable')
+        x, z = x[order], z[order]
+    return x, z
+
+
+def segment_properties(offsets: ArrayLike, elevations: ArrayLike, stages: ArrayLike) -> Dict[str, np.ndarray]:
+    """
+    Flow area, wetted perimeter and top width of every segment below each
+    stage, shaped (stages, segments).
+
+    Every segment of the section is clipped at the waterline: a segment with
+    one end dry contributes the wet fraction t = d_wet / (d_wet - d_dry) of
+    its width and length, so partially wet bank segments are exact.
+    """
+    x, z = as_section_arrays(offsets, elevations)
+    h = np.asarray(stages, dtype=float).reshape(-1, 1)
+
+    dx = np.diff(x)[None, :]
+    length = np.hypot(np.diff(x), np.diff(z))[None, :]
+    d1 = h - z[None, :-1]
+    d2 = h - z[None, 1:]
+    wet1, wet2 = d1 > 0, d2 > 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        partial = np.where(wet1, d1, d2) / (np.abs(d1) + np.abs(d2))
+    fraction = np.where(wet1 & wet2, 1.0, np.where(wet1 ^ wet2, partial, 0.0))
+    mean_depth = np.where(wet1 & wet2, 0.5 * (d1 + d2), 0.5 * np.maximum(np.maximum(d1, d2), 0.0))
+    return {
+        'area': mean_depth * fraction * dx,
+        'wetted_perimeter': fraction * length,
+        'top_width': fraction * dx,
+    }
+
+
+def stage_properties(offsets: ArrayLike, elevations: ArrayLike, stages: ArrayLike) -> Dict[str, np.ndarray]:
+    """
+    Flow area, wetted perimeter and top width below each stage (segment
+    values of segment_properties summed across the section).
+
+    Returns arrays shaped like stages.
+    """
+    shape = np.shape(stages)
+    segments = segment_properties(offsets, elevations, stages)
+    return {key: values.sum(axis=1).reshape(shape) for key, values in segments.items()}
+
+
+# ----------------------------------------------------------------------
+# Simplification, resampling and clipping
+# ----------------------------------------------------------------------
+
+def _chord_deviation(x: np.ndarray, z: np.ndarray, keep: np.ndarray) -> np.ndarray:
+    """Vertical distance of every point from the chord between its kept neighbours"""
+    kept = np.flatnonzero(keep)
+    segment = np.clip(np.searchsorted(kept, np.arange(x.size), side='right') - 1, 0, kept.size - 2)
+    i0, i1 = kept[segment], kept[segment + 1]
+    x0, x1, z0, z1 = x[i0], x[i1], z[i0], z[i1]
+    dx = x1 - x0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        chord = np.where(dx > 0, z0 + (z1 - z0) * (x - x0) / dx,
+                         np.clip(z, np.minimum(z0, z1), np.maximum(z0, z1)))
+    deviation = np.abs(z - chord)
+    deviation[keep] = 0.0
+    return deviation
+
+
+def simplify_indices(offsets: ArrayLike, elevations: ArrayLike, tolerance: float) -> np.ndarray:
+    """
+    Indices of the points kept by Douglas-Peucker simplification.
+
+    The error bound is vertical: every dropped point lies within tolerance
+    (m) of the simplified ground line, so levels read off the simplified
+    section are never off by more than that.  Each pass splits every open
+    chord at its worst point simultaneously (segment maxima by reduceat),
+    which gives the same vertices as the recursive algorithm in O(log n)
+    array passes for typical survey data.
+    """
+    x, z = as_section_arrays(offsets, elevations)
+    keep = np.zeros(x.size, dtype=bool)
+    keep[[0, -1]] = True
+    while True:
+        deviation = _chord_deviation(x, z, keep)
+        kept = np.flatnonzero(keep)
+        worst = np.maximum.reduceat(deviation, kept[:-1])
+        segment = np.clip(np.searchsorted(kept, np.arange(x.size), side='right') - 1, 0, kept.size - 2)
+        split = (deviation > tolerance) & (deviation == worst[segment])
+        if not split.any():
+            return kept
+        # One split per chord: the first of any tied worst points
+        _, first = np.unique(segment[split], return_index=True)
+        keep[np.flatnonzero(split)[first]] = True
+
+
+def simplify(offsets: ArrayLike, elevations: ArrayLike, tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Douglas-Peucker simplified (offsets, elevations) within a vertical tolerance"""
+    x, z = as_section_arrays(offsets, elevations)
+    kept = simplify_indices(x, z, tolerance)
+    return x[kept], z[kept]
+
+
+def resample(offsets: ArrayLike, elevations: ArrayLike, spacing: Optional[float] = None,
+             count: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Section resampled at uniform offsets (either a spacing in m or a point
+    count), end points included, levels interpolated linearly
+    """
+    x, z = as_section_arrays(offsets, elevations)
+    if count is None:
+        if not spacing or spacing <= 0:
+            raise ValueError("Give a positive spacing or a point count")
+        count = int(np.ceil((x[-1] - x[0]) / spacing - 1e-9)) + 1
+    if count < 2:
+        raise ValueError("Resampling needs at least two points")
+    new_x = np.linspace(x[0], x[-1], count)
+    return new_x, np.interp(new_x, x, z)
+
+
+def insert_waterline_crossings(offsets: ArrayLike, elevations: ArrayLike,
+                               stage: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Section with a vertex added wherever a segment crosses the stage"""
+    x, z = as_section_arrays(offsets, elevations)
+    d = z - stage
+    crossing = np.flatnonzero(d[:-1] * d[1:] < 0)
+    t = d[crossing] / (d[crossing] - d[crossing + 1])
+    position = np.concatenate([np.arange(x.size, dtype=float), crossing + t])
+    order = np.argsort(position, kind='stable')
+    new_x = np.concatenate([x, x[crossing] + t * (x[crossing + 1] - x[crossing])])[order]
+    new_z = np.concatenate([z, np.full(crossing.size, float(stage))])[order]
+    return new_x, new_z
+
+
+def wetted_polygons(offsets: ArrayLike, elevations: ArrayLike,
+                    stage: float) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    The wetted cross section at a stage, clipped exactly at the waterline.
+
+    Returns one closed polygon (x, z) per disjoint wet sub-channel, running
+    along the bed from bank crossing to bank crossing; the closing edge is
+    the water surface.  A section still wet at an end point is closed by a
+    vertical wall there.
+    """
+    x, z = insert_waterline_crossings(offsets, elevations, stage)
+    wet = z <= stage
+    edges = np.diff(np.concatenate([[0], wet.astype(np.int8), [0]]))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    polygons = []
+    for start, end in zip(starts, ends):
+        px, pz = x[start:end], z[start:end]
+        if px.size < 2 or not np.any(pz < stage):
+            continue  # a bank point touching the waterline
+        if pz[0] < stage:
+            px, pz = np.concatenate([[px[0]], px]), np.concatenate([[stage], pz])
+        if pz[-1] < stage:
+            px, pz = np.concatenate([px, [px[-1]]]), np.concatenate([pz, [stage]])
+        polygons.append((px, pz))
+    return polygons
+
+
+def subchannel_properties(offsets: ArrayLike, elevations: ArrayLike, stage: float,
+                          manning_n: float = 0.033) -> Dict[str, np.ndarray]:
+    """
+    Exact wetted properties of every disjoint sub-channel at a stage.
+
+    Waterline crossings are inserted as vertices first, so each segment is
+    either wholly wet or wholly dry and partial bank segments count exactly.
+    Per wet segment (depths d1, d2 over width b, offsets x1, x2):
+        area            b·(d1 + d2)/2
+        perimeter       √(b² + (z2 - z1)²)
+        x first moment  b·(d1·(2x1 + x2) + d2·(x1 + 2x2))/6
+        depth moment    b·(d1² + d1·d2 + d2²)/6   (about the water surface)
+    summed per sub-channel with bincount.  Conveyance K = A·R^(2/3)/n per
+    sub-channel; the section total is the sum over sub-channels (vertical
+    division at the dry banks between them).  End walls above a wet end
+    point are frictionless, as in stage_properties.
+
+    Returns arrays with one entry per sub-channel, left to right, plus the
+    'total_*' section values.
+    """
+    x, z = insert_waterline_crossings(offsets, elevations, stage)
+    d = np.maximum(stage - z, 0.0)
+    wet_point = z <= stage
+    wet = wet_point[:-1] & wet_point[1:] & ((d[:-1] > 0) | (d[1:] > 0))
+    # Sub-channel label: consecutive wet segments share one
+    starts = wet & ~np.concatenate([[False], wet[:-1]])
+    label = np.cumsum(starts) - 1
+    count = int(starts.sum())
+
+    x1, x2, d1, d2 = x[:-1][wet], x[1:][wet], d[:-1][wet], d[1:][wet]
+    b = x2 - x1
+    ids = label[wet]
+
+    def total(values):
+        return np.bincount(ids, weights=values, minlength=count)
+
+    area = total(0.5 * b * (d1 + d2))
+    perimeter = total(np.hypot(b, d2 - d1))
+    top_width = total(b)
+    x_moment = total(b * (d1 * (2 * x1 + x2) + d2 * (x1 + 2 * x2)) / 6)
+    depth_moment = total(b * (d1 * d1 + d1 * d2 + d2 * d2) / 6)
+    max_depth = np.zeros(count)
+    np.maximum.at(max_depth, ids, np.maximum(d1, d2))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        radius = np.where(perimeter > 0, area / perimeter, 0.0)
+        centroid_offset = np.where(area > 0, x_moment / area, np.nan)
+        centroid_level = np.where(area > 0, stage - depth_moment / area, np.nan)
+        hydraulic_depth = np.where(top_width > 0, area / top_width, 0.0)
+    conveyance = area * radius ** (2 / 3) / manning_n
+    first = np.flatnonzero(np.diff(np.concatenate([[-1], ids])) != 0)
+    last = np.concatenate([first[1:] - 1, [ids.size - 1]]) if count else first
+
+    total_area = float(area.sum())
+    return {
+        'left_edge': x1[first],
+        'right_edge': x2[last],
+        'area': area,
+        'wetted_perimeter': perimeter,
+        'top_width': top_width,
+        'hydraulic_radius': radius,
+        'hydraulic_depth': hydraulic_depth,
+        'max_depth': max_depth,
+        'centroid_offset': centroid_offset,
+        'centroid_level': centroid_level,
+        'conveyance': conveyance,
+        'total_area': total_area,
+        'total_wetted_perimeter': float(perimeter.sum()),
+        'total_top_width': float(top_width.sum()),
+        'total_conveyance': float(conveyance.sum()),
+        'total_centroid_offset': float(x_moment.sum() / total_area) if total_area > 0 else float('nan'),
+        'total_centroid_level': float(stage - depth_moment.sum() / total_area) if total_area > 0 else float('nan'),
+    }
+
+
+def drawing_tolerance(elevations: ArrayLike, fraction: float = 1e-3) -> float:
+    """Simplification tolerance invisible on a sheet: a fraction of the section relief"""
+    z = np.asarray(elevations, dtype=float)
+    return float(max(z.max() - z.min(), 1e-3) * fraction)
+
+
+class SectionGeometry:
+    """
+    One surveyed section as arrays, with simplified versions cached per
+    tolerance so repeated plots and calculations reuse them
+    """
+
+    def __init__(self, offsets: ArrayLike, elevations: ArrayLike):
+        self.offsets, self.elevations = as_section_arrays(offsets, elevations)
+        self._simplified: Dict[float, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return self.offsets.size
+
+    def simplified(self, tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+        key = round(float(tolerance), 9)
+        if key not in self._simplified:
+            self._simplified[key] = simplify(self.offsets, self.elevations, key)
+        return self._simplified[key]
+
+    def for_drawing(self, max_points: int = 500) -> Tuple[np.ndarray, np.ndarray]:
+        """Raw points for small surveys, simplified to drawing tolerance for dense ones"""
+        if len(self) <= max_points:
+            return self.offsets, self.elevations
+        return self.simplified(drawing_tolerance(self.elevations))
+
+    def resampled(self, spacing: Optional[float] = None, count: Optional[int] = None):
+        return resample(self.offsets, self.elevations, spacing, count)
+
+    def wetted_polygons(self, stage: float, tolerance: float = 0.0):
+        x, z = self.simplified(tolerance) if tolerance > 0 else (self.offsets, self.elevations)
+        return wetted_polygons(x, z, stage)
+
+    def stage_properties(self, stages: ArrayLike, tolerance: float = 0.0) -> Dict[str, np.ndarray]:
+        x, z = self.simplified(tolerance) if tolerance > 0 else (self.offsets, self.elevations)
+        return stage_properties(x, z, stages)
+
+
+@lru_cache(maxsize=64)
+def _cached_geometry(offsets: bytes, elevations: bytes) -> SectionGeometry:
+    return SectionGeometry(np.frombuffer(offsets), np.frombuffer(elevations))
+
+
+def section_geometry(offsets: ArrayLike, elevations: ArrayLike) -> SectionGeometry:
+    """
+    SectionGeometry shared between callers passing the same survey, so a
+    section redrawn or recalculated keeps its simplified versions
+    """
+    x = np.ascontiguousarray(offsets, dtype=float).ravel()
+    z = np.ascontiguousarray(elevations, dtype=float).ravel()
+    return _cached_geometry(x.tobytes(), z.tobytes())
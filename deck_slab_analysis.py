@@ -0,0 +1,533 @@
+#!/usr/bin/env python3
+"""
+DECK SLAB ANALYSIS
+Design moments and shears for solid RCC slab decks
+
+Two methods:
+1. Effective width method (IRC:112 Annex B-3 / IRC:21 Cl. 305.16.2)
+   Longitudinal moments per metre width for interior and edge strips from
+   the influence-line envelope divided by the effective width of dispersion.
+2. Grillage model (Hambly) for wide, skewed, multi-span decks
+   Plane grid of longitudinal and skew transverse members, assembled as a
+   sparse stiffness matrix and factorised once; the grid is numbered line
+   by line, so the matrix is a narrow band and a banded Cholesky factor
+   makes every vehicle placement a cheap back-substitution.
+
+The grillage needs scipy; the effective width method runs on numpy alone.
+"""
+
+import math
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+try:
+    import scipy.sparse as sp
+    from scipy.linalg import cho_solve_banded, cholesky_banded
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+from influence_line_engine import (
+    IRC_VEHICLES, compute_influence_lines, critical_vehicle_positions, impact_factor,
+    number_of_lanes, sweep_vehicle,
+)
+
+# ============================================================================
+# DECK PARAMETERS
+# ============================================================================
+
+@dataclass
+class DeckSlabGeometry:
+    """Solid slab deck geometry and materials"""
+    span_lengths: Tuple[float, ...]  # m - effective spans
+    width: float  # m - overall deck width
+    thickness: float = 0.9  # m - from Excel formulas
+    carriageway_width: Optional[float] = None  # m - default width - 3.0 (footpaths)
+    skew_angle: float = 0.0  # degrees
+    continuous: bool = False
+    fck: float = 25.0  # N/mm²
+    concrete_density: float = 24.0  # kN/m³
+    wearing_coat_thickness: float = 0.075  # m
+    wearing_coat_density: float = 22.0  # kN/m³
+    footpath_load: float = 5.0  # kN/m² on each footpath strip
+    kerb_line_load: float = 10.0  # kN/m railing + kerb on each edge
+
+    def __post_init__(self):
+        self.span_lengths = tuple(float(s) for s in self.span_lengths)
+        if self.carriageway_width is None:
+            self.carriageway_width = max(self.width - 3.0, 0.0)
+
+    @property
+    def footpath_width(self) -> float:
+        return max(0.0, (self.width - self.carriageway_width) / 2)
+
+    @property
+    def elastic_modulus(self) -> float:
+        """Ecm per IRC:112 Table 6.5 approximation, kN/m²"""
+        return 5000.0 * math.sqrt(self.fck) * 1000.0
+
+# IRC:21 Table 305.16.2 - α against b/l0 = 0.1, 0.2, ... 2.0
+ALPHA_SIMPLY_SUPPORTED = np.array([0.40, 0.80, 1.16, 1.48, 1.72, 1.96, 2.12, 2.24, 2.36, 2.48,
+                                   2.60, 2.60, 2.60, 2.60, 2.60, 2.60, 2.60, 2.60, 2.60, 2.60])
+ALPHA_CONTINUOUS = np.array([0.40, 0.80, 1.16, 1.44, 1.68, 1.84, 1.96, 2.08, 2.16, 2.24,
+                             2.28, 2.36, 2.40, 2.48, 2.48, 2.52, 2.56, 2.60, 2.60, 2.60])
+BL0_RATIOS = np.linspace(0.1, 2.0, 20)
+
+# Transverse wheel / track layout (m): contact width and gauge between wheel lines
+WHEEL_LINES = {
+    'CLASS_A': (0.5, 1.8),
+    'CLASS_70R_WHEELED': (0.86, 1.93),
+    'CLASS_70R_TRACKED': (0.84, 2.06),
+    'CLASS_AA_TRACKED': (0.85, 2.05),
+    'CLASS_AA_WHEELED': (0.3, 1.0),
+}
+
+
+def effective_width_alpha(deck_width: float, span: float, continuous: bool = False) -> float:
+    """α constant from IRC:21 Table 305.16.2 for ratio b/l0"""
+    table = ALPHA_CONTINUOUS if continuous else ALPHA_SIMPLY_SUPPORTED
+    return float(np.interp(deck_width / span, BL0_RATIOS, table))
+
+
+def effective_width(deck_width: float, span: float, a: np.ndarray, b1: float,
+                    continuous: bool = False) -> np.ndarray:
+    """b_ef = α·a·(1 - a/l0) + b1  (IRC:112 Annex B-3, Eq. B-3.1)"""
+    alpha = effective_width_alpha(deck_width, span, continuous)
+    a = np.asarray(a, dtype=float)
+    return alpha * a * (1.0 - a / span) + b1
+
+# ============================================================================
+# EFFECTIVE WIDTH METHOD
+# ============================================================================
+
+def _uls(dead: np.ndarray, sidl: np.ndarray, live: np.ndarray) -> np.ndarray:
+    """IRC:6 Table B.2 basic combination for the deck"""
+    return 1.35 * dead + 1.75 * sidl + 1.5 * live
+
+
+def analyse_effective_width(deck: DeckSlabGeometry) -> Dict[str, any]:
+    """
+    Design moments and shears per metre width for interior and edge strips
+    of every span, from the influence-line envelope of one lane of each
+    vehicle divided by the effective width of dispersion.
+    """
+    lines = compute_influence_lines(deck.span_lengths, deck.continuous)
+    spans = np.asarray(deck.span_lengths)
+    lanes = number_of_lanes(deck.carriageway_width)
+
+    # Per metre width dead loads
+    dead_udl = deck.thickness * deck.concrete_density
+    sidl_udl = deck.wearing_coat_thickness * deck.wearing_coat_density
+    section_x = lines.section_positions
+    # UDL moment envelope = Σ ordinates × tributary length (all spans loaded)
+    weights = np.gradient(lines.positions)
+    udl_moment = lines.moments @ weights
+    udl_shear = 0.5 * spans  # simply-supported end shear per unit UDL
+
+    strips = []
+    for j, span in enumerate(spans):
+        mid = int(np.argmin(np.abs(section_x - (lines.support_positions[j] + span / 2))))
+        support_sections = [int(np.argmin(np.abs(section_x - lines.support_positions[k]))) for k in (j, j + 1)]
+        lane_moment, lane_shear, governing = 0.0, 0.0, ''
+        edge_moment = 0.0
+        for key, vehicle in IRC_VEHICLES.items():
+            contact, gauge = WHEEL_LINES.get(key, (0.5, 1.8))
+            b1 = contact + 2 * deck.wearing_coat_thickness
+            envelope = sweep_vehicle(lines, vehicle)
+            impact = impact_factor(vehicle, span)
+            moment = envelope['max_moment'][mid] * impact
+            # Effective width with load at midspan for moment, one wheel line each;
+            # overlapping dispersion of the two wheel lines is combined
+            bef_m = float(effective_width(deck.width, span, span / 2, b1, deck.continuous))
+            width_m = min(bef_m + gauge, deck.carriageway_width) if bef_m > gauge else 2 * bef_m
+            if lanes >= 2 and key == 'CLASS_A':
+                # Two Class A trains side by side, 1.2 m minimum clearance
+                width_m = min(width_m + vehicle.lane_width + 1.2, deck.carriageway_width)
+                moment *= 2
+            per_metre = moment / width_m
+            # Shear: front axle group at effective depth from the support
+            depth = max(deck.thickness - 0.05, 0.1)
+            bef_v = float(effective_width(deck.width, span, depth, b1, deck.continuous))
+            width_v = min(bef_v + gauge, deck.carriageway_width) if bef_v > gauge else 2 * bef_v
+            reaction = max(envelope['max_reaction'][j], envelope['max_reaction'][j + 1])
+            shear = reaction * impact * (2 if lanes >= 2 and key == 'CLASS_A' else 1) / width_v
+            if per_metre > lane_moment:
+                lane_moment, governing = per_metre, vehicle.name
+            lane_shear = max(lane_shear, shear)
+            # Edge strip: dispersion cut off by the kerb, single wheel line
+            edge_width = min(bef_m / 2 + deck.footpath_width + b1 / 2, bef_m)
+            edge_moment = max(edge_moment, 0.5 * envelope['max_moment'][mid] * impact / max(edge_width, b1))
+
+        dead_m = udl_moment[mid] * dead_udl
+        sidl_m = udl_moment[mid] * sidl_udl
+        dead_v = udl_shear[j] * dead_udl
+        sidl_v = udl_shear[j] * sidl_udl
+        hogging = min(udl_moment[k] for k in support_sections)
+
+        strips.append({
+            'span': j + 1,
+            'strip': 'Interior',
+            'dead_moment': float(dead_m),
+            'sidl_moment': float(sidl_m),
+            'live_moment': float(lane_moment),
+            'design_moment': float(_uls(dead_m, sidl_m, lane_moment)),
+            'design_hogging_moment': float(_uls(hogging * dead_udl, hogging * sidl_udl, 0.0)),
+            'design_shear': float(_uls(dead_v, sidl_v, lane_shear)),
+            'governing_vehicle': governing,
+        })
+        # Edge strip carries kerb and railing (SIDL) and footpath pedestrian load (live)
+        # over the footpath width
+        edge_sidl = sidl_udl + deck.kerb_line_load / max(deck.footpath_width, 1.0)
+        edge_footpath = deck.footpath_load * deck.footpath_width / max(deck.footpath_width, 1.0)
+        edge_sidl_m = udl_moment[mid] * edge_sidl
+        edge_live_m = edge_moment + udl_moment[mid] * edge_footpath
+        strips.append({
+            'span': j + 1,
+            'strip': 'Edge',
+            'dead_moment': float(dead_m),
+            'sidl_moment': float(edge_sidl_m),
+            'live_moment': float(edge_live_m),
+            'design_moment': float(_uls(dead_m, edge_sidl_m, edge_live_m)),
+            'design_hogging_moment': float(_uls(hogging * dead_udl, hogging * edge_sidl, hogging * edge_footpath)),
+            'design_shear': float(_uls(dead_v, udl_shear[j] * edge_sidl,
+                                       lane_shear / 2 + udl_shear[j] * edge_footpath)),
+            'governing_vehicle': governing,
+        })
+
+    governing_strip = max(strips, key=lambda s: s['design_moment'])
+    return {
+        'method': 'Effective Width (IRC:112 Annex B-3)',
+        'units': {'moment': 'kN-m/m', 'shear': 'kN/m'},
+        'lanes': lanes,
+        'strips': strips,
+        'max_design_moment': governing_strip['design_moment'],
+        'max_design_shear': max(s['design_shear'] for s in strips),
+    }
+
+# ============================================================================
+# GRILLAGE MODEL (SPARSE)
+# ============================================================================
+
+@dataclass
+class GrillageMesh:
+    """Skew grid: nodes (i along span, j across width)"""
+    x: np.ndarray  # (nx,) positions along the deck centreline
+    y: np.ndarray  # (ny,) transverse positions from the left edge
+    skew_tan: float
+    supports: np.ndarray  # indices into x of support lines
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.x), len(self.y)
+
+    def node_xy(self) -> Tuple[np.ndarray, np.ndarray]:
+        X = self.x[:, None] + self.y[None, :] * self.skew_tan
+        Y = np.broadcast_to(self.y[None, :], X.shape)
+        return X, Y
+
+
+def build_grillage_mesh(deck: DeckSlabGeometry, longitudinal_spacing: float = 1.0,
+                        transverse_spacing: float = 0.5) -> GrillageMesh:
+    """Longitudinal members ~1 m apart, transverse members parallel to supports"""
+    ny = max(3, int(math.ceil(deck.width / longitudinal_spacing)) + 1)
+    y = np.linspace(0.0, deck.width, ny)
+    support_x = np.concatenate([[0.0], np.cumsum(deck.span_lengths)])
+    segments = [start + np.linspace(0.0, length, max(4, int(math.ceil(length / transverse_spacing))) + 1)[:-1]
+                for start, length in zip(support_x[:-1], deck.span_lengths)]
+    x = np.concatenate(segments + [support_x[-1:]])
+    supports = np.searchsorted(x, support_x)
+    return GrillageMesh(x, y, math.tan(math.radians(deck.skew_angle)), supports)
+
+
+def tributary_widths(lines: np.ndarray) -> np.ndarray:
+    """Width carried by each grid line: half the spacing on each side (trapezoidal rule)"""
+    if len(lines) < 2:
+        return np.ones(len(lines))
+    half = np.diff(lines) / 2
+    widths = np.zeros(len(lines))
+    widths[:-1] += half
+    widths[1:] += half
+    return widths
+
+
+def _member_stiffness(length: np.ndarray, ei: np.ndarray, gj: np.ndarray) -> np.ndarray:
+    """
+    Local stiffness of grillage members (M, 6, 6) for DOFs
+    [w1, θ1, φ1, w2, θ2, φ2]: θ = slope along member, φ = slope across it.
+    """
+    L = length[:, None, None]
+    k = np.zeros((len(length), 6, 6))
+    bending = np.array([[12, 6, -12, 6], [6, 4, -6, 2], [-12, -6, 12, -6], [6, 2, -6, 4]], dtype=float)
+    powers = np.array([[3, 2, 3, 2], [2, 1, 2, 1], [3, 2, 3, 2], [2, 1, 2, 1]])
+    idx = np.array([0, 1, 3, 4])
+    k[:, idx[:, None], idx[None, :]] = ei[:, None, None] * bending[None] / L ** powers[None]
+    torsion = gj / length
+    for a, b, sign in ((2, 2, 1), (5, 5, 1), (2, 5, -1), (5, 2, -1)):
+        k[:, a, b] = sign * torsion
+    return k
+
+
+class GrillageModel:
+    """Sparse grillage of a solid slab deck; factorised once per geometry"""
+
+    def __init__(self, deck: DeckSlabGeometry, longitudinal_spacing: float = 1.0,
+                 transverse_spacing: float = 0.5):
+        if not SCIPY_AVAILABLE:
+            raise ImportError("scipy is required for the grillage model")
+        self.deck = deck
+        self.mesh = build_grillage_mesh(deck, longitudinal_spacing, transverse_spacing)
+        self._assemble()
+
+    def _assemble(self):
+        deck, mesh = self.deck, self.mesh
+        nx, ny = mesh.shape
+        node = np.arange(nx * ny).reshape(nx, ny)
+        X, Y = mesh.node_xy()
+        E = deck.elastic_modulus
+        G = E / (2 * (1 + 0.2))
+        h = deck.thickness
+
+        # Tributary widths of each member line
+        dy = tributary_widths(mesh.y) if ny > 1 else np.array([deck.width])
+        dx = tributary_widths(mesh.x)
+
+        # Longitudinal members: (i, j) -> (i + 1, j)
+        n1_l = node[:-1, :].ravel()
+        n2_l = node[1:, :].ravel()
+        width_l = np.broadcast_to(dy[None, :], (nx - 1, ny)).ravel()
+        # Transverse members along the skew: (i, j) -> (i, j + 1)
+        n1_t = node[:, :-1].ravel()
+        n2_t = node[:, 1:].ravel()
+        width_t = np.broadcast_to(dx[:, None], (nx, ny - 1)).ravel()
+
+        n1 = np.concatenate([n1_l, n1_t])
+        n2 = np.concatenate([n2_l, n2_t])
+        width = np.concatenate([width_l, width_t])
+        Xf, Yf = X.ravel(), Y.ravel()
+        vx, vy = Xf[n2] - Xf[n1], Yf[n2] - Yf[n1]
+        length = np.hypot(vx, vy)
+        c, s = vx / length, vy / length
+
+        # Hambly: slab strip I = b h³/12, torsion J = b h³/6 per member
+        ei = E * width * h ** 3 / 12.0
+        gj = G * width * h ** 3 / 6.0
+        k_local = _member_stiffness(length, ei, gj)
+
+        # Global DOFs per node: [w, ∂w/∂X, ∂w/∂Y]; θ = c·gx + s·gy, φ = -s·gx + c·gy
+        T = np.zeros((len(length), 6, 6))
+        for o in (0, 3):
+            T[:, o, o] = 1.0
+            T[:, o + 1, o + 1], T[:, o + 1, o + 2] = c, s
+            T[:, o + 2, o + 1], T[:, o + 2, o + 2] = -s, c
+        k_global = np.einsum('mji,mjk,mkl->mil', T, k_local, T)
+
+        dofs = np.concatenate([3 * n1[:, None] + np.arange(3), 3 * n2[:, None] + np.arange(3)], axis=1)
+        rows = np.repeat(dofs, 6, axis=1).ravel()
+        cols = np.tile(dofs, (1, 6)).ravel()
+        ndof = 3 * nx * ny
+        K = sp.coo_matrix((k_global.ravel(), (rows, cols)), shape=(ndof, ndof)).tocsc()
+
+        # Vertical restraint on every node of every support line
+        restrained = 3 * node[mesh.supports, :].ravel()
+        free = np.setdiff1d(np.arange(ndof), restrained)
+
+        # Nodes are numbered line by line across the deck, so the free stiffness
+        # matrix is a band about 3·ny wide: factorise it as a banded Cholesky
+        K_free = K[free][:, free].tocoo()
+        upper = K_free.row <= K_free.col
+        rows, cols, values = K_free.row[upper], K_free.col[upper], K_free.data[upper]
+        bandwidth = int((cols - rows).max())
+        banded = np.zeros((bandwidth + 1, len(free)))
+        banded[bandwidth + rows - cols, cols] = values
+
+        self.node = node
+        # End actions [f_w1, f_θ1, f_θ2] from global displacements: rows of k_local·T
+        self.members = {'n1': n1, 'n2': n2, 'actions': np.matmul(k_local, T)[:, [0, 1, 4], :],
+                        'width': width, 'longitudinal': np.arange(len(n1)) < len(n1_l)}
+        self.free = free
+        self.ndof = ndof
+        self.factor = cholesky_banded(banded)
+
+    def nodal_loads_from_points(self, px: np.ndarray, py: np.ndarray, loads: np.ndarray,
+                                case: np.ndarray, n_cases: int) -> np.ndarray:
+        """Distribute point loads (kN, downward) bilinearly to the skew grid"""
+        mesh = self.mesh
+        nx, ny = mesh.shape
+        xi = px - py * mesh.skew_tan  # parametric coordinate along the span
+        on = (xi >= mesh.x[0]) & (xi <= mesh.x[-1]) & (py >= mesh.y[0]) & (py <= mesh.y[-1])
+        xi, eta, loads, case = xi[on], py[on], loads[on], case[on]
+        i = np.clip(np.searchsorted(mesh.x, xi, side='right') - 1, 0, nx - 2)
+        j = np.clip(np.searchsorted(mesh.y, eta, side='right') - 1, 0, ny - 2)
+        fx = (xi - mesh.x[i]) / (mesh.x[i + 1] - mesh.x[i])
+        fy = (eta - mesh.y[j]) / (mesh.y[j + 1] - mesh.y[j])
+        F = np.zeros((self.ndof, n_cases))
+        for di, dj, w in ((0, 0, (1 - fx) * (1 - fy)), (1, 0, fx * (1 - fy)),
+                          (0, 1, (1 - fx) * fy), (1, 1, fx * fy)):
+            np.add.at(F, (3 * self.node[i + di, j + dj], case), -loads * w)
+        return F
+
+    def uniform_load_vectors(self) -> np.ndarray:
+        """
+        Distributed load cases lumped to nodes by trapezoidal tributary area,
+        as columns: self weight (dead), wearing coat and kerb/railing line
+        loads (SIDL), footpath pedestrian pressure (live)
+        """
+        deck, mesh = self.deck, self.mesh
+        dx = tributary_widths(mesh.x)
+        dy = tributary_widths(mesh.y)
+        area = dx[:, None] * dy[None, :]
+        # Footpath strip each node carries: overlap of its tributary band with the footpaths
+        bounds = np.concatenate([mesh.y[:1], (mesh.y[1:] + mesh.y[:-1]) / 2, mesh.y[-1:]])
+        low, high = bounds[:-1], bounds[1:]
+        footpath = (np.clip(np.minimum(high, deck.footpath_width) - low, 0.0, None)
+                    + np.clip(high - np.maximum(low, deck.width - deck.footpath_width), 0.0, None))
+        kerb = np.zeros(len(mesh.y))
+        kerb[[0, -1]] = deck.kerb_line_load
+
+        loads = np.stack([
+            deck.thickness * deck.concrete_density * area,
+            deck.wearing_coat_thickness * deck.wearing_coat_density * area + dx[:, None] * kerb[None, :],
+            deck.footpath_load * dx[:, None] * footpath[None, :],
+        ], axis=-1)
+        F = np.zeros((self.ndof, 3))
+        F[3 * self.node.ravel(), :] = -loads.reshape(-1, 3)
+        return F
+
+    def vehicle_load_vectors(self, vehicle_key: str) -> np.ndarray:
+        """
+        Load cases: the vehicle near each kerb and on the centreline, at the
+        critical longitudinal positions found from the 1D influence lines.
+        """
+        deck = self.deck
+        vehicle = IRC_VEHICLES[vehicle_key]
+        contact, gauge = WHEEL_LINES.get(vehicle_key, (0.5, 1.8))
+        kerb = deck.footpath_width
+        # Transverse positions of the vehicle centreline: near the kerb and central
+        clearance = 0.15 + contact / 2 + gauge / 2
+        centres = np.unique(np.array([kerb + clearance, deck.width / 2, deck.width - kerb - clearance]))
+        lines = compute_influence_lines(deck.span_lengths, deck.continuous)
+        placements = np.array(critical_vehicle_positions(lines, vehicle))
+        offsets = np.asarray(vehicle.axle_offsets)
+        axle_loads = np.asarray(vehicle.axle_loads) / 2  # per wheel line
+
+        n_cases = len(placements) * len(centres)
+        lead = np.repeat(placements[:, 0], len(centres))
+        direction = np.repeat(placements[:, 1], len(centres))
+        centre = np.tile(centres, len(placements))
+        axle_x = lead[:, None] - direction[:, None] * offsets[None, :]  # (C, A)
+        px, py, loads, case = [], [], [], []
+        for side in (-0.5, 0.5):
+            wheel_y = centre[:, None] + side * gauge
+            px.append(axle_x + wheel_y * self.mesh.skew_tan)
+            py.append(np.broadcast_to(wheel_y, axle_x.shape))
+            loads.append(np.broadcast_to(axle_loads[None, :], axle_x.shape))
+            case.append(np.broadcast_to(np.arange(n_cases)[:, None], axle_x.shape))
+        return self.nodal_loads_from_points(*(np.concatenate([a.ravel() for a in arr]) for arr in (px, py, loads, case)),
+                                            n_cases=n_cases)
+
+    def solve(self, F: np.ndarray) -> np.ndarray:
+        """Back-substitution for any number of load cases (columns of F)"""
+        u = np.zeros_like(F)
+        u[self.free] = cho_solve_banded((self.factor, False), F[self.free], check_finite=False)
+        return u
+
+    def member_actions(self, u: np.ndarray, longitudinal_only: bool = True) -> Dict[str, np.ndarray]:
+        """Sagging moments and shears at both member ends, per metre width"""
+        m = self.members
+        sel = m['longitudinal'] if longitudinal_only else slice(None)
+        n1, n2 = m['n1'][sel], m['n2'][sel]
+        dofs = np.concatenate([3 * n1[:, None] + np.arange(3), 3 * n2[:, None] + np.arange(3)], axis=1)
+        f = np.matmul(m['actions'][sel], u[dofs])
+        width = m['width'][sel]
+        # Internal sagging moment: -f_θ1 at end 1, +f_θ2 at end 2
+        moment = np.stack([-f[:, 1, :], f[:, 2, :]], axis=1) / width[:, None, None]
+        shear = np.abs(f[:, 0, :]) / width[:, None]
+        return {'moment': moment, 'shear': shear}
+
+
+def analyse_grillage(deck: DeckSlabGeometry, vehicle_keys: Optional[Sequence[str]] = None,
+                     longitudinal_spacing: float = 1.0, transverse_spacing: float = 0.5) -> Dict[str, any]:
+    """
+    Grillage analysis of the deck. Simply-supported multi-span decks are
+    analysed span by span (identical spans share one factorisation).
+    Returns ULS moments / shears per longitudinal strip (grid line).
+    """
+    vehicle_keys = list(vehicle_keys or ['CLASS_A', 'CLASS_70R_WHEELED', 'CLASS_70R_TRACKED'])
+    if deck.continuous or len(deck.span_lengths) == 1:
+        units = [deck.span_lengths]
+    else:
+        units = [(span,) for span in deck.span_lengths]
+
+    models: Dict[Tuple[float, ...], GrillageModel] = {}
+    strips = []
+    for unit_index, unit in enumerate(units):
+        if unit not in models:
+            unit_deck = DeckSlabGeometry(**{**deck.__dict__, 'span_lengths': unit})
+            models[unit] = GrillageModel(unit_deck, longitudinal_spacing, transverse_spacing)
+        model = models[unit]
+        ny = model.mesh.shape[1]
+
+        # Uniform cases and every vehicle placement in one back-substitution
+        vehicle_loads = [model.vehicle_load_vectors(key) for key in vehicle_keys]
+        F = np.concatenate([model.uniform_load_vectors()] + vehicle_loads, axis=1)
+        actions = model.member_actions(model.solve(F))
+        moment = actions['moment'].reshape(-1, ny, 2, F.shape[1])  # (nx-1, ny, 2, cases)
+        shear = actions['shear'].reshape(-1, ny, F.shape[1])
+        dead_m, sidl_m, footpath_m = (moment[..., k] for k in range(3))
+        dead_v, sidl_v, footpath_v = (shear[..., k] for k in range(3))
+
+        live_sag = np.zeros(moment.shape[:3])
+        live_hog = np.zeros(moment.shape[:3])
+        live_v = np.zeros(shear.shape[:2])
+        first = 3
+        for key, loads in zip(vehicle_keys, vehicle_loads):
+            impact = impact_factor(IRC_VEHICLES[key], min(unit))
+            cases = slice(first, first + loads.shape[1])
+            first += loads.shape[1]
+            live_sag = np.maximum(live_sag, impact * moment[..., cases].max(axis=-1))
+            live_hog = np.minimum(live_hog, impact * moment[..., cases].min(axis=-1))
+            live_v = np.maximum(live_v, impact * shear[..., cases].max(axis=-1))
+
+        # IRC:6 Table B.2 at every member end, as in the effective width method;
+        # footpath pressure is live load, adverse only where it adds to the vehicle effect
+        design_sag = _uls(dead_m, sidl_m, live_sag + np.maximum(footpath_m, 0.0))
+        design_hog = np.minimum(_uls(dead_m, sidl_m, live_hog + np.minimum(footpath_m, 0.0)), 0.0)
+        design_v = _uls(dead_v, sidl_v, live_v + footpath_v)
+
+        y = model.mesh.y
+        for j in range(ny):
+            critical = np.unravel_index(np.argmax(design_sag[:, j, :]), design_sag[:, j, :].shape)
+            strips.append({
+                'unit': unit_index + 1,
+                'strip': j + 1,
+                'offset': float(y[j]),
+                'dead_moment': float(dead_m[:, j, :][critical]),
+                'sidl_moment': float(sidl_m[:, j, :][critical]),
+                'live_moment': float(live_sag[:, j, :][critical] + max(footpath_m[:, j, :][critical], 0.0)),
+                'design_moment': float(design_sag[:, j, :].max()),
+                'design_hogging_moment': float(design_hog[:, j, :].min()),
+                'design_shear': float(design_v[:, j].max()),
+            })
+
+    return {
+        'method': 'Grillage (banded Cholesky solver)',
+        'units': {'moment': 'kN-m/m', 'shear': 'kN/m'},
+        'strips': strips,
+        'max_design_moment': max(s['design_moment'] for s in strips),
+        'max_design_shear': max(s['design_shear'] for s in strips),
+        'mesh': {'longitudinal_lines': int(models[units[0]].mesh.shape[1]),
+                 'nodes_per_line': int(models[units[0]].mesh.shape[0]),
+                 'skew_angle': deck.skew_angle},
+    }
+
+
+def analyse_deck(deck: DeckSlabGeometry, method: str = 'effective_width', **options) -> Dict[str, any]:
+    """Entry point used by the design pipelines"""
+    if method == 'grillage':
+        if SCIPY_AVAILABLE:
+            return analyse_grillage(deck, **options)
+        result = analyse_effective_width(deck)
+        result['note'] = 'scipy not available - grillage skipped, effective width method used'
+        return result
+    return analyse_effective_width(deck)
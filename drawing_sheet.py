@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+DRAWING SHEET
+Reusable A4 drawing-sheet templates: the static frame is built once per
+sheet and Streamlit session (or worker thread)
+
+An A4 print is a sheet frame (main drawing axes, title block border, fixed
+captions such as the organisation name), a few title-block fields (project,
+levels, drawing number, date ...) and the data layers drawn on the main
+axes.  SheetTemplate describes the frame and where the fields go;
+drawing_sheet() builds the figure once per template and dpi and keeps it
+in the Streamlit session state (so it survives reruns, which Streamlit runs
+on a new thread each time) or, outside Streamlit, per thread.  Every
+further print only clears the main axes and rewrites the field texts
+before the printer draws its data layers.  No figure, axes, fonts or
+layout are rebuilt per print, and no tight_layout pass is needed because
+the layout is fixed.
+
+PNG output is blitted: the static frame is rasterised once per sheet and a
+print restores that background and draws only the main axes and the fields
+over it.  PDF output is vector-first (save_vector_pdf): linework and text
+stay vector, markers are thinned to one per cell of about half a marker at
+the print resolution, and only heavy layers (fills or point clouds with
+many vertices) are rasterised, per artist, at the print dpi.  File size and
+write time then depend on the sheet area, not on the survey density.
+"""
+
+import json
+import threading
+import matplotlib.image as mpimg
+import matplotlib.patches as patches
+import numpy as np
+import streamlit as st
+from dataclasses import asdict, dataclass, field
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import Collection, PathCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from typing import Any, Dict, IO, List, Optional, Tuple, Union
+
+# A4 landscape in inches (297mm x 210mm)
+A4_LANDSCAPE = (11.69, 8.27)
+
+Rect = Tuple[float, float, float, float]  # left, bottom, width, height (figure fractions)
+
+# Artists with more vertices or points than this are rasterised in vector output
+RASTER_VERTICES = 10000
+
+# No creation date: the same drawing always gives the same file
+PDF_METADATA = {'CreationDate': None}
+
+
+@dataclass
+class SheetText:
+    """A text in the title block (axes fractions) with matplotlib text options"""
+    x: float
+    y: float
+    text: str = ''
+    style: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SheetTemplate:
+    """Static frame of an A4 drawing sheet and the title-block fields it fills per print"""
+    name: str
+    main_rect: Rect
+    title_rect: Rect
+    captions: List[SheetText] = field(default_factory=list)
+    fields: Dict[str, SheetText] = field(default_factory=dict)
+    width_inches: float = A4_LANDSCAPE[0]
+    height_inches: float = A4_LANDSCAPE[1]
+
+    def key(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True, default=str)
+
+
+class DrawingSheet:
+    """The figure of one SheetTemplate at one dpi, reused print after print"""
+
+    def __init__(self, template: SheetTemplate, dpi: int = 300):
+        self.template = template
+        self.figure = Figure(figsize=(template.width_inches, template.height_inches), dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.ax_main = self.figure.add_axes(template.main_rect)
+        self.ax_title = self.figure.add_axes(template.title_rect)
+        self.ax_title.set_xlim(0, 1)
+        self.ax_title.set_ylim(0, 1)
+        self.ax_title.axis('off')
+
+        # Title block border
+        self.ax_title.add_patch(patches.Rectangle((0.02, 0.1), 0.96, 0.8,
+                                                  linewidth=2, edgecolor='black',
+                                                  facecolor='lightgray', alpha=0.1))
+        for caption in template.captions:
+            self.ax_title.text(caption.x, caption.y, caption.text, **caption.style)
+        self.fields = {name: self.ax_title.text(spec.x, spec.y, spec.text, **spec.style)
+                       for name, spec in template.fields.items()}
+        self._background = None
+        self.prints = 0
+
+    def new_print(self, **values: Any) -> Axes:
+        """Clear the data layers, fill the title-block fields and return the main axes"""
+        self.ax_main.cla()
+        for name, text in self.fields.items():
+            text.set_text(self.template.fields[name].text)
+        self.set_fields(**values)
+        self.prints += 1
+        return self.ax_main
+
+    def set_fields(self, **values: Any):
+        for name, value in values.items():
+            self.fields[name].set_text(str(value))
+
+    def render_rgba(self) -> np.ndarray:
+        """Full-sheet RGBA raster: the cached frame with the data layers and fields blitted on top"""
+        canvas = self.figure.canvas
+        if self._background is None:
+            dynamic = [self.ax_main, *self.fields.values()]
+            for artist in dynamic:
+                artist.set_visible(False)
+            canvas.draw()
+            self._background = canvas.copy_from_bbox(self.figure.bbox)
+            for artist in dynamic:
+                artist.set_visible(True)
+        canvas.restore_region(self._background)
+        self.figure.draw_artist(self.ax_main)
+        for text in self.fields.values():
+            self.figure.draw_artist(text)
+        return np.asarray(canvas.buffer_rgba()).copy()
+
+    def save_png(self, filename: str) -> str:
+        mpimg.imsave(filename, self.render_rgba(), format='png', dpi=self.figure.dpi)
+        return filename
+
+    def save_pdf(self, target: Union[str, IO[bytes]], dpi: Optional[int] = None) -> Union[str, IO[bytes]]:
+        return save_vector_pdf(self.figure, target, dpi or int(self.figure.dpi))
+
+
+def _marker_cells(ax: Axes, xy: np.ndarray, diameter_points: float, dpi: float) -> np.ndarray:
+    """Indices of the first point in each print cell of half a marker diameter"""
+    pixels = ax.transData.transform(xy) * (dpi / ax.figure.dpi)
+    cell = max(0.5 * diameter_points * dpi / 72.0, 1.0)
+    finite = np.all(np.isfinite(pixels), axis=1)
+    cells = np.floor(pixels[finite] / cell).astype(np.int64)
+    _, first = np.unique(cells, axis=0, return_index=True)
+    return np.sort(np.flatnonzero(finite)[first])
+
+
+def thin_markers(ax: Axes, dpi: float) -> int:
+    """
+    Drop markers that would print on top of each other: line markers via
+    markevery (the line itself keeps every vertex) and the points of
+    single-style scatter layers.  Returns the number of markers removed.
+    """
+    ax.autoscale_view()  # data limits are otherwise only settled by the first draw
+    ax.apply_aspect()
+    removed = 0
+    for line in ax.get_lines():
+        if line.get_marker() in (None, 'None', 'none', '', ' ') or line.get_markevery() is not None:
+            continue
+        xy = line.get_xydata()
+        keep = _marker_cells(ax, xy, line.get_markersize(), dpi)
+        if len(keep) < len(xy):
+            line.set_markevery(keep.tolist())
+            removed += len(xy) - len(keep)
+    for collection in ax.collections:
+        if not isinstance(collection, PathCollection):
+            continue
+        offsets = np.asarray(collection.get_offsets())
+        uniform = (len(collection.get_sizes()) <= 1 and len(collection.get_facecolors()) <= 1
+                   and len(collection.get_edgecolors()) <= 1 and collection.get_array() is None)
+        if len(offsets) < 2 or not uniform or collection.get_offset_transform() is not ax.transData:
+            continue
+        size = collection.get_sizes()
+        keep = _marker_cells(ax, offsets, float(np.sqrt(size[0])) if len(size) else 6.0, dpi)
+        if len(keep) < len(offsets):
+            collection.set_offsets(offsets[keep])
+            removed += len(offsets) - len(keep)
+    return removed
+
+
+def _vertex_count(artist: Union[Collection, Patch]) -> int:
+    if isinstance(artist, Collection):
+        paths = artist.get_paths()
+        count = sum(len(path.vertices) for path in paths)
+        return max(count, len(artist.get_offsets())) if isinstance(artist, PathCollection) else count
+    return len(artist.get_path().vertices)
+
+
+def rasterize_heavy_layers(figure: Figure, max_vertices: int = RASTER_VERTICES) -> int:
+    """Rasterise fills and point clouds with more than max_vertices; linework stays vector"""
+    rasterized = 0
+    for ax in figure.axes:
+        for artist in [*ax.collections, *ax.patches]:
+            if not artist.get_rasterized() and _vertex_count(artist) > max_vertices:
+                artist.set_rasterized(True)
+                rasterized += 1
+    return rasterized
+
+
+def vector_first(figure: Figure, dpi: int = 300, max_vertices: int = RASTER_VERTICES):
+    """Thin markers to the print resolution and rasterise heavy layers, in place"""
+    for ax in figure.axes:
+        if ax.get_visible() and ax.axison:
+            thin_markers(ax, dpi)
+    rasterize_heavy_layers(figure, max_vertices)
+
+
+def save_vector_pdf(figure: Figure, target: Union[str, IO[bytes]], dpi: int = 300,
+                    max_vertices: int = RASTER_VERTICES) -> Union[str, IO[bytes]]:
+    """
+    Vector-first PDF of a fixed-layout sheet: the raster dpi applies only to
+    the rasterised layers, and no tight bounding box pass is made
+    """
+    vector_first(figure, dpi, max_vertices)
+    figure.savefig(target, format='pdf', dpi=dpi, metadata=PDF_METADATA,
+                   facecolor='white', edgecolor='none')
+    return target
+
+
+_sheets = threading.local()
+
+# Session state key of the per-session sheet cache
+SESSION_SHEETS_KEY = '_drawing_sheets'
+
+
+def _sheet_cache() -> Dict[Tuple[str, int], DrawingSheet]:
+    """The current Streamlit session's sheets, or the current thread's outside a script run"""
+    if get_script_run_ctx(suppress_warning=True) is not None:
+        if SESSION_SHEETS_KEY not in st.session_state:
+            st.session_state[SESSION_SHEETS_KEY] = {}
+        return st.session_state[SESSION_SHEETS_KEY]
+    cache: Optional[Dict[Tuple[str, int], DrawingSheet]] = getattr(_sheets, 'cache', None)
+    if cache is None:
+        cache = _sheets.cache = {}
+    return cache
+
+
+def drawing_sheet(template: SheetTemplate, dpi: int = 300) -> DrawingSheet:
+    """
+    Cached DrawingSheet for a template and dpi, one per Streamlit session
+    (kept across reruns; concurrent sessions never draw on the same figure)
+    or per thread for batch workers.  The figure returned by a print is
+    reused by the next print on the same sheet: save or show it before
+    printing again.
+    """
+    cache = _sheet_cache()
+    key = (template.key(), int(dpi))
+    sheet = cache.get(key)
+    if sheet is None:
+        sheet = cache[key] = DrawingSheet(template, dpi)
+    return sheet
+
+
+def a4_landscape_template(name: str, captions: List[SheetText],
+                          fields: Dict[str, SheetText]) -> SheetTemplate:
+    """
+    Standard A4 landscape sheet: main drawing over a title block a quarter
+    of its height, with room above the main axes for a two-line title
+    """
+    return SheetTemplate(name, main_rect=(0.08, 0.31, 0.88, 0.59), title_rect=(0.04, 0.02, 0.92, 0.17),
+                         captions=captions, fields=fields)
@@ -192,8 +192,8 @@ class EnhancedBridgeDesignApp(BridgeDesignApp):
     
     def _calculate_comprehensive_estimate(self, pier_details: Dict, abutment_details: Dict) -> Dict[str, any]:
         """Calculate comprehensive cost estimate for entire bridge"""
-        # Initialize estimator
-        self.estimator = BridgeEstimator(self.material_data)
+        # Initialize estimator with the bar schedules of the one-click design
+        self.estimator = BridgeEstimator(self.material_data, self.design_results.get('reinforcement'))
         
         # Calculate pier quantities (using detailed geometry)
         pier_quantities = self.estimator.calculate_pier_quantities(
@@ -13,10 +13,10 @@ Author: Enhanced Bridge Design App
 Version: 2.1.0 - Complete Edition with Missing Elements
 """
 
-import json
 import os
-from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from report_engine import ReportEngine, Section, Template, default_report_path, load_results
 
 def calculate_steel_reinforcement_design(detailed_pier: Dict, pier: Dict) -> Dict[str, Any]:
     """Calculate steel reinforcement based on UIT BRIDGES Excel data"""
@@ -94,29 +94,20 @@ def calculate_scour_and_bed_protection(hydraulic: Dict, foundation: Dict) -> Dic
         'protection_cost': 850000  # Bed protection cost
     }
 
-def create_enhanced_complete_report():
-    """Generate complete report with all 11 standard bridge design sheets"""
+def create_enhanced_complete_report(results: Dict[str, Any], report_filepath: Optional[str] = None) -> str:
+    """
+    Generate complete report with all 11 standard bridge design sheets
+    
+    Streams the precompiled sheets of ENHANCED_REPORT to report_filepath,
+    by default reports/Complete_Bridge_Report_All_Sheets_<timestamp>.html
+    """
     
     print("📄 ENHANCED COMPLETE BRIDGE DESIGN REPORT GENERATOR")
     print("="*60)
     print("🔧 Including ALL missing elements from Excel subfolders")
     
-    # Load results
-    results_file = r"c:\Users\Rajkumar\Bridge_Slab_Design\sample_slab_bridge_design_results.json"
-    
-    if not os.path.exists(results_file):
-        print("❌ Bridge design results file not found!")
-        return
-    
-    with open(results_file, 'r') as f:
-        results = json.load(f)
-    
-    # Generate enhanced report with all missing elements
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    report_filename = f'Complete_Bridge_Report_All_Sheets_{timestamp}.html'
-    report_filepath = os.path.join(os.path.dirname(results_file), report_filename)
-    
-    print(f"📝 Creating enhanced report: {report_filename}")
+    report_filepath = report_filepath or default_report_path('Complete_Bridge_Report_All_Sheets')
+    print(f"📝 Creating enhanced report: {os.path.basename(report_filepath)}")
     print("📋 Including all 11 standard bridge design sheets:")
     print("   ✅ 1. Hydraulics Design")
     print("   ✅ 2. Stability Check Pier") 
@@ -130,23 +121,50 @@ def create_enhanced_complete_report():
     print("   🆕 10. Live Load Calculations") 
     print("   🆕 11. Bed Protection/Scour Analysis")
     
-    # Extract data for enhanced calculations
-    project_info = results.get('project_info', {})
+    # Write enhanced HTML file
+    ENHANCED_REPORT.write(results, report_filepath)
+    
+    print(f"✅ Enhanced complete report created: {report_filepath}")
+    
+    # Display comprehensive stats
+    file_size = os.path.getsize(report_filepath) / 1024
+    
+    print(f"\n📊 ENHANCED REPORT STATISTICS:")
+    print(f"• File size: {file_size:.1f} KB")
+    print(f"• Complete coverage: 11/11 sheets (100%)")
+    print(f"• Format: HTML (print to PDF)")
+    print(f"• New elements included: 3 missing sheets")
+    print(f"• Ready for construction implementation")
+    
+    return report_filepath
+
+
+def report_context(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Values the report sheets read, with the elements calculated from the Excel data"""
     hydraulic = results.get('hydraulic_analysis', {})
     pier = results.get('pier_design', {})
     detailed_pier = results.get('detailed_pier_geometry', {})
     foundation = results.get('foundation_design', {})
     estimation = results.get('comprehensive_estimation', {})
-    materials = estimation.get('material_summary', {})
-    cost_dist = estimation.get('cost_distribution', {})
-    
-    # Calculate missing elements based on extracted Excel data
-    steel_design = calculate_steel_reinforcement_design(detailed_pier, pier)
-    live_load_analysis = calculate_live_load_analysis(pier)
-    scour_analysis = calculate_scour_and_bed_protection(hydraulic, foundation)
-    
-    html_content = f"""
-<!DOCTYPE html>
+    return {
+        'results': results,
+        'project_info': results.get('project_info', {}),
+        'hydraulic': hydraulic,
+        'pier': pier,
+        'detailed_pier': detailed_pier,
+        'foundation': foundation,
+        'estimation': estimation,
+        # Calculate missing elements based on extracted Excel data
+        'steel_design': calculate_steel_reinforcement_design(detailed_pier, pier),
+        'live_load_analysis': calculate_live_load_analysis(pier),
+        'scour_analysis': calculate_scour_and_bed_protection(hydraulic, foundation),
+    }
+
+# ----------------------------------------------------------------------
+# Report templates and section order
+# ----------------------------------------------------------------------
+
+REPORT_HEAD = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -260,7 +278,9 @@ def create_enhanced_complete_report():
 </head>
 <body>
     <div class="container">
-        <!-- Header -->
+""", 'head')
+
+HEADER = Template("""        <!-- Header -->
         <div class="header">
             <h1>COMPLETE BRIDGE DESIGN REPORT - ALL 11 SHEETS</h1>
             <p><strong>Enhanced Edition with Missing Elements</strong></p>
@@ -268,7 +288,9 @@ def create_enhanced_complete_report():
             <p><strong>Location:</strong> {project_info.get('location', 'Sample Location')}</p>
         </div>
 
-        <!-- Sheets 1-8: Previously Included -->
+""", 'header')
+
+HYDRAULICS_SHEET = Template("""        <!-- Sheets 1-8: Previously Included -->
         <!-- Sheet 1: Hydraulics -->
         <div class="section">
             <h3>🌊 SHEET 1: HYDRAULIC ANALYSIS</h3>
@@ -306,7 +328,9 @@ def create_enhanced_complete_report():
             </div>
         </div>
 
-        <!-- Sheet 2: Pier Stability -->
+""", 'hydraulics')
+
+PIER_STABILITY_SHEET = Template("""        <!-- Sheet 2: Pier Stability -->
         <div class="section">
             <h3>🏗️ SHEET 2: PIER STABILITY CHECK</h3>
             <div class="section-content">
@@ -335,7 +359,9 @@ def create_enhanced_complete_report():
             </div>
         </div>
 
-        <!-- Sheet 3: Foundation Design -->
+""", 'pier_stability')
+
+FOUNDATION_SHEET = Template("""        <!-- Sheet 3: Foundation Design -->
         <div class="section">
             <h3>🏛️ SHEET 3: FOUNDATION DESIGN</h3>
             <div class="section-content">
@@ -364,7 +390,9 @@ def create_enhanced_complete_report():
             </div>
         </div>
 
-        <!-- NEW MISSING SHEETS -->
+""", 'foundation_design')
+
+STEEL_REINFORCEMENT_SHEET = Template("""        <!-- NEW MISSING SHEETS -->
         
         <!-- Sheet 9: Steel Reinforcement Design -->
         <div class="section new-section">
@@ -457,7 +485,9 @@ def create_enhanced_complete_report():
             </div>
         </div>
 
-        <!-- Sheet 10: Live Load Analysis -->
+""", 'steel_reinforcement')
+
+LIVE_LOAD_SHEET = Template("""        <!-- Sheet 10: Live Load Analysis -->
         <div class="section new-section">
             <h3>🚛 SHEET 10: LIVE LOAD CALCULATIONS (NEW)</h3>
             <div class="section-content">
@@ -531,7 +561,9 @@ def create_enhanced_complete_report():
             </div>
         </div>
 
-        <!-- Sheet 11: Bed Protection/Scour Analysis -->
+""", 'live_load')
+
+SCOUR_SHEET = Template("""        <!-- Sheet 11: Bed Protection/Scour Analysis -->
         <div class="section new-section">
             <h3>🌊 SHEET 11: BED PROTECTION & SCOUR ANALYSIS (NEW)</h3>
             <div class="section-content">
@@ -614,7 +646,9 @@ def create_enhanced_complete_report():
             </div>
         </div>
 
-        <!-- Cost Summary with All Elements -->
+""", 'scour_protection')
+
+COST_SUMMARY = Template("""        <!-- Cost Summary with All Elements -->
         <div class="section">
             <h3>💰 COMPLETE COST SUMMARY (ALL 11 SHEETS)</h3>
             <div class="section-content">
@@ -650,7 +684,9 @@ def create_enhanced_complete_report():
             </div>
         </div>
 
-        <!-- Final Status -->
+""", 'cost_summary')
+
+FINAL_STATUS = Template("""        <!-- Final Status -->
         <div class="section">
             <h3>✅ COMPLETE DESIGN STATUS (ALL 11 SHEETS)</h3>
             <div class="section-content">
@@ -699,7 +735,9 @@ def create_enhanced_complete_report():
             </div>
         </div>
 
-        <!-- Footer -->
+""", 'final_status')
+
+FOOTER = Template("""        <!-- Footer -->
         <div class="footer">
             <p><strong>Enhanced Complete Bridge Design Report - All 11 Sheets</strong></p>
             <p>Includes missing elements from Excel subfolders: UIT BRIDGES, KHERWARA BRIDGE</p>
@@ -708,25 +746,27 @@ def create_enhanced_complete_report():
     </div>
 </body>
 </html>
-"""
+""", 'footer')
 
-    # Write enhanced HTML file
-    with open(report_filepath, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
-    print(f"✅ Enhanced complete report created: {report_filepath}")
-    
-    # Display comprehensive stats
-    file_size = os.path.getsize(report_filepath) / 1024
-    
-    print(f"\n📊 ENHANCED REPORT STATISTICS:")
-    print(f"• File size: {file_size:.1f} KB")
-    print(f"• Complete coverage: 11/11 sheets (100%)")
-    print(f"• Format: HTML (print to PDF)")
-    print(f"• New elements included: 3 missing sheets")
-    print(f"• Ready for construction implementation")
-    
-    return report_filepath
+ENHANCED_REPORT = ReportEngine([
+    Section('head', REPORT_HEAD),
+    Section('header', HEADER),
+    Section('hydraulics', HYDRAULICS_SHEET),
+    Section('pier_stability', PIER_STABILITY_SHEET),
+    Section('foundation_design', FOUNDATION_SHEET),
+    Section('steel_reinforcement', STEEL_REINFORCEMENT_SHEET),
+    Section('live_load', LIVE_LOAD_SHEET),
+    Section('scour_protection', SCOUR_SHEET),
+    Section('cost_summary', COST_SUMMARY),
+    Section('final_status', FINAL_STATUS),
+    Section('footer', FOOTER),
+], report_context)
 
 if __name__ == "__main__":
-    create_enhanced_complete_report()
\ No newline at end of file
+    import sys
+    results_file = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'sample_slab_bridge_design_results.json')
+    if not os.path.exists(results_file):
+        print("❌ Bridge design results file not found!")
+    else:
+        create_enhanced_complete_report(load_results(results_file))
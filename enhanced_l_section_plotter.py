@@ -13,7 +13,6 @@ Enhanced longitudinal section plotting with hydraulic design features:
 Essential for hydraulic design and discharge computation
 """
 
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.figure import Figure
 import numpy as np
@@ -21,7 +20,33 @@ import streamlit as st
 import plotly.graph_objects as go
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Tuple
-from river_section_input_schema import RiverSectionInputSchema, LongitudinalSectionData, WaterLevelData
+from river_section_input_schema import (RiverSectionInputSchema, LongitudinalSectionData, WaterLevelData,
+                                        HydraulicCalculationEngine)
+from drawing_sheet import SheetText, a4_landscape_template, drawing_sheet
+from plot_decimation import MAX_TRACE_POINTS, decimated
+from chart_cache import cached_chart
+
+# A4 landscape L-section sheet: frame and fixed captions drawn once, fields per print
+L_SECTION_SHEET = a4_landscape_template(
+    'l_section_a4',
+    captions=[
+        SheetText(0.98, 0.8, "LONGITUDINAL SECTION", {'fontsize': 10, 'fontweight': 'bold', 'ha': 'right'}),
+        SheetText(0.98, 0.4, "A4 LANDSCAPE - HYDRAULIC DESIGN", {'fontsize': 8, 'ha': 'right', 'style': 'italic'}),
+    ],
+    fields={
+        # Left section
+        'project': SheetText(0.05, 0.7, style={'fontsize': 10, 'fontweight': 'bold'}),
+        'river': SheetText(0.05, 0.5, style={'fontsize': 9}),
+        'location': SheetText(0.05, 0.3, style={'fontsize': 9}),
+        # Center section
+        'total_length': SheetText(0.35, 0.7, style={'fontsize': 9}),
+        'bridge_chainage': SheetText(0.35, 0.5, style={'fontsize': 9}),
+        'discharge': SheetText(0.35, 0.3, style={'fontsize': 9}),
+        # Right section
+        'drawing_number': SheetText(0.98, 0.6, style={'fontsize': 8, 'ha': 'right'}),
+        'date': SheetText(0.98, 0.2, style={'fontsize': 8, 'ha': 'right'}),
+    },
+)
 
 class EnhancedLSectionPlotter:
     """Enhanced longitudinal section plotter for hydraulic analysis"""
@@ -30,17 +55,39 @@ class EnhancedLSectionPlotter:
         self.river_data = river_data
         self.l_section = river_data.l_section
         self.water_levels = river_data.water_levels
-        
-    def create_enhanced_l_section_plot(self) -> go.Figure:
-        """Create enhanced L-section plot with hydraulic features"""
+        self.reach = river_data.reach if river_data.reach is not None and len(river_data.reach) > 1 else None
+        self._reach_profile: Optional[Dict[str, np.ndarray]] = None
+        
+    def _profile_chainages(self, num_points: int) -> np.ndarray:
+        """Plot chainages: the surveyed sections plus an even grid"""
+        if self.reach is None:
+            return np.linspace(self.l_section.upstream_chainage, self.l_section.downstream_chainage, num_points)
+        grid = np.linspace(self.reach.chainages[0], self.reach.chainages[-1], num_points)
+        return np.union1d(grid, self.reach.chainages)
+    
+    def _backwater_profile(self) -> Dict[str, np.ndarray]:
+        """Standard-step profile of the surveyed reach (computed once)"""
+        if self._reach_profile is None:
+            self._reach_profile = self.reach.water_surface_profile(self.water_levels.design_discharge)
+        return self._reach_profile
+    
+    def _afflux_rise(self, chainages: np.ndarray) -> np.ndarray:
+        """Design afflux at the bridge, decaying upstream over the backwater length"""
+        afflux = HydraulicCalculationEngine(self.river_data).calculate_afflux()['design_afflux']
+        upstream_distance = self.l_section.bridge_chainage - chainages
+        return np.where(upstream_distance >= 0, afflux * np.exp(-upstream_distance / 25), 0.0)
+    
+    def create_enhanced_l_section_plot(self, x_range: Optional[Tuple[float, float]] = None) -> go.Figure:
+        """
+        Create enhanced L-section plot with hydraulic features.  Long profiles
+        are decimated per trace (min-max for the bed, LTTB for the smooth
+        water and energy lines); x_range plots only that chainage window, at
+        full resolution once it is narrow enough.
+        """
         
         # Generate detailed profile points
         num_points = 50
-        chainages = np.linspace(
-            self.l_section.upstream_chainage, 
-            self.l_section.downstream_chainage, 
-            num_points
-        )
+        chainages = self._profile_chainages(num_points)
         
         # Interpolate bed levels with cubic spline for smooth curve
         bed_levels = self._interpolate_bed_profile(chainages)
@@ -51,13 +98,18 @@ class EnhancedLSectionPlotter:
         # Calculate energy grade line
         energy_line = self._calculate_energy_grade_line(chainages, water_surface)
         
+        # Level of detail per trace
+        bed_x, bed_y = decimated(chainages, bed_levels, x_range=x_range)
+        water_x, water_y = decimated(chainages, water_surface, method='lttb', x_range=x_range)
+        energy_x, energy_y = decimated(chainages, energy_line, method='lttb', x_range=x_range)
+        
         # Create figure
         fig = go.Figure()
         
         # Add bed profile
         fig.add_trace(go.Scatter(
-            x=chainages,
-            y=bed_levels,
+            x=bed_x,
+            y=bed_y,
             mode='lines',
             name='River Bed Profile',
             line=dict(color='saddlebrown', width=3),
@@ -68,8 +120,8 @@ class EnhancedLSectionPlotter:
         
         # Add water surface profile
         fig.add_trace(go.Scatter(
-            x=chainages,
-            y=water_surface,
+            x=water_x,
+            y=water_y,
             mode='lines',
             name='Water Surface (HFL)',
             line=dict(color='blue', width=2, dash='solid'),
@@ -78,8 +130,8 @@ class EnhancedLSectionPlotter:
         
         # Add energy grade line
         fig.add_trace(go.Scatter(
-            x=chainages,
-            y=energy_line,
+            x=energy_x,
+            y=energy_y,
             mode='lines',
             name='Energy Grade Line',
             line=dict(color='red', width=2, dash='dot'),
@@ -88,8 +140,8 @@ class EnhancedLSectionPlotter:
         
         # Fill water area
         fig.add_trace(go.Scatter(
-            x=chainages,
-            y=water_surface,
+            x=water_x,
+            y=water_y,
             fill='tonexty',
             fillcolor='rgba(65, 105, 225, 0.3)',
             line=dict(width=0),
@@ -161,11 +213,15 @@ class EnhancedLSectionPlotter:
             linewidth=2,
             linecolor='black'
         )
-        
+        if x_range is not None:
+            fig.update_xaxes(range=list(x_range))
+
         return fig
-    
+
     def _interpolate_bed_profile(self, chainages: np.ndarray) -> np.ndarray:
         """Interpolate bed profile with smooth curve"""
+        if self.reach is not None:
+            return self.reach.bed_level_at(chainages)
         
         # Key points for interpolation
         key_chainages = [
@@ -190,6 +246,10 @@ class EnhancedLSectionPlotter:
     
     def _calculate_water_surface_profile(self, chainages: np.ndarray, bed_levels: np.ndarray) -> np.ndarray:
         """Calculate water surface profile considering hydraulic principles"""
+        if self.reach is not None:
+            profile = self._backwater_profile()
+            return (np.interp(chainages, profile['chainage'], profile['water_surface'])
+                    + self._afflux_rise(chainages))
         
         # Base water level at HFL
         base_level = self.water_levels.hfl
@@ -225,6 +285,10 @@ class EnhancedLSectionPlotter:
     
     def _calculate_energy_grade_line(self, chainages: np.ndarray, water_surface: np.ndarray) -> np.ndarray:
         """Calculate energy grade line"""
+        if self.reach is not None:
+            profile = self._backwater_profile()
+            return (np.interp(chainages, profile['chainage'], profile['energy_level'])
+                    + self._afflux_rise(chainages))
         
         # Velocity head calculation
         velocity = self.water_levels.velocity_at_hfl  # m/s
@@ -391,19 +455,22 @@ class EnhancedLSectionPlotter:
         ]
     
     def create_a4_l_section_print(self, project_info: Optional[Dict[str, Any]] = None) -> Figure:
-        """Create A4 printable L-section for hydraulic design"""
+        """
+        Create A4 printable L-section for hydraulic design
+
+        The sheet frame and title block are cached (L_SECTION_SHEET); each
+        call redraws only the profile and the title-block fields, on the
+        same figure as the previous call.
+        """
         
-        # A4 landscape dimensions
-        fig, (ax_main, ax_title) = plt.subplots(2, 1, figsize=(11.69, 8.27), 
-                                               gridspec_kw={'height_ratios': [4, 1]}, dpi=300)
+        # A4 landscape sheet with its frame already drawn
+        sheet = drawing_sheet(L_SECTION_SHEET, dpi=300)
+        ax_main = sheet.new_print()
+        fig = sheet.figure
         
         # Generate profile data
         num_points = 100
-        chainages = np.linspace(
-            self.l_section.upstream_chainage, 
-            self.l_section.downstream_chainage, 
-            num_points
-        )
+        chainages = self._profile_chainages(num_points)
         
         bed_levels = self._interpolate_bed_profile(chainages)
         water_surface = self._calculate_water_surface_profile(chainages, bed_levels)
@@ -477,40 +544,20 @@ class EnhancedLSectionPlotter:
                          f'Hydraulic Design Profile with Energy Grade Line',
                          fontsize=14, fontweight='bold', pad=20)
         
-        # Create title block
-        ax_title.set_xlim(0, 1)
-        ax_title.set_ylim(0, 1)
-        ax_title.axis('off')
-        
-        # Title block border
-        title_rect = patches.Rectangle((0.02, 0.1), 0.96, 0.8, 
-                                     linewidth=2, edgecolor='black', 
-                                     facecolor='lightgray', alpha=0.1)
-        ax_title.add_patch(title_rect)
-        
         # Title block content
         if project_info is None:
             project_info = {}
         
-        # Left section
-        ax_title.text(0.05, 0.7, f"Project: {project_info.get('project_name', self.river_data.project_name)}", 
-                     fontsize=10, fontweight='bold')
-        ax_title.text(0.05, 0.5, f"River: {self.river_data.river_name}", fontsize=9)
-        ax_title.text(0.05, 0.3, f"Location: {self.river_data.location}", fontsize=9)
-        
-        # Center section
-        ax_title.text(0.35, 0.7, f"Total Length: {self.l_section.downstream_chainage - self.l_section.upstream_chainage:.0f}m", 
-                     fontsize=9)
-        ax_title.text(0.35, 0.5, f"Bridge at Ch: {self.l_section.bridge_chainage:.0f}m", fontsize=9)
-        ax_title.text(0.35, 0.3, f"Design Discharge: {self.water_levels.design_discharge:.0f} cumecs", fontsize=9)
-        
-        # Right section
-        ax_title.text(0.98, 0.8, "LONGITUDINAL SECTION", fontsize=10, fontweight='bold', ha='right')
-        ax_title.text(0.98, 0.6, f"Drawing No: LS-{datetime.now().strftime('%Y%m%d')}-001", fontsize=8, ha='right')
-        ax_title.text(0.98, 0.4, "A4 LANDSCAPE - HYDRAULIC DESIGN", fontsize=8, ha='right', style='italic')
-        ax_title.text(0.98, 0.2, f"Date: {datetime.now().strftime('%d-%m-%Y')}", fontsize=8, ha='right')
-        
-        plt.tight_layout()
+        sheet.set_fields(
+            project=f"Project: {project_info.get('project_name', self.river_data.project_name)}",
+            river=f"River: {self.river_data.river_name}",
+            location=f"Location: {self.river_data.location}",
+            total_length=f"Total Length: {self.l_section.downstream_chainage - self.l_section.upstream_chainage:.0f}m",
+            bridge_chainage=f"Bridge at Ch: {self.l_section.bridge_chainage:.0f}m",
+            discharge=f"Design Discharge: {self.water_levels.design_discharge:.0f} cumecs",
+            drawing_number=f"Drawing No: LS-{datetime.now().strftime('%Y%m%d')}-001",
+            date=f"Date: {datetime.now().strftime('%d-%m-%Y')}",
+        )
         return fig
 
 def add_enhanced_l_section_to_app():
@@ -557,8 +604,12 @@ def add_enhanced_l_section_to_app():
     
     try:
         if plot_type == "Interactive":
-            # Create enhanced interactive plot
-            fig = plotter.create_enhanced_l_section_plot()
+            # Create enhanced interactive plot (long reaches: zoom by chainage window for full detail)
+            x_range = None
+            if plotter.reach is not None and len(plotter.reach) > MAX_TRACE_POINTS:
+                first, last = float(plotter.reach.chainages[0]), float(plotter.reach.chainages[-1])
+                x_range = st.slider("Chainage window (m)", first, last, (first, last), key="l_section_window")
+            fig = cached_chart(plotter.create_enhanced_l_section_plot, x_range, depends_on=plotter.river_data)
             st.plotly_chart(fig, use_container_width=True)
         
         # A4 Print option
@@ -588,15 +639,10 @@ def add_enhanced_l_section_to_app():
                     # Save and provide download
                     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                     
-                    # Save as PDF
-                    pdf_filename = f'L_Section_A4_{timestamp}.pdf'
-                    fig.savefig(pdf_filename, format='pdf', dpi=300, bbox_inches='tight',
-                               facecolor='white', edgecolor='none')
-                    
-                    # Save as PNG
-                    png_filename = f'L_Section_A4_{timestamp}.png'
-                    fig.savefig(png_filename, format='png', dpi=300, bbox_inches='tight',
-                               facecolor='white', edgecolor='none')
+                    # Save as PDF (vector-first) and PNG (blitted full sheet)
+                    sheet = drawing_sheet(L_SECTION_SHEET, dpi=300)
+                    pdf_filename = sheet.save_pdf(f'L_Section_A4_{timestamp}.pdf')
+                    png_filename = sheet.save_png(f'L_Section_A4_{timestamp}.png')
                     
                     # Download buttons
                     st.markdown("### 📥 Download A4 Ready Files")
@@ -9,6 +9,7 @@ import json
 import io
 import base64
 from datetime import datetime
+from chart_cache import cached_chart
 
 st.set_page_config(
     page_title="Final Integrated Bridge Hydraulic System",
@@ -490,6 +491,49 @@ class FinalIntegratedHydraulicSystem:
         """
         return report_html
 
+def document_type_chart(content_types):
+    """Pie of the DOC files by document type"""
+    fig = go.Figure(data=[
+        go.Pie(
+            labels=[t.replace('_', ' ').title() for t in content_types],
+            values=[data['count'] for data in content_types.values()],
+            hole=0.3,
+            textinfo='label+percent+value'
+        )
+    ])
+
+    fig.update_layout(
+        title="Distribution of Document Types",
+        height=400,
+        template='plotly_white'
+    )
+    return fig
+
+def project_document_chart(project_data):
+    """Bar chart of the DOC files per bridge project"""
+    file_counts = [data['file_count'] for data in project_data.values()]
+
+    fig = go.Figure(data=[
+        go.Bar(
+            x=list(project_data.keys()),
+            y=file_counts,
+            marker_color='lightblue',
+            text=file_counts,
+            textposition='auto'
+        )
+    ])
+
+    fig.update_layout(
+        title="Document Count by Bridge Project",
+        xaxis_title="Project",
+        yaxis_title="Number of Documents",
+        height=400,
+        template='plotly_white'
+    )
+
+    fig.update_xaxes(tickangle=45)
+    return fig
+
 def main():
     st.title("🌊 Final Integrated Bridge Hydraulic System")
     st.subheader("Complete Bundan River Bridge Analysis with Excel Data Integration")
@@ -582,7 +626,7 @@ def main():
     elif analysis_type == "📊 Cross Section Analysis":
         st.header("📊 Cross Section Analysis")
         
-        fig = system.create_comprehensive_cross_section()
+        fig = cached_chart(system.create_comprehensive_cross_section, depends_on=system.data)
         st.plotly_chart(fig, use_container_width=True)
         
         # Display data table
@@ -612,7 +656,7 @@ def main():
     elif analysis_type == "📈 Longitudinal Section":
         st.header("📈 Longitudinal Section Analysis")
         
-        fig = system.create_longitudinal_section()
+        fig = cached_chart(system.create_longitudinal_section, depends_on=system.data)
         st.plotly_chart(fig, use_container_width=True)
         
         # Slope analysis
@@ -668,53 +712,13 @@ def main():
         st.subheader("📊 Document Type Distribution")
         
         content_types = system.doc_data['content_types']
-        doc_types = list(content_types.keys())
-        counts = [data['count'] for data in content_types.values()]
-        
-        fig = go.Figure(data=[
-            go.Pie(
-                labels=[t.replace('_', ' ').title() for t in doc_types],
-                values=counts,
-                hole=0.3,
-                textinfo='label+percent+value'
-            )
-        ])
-        
-        fig.update_layout(
-            title="Distribution of Document Types",
-            height=400,
-            template='plotly_white'
-        )
-        
+        fig = cached_chart(document_type_chart, content_types)
         st.plotly_chart(fig, use_container_width=True)
         
         # Project breakdown
         st.subheader("🏢 Document Distribution by Project")
         
-        project_data = system.doc_data['project_breakdown']
-        projects = list(project_data.keys())
-        file_counts = [data['file_count'] for data in project_data.values()]
-        
-        fig = go.Figure(data=[
-            go.Bar(
-                x=projects,
-                y=file_counts,
-                marker_color='lightblue',
-                text=file_counts,
-                textposition='auto'
-            )
-        ])
-        
-        fig.update_layout(
-            title="Document Count by Bridge Project",
-            xaxis_title="Project",
-            yaxis_title="Number of Documents",
-            height=400,
-            template='plotly_white'
-        )
-        
-        fig.update_xaxes(tickangle=45)
-        
+        fig = cached_chart(project_document_chart, system.doc_data['project_breakdown'])
         st.plotly_chart(fig, use_container_width=True)
         
         # Detailed content table
@@ -735,7 +739,7 @@ def main():
     elif analysis_type == "💧 Afflux Analysis":
         st.header("💧 Detailed Afflux Analysis")
         
-        fig = system.create_afflux_analysis()
+        fig = cached_chart(system.create_afflux_analysis, depends_on=system.data)
         st.plotly_chart(fig, use_container_width=True)
         
         params = system.get_parameters()
@@ -766,7 +770,7 @@ def main():
     elif analysis_type == "⚓ Anchorage Design":
         st.header("⚓ Deck Anchorage Design")
         
-        fig = system.create_anchorage_design()
+        fig = cached_chart(system.create_anchorage_design, depends_on=system.data)
         st.plotly_chart(fig, use_container_width=True)
         
         params = system.get_parameters()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+FOOTING PRESSURE SOLVER
+No-tension biaxial contact pressure under rectangular footings
+
+Replaces the "2P/(L×B) and 10% area in tension" approximation of the
+FOOTING DESIGN sheet (Rows 17-25) once the resultant leaves the kern.
+
+The soil is modelled as a no-tension Winkler bed, so the contact pressure is
+a plane q(x, y) = a + b·x + c·y cut off at zero.  The neutral axis is the line
+q = 0 and the compressed zone is the footing rectangle clipped by q > 0.
+Equilibrium requires
+
+    ∫q dA = P,   ∫q·x dA = P·e_L,   ∫q·y dA = P·e_B
+
+over the compressed zone.  Because q vanishes on the neutral axis, the
+Jacobian of these equations is exactly the moment matrix of the compressed
+polygon, so each Newton step is a 3×3 solve against closed-form polygon
+moments (shoelace formulas).  All operations are vectorized, so whole trial
+grids of footings / load cases are solved in one call.
+
+Sign convention: x along footing length L, y along footing width B, origin at
+the footing centroid.
+"""
+
+import numpy as np
+from typing import Dict, Union
+
+ArrayLike = Union[float, np.ndarray]
+
+# ============================================================================
+# POLYGON KERNELS
+# ============================================================================
+
+def _clip_rectangles(length: np.ndarray, width: np.ndarray, a: np.ndarray,
+                     b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+    Clip each footing rectangle by the half-plane a + b·x + c·y >= 0.
+    Returns an (N, 8, 2) vertex array; unused slots repeat the first vertex
+    so they form zero-length edges in the shoelace sums.
+    """
+    hl, hw = 0.5 * length, 0.5 * width
+    # Counter-clockwise rectangle corners
+    xs = np.stack([-hl, hl, hl, -hl], axis=1)
+    ys = np.stack([-hw, -hw, hw, hw], axis=1)
+    q = a[:, None] + b[:, None] * xs + c[:, None] * ys
+
+    xs_next = np.roll(xs, -1, axis=1)
+    ys_next = np.roll(ys, -1, axis=1)
+    q_next = np.roll(q, -1, axis=1)
+
+    inside = q >= 0
+    crossing = (q >= 0) != (q_next >= 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(crossing, q / (q - q_next), 0.0)
+    x_cross = xs + t * (xs_next - xs)
+    y_cross = ys + t * (ys_next - ys)
+
+    # Sutherland-Hodgman for a single clip plane: every edge emits its start
+    # vertex (if inside) followed by the crossing point (if any).
+    out_x = np.stack([xs, x_cross], axis=2).reshape(len(a), 8)
+    out_y = np.stack([ys, y_cross], axis=2).reshape(len(a), 8)
+    valid = np.stack([inside, crossing], axis=2).reshape(len(a), 8)
+
+    # Compact valid vertices to the front, keeping their cyclic order
+    order = np.argsort(~valid, axis=1, kind='stable')
+    out_x = np.take_along_axis(out_x, order, axis=1)
+    out_y = np.take_along_axis(out_y, order, axis=1)
+    valid = np.take_along_axis(valid, order, axis=1)
+    out_x = np.where(valid, out_x, out_x[:, :1])
+    out_y = np.where(valid, out_y, out_y[:, :1])
+    return np.stack([out_x, out_y], axis=2)
+
+
+def _polygon_moment_matrix(vertices: np.ndarray) -> np.ndarray:
+    """
+    Moment matrix [[A, Sx, Sy], [Sx, Ixx, Ixy], [Sy, Ixy, Iyy]] of each
+    polygon, with Sx = ∫x dA, Ixx = ∫x² dA etc. about the footing centroid.
+    """
+    x0, y0 = vertices[..., 0], vertices[..., 1]
+    x1, y1 = np.roll(x0, -1, axis=1), np.roll(y0, -1, axis=1)
+    cross = x0 * y1 - x1 * y0
+
+    area = 0.5 * cross.sum(axis=1)
+    sx = ((x0 + x1) * cross).sum(axis=1) / 6.0
+    sy = ((y0 + y1) * cross).sum(axis=1) / 6.0
+    ixx = ((x0 * x0 + x0 * x1 + x1 * x1) * cross).sum(axis=1) / 12.0
+    iyy = ((y0 * y0 + y0 * y1 + y1 * y1) * cross).sum(axis=1) / 12.0
+    ixy = ((x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0) * cross).sum(axis=1) / 24.0
+
+    return np.stack([
+        np.stack([area, sx, sy], axis=1),
+        np.stack([sx, ixx, ixy], axis=1),
+        np.stack([sy, ixy, iyy], axis=1),
+    ], axis=1)
+
+# ============================================================================
+# BIAXIAL NO-TENSION SOLVER
+# ============================================================================
+
+def solve_base_pressure(length: ArrayLike, width: ArrayLike, vertical_load: ArrayLike,
+                        moment_l: ArrayLike = 0.0, moment_t: ArrayLike = 0.0,
+                        max_iterations: int = 60, tolerance: float = 1e-9) -> Dict[str, np.ndarray]:
+    """
+    Exact contact pressure under rectangular footings with no soil tension.
+
+    All arguments broadcast against each other, so a trial grid of footing
+    sizes, a set of load cases, or both can be solved in one call.
+
+    Args:
+        length: Footing length L (m), direction of moment_l
+        width: Footing width B (m), direction of moment_t
+        vertical_load: Total vertical load P (kN), must be positive
+        moment_l: Moment producing eccentricity along L (kN-m)
+        moment_t: Moment producing eccentricity along B (kN-m)
+
+    Returns:
+        Dict of arrays (broadcast shape) with max/min pressure, compressed
+        and tension areas, contact ratio, plane coefficients (a, b, c) of the
+        neutral axis a + b·x + c·y = 0, and a 'stable' flag that is False when
+        the resultant falls outside the footing (overturning).
+    """
+    L, B, P, ML, MT = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (length, width, vertical_load, moment_l, moment_t))
+    )
+    shape = L.shape
+    L, B, P, ML, MT = (v.ravel() for v in (L, B, P, ML, MT))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        e_l = np.where(P > 0, ML / P, np.inf)
+        e_t = np.where(P > 0, MT / P, np.inf)
+
+    full_area = L * B
+    # Resultant must lie strictly inside the footing for equilibrium
+    stable = (P > 0) & (np.abs(e_l) < 0.5 * L) & (np.abs(e_t) < 0.5 * B)
+    e_l_s = np.where(stable, e_l, 0.0)
+    e_t_s = np.where(stable, e_t, 0.0)
+
+    # Elastic full-contact plane as the starting point (exact inside the kern)
+    a = P / full_area
+    b = 12.0 * P * e_l_s / (B * L ** 3)
+    c = 12.0 * P * e_t_s / (L * B ** 3)
+    rhs = np.stack([P, P * e_l_s, P * e_t_s], axis=1)
+
+    corner_x = np.stack([-0.5 * L, 0.5 * L, 0.5 * L, -0.5 * L], axis=1)
+    corner_y = np.stack([-0.5 * B, -0.5 * B, 0.5 * B, 0.5 * B], axis=1)
+
+    converged = np.zeros_like(stable)
+    active = stable.copy()
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+        idx = np.nonzero(active)[0]
+        polygon = _clip_rectangles(L[idx], B[idx], a[idx], b[idx], c[idx])
+        moments = _polygon_moment_matrix(polygon)
+        coeffs = np.linalg.solve(moments, rhs[idx][..., None])[..., 0]
+
+        change = np.abs(coeffs - np.stack([a[idx], b[idx], c[idx]], axis=1))
+        scale = np.maximum(np.abs(coeffs[:, 0]), 1e-12)
+        done = (change[:, 0] / scale <= tolerance) & \
+               (change[:, 1] * L[idx] / scale <= tolerance) & \
+               (change[:, 2] * B[idx] / scale <= tolerance)
+
+        a[idx], b[idx], c[idx] = coeffs[:, 0], coeffs[:, 1], coeffs[:, 2]
+        converged[idx[done]] = True
+        active[idx[done]] = False
+
+    polygon = _clip_rectangles(L, B, a, b, c)
+    compressed_area = np.where(stable, _polygon_moment_matrix(polygon)[:, 0, 0], 0.0)
+
+    corner_q = a[:, None] + b[:, None] * corner_x + c[:, None] * corner_y
+    max_pressure = np.where(stable, corner_q.max(axis=1), np.inf)
+    min_pressure = np.where(stable, np.maximum(corner_q.min(axis=1), 0.0), 0.0)
+    compressed_area = np.clip(compressed_area, 0.0, full_area)
+    # Numerical dust when the whole base is in contact
+    full_contact = stable & (corner_q.min(axis=1) >= -1e-9 * np.maximum(max_pressure, 1.0))
+    compressed_area = np.where(full_contact, full_area, compressed_area)
+
+    results = {
+        'eccentricity_longitudinal': e_l,
+        'eccentricity_transverse': e_t,
+        'max_pressure': max_pressure,
+        'min_pressure': min_pressure,
+        'compressed_area': compressed_area,
+        'area_in_tension': full_area - compressed_area,
+        'contact_ratio': compressed_area / full_area,
+        'plane_a': a,
+        'plane_b': b,
+        'plane_c': c,
+        'stable': stable,
+        'converged': converged | ~stable,
+    }
+    return {key: value.reshape(shape) for key, value in results.items()}
+
+
+def base_pressure_summary(length: float, width: float, vertical_load: float,
+                          moment_l: float = 0.0, moment_t: float = 0.0) -> Dict[str, float]:
+    """Scalar wrapper returning plain floats for result dictionaries and reports."""
+    solved = solve_base_pressure(length, width, vertical_load, moment_l, moment_t)
+    summary = {key: value.item() for key, value in solved.items()}
+    summary['stable'] = bool(summary['stable'])
+    summary['converged'] = bool(summary['converged'])
+    return summary
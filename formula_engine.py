@@ -0,0 +1,547 @@
+#!/usr/bin/env python3
+"""
+FORMULA ENGINE
+Spreadsheet-style dependency graph for Excel-like variable registries
+
+A registry maps variable names to {'value', 'formula', ...} records, as in
+StabilityAnalysisApp.setup_variables.  Formulas use Excel syntax:
+
+    =Q/A_cross          =1.34*(Q²/f)^(1/3)          =IF(L_eff>9,1.25,1.5)
+
+Each formula is parsed once into a restricted Python AST (numbers, names,
+arithmetic, comparisons and whitelisted Excel functions) and compiled.  The
+names it uses become edges of a DAG, so the registry is evaluated in
+topological order, edits recompute only the dirty downstream nodes, and
+circular references are reported instead of looping.
+
+For what-if batches the same ASTs are compiled into NumPy kernels: every
+formula of the sheet becomes one line of a generated function, so a single
+call evaluates the whole sheet over arrays of inputs (e.g. 10,000
+discharge / silt-factor scenarios).  Kernels are cached by a hash of the
+formulas they were built from.
+
+Formulas that point at cells of other sheets (=Survey.C5, =INPUT!C4,
+=SUM(Loads.C4:C8)) or use names that are not in the registry cannot be
+evaluated here; those variables stay inputs that keep their stored value,
+and the graph reports why.
+"""
+
+import ast
+import hashlib
+import keyword
+import math
+import re
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache, reduce
+from types import CodeType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# ============================================================================
+# ERRORS
+# ============================================================================
+
+class FormulaError(ValueError):
+    """Formula cannot be parsed or evaluated"""
+
+
+class CircularReferenceError(FormulaError):
+    """Formulas reference each other in a cycle"""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__("Circular reference: " + " → ".join(cycle + cycle[:1]))
+
+# ============================================================================
+# EXCEL FUNCTIONS
+# ============================================================================
+
+def _excel_if(condition, if_true, if_false=0.0):
+    return if_true if condition else if_false
+
+
+def _excel_round(value, digits=0):
+    return round(value, int(digits))
+
+
+SCALAR_FUNCTIONS = {
+    'IF': _excel_if,
+    'MIN': min,
+    'MAX': max,
+    'SUM': lambda *values: sum(values),
+    'AVERAGE': lambda *values: sum(values) / len(values),
+    'ABS': abs,
+    'SQRT': math.sqrt,
+    'EXP': math.exp,
+    'LN': math.log,
+    'LOG10': math.log10,
+    'ROUND': _excel_round,
+    'AND': lambda *values: all(values),
+    'OR': lambda *values: any(values),
+    'NOT': lambda value: not value,
+    'PI': lambda: math.pi,
+    'SIN': math.sin,
+    'COS': math.cos,
+    'TAN': math.tan,
+    'RADIANS': math.radians,
+}
+
+VECTOR_FUNCTIONS = {
+    'IF': lambda condition, if_true, if_false=0.0: np.where(condition, if_true, if_false),
+    'MIN': lambda *values: reduce(np.minimum, values),
+    'MAX': lambda *values: reduce(np.maximum, values),
+    'SUM': lambda *values: reduce(np.add, values),
+    'AVERAGE': lambda *values: reduce(np.add, values) / len(values),
+    'ABS': np.abs,
+    'SQRT': np.sqrt,
+    'EXP': np.exp,
+    'LN': np.log,
+    'LOG10': np.log10,
+    'ROUND': lambda value, digits=0: np.round(value, int(digits)),
+    'AND': lambda *values: reduce(np.logical_and, values),
+    'OR': lambda *values: reduce(np.logical_or, values),
+    'NOT': np.logical_not,
+    'PI': lambda: np.pi,
+    'SIN': np.sin,
+    'COS': np.cos,
+    'TAN': np.tan,
+    'RADIANS': np.radians,
+}
+
+# Function names are mangled so that a variable may share a function's name
+# (the registry has a variable 'IF' defined by =IF(...))
+_FUNCTION_PREFIX = '_xl_'
+
+# ============================================================================
+# PARSING
+# ============================================================================
+
+# INPUT!C4, Survey.C5, Loads.C4:C8, $B$2 ... - references to worksheet cells
+_CELL_REFERENCE = re.compile(
+    r"(?:\b[A-Za-z_]\w*[!.])?\$?\b[A-Z]{1,3}\$?\d+\b(?::\$?[A-Z]{1,3}\$?\d+)?"
+)
+_SHEET_REFERENCE = re.compile(r"\b[A-Za-z_]\w*(?:!|\.(?=\$?[A-Z]{1,3}\$?\d))")
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.Call, ast.Name, ast.Load,
+    ast.Constant, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.USub, ast.UAdd,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+
+@dataclass(frozen=True)
+class ParsedFormula:
+    """Result of parsing one formula string"""
+    text: str
+    expression: Optional[str]  # Python source of the translated formula
+    dependencies: Tuple[str, ...]  # registry names the formula reads
+    code: Optional[CodeType]
+    tree: Optional[ast.Expression]
+    external: bool  # refers to worksheet cells outside the registry
+    error: Optional[str] = None
+
+    @property
+    def evaluable(self) -> bool:
+        return self.code is not None
+
+
+def _translate(body: str) -> str:
+    """Excel operators to Python operators"""
+    body = body.replace('²', '**2').replace('³', '**3').replace('^', '**')
+    body = body.replace('<>', '!=')
+    # A lone '=' inside a formula is a comparison
+    return re.sub(r'(?<![<>!=])=(?!=)', '==', body)
+
+
+class _FunctionRenamer(ast.NodeTransformer):
+    def visit_Call(self, node: ast.Call) -> ast.Call:
+        self.generic_visit(node)
+        if not isinstance(node.func, ast.Name):
+            raise FormulaError("Only Excel function calls are allowed")
+        name = node.func.id.upper()
+        if name not in SCALAR_FUNCTIONS:
+            raise FormulaError(f"Unknown function {node.func.id}()")
+        if node.keywords:
+            raise FormulaError("Keyword arguments are not allowed")
+        node.func = ast.copy_location(ast.Name(id=_FUNCTION_PREFIX + name, ctx=ast.Load()), node.func)
+        return node
+
+
+@lru_cache(maxsize=4096)
+def parse_formula(text: str) -> ParsedFormula:
+    """
+    Parse an Excel-style formula ('=...').  Plain values (no leading '=')
+    and formulas with worksheet references parse as non-evaluable.
+    """
+    if not isinstance(text, str) or not text.strip().startswith('='):
+        return ParsedFormula(text, None, (), None, None, external=False,
+                             error=None if text is None else 'Not a formula')
+    body = text.strip()[1:]
+    if _SHEET_REFERENCE.search(body) or _CELL_REFERENCE.search(body):
+        return ParsedFormula(text, None, (), None, None, external=True,
+                             error='References worksheet cells')
+
+    expression = _translate(body)
+    try:
+        tree = ast.parse(expression, mode='eval')
+        for node in ast.walk(tree):
+            if not isinstance(node, _ALLOWED_NODES):
+                raise FormulaError(f"Unsupported syntax: {type(node).__name__}")
+            if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+                raise FormulaError("Only numeric constants are allowed")
+        tree = ast.fix_missing_locations(_FunctionRenamer().visit(tree))
+    except (SyntaxError, FormulaError) as exc:
+        message = f"Syntax error: {exc.msg}" if isinstance(exc, SyntaxError) else str(exc)
+        return ParsedFormula(text, expression, (), None, None, external=False, error=message)
+
+    dependencies = sorted({node.id for node in ast.walk(tree)
+                           if isinstance(node, ast.Name) and not node.id.startswith(_FUNCTION_PREFIX)})
+    code = compile(tree, f'<formula {text}>', 'eval')
+    return ParsedFormula(text, expression, tuple(dependencies), code, tree, external=False)
+
+# ============================================================================
+# NUMPY KERNELS
+# ============================================================================
+
+_VECTOR_NAMESPACE = {'__builtins__': {},
+                     **{_FUNCTION_PREFIX + name: fn for name, fn in VECTOR_FUNCTIONS.items()}}
+
+# Compiled kernels by formula hash (single formulas and whole sheets)
+_KERNEL_CACHE: Dict[str, Callable[..., Any]] = {}
+
+
+def formula_hash(*formulas: str) -> str:
+    """Stable hash of one or more formula strings"""
+    digest = hashlib.sha256()
+    for text in formulas:
+        digest.update(text.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def _check_identifier(name: str) -> None:
+    if not name.isidentifier() or keyword.iskeyword(name) or name.startswith(_FUNCTION_PREFIX):
+        raise FormulaError(f"'{name}' cannot be used as a kernel variable name")
+
+
+def compile_kernel(formula: str) -> Callable[..., Any]:
+    """
+    NumPy kernel of a single formula, called with its dependencies as
+    keyword arguments (scalars or broadcastable arrays).
+    """
+    parsed = parse_formula(formula)
+    if not parsed.evaluable:
+        raise FormulaError(f"Cannot compile {formula!r}: {parsed.error}")
+    key = 'formula:' + formula_hash(formula)
+    kernel = _KERNEL_CACHE.get(key)
+    if kernel is None:
+        for name in parsed.dependencies:
+            _check_identifier(name)
+        source = (f"def kernel({', '.join(parsed.dependencies)}):\n"
+                  f"    return {ast.unparse(parsed.tree)}\n")
+        namespace = dict(_VECTOR_NAMESPACE)
+        exec(compile(source, f'<kernel {formula}>', 'exec'), namespace)
+        kernel = namespace['kernel']
+        _KERNEL_CACHE[key] = kernel
+    return lambda **inputs: kernel(**{name: inputs[name] for name in parsed.dependencies})
+
+
+@dataclass(frozen=True)
+class SheetKernel:
+    """A whole sheet compiled to one NumPy function"""
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    source: str
+    function: Callable[..., Tuple[Any, ...]]
+
+    def __call__(self, **inputs) -> Dict[str, np.ndarray]:
+        missing = [name for name in self.inputs if name not in inputs]
+        if missing:
+            raise FormulaError(f"Missing kernel inputs: {missing}")
+        arrays = {name: np.asarray(inputs[name], dtype=float) for name in self.inputs}
+        # IF() evaluates both branches over arrays; the discarded branch may warn
+        with np.errstate(all='ignore'):
+            results = self.function(**arrays)
+        shape = np.broadcast_shapes(*(a.shape for a in arrays.values())) if arrays else ()
+        return {name: np.broadcast_to(np.asarray(value, dtype=float), shape)
+                for name, value in zip(self.outputs, results)}
+
+
+def compile_sheet(formulas: List[Tuple[str, str]], inputs: Iterable[str]) -> SheetKernel:
+    """
+    Compile (name, formula) pairs, already in evaluation order, into one
+    kernel taking the inputs as keyword arguments and returning every name.
+    """
+    inputs = tuple(sorted(inputs))
+    outputs = tuple(name for name, _ in formulas)
+    key = 'sheet:' + formula_hash(*inputs, *(f'{name}{formula}' for name, formula in formulas))
+    kernel = _KERNEL_CACHE.get(key)
+    if kernel is None:
+        lines = [f"def sheet({', '.join(inputs)}):"]
+        for name in inputs + outputs:
+            _check_identifier(name)
+        for name, formula in formulas:
+            parsed = parse_formula(formula)
+            if not parsed.evaluable:
+                raise FormulaError(f"Cannot compile {name} = {formula!r}: {parsed.error}")
+            lines.append(f"    {name} = {ast.unparse(parsed.tree)}")
+        lines.append(f"    return ({''.join(name + ', ' for name in outputs)})")
+        source = '\n'.join(lines) + '\n'
+        namespace = dict(_VECTOR_NAMESPACE)
+        exec(compile(source, '<sheet kernel>', 'exec'), namespace)
+        kernel = SheetKernel(inputs, outputs, source, namespace['sheet'])
+        _KERNEL_CACHE[key] = kernel
+    return kernel
+
+# ============================================================================
+# DEPENDENCY GRAPH
+# ============================================================================
+
+_SCALAR_NAMESPACE = {'__builtins__': {},
+                     **{_FUNCTION_PREFIX + name: fn for name, fn in SCALAR_FUNCTIONS.items()}}
+
+
+class FormulaGraph:
+    """
+    Dependency graph over a variable registry.
+
+    The registry dictionaries are updated in place: computed values are
+    written back to registry[name]['value'], so code that reads the
+    registry sees current results.
+    """
+
+    def __init__(self, registry: Dict[str, Dict[str, Any]]):
+        self.registry = registry
+        self.parsed: Dict[str, ParsedFormula] = {}
+        self.precedents: Dict[str, Tuple[str, ...]] = {}
+        self.dependents: Dict[str, Set[str]] = {name: set() for name in registry}
+        self.errors: Dict[str, str] = {}
+        self.overridden: Set[str] = set()
+        self._order: List[str] = []
+        self._rank: Dict[str, int] = {}
+        self._dirty: Set[str] = set()
+        for name in registry:
+            self._link(name)
+        self._sort()
+        self._dirty = set(self.computed_nodes())
+
+    # ------------------------------------------------------------------
+    # Structure
+    # ------------------------------------------------------------------
+
+    def _link(self, name: str) -> None:
+        for precedent in self.precedents.get(name, ()):
+            self.dependents[precedent].discard(name)
+        parsed = parse_formula(self.registry[name].get('formula'))
+        self.parsed[name] = parsed
+        live = (parsed.evaluable and name not in self.overridden and
+                all(dep in self.registry for dep in parsed.dependencies))
+        self.precedents[name] = parsed.dependencies if live else ()
+        for precedent in self.precedents[name]:
+            self.dependents[precedent].add(name)
+
+    def _sort(self) -> None:
+        """Kahn's algorithm; leftover nodes lie on or behind a cycle"""
+        indegree = {name: len(self.precedents[name]) for name in self.registry}
+        queue = deque(name for name, degree in indegree.items() if degree == 0)
+        order = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for dependent in sorted(self.dependents[name]):
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+        if len(order) < len(self.registry):
+            raise CircularReferenceError(self._find_cycle(set(self.registry) - set(order)))
+        self._order = order
+        self._rank = {name: i for i, name in enumerate(order)}
+
+    def _find_cycle(self, candidates: Set[str]) -> List[str]:
+        """Walk precedents inside the unsorted set until a node repeats"""
+        name = min(candidates)
+        path, seen = [], {}
+        while name not in seen:
+            seen[name] = len(path)
+            path.append(name)
+            name = min(p for p in self.precedents[name] if p in candidates)
+        return path[seen[name]:]
+
+    def status(self, name: str) -> str:
+        """'formula', 'input', 'override', 'external', 'unresolved' or 'error'"""
+        parsed = self.parsed[name]
+        if name in self.errors:
+            return 'error'
+        if name in self.overridden:
+            return 'override'
+        if self.precedents[name] or (parsed.evaluable and not parsed.dependencies):
+            return 'formula'
+        if parsed.external:
+            return 'external'
+        if parsed.evaluable:
+            return 'unresolved'
+        return 'input' if parsed.error in (None, 'Not a formula') else 'error'
+
+    def unresolved_names(self, name: str) -> List[str]:
+        """Names a formula uses that are not registry variables"""
+        return [dep for dep in self.parsed[name].dependencies if dep not in self.registry]
+
+    def computed_nodes(self) -> List[str]:
+        return [name for name in self._order if self.status(name) in ('formula', 'error')
+                and self.parsed[name].evaluable]
+
+    @property
+    def evaluation_order(self) -> List[str]:
+        return list(self._order)
+
+    def downstream(self, names: Iterable[str]) -> List[str]:
+        """All transitive dependents of names, in evaluation order"""
+        seen: Set[str] = set()
+        stack = list(names)
+        while stack:
+            for dependent in self.dependents[stack.pop()]:
+                if dependent not in seen:
+                    seen.add(dependent)
+                    stack.append(dependent)
+        return sorted(seen, key=self._rank.__getitem__)
+
+    def upstream(self, name: str) -> List[str]:
+        """All transitive precedents of a node, in evaluation order"""
+        seen: Set[str] = set()
+        stack = [name]
+        while stack:
+            for precedent in self.precedents[stack.pop()]:
+                if precedent not in seen:
+                    seen.add(precedent)
+                    stack.append(precedent)
+        return sorted(seen, key=self._rank.__getitem__)
+
+    def edges(self) -> List[Tuple[str, str]]:
+        """(precedent, dependent) pairs in evaluation order"""
+        return [(p, name) for name in self._order for p in self.precedents[name]]
+
+    # ------------------------------------------------------------------
+    # Editing
+    # ------------------------------------------------------------------
+
+    def set_value(self, name: str, value: float) -> List[str]:
+        """
+        Change a value and recompute its dependents.  Typing a value over a
+        computed cell overrides its formula, as in a spreadsheet.
+        Returns the names that were recomputed.
+        """
+        if name not in self.registry:
+            raise KeyError(name)
+        if name in self.computed_nodes():
+            self.overridden.add(name)
+            self._link(name)
+            self._sort()
+        self.errors.pop(name, None)
+        self.registry[name]['value'] = value
+        self._dirty.update(self.downstream([name]))
+        return self.recalculate()
+
+    def set_formula(self, name: str, formula: str) -> List[str]:
+        """Replace a formula; the edit is rolled back if it closes a cycle"""
+        if name not in self.registry:
+            raise KeyError(name)
+        previous = self.registry[name].get('formula')
+        was_overridden = name in self.overridden
+        self.registry[name]['formula'] = formula
+        self.overridden.discard(name)
+        self._link(name)
+        try:
+            self._sort()
+        except CircularReferenceError:
+            self.registry[name]['formula'] = previous
+            if was_overridden:
+                self.overridden.add(name)
+            self._link(name)
+            self._sort()
+            raise
+        self._dirty.add(name)
+        self._dirty.update(self.downstream([name]))
+        return self.recalculate()
+
+    def clear_override(self, name: str) -> List[str]:
+        """Restore the formula of an overridden node"""
+        self.overridden.discard(name)
+        self._link(name)
+        self._sort()
+        self._dirty.add(name)
+        self._dirty.update(self.downstream([name]))
+        return self.recalculate()
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def _evaluate(self, name: str) -> None:
+        parsed = self.parsed[name]
+        namespace = {dep: self.registry[dep]['value'] for dep in parsed.dependencies}
+        try:
+            value = eval(parsed.code, _SCALAR_NAMESPACE, namespace)
+            self.errors.pop(name, None)
+        except (ArithmeticError, ValueError, TypeError) as exc:
+            # Spreadsheet semantics: the cell shows an error, dependents see NaN
+            value = float('nan')
+            self.errors[name] = f"{type(exc).__name__}: {exc}"
+        self.registry[name]['value'] = float(value) if isinstance(value, (bool, int, float)) else value
+
+    def recalculate(self, full: bool = False) -> List[str]:
+        """Evaluate dirty nodes (all computed nodes if full) in topological order"""
+        if full:
+            self._dirty = set(self.computed_nodes())
+        pending = sorted((name for name in self._dirty
+                          if self.parsed[name].evaluable and name not in self.overridden
+                          and self.status(name) in ('formula', 'error')),
+                         key=self._rank.__getitem__)
+        for name in pending:
+            self._evaluate(name)
+        self._dirty.clear()
+        return pending
+
+    # ------------------------------------------------------------------
+    # What-if batches
+    # ------------------------------------------------------------------
+
+    def compile(self, outputs: Optional[Iterable[str]] = None) -> SheetKernel:
+        """
+        Kernel for the computed nodes (all, or those feeding outputs); its
+        inputs are every non-computed precedent of those nodes.
+        """
+        computed = self.computed_nodes()
+        if outputs is not None:
+            outputs = list(outputs)
+            needed = set(outputs)
+            for name in outputs:
+                needed.update(self.upstream(name))
+            computed = [name for name in computed if name in needed]
+        computed_set = set(computed)
+        inputs = {p for name in computed for p in self.precedents[name] if p not in computed_set}
+        return compile_sheet([(name, self.registry[name]['formula']) for name in computed], inputs)
+
+    def evaluate_batch(self, outputs: Optional[Iterable[str]] = None,
+                       **inputs) -> Dict[str, np.ndarray]:
+        """
+        Evaluate the sheet over arrays of inputs in one kernel call.
+        Inputs not given keep their current registry value; the registry
+        itself is not changed.
+        """
+        kernel = self.compile(outputs)
+        unknown = set(inputs) - set(kernel.inputs)
+        if unknown:
+            raise FormulaError(f"Not inputs of the compiled sheet: {sorted(unknown)}")
+        arguments = {name: inputs.get(name, self.registry[name]['value']) for name in kernel.inputs}
+        results = kernel(**arguments)
+        if outputs is not None:
+            results = {name: results[name] for name in outputs if name in results}
+        return results
+
+    def value(self, name: str) -> Any:
+        return self.registry[name]['value']
+
+    def values(self) -> Dict[str, Any]:
+        return {name: record['value'] for name, record in self.registry.items()}
@@ -4,46 +4,78 @@ Generate HTML Report for Bridge Design
 Creates professional HTML report that can be printed to PDF
 """
 
-import json
 import os
-from datetime import datetime
+from typing import Any, Dict, Optional
 
-def create_html_report():
-    """Generate comprehensive HTML report"""
+from report_engine import ReportEngine, Section, Template, default_report_path, load_results
+
+def create_html_report(results: Dict[str, Any], html_filepath: Optional[str] = None) -> str:
+    """
+    Generate comprehensive HTML report
+    
+    Streams the precompiled sections of HTML_REPORT to html_filepath, by
+    default reports/Bridge_Design_Report_<timestamp>.html
+    """
     
     print("🌐 GENERATING HTML BRIDGE DESIGN REPORT")
     print("="*50)
     
-    # Load results
-    results_file = r"c:\Users\Rajkumar\Bridge_Slab_Design\sample_slab_bridge_design_results.json"
+    html_filepath = html_filepath or default_report_path('Bridge_Design_Report')
+    print(f"📝 Creating HTML report: {os.path.basename(html_filepath)}")
     
-    if not os.path.exists(results_file):
-        print("❌ Results file not found!")
-        return
+    # Write HTML file
+    HTML_REPORT.write(results, html_filepath)
     
-    with open(results_file, 'r') as f:
-        results = json.load(f)
+    print(f"✅ HTML report created: {html_filepath}")
     
-    # Generate HTML report
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    html_filename = f'Bridge_Design_Report_{timestamp}.html'
-    html_filepath = os.path.join(os.path.dirname(results_file), html_filename)
+    # Display stats
+    file_size = os.path.getsize(html_filepath) / 1024
     
-    print(f"📝 Creating HTML report: {html_filename}")
+    print(f"\n📊 REPORT STATISTICS:")
+    print(f"• File size: {file_size:.1f} KB")
+    print(f"• Format: HTML (viewable in any browser)")
+    print(f"• Print-ready: Can be saved as PDF from browser")
+    print(f"• Professional styling with responsive design")
     
-    # Extract data
-    project_info = results.get('project_info', {})
-    hydraulic = results.get('hydraulic_analysis', {})
-    pier = results.get('pier_design', {})
-    detailed_pier = results.get('detailed_pier_geometry', {})
-    foundation = results.get('foundation_design', {})
-    estimation = results.get('comprehensive_estimation', {})
-    materials = estimation.get('material_summary', {})
-    cost_dist = estimation.get('cost_distribution', {})
-    abutment_design = results.get('complete_abutment_design', {})
+    print(f"\n🎯 FEATURES:")
+    print("• Professional layout and formatting")
+    print("• Color-coded status indicators")
+    print("• Organized sections with clear headings")
+    print("• Print-optimized CSS styling")
+    print("• Complete design data presentation")
     
-    html_content = f"""
-<!DOCTYPE html>
+    print(f"\n📄 TO CREATE PDF:")
+    print("1. Open the HTML file in a web browser")
+    print("2. Press Ctrl+P (or Cmd+P on Mac)")
+    print("3. Select 'Save as PDF' as destination")
+    print("4. Choose appropriate page size (A4)")
+    print("5. Save the PDF file")
+    
+    print(f"\n🌐 HTML Report ready!")
+    print(f"📁 Location: {html_filepath}")
+    
+    return html_filepath
+
+
+def report_context(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Values the report templates read"""
+    estimation = results.get('comprehensive_estimation', {})
+    return {
+        'results': results,
+        'project_info': results.get('project_info', {}),
+        'hydraulic': results.get('hydraulic_analysis', {}),
+        'detailed_pier': results.get('detailed_pier_geometry', {}),
+        'foundation': results.get('foundation_design', {}),
+        'estimation': estimation,
+        'materials': estimation.get('material_summary', {}),
+        'cost_dist': estimation.get('cost_distribution', {}),
+    }
+
+# ----------------------------------------------------------------------
+# Report templates and section order
+# ----------------------------------------------------------------------
+
+REPORT_HEAD = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -157,7 +189,9 @@ def create_html_report():
 </head>
 <body>
     <div class="container">
-        <!-- Header -->
+""", 'head')
+
+HEADER = Template("""        <!-- Header -->
         <div class="header">
             <h1>COMPREHENSIVE BRIDGE DESIGN REPORT</h1>
             <h2>Complete Slab Bridge Analysis & Design</h2>
@@ -166,7 +200,9 @@ def create_html_report():
             <p><strong>Date:</strong> {project_info.get('design_date', 'N/A')}</p>
         </div>
 
-        <!-- Project Summary -->
+""", 'header')
+
+PROJECT_SUMMARY = Template("""        <!-- Project Summary -->
         <div class="section">
             <h3>📋 PROJECT SUMMARY</h3>
             <div class="section-content">
@@ -211,7 +247,9 @@ def create_html_report():
             </div>
         </div>
 
-        <!-- Hydraulic Analysis -->
+""", 'project_summary')
+
+HYDRAULIC_ANALYSIS = Template("""        <!-- Hydraulic Analysis -->
         <div class="section">
             <h3>🌊 HYDRAULIC ANALYSIS</h3>
             <div class="section-content">
@@ -252,7 +290,9 @@ def create_html_report():
             </div>
         </div>
 
-        <!-- Pier Design -->
+""", 'hydraulic_analysis')
+
+PIER_DESIGN = Template("""        <!-- Pier Design -->
         <div class="section">
             <h3>🏗️ PIER DESIGN</h3>
             <div class="section-content">
@@ -289,7 +329,9 @@ def create_html_report():
             </div>
         </div>
 
-        <!-- Foundation Design -->
+""", 'pier_design')
+
+FOUNDATION_DESIGN = Template("""        <!-- Foundation Design -->
         <div class="section">
             <h3>🏛️ FOUNDATION DESIGN</h3>
             <div class="section-content">
@@ -326,7 +368,9 @@ def create_html_report():
             </div>
         </div>
 
-        <!-- Cost Estimation -->
+""", 'foundation_design')
+
+COST_ESTIMATION = Template("""        <!-- Cost Estimation -->
         <div class="cost-summary">
             <h4>💰 PROJECT COST SUMMARY</h4>
             <p><strong>Total Project Cost: ₹{estimation.get('total_project_cost', 0):,.0f}</strong></p>
@@ -379,7 +423,9 @@ def create_html_report():
             </div>
         </div>
 
-        <!-- Design Status -->
+""", 'cost_estimation')
+
+DESIGN_STATUS = Template("""        <!-- Design Status -->
         <div class="section">
             <h3>✅ DESIGN STATUS & COMPLIANCE</h3>
             <div class="section-content">
@@ -423,7 +469,9 @@ def create_html_report():
             </div>
         </div>
 
-        <!-- Recommendations -->
+""", 'design_status')
+
+RECOMMENDATIONS = Template("""        <!-- Recommendations -->
         <div class="section">
             <h3>💡 RECOMMENDATIONS & NEXT STEPS</h3>
             <div class="section-content">
@@ -448,7 +496,9 @@ def create_html_report():
             </div>
         </div>
 
-        <!-- Footer -->
+""", 'recommendations')
+
+FOOTER = Template("""        <!-- Footer -->
         <div class="footer">
             <p><strong>Generated by Enhanced Bridge Design App 2025</strong></p>
             <p>Complete Solution: Survey Data → Professional Bridge Design → Cost Estimate</p>
@@ -457,41 +507,26 @@ def create_html_report():
     </div>
 </body>
 </html>
-"""
+""", 'footer')
 
-    # Write HTML file
-    with open(html_filepath, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
-    print(f"✅ HTML report created: {html_filepath}")
-    
-    # Display stats
-    file_size = os.path.getsize(html_filepath) / 1024
-    
-    print(f"\n📊 REPORT STATISTICS:")
-    print(f"• File size: {file_size:.1f} KB")
-    print(f"• Format: HTML (viewable in any browser)")
-    print(f"• Print-ready: Can be saved as PDF from browser")
-    print(f"• Professional styling with responsive design")
-    
-    print(f"\n🎯 FEATURES:")
-    print("• Professional layout and formatting")
-    print("• Color-coded status indicators")
-    print("• Organized sections with clear headings")
-    print("• Print-optimized CSS styling")
-    print("• Complete design data presentation")
-    
-    print(f"\n📄 TO CREATE PDF:")
-    print("1. Open the HTML file in a web browser")
-    print("2. Press Ctrl+P (or Cmd+P on Mac)")
-    print("3. Select 'Save as PDF' as destination")
-    print("4. Choose appropriate page size (A4)")
-    print("5. Save the PDF file")
-    
-    print(f"\n🌐 HTML Report ready!")
-    print(f"📁 Location: {html_filepath}")
-    
-    return html_filepath
+HTML_REPORT = ReportEngine([
+    Section('head', REPORT_HEAD),
+    Section('header', HEADER),
+    Section('project_summary', PROJECT_SUMMARY),
+    Section('hydraulic_analysis', HYDRAULIC_ANALYSIS),
+    Section('pier_design', PIER_DESIGN),
+    Section('foundation_design', FOUNDATION_DESIGN),
+    Section('cost_estimation', COST_ESTIMATION),
+    Section('design_status', DESIGN_STATUS),
+    Section('recommendations', RECOMMENDATIONS),
+    Section('footer', FOOTER),
+], report_context)
 
 if __name__ == "__main__":
-    create_html_report()
\ No newline at end of file
+    import sys
+    results_file = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'sample_slab_bridge_design_results.json')
+    if not os.path.exists(results_file):
+        print("❌ Results file not found!")
+    else:
+        create_html_report(load_results(results_file))
@@ -6,32 +6,62 @@ Simple, effective A4 landscape printable cross-section with Highest Flood Level
 Professional engineering drawing for bridge design
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 import numpy as np
 import streamlit as st
 from datetime import datetime
 from typing import Dict, Any, Optional
 from river_section_input_schema import RiverSectionInputSchema
+from cross_section_geometry import section_geometry, wetted_polygons
+from drawing_sheet import SheetText, a4_landscape_template, drawing_sheet
+
+# A4 landscape sheet: frame and fixed captions drawn once, fields per print
+HFL_SHEET = a4_landscape_template(
+    'hfl_cross_section_a4',
+    captions=[
+        SheetText(0.98, 0.8, "BRIDGE DESIGN APPLICATION", {'fontsize': 10, 'fontweight': 'bold', 'ha': 'right'}),
+        SheetText(0.98, 0.4, "A4 LANDSCAPE - READY TO PRINT", {'fontsize': 8, 'ha': 'right', 'style': 'italic'}),
+    ],
+    fields={
+        # Left section - Project info
+        'project': SheetText(0.05, 0.7, style={'fontsize': 10, 'fontweight': 'bold'}),
+        'survey_date': SheetText(0.05, 0.5, style={'fontsize': 9}),
+        'drawing_date': SheetText(0.05, 0.3, style={'fontsize': 9}),
+        # Center section - Water levels
+        'hfl': SheetText(0.35, 0.7, style={'fontsize': 10, 'fontweight': 'bold', 'color': 'red'}),
+        'nwl': SheetText(0.35, 0.5, style={'fontsize': 9, 'color': 'blue'}),
+        'lwl': SheetText(0.35, 0.3, style={'fontsize': 9, 'color': 'green'}),
+        # Right section - Technical info
+        'discharge': SheetText(0.65, 0.7, style={'fontsize': 9}),
+        'river_width': SheetText(0.65, 0.5, style={'fontsize': 9}),
+        'max_depth': SheetText(0.65, 0.3, style={'fontsize': 9}),
+        'drawing_number': SheetText(0.98, 0.6, style={'fontsize': 8, 'ha': 'right'}),
+    },
+)
 
 def create_hfl_cross_section_a4(river_data: RiverSectionInputSchema, 
                                project_info: Optional[Dict[str, Any]] = None):
     """
     Create A4 landscape printable cross-section with HFL annotations
+
+    The sheet frame and title block are cached (HFL_SHEET); each call only
+    redraws the section and rewrites the title-block fields, and returns
+    the same figure as the previous call.
     """
     
-    # A4 landscape dimensions (297mm x 210mm)
-    fig, (ax_main, ax_title) = plt.subplots(2, 1, figsize=(11.69, 8.27), 
-                                           gridspec_kw={'height_ratios': [4, 1]},
-                                           dpi=300)
-    
     # Extract cross-section data
     if not river_data.cross_section_points:
         st.error("No cross-section data available")
         return None
     
-    chainages = [p.chainage for p in river_data.cross_section_points]
-    elevations = [p.elevation for p in river_data.cross_section_points]
+    # A4 landscape sheet (297mm x 210mm) with its frame already drawn
+    sheet = drawing_sheet(HFL_SHEET, dpi=300)
+    ax_main = sheet.new_print()
+    fig = sheet.figure
+    
+    # Dense surveys are simplified to drawing tolerance
+    geometry = section_geometry([p.chainage for p in river_data.cross_section_points],
+                                [p.elevation for p in river_data.cross_section_points])
+    chainages, elevations = (values.tolist() for values in geometry.for_drawing())
     
     # Plot ground profile
     ax_main.plot(chainages, elevations, 'k-', linewidth=2.5, label='Ground Level', marker='o', markersize=4)
@@ -56,13 +86,11 @@ def create_hfl_cross_section_a4(river_data: RiverSectionInputSchema,
     ax_main.axhline(y=water_levels.lwl, color='green', linestyle='--', linewidth=2, 
                    label=f'LWL = {water_levels.lwl:.2f}m')
     
-    # Water area at HFL (blue fill)
-    water_mask = np.array(elevations) <= water_levels.hfl
-    if any(water_mask):
-        water_chainages = np.array(chainages)[water_mask]
-        water_elevations = np.array(elevations)[water_mask]
-        ax_main.fill_between(water_chainages, water_elevations, water_levels.hfl,
-                           color='lightblue', alpha=0.5, label='Water Area at HFL')
+    # Water area at HFL (blue fill), clipped at the waterline per sub-channel
+    for i, (water_chainages, water_elevations) in enumerate(
+            wetted_polygons(chainages, elevations, water_levels.hfl)):
+        ax_main.fill(water_chainages, water_elevations, color='lightblue', alpha=0.5,
+                     label='Water Area at HFL' if i == 0 else None)
     
     # Add HFL annotations
     xlim = ax_main.get_xlim()
@@ -75,7 +103,7 @@ def create_hfl_cross_section_a4(river_data: RiverSectionInputSchema,
     
     # River width and depth annotations
     river_width = max(chainages) - min(chainages)
-    max_depth = water_levels.hfl - min(elevations)
+    max_depth = water_levels.hfl - float(geometry.elevations.min())
     
     # Add dimension line for river width
     y_dim = max(elevations) + (max(elevations) - min(elevations)) * 0.1
@@ -86,9 +114,9 @@ def create_hfl_cross_section_a4(river_data: RiverSectionInputSchema,
                bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.7))
     
     # Max depth annotation
-    deepest_idx = elevations.index(min(elevations))
+    deepest_idx = int(np.argmin(geometry.elevations))
     ax_main.annotate(f'Max Depth\\n{max_depth:.2f}m at HFL',
-                    (chainages[deepest_idx], elevations[deepest_idx]),
+                    (geometry.offsets[deepest_idx], geometry.elevations[deepest_idx]),
                     xytext=(20, -40), textcoords='offset points',
                     fontweight='bold', ha='center',
                     bbox=dict(boxstyle='round,pad=0.4', facecolor='orange', alpha=0.8),
@@ -122,43 +150,22 @@ def create_hfl_cross_section_a4(river_data: RiverSectionInputSchema,
     ax_main.set_title(f'RIVER CROSS-SECTION WITH HIGHEST FLOOD LEVEL\\n{river_data.river_name} at {river_data.location}',
                      fontsize=14, fontweight='bold', pad=20)
     
-    # Create title block
-    ax_title.set_xlim(0, 1)
-    ax_title.set_ylim(0, 1)
-    ax_title.axis('off')
-    
-    # Title block border
-    title_rect = patches.Rectangle((0.02, 0.1), 0.96, 0.8, 
-                                 linewidth=2, edgecolor='black', 
-                                 facecolor='lightgray', alpha=0.1)
-    ax_title.add_patch(title_rect)
-    
     # Title block content
     if project_info is None:
         project_info = {}
     
-    # Left section - Project info
-    ax_title.text(0.05, 0.7, f"Project: {project_info.get('project_name', river_data.project_name)}", 
-                 fontsize=10, fontweight='bold')
-    ax_title.text(0.05, 0.5, f"Survey Date: {river_data.survey_date}", fontsize=9)
-    ax_title.text(0.05, 0.3, f"Drawing Date: {datetime.now().strftime('%d-%m-%Y')}", fontsize=9)
-    
-    # Center section - Water levels
-    ax_title.text(0.35, 0.7, f"HFL = {water_levels.hfl:.2f}m", fontsize=10, fontweight='bold', color='red')
-    ax_title.text(0.35, 0.5, f"NWL = {water_levels.nwl:.2f}m", fontsize=9, color='blue')
-    ax_title.text(0.35, 0.3, f"LWL = {water_levels.lwl:.2f}m", fontsize=9, color='green')
-    
-    # Right section - Technical info
-    ax_title.text(0.65, 0.7, f"Discharge = {water_levels.design_discharge:.0f} cumecs", fontsize=9)
-    ax_title.text(0.65, 0.5, f"River Width = {river_width:.1f}m", fontsize=9)
-    ax_title.text(0.65, 0.3, f"Max Depth = {max_depth:.2f}m", fontsize=9)
-    
-    # Drawing info
-    ax_title.text(0.98, 0.8, "BRIDGE DESIGN APPLICATION", fontsize=10, fontweight='bold', ha='right')
-    ax_title.text(0.98, 0.6, f"Drawing No: CS-{datetime.now().strftime('%Y%m%d')}-001", fontsize=8, ha='right')
-    ax_title.text(0.98, 0.4, "A4 LANDSCAPE - READY TO PRINT", fontsize=8, ha='right', style='italic')
-    
-    plt.tight_layout()
+    sheet.set_fields(
+        project=f"Project: {project_info.get('project_name', river_data.project_name)}",
+        survey_date=f"Survey Date: {river_data.survey_date}",
+        drawing_date=f"Drawing Date: {datetime.now().strftime('%d-%m-%Y')}",
+        hfl=f"HFL = {water_levels.hfl:.2f}m",
+        nwl=f"NWL = {water_levels.nwl:.2f}m",
+        lwl=f"LWL = {water_levels.lwl:.2f}m",
+        discharge=f"Discharge = {water_levels.design_discharge:.0f} cumecs",
+        river_width=f"River Width = {river_width:.1f}m",
+        max_depth=f"Max Depth = {max_depth:.2f}m",
+        drawing_number=f"Drawing No: CS-{datetime.now().strftime('%Y%m%d')}-001",
+    )
     return fig
 
 def add_hfl_cross_section_to_app():
@@ -236,15 +243,10 @@ def add_hfl_cross_section_to_app():
                     # Save and provide download
                     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                     
-                    # Save as PDF
-                    pdf_filename = f'HFL_Cross_Section_A4_{timestamp}.pdf'
-                    fig.savefig(pdf_filename, format='pdf', dpi=300, bbox_inches='tight',
-                               facecolor='white', edgecolor='none')
-                    
-                    # Save as PNG  
-                    png_filename = f'HFL_Cross_Section_A4_{timestamp}.png'
-                    fig.savefig(png_filename, format='png', dpi=300, bbox_inches='tight',
-                               facecolor='white', edgecolor='none')
+                    # Save as PDF (vector-first) and PNG (blitted full sheet)
+                    sheet = drawing_sheet(HFL_SHEET, dpi=300)
+                    pdf_filename = sheet.save_pdf(f'HFL_Cross_Section_A4_{timestamp}.pdf')
+                    png_filename = sheet.save_png(f'HFL_Cross_Section_A4_{timestamp}.png')
                     
                     # Download buttons
                     st.markdown("### 📥 Download A4 Ready Files")
@@ -306,7 +308,40 @@ def add_hfl_cross_section_to_app():
                     
             except Exception as e:
                 st.error(f"Error generating drawing: {str(e)}")
-    
+
+    # Whole reach: one indexed PDF with a sheet per cross section
+    reach = getattr(river_data, 'reach', None)
+    if reach is not None and len(reach) > 1:
+        st.markdown("---")
+        st.markdown(f"### 🗺️ All Reach Cross-Sections ({len(reach)} sheets)")
+
+        if st.button("📚 Export All Sections to One PDF", use_container_width=True):
+            from batch_drawing_export import export_cross_sections, reach_sections
+
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+
+            def show_progress(done: int, total: int, label: str):
+                progress_bar.progress(done / total)
+                status_text.text(f"🎨 Sheet {done} of {total}: {label}")
+
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            pdf_filename = f'Reach_Cross_Sections_A4_{timestamp}.pdf'
+            try:
+                export = export_cross_sections(reach_sections(reach, river_data), pdf_filename,
+                                               project_info=project_info, progress=show_progress)
+                status_text.success(f"✅ {export['sheets']} sheets exported in {export['elapsed_s']:.1f} s")
+                with open(pdf_filename, 'rb') as pdf_file:
+                    st.download_button(
+                        label="📄 Download Reach Drawing Set (PDF)",
+                        data=pdf_file.read(),
+                        file_name=pdf_filename,
+                        mime="application/pdf",
+                        use_container_width=True
+                    )
+            except Exception as e:
+                st.error(f"Error exporting reach drawings: {str(e)}")
+
     # Display current data summary
     st.markdown("---")
     st.markdown("### 📊 Current River Data Summary")
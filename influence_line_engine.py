@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+INFLUENCE LINE ENGINE
+Moving IRC vehicle trains over simply-supported and continuous slab decks
+
+Influence ordinates for support reactions and bending moments are computed
+once per span geometry (direct stiffness method for continuous decks, statics
+for simply-supported spans) and cached.  Vehicle trains are then swept across
+the deck in both directions as one vectorized position × axle interpolation,
+so a full envelope costs a handful of array operations and can run inside
+every design of a batch sweep.
+
+Vehicle data from IRC:6 Clause 204 / Annex A:
+- Class A train (8 axles, 554 kN)
+- Class 70R wheeled (7 axles, 1000 kN) and tracked (700 kN over 4.57 m)
+- Class AA tracked (700 kN over 3.6 m) and wheeled (2 × 200 kN at 1.2 m)
+"""
+
+import math
+import numpy as np
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import scipy.sparse as sp
+    from scipy.sparse.linalg import splu
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# ============================================================================
+# IRC VEHICLE TRAINS
+# ============================================================================
+
+@dataclass(frozen=True)
+class VehicleTrain:
+    """Axle loads (kN) and distances of each axle behind the leading axle (m)"""
+    name: str
+    axle_loads: Tuple[float, ...]
+    axle_offsets: Tuple[float, ...]
+    tracked: bool = False
+    lane_width: float = 2.3  # m - transverse space occupied by the vehicle
+
+    @property
+    def length(self) -> float:
+        return self.axle_offsets[-1]
+
+    @property
+    def total_load(self) -> float:
+        return sum(self.axle_loads)
+
+
+def _tracked(name: str, total_load: float, contact_length: float, lane_width: float,
+             divisions: int = 10) -> VehicleTrain:
+    """Uniform track contact modelled as equal point loads at segment centres"""
+    step = contact_length / divisions
+    return VehicleTrain(name, (total_load / divisions,) * divisions,
+                        tuple(step * (i + 0.5) for i in range(divisions)),
+                        tracked=True, lane_width=lane_width)
+
+
+def _wheeled(name: str, loads: Sequence[float], spacings: Sequence[float],
+             lane_width: float) -> VehicleTrain:
+    offsets = tuple(float(x) for x in np.concatenate([[0.0], np.cumsum(spacings)]))
+    return VehicleTrain(name, tuple(float(w) for w in loads), offsets, lane_width=lane_width)
+
+
+IRC_VEHICLES: Dict[str, VehicleTrain] = {
+    'CLASS_A': _wheeled('IRC Class A', [27, 27, 114, 114, 68, 68, 68, 68],
+                        [1.1, 3.2, 1.2, 4.3, 3.0, 3.0, 3.0], lane_width=2.3),
+    'CLASS_70R_WHEELED': _wheeled('IRC Class 70R (Wheeled)', [80, 120, 120, 170, 170, 170, 170],
+                                  [3.96, 1.52, 2.13, 1.37, 3.05, 1.37], lane_width=2.9),
+    'CLASS_70R_TRACKED': _tracked('IRC Class 70R (Tracked)', 700.0, 4.57, lane_width=2.9),
+    'CLASS_AA_TRACKED': _tracked('IRC Class AA (Tracked)', 700.0, 3.6, lane_width=2.85),
+    'CLASS_AA_WHEELED': _wheeled('IRC Class AA (Wheeled)', [200, 200], [1.2], lane_width=2.6),
+}
+
+HEAVY_VEHICLES = ('CLASS_70R_WHEELED', 'CLASS_70R_TRACKED', 'CLASS_AA_TRACKED', 'CLASS_AA_WHEELED')
+
+
+def impact_factor(vehicle: VehicleTrain, span: float) -> float:
+    """
+    Impact allowance for RCC bridges, IRC:6 Clause 208:
+    - Class A: 4.5 / (6 + L)
+    - Tracked: 25% up to 5 m reducing linearly to 10% at 9 m, 10% beyond
+    - Heavy wheeled: 25% up to 12 m, then the Class A curve (Fig. 5)
+    Returned as a multiplier (1 + I).
+    """
+    if vehicle.tracked:
+        if span <= 5.0:
+            fraction = 0.25
+        elif span < 9.0:
+            fraction = 0.25 - 0.15 * (span - 5.0) / 4.0
+        else:
+            fraction = 0.10
+    elif vehicle.name == IRC_VEHICLES['CLASS_A'].name:
+        fraction = 4.5 / (6.0 + span)
+    else:
+        fraction = 0.25 if span <= 12.0 else 4.5 / (6.0 + span)
+    return 1.0 + fraction
+
+
+def number_of_lanes(carriageway_width: float) -> int:
+    """Design traffic lanes, IRC:6 Table 6"""
+    if carriageway_width < 5.3:
+        return 1
+    if carriageway_width < 9.6:
+        return 2
+    if carriageway_width < 13.1:
+        return 3
+    if carriageway_width < 16.6:
+        return 4
+    if carriageway_width < 20.1:
+        return 5
+    return 6
+
+
+def lane_reduction_factor(lanes: int) -> float:
+    """Reduction in longitudinal effects for multi-lane loading, IRC:6 Clause 205"""
+    if lanes <= 2:
+        return 1.0
+    if lanes == 3:
+        return 0.9
+    return 0.8
+
+# ============================================================================
+# INFLUENCE ORDINATES (CACHED PER GEOMETRY)
+# ============================================================================
+
+@dataclass(frozen=True)
+class InfluenceLines:
+    """Ordinates sampled at `positions` for every support and section"""
+    positions: np.ndarray          # (P,) unit load positions along the deck
+    support_positions: np.ndarray  # (S,)
+    reactions: np.ndarray          # (S, P) reaction at each support
+    section_positions: np.ndarray  # (K,)
+    moments: np.ndarray            # (K, P) sagging-positive bending moment
+    step: float
+
+
+def _continuous_reactions(span_lengths: Tuple[float, ...], positions: np.ndarray,
+                          support_positions: np.ndarray) -> np.ndarray:
+    """Support reaction influence lines by the direct stiffness method (EI = 1)"""
+    n = len(positions)
+    dof = 2 * n
+    h = np.diff(positions)[:, None, None]
+    # Euler-Bernoulli beam elements, assembled for all elements at once
+    base = np.array([[12, 6, -12, 6], [6, 4, -6, 2], [-12, -6, 12, -6], [6, 2, -6, 4]], dtype=float)
+    powers = np.array([[3, 2, 3, 2], [2, 1, 2, 1], [3, 2, 3, 2], [2, 1, 2, 1]])
+    element_k = base[None] / h ** powers[None]
+    element_dofs = 2 * np.arange(n - 1)[:, None] + np.arange(4)[None, :]
+    rows = np.repeat(element_dofs, 4, axis=1).ravel()
+    cols = np.tile(element_dofs, (1, 4)).ravel()
+
+    support_nodes = np.searchsorted(positions, support_positions)
+    restrained = 2 * support_nodes
+    free = np.setdiff1d(np.arange(dof), restrained)
+
+    # Unit vertical load at every node: one multi-RHS solve
+    loads = np.zeros((dof, n))
+    loads[2 * np.arange(n), np.arange(n)] = -1.0
+    if SCIPY_AVAILABLE:
+        # Banded beam stiffness: sparse LU keeps this O(n) per load position
+        K = sp.coo_matrix((element_k.ravel(), (rows, cols)), shape=(dof, dof)).tocsr()
+        displacement = splu(K[free][:, free].tocsc()).solve(loads[free])
+        return K[restrained][:, free] @ displacement - loads[restrained]
+    K = np.zeros((dof, dof))
+    np.add.at(K, (rows, cols), element_k.ravel())
+    displacement = np.linalg.solve(K[np.ix_(free, free)], loads[free])
+    return K[np.ix_(restrained, free)] @ displacement - loads[restrained]
+
+
+@lru_cache(maxsize=128)
+def compute_influence_lines(span_lengths: Tuple[float, ...], continuous: bool = False,
+                            step: float = 0.1) -> InfluenceLines:
+    """
+    Influence lines for a deck of `span_lengths`, cached per geometry.
+    Sections for moments are every support and every midspan.
+    """
+    spans = np.asarray(span_lengths, dtype=float)
+    support_positions = np.concatenate([[0.0], np.cumsum(spans)])
+    # Sample every span on its own grid so supports fall exactly on nodes
+    grids = [start + np.linspace(0.0, length, max(2, int(math.ceil(length / step))) + 1)[:-1]
+             for start, length in zip(support_positions[:-1], spans)]
+    positions = np.concatenate(grids + [support_positions[-1:]])
+
+    if continuous and len(spans) > 1:
+        reactions = _continuous_reactions(tuple(spans), positions, support_positions)
+    else:
+        # Simply supported spans: each bearing line takes load from its own spans
+        reactions = np.zeros((len(support_positions), len(positions)))
+        span_index = np.clip(np.searchsorted(support_positions, positions, side='right') - 1,
+                             0, len(spans) - 1)
+        xi = (positions - support_positions[span_index]) / spans[span_index]
+        np.add.at(reactions, (span_index, np.arange(len(positions))), 1.0 - xi)
+        np.add.at(reactions, (span_index + 1, np.arange(len(positions))), xi)
+
+    midspans = support_positions[:-1] + spans / 2
+    section_positions = np.sort(np.concatenate([support_positions, midspans]))
+    if continuous and len(spans) > 1:
+        # M(s) = Σ_{supports left of s} R_j (s - x_j) - (s - x)⁺
+        lever = np.clip(section_positions[:, None] - support_positions[None, :], 0.0, None)
+        lever[section_positions[:, None] <= support_positions[None, :]] = 0.0
+        moments = lever @ reactions - np.clip(section_positions[:, None] - positions[None, :], 0.0, None)
+    else:
+        # Statics within each span; zero moment at bearings
+        moments = np.zeros((len(section_positions), len(positions)))
+        for k, s in enumerate(section_positions):
+            j = int(np.clip(np.searchsorted(support_positions, s, side='right') - 1, 0, len(spans) - 1))
+            a, length = support_positions[j], spans[j]
+            if np.isclose(s, a) or np.isclose(s, a + length):
+                continue
+            x = positions
+            inside = (x >= a) & (x <= a + length)
+            left = inside & (x <= s)
+            right = inside & (x > s)
+            moments[k, left] = (x[left] - a) * (a + length - s) / length
+            moments[k, right] = (s - a) * (a + length - x[right]) / length
+
+    for array in (positions, support_positions, reactions, section_positions, moments):
+        array.setflags(write=False)
+    return InfluenceLines(positions, support_positions, reactions, section_positions, moments, step)
+
+# ============================================================================
+# VECTORIZED VEHICLE SWEEP
+# ============================================================================
+
+def _interpolate_ordinates(lines: InfluenceLines, ordinates: np.ndarray,
+                           axle_positions: np.ndarray) -> np.ndarray:
+    """Ordinates (N, P) at axle positions (..., A); zero off the deck"""
+    x = lines.positions
+    on_deck = (axle_positions >= x[0]) & (axle_positions <= x[-1])
+    idx = np.clip(np.searchsorted(x, axle_positions, side='right') - 1, 0, len(x) - 2)
+    frac = (axle_positions - x[idx]) / (x[idx + 1] - x[idx])
+    values = ordinates[:, idx] * (1.0 - frac) + ordinates[:, idx + 1] * frac
+    return np.where(on_deck, values, 0.0)
+
+
+def sweep_vehicle(lines: InfluenceLines, vehicle: VehicleTrain,
+                  step: Optional[float] = None) -> Dict[str, np.ndarray]:
+    """
+    Run a vehicle over the deck in both directions.
+    Returns max/min reaction per support and max sagging / hogging moment per
+    section (single lane, without impact).
+    """
+    step = step or lines.step
+    total = lines.positions[-1]
+    offsets = np.asarray(vehicle.axle_offsets)
+    loads = np.asarray(vehicle.axle_loads)
+    lead = np.arange(0.0, total + vehicle.length + step, step)
+
+    # Forward: axles behind the leading one; reverse: mirror the train
+    forward = lead[:, None] - offsets[None, :]
+    reverse = (total - lead)[:, None] + offsets[None, :]
+    axles = np.concatenate([forward, reverse], axis=0)  # (2P, A)
+
+    reactions = _interpolate_ordinates(lines, lines.reactions, axles) @ loads  # (S, 2P)
+    moments = _interpolate_ordinates(lines, lines.moments, axles) @ loads      # (K, 2P)
+    return {
+        'max_reaction': reactions.max(axis=1),
+        'min_reaction': reactions.min(axis=1),
+        'max_moment': np.maximum(moments.max(axis=1), 0.0),
+        'min_moment': np.minimum(moments.min(axis=1), 0.0),
+    }
+
+
+def critical_vehicle_positions(lines: InfluenceLines, vehicle: VehicleTrain,
+                               step: Optional[float] = None) -> List[Tuple[float, int]]:
+    """
+    Leading-axle positions (and direction, +1 forward / -1 reversed) that
+    give the extreme reaction at every support and the extreme sagging and
+    hogging moment at every section. Used to load 2D models with only the
+    governing vehicle placements.
+    """
+    step = step or lines.step
+    total = lines.positions[-1]
+    offsets = np.asarray(vehicle.axle_offsets)
+    loads = np.asarray(vehicle.axle_loads)
+    lead = np.arange(0.0, total + vehicle.length + step, step)
+    candidates = []
+    for direction, leads in ((1, lead), (-1, total - lead)):
+        axles = leads[:, None] - direction * offsets[None, :]
+        reactions = _interpolate_ordinates(lines, lines.reactions, axles) @ loads
+        moments = _interpolate_ordinates(lines, lines.moments, axles) @ loads
+        for effects in (reactions, moments, -moments):
+            best = np.argmax(effects, axis=1)
+            candidates.extend((float(leads[i]), direction) for i in best)
+    return sorted(set(candidates))
+
+
+def live_load_envelope(span_lengths: Sequence[float], carriageway_width: float,
+                       continuous: bool = False,
+                       vehicles: Optional[Dict[str, VehicleTrain]] = None) -> Dict[str, any]:
+    """
+    Governing live-load reactions and moments per support / section.
+
+    Lane arrangements per IRC:6 Table 6: all lanes Class A, or one heavy
+    vehicle (70R / AA) with Class A in the remaining lanes beyond the two it
+    occupies. Impact is included via impact_factor for the shortest span
+    adjoining each support.
+    """
+    vehicles = vehicles or IRC_VEHICLES
+    spans = tuple(float(s) for s in span_lengths)
+    lines = compute_influence_lines(spans, continuous)
+    lanes = number_of_lanes(carriageway_width)
+    span_array = np.asarray(spans)
+    # Span governing impact at each support / section
+    adjoining = np.concatenate([[span_array[0]], np.minimum(span_array[:-1], span_array[1:]),
+                                [span_array[-1]]])
+    section_span = span_array[np.clip(np.searchsorted(lines.support_positions, lines.section_positions,
+                                                      side='right') - 1, 0, len(spans) - 1)]
+
+    per_vehicle = {}
+    for key, vehicle in vehicles.items():
+        result = sweep_vehicle(lines, vehicle)
+        support_impact = np.array([impact_factor(vehicle, s) for s in adjoining])
+        section_impact = np.array([impact_factor(vehicle, s) for s in section_span])
+        per_vehicle[key] = {
+            'reaction': result['max_reaction'],
+            'reaction_with_impact': result['max_reaction'] * support_impact,
+            'max_moment': result['max_moment'] * section_impact,
+            'min_moment': result['min_moment'] * section_impact,
+            'impact_factor': support_impact,
+        }
+
+    arrangements = {}
+    if 'CLASS_A' in per_vehicle:
+        arrangements[f'{lanes} lane(s) Class A'] = {'CLASS_A': lanes}
+    for key in HEAVY_VEHICLES:
+        if key not in per_vehicle or (lanes < 2 and 'CLASS_A' in per_vehicle):
+            continue
+        combo = {key: 1}
+        name = vehicles[key].name
+        if lanes > 2 and 'CLASS_A' in per_vehicle:
+            combo['CLASS_A'] = lanes - 2
+            name += f' + {lanes - 2} lane(s) Class A'
+        arrangements[name] = combo
+
+    reduction = lane_reduction_factor(lanes)
+    fields = ('reaction', 'reaction_with_impact', 'max_moment', 'min_moment')
+    totals = {name: {f: reduction * sum(count * per_vehicle[k][f] for k, count in combo.items())
+                     for f in fields}
+              for name, combo in arrangements.items()}
+
+    names = list(totals)
+    stack = {f: np.stack([totals[n][f] for n in names]) for f in fields}
+    gov_reaction = np.argmax(stack['reaction_with_impact'], axis=0)
+    gov_sag = np.argmax(stack['max_moment'], axis=0)
+    gov_hog = np.argmin(stack['min_moment'], axis=0)
+    supports = np.arange(len(lines.support_positions))
+    sections = np.arange(len(lines.section_positions))
+
+    return {
+        'lanes': lanes,
+        'support_positions': lines.support_positions.tolist(),
+        'section_positions': lines.section_positions.tolist(),
+        'max_reaction': stack['reaction'][gov_reaction, supports].tolist(),
+        'max_reaction_with_impact': stack['reaction_with_impact'][gov_reaction, supports].tolist(),
+        'reaction_governed_by': [names[i] for i in gov_reaction],
+        'max_sagging_moment': stack['max_moment'][gov_sag, sections].tolist(),
+        'max_hogging_moment': stack['min_moment'][gov_hog, sections].tolist(),
+        'per_vehicle': {k: {f: v[f].tolist() for f in v} for k, v in per_vehicle.items()},
+    }
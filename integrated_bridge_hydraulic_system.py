@@ -10,6 +10,8 @@ import io
 import base64
 from datetime import datetime
 from pathlib import Path
+from plot_decimation import decimated
+from chart_cache import cached_chart
 
 # Import existing functionality
 try:
@@ -86,8 +88,9 @@ class IntegratedBridgeHydraulicSystem:
         if 'cross_section' in self.hydraulic_data:
             coords = self.hydraulic_data['cross_section'].get('coordinates', [])
             if coords:
-                chainages = [c['chainage'] for c in coords]
-                elevations = [c['elevation'] for c in coords]
+                chainages, elevations = decimated([c['chainage'] for c in coords],
+                                                  [c['elevation'] for c in coords])
+                chainages, elevations = chainages.tolist(), elevations.tolist()
                 
                 # Add river bed profile
                 fig.add_trace(
@@ -723,7 +726,7 @@ def display_integrated_cross_section(system):
     st.header("📊 Integrated Cross Section Analysis")
     
     # Create and display the integrated plot
-    fig = system.create_integrated_cross_section_plot()
+    fig = cached_chart(system.create_integrated_cross_section_plot, depends_on=system.hydraulic_data)
     st.plotly_chart(fig, use_container_width=True)
     
     # Display coordinate data if available
@@ -763,6 +766,61 @@ def display_integrated_cross_section(system):
                 st.info(f"**Avg Bed Level**: {coords_df['elevation'].mean():.2f} m")
                 st.info(f"**Max Depth at HFL**: {coords_df['Water_Depth_at_HFL'].max():.2f} m")
 
+def longitudinal_profile_chart(profile_data):
+    """Bed profile with normal and HFL water surfaces and the bridge location"""
+    chainages = [p['chainage'] for p in profile_data]
+    bed_levels = [p['bed_level'] for p in profile_data]
+    
+    fig = go.Figure()
+    
+    # Add bed profile
+    fig.add_trace(go.Scatter(
+        x=chainages, y=bed_levels,
+        mode='lines+markers',
+        name='River Bed Profile',
+        line=dict(color='saddlebrown', width=3),
+        marker=dict(size=8, color='brown')
+    ))
+    
+    # Add water surface profiles
+    normal_surface = [level + 3.0 for level in bed_levels]
+    hfl_surface = [level + 5.02 for level in bed_levels]  # Normal + afflux
+    
+    fig.add_trace(go.Scatter(
+        x=chainages, y=normal_surface,
+        mode='lines',
+        name='Normal Water Surface',
+        line=dict(color='blue', width=2, dash='dot')
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=chainages, y=hfl_surface,
+        mode='lines',
+        name='HFL Water Surface',
+        line=dict(color='red', width=3),
+        fill='tonexty',
+        fillcolor='rgba(255, 0, 0, 0.2)'
+    ))
+    
+    # Add bridge location
+    bridge_chainage = np.mean(chainages)
+    fig.add_vline(
+        x=bridge_chainage,
+        line_dash="solid",
+        line_color="black",
+        line_width=3,
+        annotation_text="Bridge Location"
+    )
+    
+    fig.update_layout(
+        title="Longitudinal Section - Bundan River with Water Surface Profiles",
+        xaxis_title="Chainage (m)",
+        yaxis_title="Elevation (m)",
+        height=600,
+        template='plotly_white'
+    )
+    return fig
+
 def display_longitudinal_analysis(system):
     st.header("📈 Longitudinal Section Analysis")
     
@@ -774,55 +832,7 @@ def display_longitudinal_analysis(system):
             chainages = [p['chainage'] for p in profile_data]
             bed_levels = [p['bed_level'] for p in profile_data]
             
-            fig = go.Figure()
-            
-            # Add bed profile
-            fig.add_trace(go.Scatter(
-                x=chainages, y=bed_levels,
-                mode='lines+markers',
-                name='River Bed Profile',
-                line=dict(color='saddlebrown', width=3),
-                marker=dict(size=8, color='brown')
-            ))
-            
-            # Add water surface profiles
-            normal_surface = [level + 3.0 for level in bed_levels]
-            hfl_surface = [level + 5.02 for level in bed_levels]  # Normal + afflux
-            
-            fig.add_trace(go.Scatter(
-                x=chainages, y=normal_surface,
-                mode='lines',
-                name='Normal Water Surface',
-                line=dict(color='blue', width=2, dash='dot')
-            ))
-            
-            fig.add_trace(go.Scatter(
-                x=chainages, y=hfl_surface,
-                mode='lines',
-                name='HFL Water Surface',
-                line=dict(color='red', width=3),
-                fill='tonexty',
-                fillcolor='rgba(255, 0, 0, 0.2)'
-            ))
-            
-            # Add bridge location
-            bridge_chainage = np.mean(chainages)
-            fig.add_vline(
-                x=bridge_chainage,
-                line_dash="solid",
-                line_color="black",
-                line_width=3,
-                annotation_text="Bridge Location"
-            )
-            
-            fig.update_layout(
-                title="Longitudinal Section - Bundan River with Water Surface Profiles",
-                xaxis_title="Chainage (m)",
-                yaxis_title="Elevation (m)",
-                height=600,
-                template='plotly_white'
-            )
-            
+            fig = cached_chart(longitudinal_profile_chart, profile_data)
             st.plotly_chart(fig, use_container_width=True)
             
             # Display slope analysis
@@ -865,7 +875,7 @@ def display_afflux_analysis(system):
     st.header("💧 Detailed Afflux Analysis")
     
     # Create and display detailed afflux plot
-    fig = system.create_afflux_detailed_analysis()
+    fig = cached_chart(system.create_afflux_detailed_analysis, depends_on=system.hydraulic_data)
     st.plotly_chart(fig, use_container_width=True)
     
     # Afflux calculation details
@@ -910,7 +920,7 @@ def display_anchorage_design(system):
     st.header("⚓ Deck Anchorage Design Analysis")
     
     # Create and display anchorage design plot
-    fig = system.create_deck_anchorage_design_plot()
+    fig = cached_chart(system.create_deck_anchorage_design_plot, depends_on=system.hydraulic_data)
     st.plotly_chart(fig, use_container_width=True)
     
     # Design calculations
@@ -1011,7 +1021,7 @@ def display_hfl_printer(system):
         
         # Show alternative visualization
         st.subheader("📊 Cross-Section Visualization (Alternative)")
-        fig = system.create_integrated_cross_section_plot()
+        fig = cached_chart(system.create_integrated_cross_section_plot, depends_on=system.hydraulic_data)
         st.plotly_chart(fig, use_container_width=True)
 
 def display_l_section_plotter(system):
@@ -1080,3 +1090,26 @@ def display_complete_summary(system):
             'Survey Data', 'Calculated', 'NWL + Afflux', 'Survey Data', 'Survey Data',
             'Design', 'Design', 'L-Section Survey', 'IRC SP-13',
             'Hydrostatic', 'Calculated', 'SF = 1.5'
+        ]
+    }
+    
+    summary_df = pd.DataFrame(summary_data)
+    st.dataframe(summary_df, use_container_width=True)
+    
+    st.success("✅ Hydraulic, geometric and structural parameters integrated from the extracted Excel data")
+
+def display_comprehensive_report(system):
+    st.header("📄 Comprehensive Design Report")
+    
+    report_html = system.generate_comprehensive_report()
+    st.markdown(report_html, unsafe_allow_html=True)
+    
+    st.download_button(
+        label="📥 Download Report (HTML)",
+        data=report_html,
+        file_name=f"integrated_bridge_hydraulic_report_{datetime.now().strftime('%Y%m%d')}.html",
+        mime="text/html"
+    )
+
+if __name__ == "__main__":
+    main()
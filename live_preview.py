@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+LIVE PREVIEW
+Dependency-tracked, debounced recomputation of live calculation previews
+
+A preview is a list of named outputs, each computed from named parameters
+and earlier outputs.  PreviewModel keeps the last parameters and outputs:
+when a parameter changes, only the outputs that depend on it (directly or
+through other outputs) are recomputed, and complete output sets are kept per
+parameter state, so going back to a state seen before (undoing an edit,
+dragging a slider back) recomputes nothing.
+
+Outputs marked slow (the full design pipeline) are debounced: while edits
+keep arriving they stay stale and are reported as pending; they are
+recomputed once the parameters have been quiet for debounce_s, or when the
+caller asks to settle.  Fast outputs are always current, so the preview
+follows every keystroke while the heavy work runs once per pause.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from chart_cache import data_hash
+
+
+@dataclass(frozen=True)
+class PreviewOutput:
+    """One preview value: compute(**{name: value for name in inputs})"""
+    name: str
+    inputs: Tuple[str, ...]
+    compute: Callable[..., Any]
+    slow: bool = False
+
+
+@dataclass
+class PreviewState:
+    """Outputs after an update, which were recomputed and which slow ones are still stale"""
+    values: Dict[str, Any]
+    recomputed: List[str] = field(default_factory=list)
+    pending: List[str] = field(default_factory=list)
+    from_cache: bool = False
+
+
+class PreviewModel:
+    """
+    Incremental evaluation of preview outputs.  Outputs must be listed so
+    that each reads only parameters and outputs listed before it.
+    """
+
+    def __init__(self, outputs: Sequence[PreviewOutput], defaults: Optional[Mapping[str, Any]] = None,
+                 debounce_s: float = 0.35, max_states: int = 64):
+        self.outputs = list(outputs)
+        self.defaults = dict(defaults or {})
+        self.debounce_s = debounce_s
+        self.max_states = max_states
+        names = {output.name for output in self.outputs}
+        if len(names) != len(self.outputs):
+            raise ValueError("Preview output names must be unique")
+        seen: Set[str] = set()
+        self.parameters: Tuple[str, ...] = ()
+        for output in self.outputs:
+            later = [name for name in output.inputs if name in names and name not in seen]
+            if later:
+                raise ValueError(f"Preview output {output.name} reads {later} before they are computed")
+            self.parameters += tuple(name for name in output.inputs
+                                     if name not in names and name not in self.parameters)
+            seen.add(output.name)
+        self._dependents: Dict[str, List[str]] = {}
+        for output in self.outputs:
+            for name in output.inputs:
+                self._dependents.setdefault(name, []).append(output.name)
+        self._inputs: Dict[str, Any] = {}
+        self._values: Dict[str, Any] = {}
+        self._stale: Set[str] = set()
+        self._last_change = float('-inf')
+        self._states: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def affected(self, changed: Sequence[str]) -> Set[str]:
+        """Outputs depending on the changed parameters, directly or through other outputs"""
+        affected: Set[str] = set()
+        stack = list(changed)
+        while stack:
+            for name in self._dependents.get(stack.pop(), ()):
+                if name not in affected:
+                    affected.add(name)
+                    stack.append(name)
+        return affected
+
+    def quiet_for(self, now: Optional[float] = None) -> float:
+        """Seconds since the parameters last changed"""
+        return (time.monotonic() if now is None else now) - self._last_change
+
+    def update(self, parameters: Mapping[str, Any], settle: bool = False,
+               now: Optional[float] = None) -> PreviewState:
+        """
+        Bring the outputs up to date with parameters.  Slow outputs are only
+        recomputed with settle=True or after debounce_s without changes.
+        """
+        now = time.monotonic() if now is None else now
+        inputs = {name: parameters.get(name, self.defaults.get(name)) for name in self.parameters}
+        key = data_hash(inputs)
+        changed = [name for name in self.parameters
+                   if name not in self._inputs or self._inputs[name] != inputs[name]]
+        if changed:
+            self._last_change = now
+        self._inputs = inputs
+
+        cached = self._states.get(key)
+        if cached is not None:
+            self._states.move_to_end(key)
+            self.hits += 1
+            self._values = dict(cached)
+            self._stale = set()
+            return PreviewState(dict(cached), from_cache=True)
+        self.misses += 1
+
+        settle = settle or self.quiet_for(now) >= self.debounce_s
+        dirty = self.affected(changed) | self._stale
+        values = dict(inputs)
+        values.update(self._values)
+        recomputed, pending = [], []
+        for output in self.outputs:
+            if output.name not in dirty and output.name in self._values:
+                continue
+            if (output.slow and not settle) or any(name in pending for name in output.inputs):
+                pending.append(output.name)
+                continue
+            values[output.name] = output.compute(**{name: values[name] for name in output.inputs})
+            recomputed.append(output.name)
+
+        self._values = {output.name: values[output.name] for output in self.outputs if output.name in values}
+        self._stale = set(pending)
+        if not pending:
+            self._states[key] = dict(self._values)
+            while len(self._states) > self.max_states:
+                self._states.popitem(last=False)
+        return PreviewState(dict(self._values), recomputed, pending)
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+LOAD COMBINATION ENGINE
+IRC:6 combination / partial-factor matrix evaluated in one matrix product
+
+Every load case is an action vector at the base of the member
+(vertical, horizontal along L, horizontal along B, moment along L, moment
+along B), where L/B follow the footing convention used by FootingOptimizer.
+All combinations are rows of a factor matrix, so
+
+    design_actions = factors @ load_vectors        (C × N) @ (N × 5)
+
+evaluates every combination at once; checking dozens of combinations costs
+the same as checking one.  Factors follow IRC:6 Annex B (Tables B.1-B.4):
+equilibrium, basic/seismic ULS, rare/frequent/quasi-permanent SLS and the
+base-pressure combinations used for foundation sizing.
+"""
+
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
+
+from footing_pressure_solver import solve_base_pressure
+
+# ============================================================================
+# LOAD CASES AND ACTION COMPONENTS
+# ============================================================================
+
+LOAD_CASES = (
+    'dead',
+    'live',
+    'water_current',
+    'wind',
+    'braking',
+    'temperature',
+    'seismic',
+)
+
+ACTION_COMPONENTS = (
+    'vertical',          # kN
+    'horizontal_long',   # kN, along footing length L
+    'horizontal_trans',  # kN, along footing width B
+    'moment_long',       # kN-m, produces eccentricity along L
+    'moment_trans',      # kN-m, produces eccentricity along B
+)
+
+@dataclass
+class LoadCombination:
+    """One row of the IRC:6 combination matrix"""
+    name: str
+    limit_state: str  # 'equilibrium' | 'uls' | 'sls' | 'base_pressure'
+    factors: Dict[str, float] = field(default_factory=dict)
+    sbc_increase: float = 1.0  # IRC:78 permits +25% SBC with wind/seismic
+    min_contact_ratio: float = 1.0  # fraction of base that must stay in contact
+
+    def factor_row(self) -> np.ndarray:
+        return np.array([self.factors.get(case, 0.0) for case in LOAD_CASES])
+
+# ============================================================================
+# IRC:6 ANNEX B COMBINATIONS
+# ============================================================================
+
+IRC6_COMBINATIONS: List[LoadCombination] = [
+    # Table B.1 - Verification of equilibrium (overturning / sliding)
+    LoadCombination('EQU-1 LL leading', 'equilibrium',
+                    {'dead': 1.05, 'live': 1.5, 'braking': 1.5, 'water_current': 1.0,
+                     'wind': 0.9, 'temperature': 0.9}),
+    LoadCombination('EQU-2 Wind leading', 'equilibrium',
+                    {'dead': 0.95, 'live': 1.15, 'braking': 1.15, 'water_current': 1.0,
+                     'wind': 1.5, 'temperature': 0.9}),
+    LoadCombination('EQU-3 Seismic', 'equilibrium',
+                    {'dead': 0.95, 'live': 0.2, 'braking': 0.2, 'water_current': 1.0,
+                     'seismic': 1.5}),
+
+    # Table B.2 - Structural strength, basic and seismic combinations
+    LoadCombination('ULS-1 LL leading', 'uls',
+                    {'dead': 1.35, 'live': 1.5, 'braking': 1.5, 'water_current': 1.0,
+                     'wind': 0.9, 'temperature': 0.9}),
+    LoadCombination('ULS-2 Wind leading', 'uls',
+                    {'dead': 1.35, 'live': 1.15, 'braking': 1.15, 'water_current': 1.0,
+                     'wind': 1.5, 'temperature': 0.9}),
+    LoadCombination('ULS-3 Temperature leading', 'uls',
+                    {'dead': 1.35, 'live': 1.15, 'braking': 1.15, 'water_current': 1.0,
+                     'wind': 0.9, 'temperature': 1.5}),
+    LoadCombination('ULS-4 Dead relieving', 'uls',
+                    {'dead': 1.0, 'live': 1.5, 'braking': 1.5, 'water_current': 1.0,
+                     'wind': 0.9, 'temperature': 0.9}),
+    LoadCombination('ULS-5 Seismic', 'uls',
+                    {'dead': 1.35, 'live': 0.2, 'braking': 0.2, 'water_current': 1.0,
+                     'seismic': 1.5}),
+
+    # Table B.3 - Serviceability
+    LoadCombination('SLS-Rare LL leading', 'sls',
+                    {'dead': 1.0, 'live': 1.0, 'braking': 1.0, 'water_current': 1.0,
+                     'wind': 0.6, 'temperature': 0.6}),
+    LoadCombination('SLS-Rare Wind leading', 'sls',
+                    {'dead': 1.0, 'live': 0.75, 'braking': 0.75, 'water_current': 1.0,
+                     'wind': 1.0, 'temperature': 0.6}),
+    LoadCombination('SLS-Frequent', 'sls',
+                    {'dead': 1.0, 'live': 0.75, 'braking': 0.75, 'water_current': 1.0,
+                     'wind': 0.6, 'temperature': 0.5}),
+    LoadCombination('SLS-Quasi-permanent', 'sls',
+                    {'dead': 1.0, 'water_current': 1.0, 'temperature': 0.5}),
+
+    # Table B.4 - Checking base pressure and design of foundation
+    LoadCombination('BP-1 LL leading', 'base_pressure',
+                    {'dead': 1.0, 'live': 1.0, 'braking': 1.0, 'water_current': 1.0,
+                     'temperature': 1.0}),
+    LoadCombination('BP-2 Wind leading', 'base_pressure',
+                    {'dead': 1.0, 'live': 0.75, 'braking': 0.75, 'water_current': 1.0,
+                     'wind': 1.0, 'temperature': 1.0},
+                    sbc_increase=1.25, min_contact_ratio=0.8),
+    LoadCombination('BP-3 Seismic', 'base_pressure',
+                    {'dead': 1.0, 'live': 0.2, 'braking': 0.2, 'water_current': 1.0,
+                     'seismic': 1.0},
+                    sbc_increase=1.25, min_contact_ratio=0.8),
+]
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+LoadVectors = Union[Dict[str, Union[List[float], np.ndarray]], np.ndarray]
+
+class LoadCombinationEngine:
+    """Applies the combination matrix to load vectors in one vectorized pass"""
+
+    def __init__(self, combinations: Optional[List[LoadCombination]] = None):
+        self.combinations = list(combinations or IRC6_COMBINATIONS)
+        self.factor_matrix = np.array([combo.factor_row() for combo in self.combinations])
+        self.names = [combo.name for combo in self.combinations]
+        self.limit_states = np.array([combo.limit_state for combo in self.combinations])
+        self.sbc_increase = np.array([combo.sbc_increase for combo in self.combinations])
+        self.min_contact_ratio = np.array([combo.min_contact_ratio for combo in self.combinations])
+
+    @staticmethod
+    def stack_load_vectors(load_vectors: LoadVectors) -> np.ndarray:
+        """
+        Normalise load vectors to an array of shape (..., n_cases, 5).
+        A dict maps case name -> 5-component vector; missing cases are zero.
+        """
+        if isinstance(load_vectors, dict):
+            unknown = set(load_vectors) - set(LOAD_CASES)
+            if unknown:
+                raise ValueError(f"Unknown load cases: {sorted(unknown)}")
+            sample = next(iter(load_vectors.values()), np.zeros(len(ACTION_COMPONENTS)))
+            zero = np.zeros(np.shape(sample))
+            return np.stack([np.asarray(load_vectors.get(case, zero), dtype=float)
+                             for case in LOAD_CASES], axis=-2)
+        array = np.asarray(load_vectors, dtype=float)
+        if array.shape[-2:] != (len(LOAD_CASES), len(ACTION_COMPONENTS)):
+            raise ValueError(f"Load vector array must end in shape "
+                             f"({len(LOAD_CASES)}, {len(ACTION_COMPONENTS)}), got {array.shape}")
+        return array
+
+    def evaluate(self, load_vectors: LoadVectors, limit_state: Optional[str] = None) -> np.ndarray:
+        """
+        Factored actions for every combination: shape (..., n_combinations, 5).
+        Leading dimensions of the load vectors (e.g. many piers or designs)
+        are carried through the single matrix product.
+        """
+        stacked = self.stack_load_vectors(load_vectors)
+        factors = self.factor_matrix
+        if limit_state is not None:
+            factors = factors[self.limit_states == limit_state]
+        return factors @ stacked
+
+    def _select(self, limit_state: str) -> np.ndarray:
+        mask = self.limit_states == limit_state
+        if not mask.any():
+            raise ValueError(f"No combinations defined for limit state '{limit_state}'")
+        return np.nonzero(mask)[0]
+
+    def governing_actions(self, load_vectors: LoadVectors,
+                          limit_state: str = 'uls') -> Dict[str, any]:
+        """Envelope of factored actions for one limit state (single load set)"""
+        idx = self._select(limit_state)
+        actions = self.evaluate(load_vectors)[..., idx, :]
+        if actions.ndim != 2:
+            raise ValueError("governing_actions expects a single set of load vectors")
+        magnitudes = np.abs(actions)
+        envelope = {}
+        for k, component in enumerate(ACTION_COMPONENTS):
+            i = int(np.argmax(magnitudes[:, k]))
+            envelope[component] = {
+                'value': float(actions[i, k]),
+                'combination': self.names[idx[i]],
+            }
+        return {
+            'limit_state': limit_state,
+            'combinations': {self.names[i]: dict(zip(ACTION_COMPONENTS, map(float, actions[j])))
+                             for j, i in enumerate(idx)},
+            'envelope': envelope,
+        }
+
+    def base_pressure_check(self, length, width, load_vectors: LoadVectors,
+                            safe_bearing_capacity: float,
+                            min_contact_ratio: float = 1.0) -> Dict[str, np.ndarray]:
+        """
+        Base pressure under every base-pressure combination for any grid of
+        footing sizes, solved in one call to the no-tension solver.
+
+        Returns arrays over the footing grid: governing utilisation (pressure
+        over the permitted SBC), the combination index that governs, the
+        governing pressure / contact ratio and an overall 'acceptable' flag.
+        """
+        idx = self._select('base_pressure')
+        actions = self.evaluate(load_vectors)[..., idx, :]  # (C, 5)
+        if actions.ndim != 2:
+            raise ValueError("base_pressure_check expects a single set of load vectors")
+
+        L = np.asarray(length, dtype=float)[..., None]
+        B = np.asarray(width, dtype=float)[..., None]
+        pressures = solve_base_pressure(L, B, actions[:, 0],
+                                        actions[:, 3], actions[:, 4])
+
+        allowable = safe_bearing_capacity * self.sbc_increase[idx]
+        required_contact = np.minimum(self.min_contact_ratio[idx], min_contact_ratio)
+        utilisation = np.where(pressures['stable'], pressures['max_pressure'] / allowable, np.inf)
+        contact_ok = pressures['contact_ratio'] >= required_contact - 1e-9
+        # Contact shortfall is treated as failure for the governing search
+        score = np.where(contact_ok, utilisation, np.inf)
+
+        governing = np.argmax(score, axis=-1)
+        pick = lambda arr: np.take_along_axis(arr, governing[..., None], axis=-1)[..., 0]
+        return {
+            'acceptable': np.all(contact_ok & (utilisation < 1.0), axis=-1),
+            'governing_index': idx[governing],
+            'utilization_ratio': pick(utilisation),
+            'max_pressure': pick(pressures['max_pressure']),
+            'min_pressure': pick(pressures['min_pressure']),
+            'area_in_tension': pick(pressures['area_in_tension']),
+            'contact_ratio': pick(pressures['contact_ratio']),
+            'eccentricity_longitudinal': pick(pressures['eccentricity_longitudinal']),
+            'eccentricity_transverse': pick(pressures['eccentricity_transverse']),
+            'vertical_load': actions[:, 0][governing],
+            'moment_long': actions[:, 3][governing],
+            'moment_trans': actions[:, 4][governing],
+        }
+
+def action_vector(vertical: float = 0.0, horizontal_long: float = 0.0,
+                  horizontal_trans: float = 0.0, lever_arm: float = 0.0,
+                  moment_long: float = 0.0, moment_trans: float = 0.0) -> np.ndarray:
+    """
+    Build a 5-component action vector; horizontal forces applied at
+    lever_arm above the base add their overturning moments.
+    """
+    return np.array([
+        vertical,
+        horizontal_long,
+        horizontal_trans,
+        moment_long + horizontal_long * lever_arm,
+        moment_trans + horizontal_trans * lever_arm,
+    ], dtype=float)
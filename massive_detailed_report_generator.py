@@ -12,558 +12,127 @@ Author: Enhanced Bridge Design App
 Version: 3.0.0 - Professional Engineering Documentation
 """
 
-import json
 import os
-from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import math
 
-def generate_massive_detailed_report():
-    """Generate comprehensive 250+ page bridge design report"""
+from reinforcement_optimizer import ReinforcedMember, design_members
+from report_engine import (Deferred, FragmentCache, ReportEngine, Section, Template, default_report_path,
+                           load_results)
+
+def generate_massive_detailed_report(results: Dict[str, Any], report_filepath: Optional[str] = None) -> str:
+    """
+    Generate comprehensive 250+ page bridge design report
+    
+    The report is streamed section by section from precompiled templates
+    (MASSIVE_REPORT) to report_filepath, by default
+    reports/Massive_Bridge_Design_Report_<timestamp>.html.  For an HTTP
+    response use MASSIVE_REPORT.iter_bytes(results).  Sections whose input
+    results are unchanged since an earlier report are copied from the
+    fragment cache instead of being rendered again.
+    """
     
     print("📄 MASSIVE DETAILED BRIDGE DESIGN REPORT GENERATOR")
     print("="*60)
     print("🎯 Target: 250+ A4 pages of professional engineering documentation")
     print("📋 All sheets in chronological order with full details")
     
-    # Load results
-    results_file = r"c:\Users\Rajkumar\Bridge_Slab_Design\sample_slab_bridge_design_results.json"
-    
-    if not os.path.exists(results_file):
-        print("❌ Bridge design results file not found!")
-        return
-    
-    with open(results_file, 'r') as f:
-        results = json.load(f)
+    report_filepath = report_filepath or default_report_path('Massive_Bridge_Design_Report')
+    print(f"📝 Creating massive report: {os.path.basename(report_filepath)}")
     
-    # Generate massive report
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    report_filename = f'Massive_Bridge_Design_Report_{timestamp}.html'
-    report_filepath = os.path.join(os.path.dirname(results_file), report_filename)
+    # Write massive HTML file
+    content_length = MASSIVE_REPORT.write(results, report_filepath)
     
-    print(f"📝 Creating massive report: {report_filename}")
+    print(f"✅ Massive detailed report created: {report_filepath}")
     
-    # Extract comprehensive data
-    project_info = results.get('project_info', {})
-    hydraulic = results.get('hydraulic_analysis', {})
-    pier = results.get('pier_design', {})
-    detailed_pier = results.get('detailed_pier_geometry', {})
-    foundation = results.get('foundation_design', {})
-    estimation = results.get('comprehensive_estimation', {})
+    # Calculate approximate page count
+    estimated_pages = max(250, content_length // 8000)  # Rough estimate
     
-    # Generate comprehensive calculations and detailed sheets
-    detailed_calculations = generate_detailed_calculations(results)
-    construction_details = generate_construction_details(results)
-    quality_specs = generate_quality_specifications()
-    safety_analysis = generate_safety_analysis(results)
-    environmental_analysis = generate_environmental_analysis()
+    print(f"\n📊 MASSIVE REPORT STATISTICS:")
+    print(f"• File size: {os.path.getsize(report_filepath) / 1024:.1f} KB")
+    print(f"• Estimated pages: {estimated_pages}+ A4 pages")
+    print(f"• Content length: {content_length:,} characters")
+    print(f"• Sections rendered: {len(MASSIVE_REPORT.rendered)}, reused from cache: {len(MASSIVE_REPORT.reused)}")
+    print(f"• Format: Professional engineering documentation")
+    print(f"• Ready for professional printing and submission")
     
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Massive Bridge Design Report - 250+ Pages</title>
-    <style>
-        body {{
-            font-family: "Times New Roman", serif;
-            line-height: 1.4;
-            margin: 0;
-            padding: 15px;
-            font-size: 11pt;
-            color: #000;
-        }}
-        .page {{
-            width: 210mm;
-            min-height: 297mm;
-            margin: 0 auto 20px auto;
-            padding: 20mm;
-            background: white;
-            box-shadow: 0 0 10px rgba(0,0,0,0.1);
-            page-break-after: always;
-        }}
-        .page:last-child {{
-            page-break-after: auto;
-        }}
-        .header {{
-            text-align: center;
-            border-bottom: 2px solid #000;
-            padding-bottom: 15px;
-            margin-bottom: 20px;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 18pt;
-            font-weight: bold;
-        }}
-        .header h2 {{
-            margin: 5px 0;
-            font-size: 14pt;
-        }}
-        .section-title {{
-            background: #000;
-            color: white;
-            padding: 8px 15px;
-            margin: 20px 0 10px 0;
-            font-size: 14pt;
-            font-weight: bold;
-        }}
-        .subsection {{
-            margin: 15px 0;
-            padding: 10px;
-            border-left: 3px solid #333;
-        }}
-        .calculation-box {{
-            background: #f9f9f9;
-            border: 1px solid #ccc;
-            padding: 15px;
-            margin: 10px 0;
-            font-family: "Courier New", monospace;
-        }}
-        .data-table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 15px 0;
-            font-size: 10pt;
-        }}
-        .data-table th, .data-table td {{
-            border: 1px solid #000;
-            padding: 6px;
-            text-align: left;
-        }}
-        .data-table th {{
-            background: #e0e0e0;
-            font-weight: bold;
-        }}
-        .formula {{
-            background: #fff8dc;
-            border: 1px dashed #000;
-            padding: 10px;
-            margin: 10px 0;
-            text-align: center;
-            font-style: italic;
-        }}
-        .drawing-placeholder {{
-            border: 2px solid #000;
-            height: 200px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin: 20px 0;
-            background: #f0f0f0;
-        }}
-        .page-number {{
-            position: absolute;
-            bottom: 10mm;
-            right: 20mm;
-            font-size: 10pt;
-        }}
-        @media print {{
-            body {{ background: white; }}
-            .page {{ 
-                box-shadow: none; 
-                margin: 0;
-                page-break-after: always;
-            }}
-        }}
-    </style>
-</head>
-<body>
+    return report_filepath
 
-<!-- COVER PAGE -->
-<div class="page">
-    <div class="header">
-        <h1>COMPREHENSIVE BRIDGE DESIGN REPORT</h1>
-        <h2>Complete Engineering Documentation</h2>
-        <h2>250+ Pages Professional Design</h2>
-    </div>
-    
-    <div style="text-align: center; margin-top: 100px;">
-        <h2>PROJECT: {project_info.get('bridge_name', 'Advanced Bridge Design Project')}</h2>
-        <h3>LOCATION: {project_info.get('location', 'Professional Engineering Site')}</h3>
-        <p style="font-size: 14pt; margin-top: 50px;">
-            <strong>Design Standards:</strong><br>
-            IS 456:2000 - Code for Plain and Reinforced Concrete<br>
-            IRC:6-2017 - Loads and Load Combinations<br>
-            IRC:21-2000 - Standard Specifications<br>
-            IRC:78-2014 - Standard Specifications for Road Bridges
-        </p>
-        
-        <p style="margin-top: 80px;">
-            <strong>Prepared by:</strong> Professional Bridge Design Team<br>
-            <strong>Date:</strong> {datetime.now().strftime('%B %d, %Y')}<br>
-            <strong>Report Version:</strong> 3.0.0 - Complete Engineering Documentation
-        </p>
-    </div>
-    <div class="page-number">Page 1 of 250+</div>
-</div>
+def report_context(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Values the report templates and section generators read"""
+    return {
+        'results': results,
+        'project_info': results.get('project_info', {}),
+        'hydraulic': results.get('hydraulic_analysis', {}),
+        'pier': results.get('pier_design', {}),
+        'detailed_pier': results.get('detailed_pier_geometry', {}),
+        'foundation': results.get('foundation_design', {}),
+        'estimation': results.get('comprehensive_estimation', {}),
+        # Comprehensive calculations and detailed sheets, computed only when a
+        # section that reads them is rendered (not copied from the cache)
+        'detailed_calculations': Deferred(generate_detailed_calculations, results),
+        'construction_details': Deferred(generate_construction_details, results),
+        'quality_specs': Deferred(generate_quality_specifications),
+        'safety_analysis': Deferred(generate_safety_analysis, results),
+        'environmental_analysis': Deferred(generate_environmental_analysis),
+    }
 
-<!-- TABLE OF CONTENTS -->
-<div class="page">
-    <div class="section-title">TABLE OF CONTENTS</div>
+def generate_detailed_calculations(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate detailed engineering calculations for all components"""
+    calculations = {
+        'structural_analysis': {
+            'deck_slab': calculate_deck_slab_analysis(results),
+            'pier_analysis': calculate_pier_analysis(results),
+            'foundation': calculate_foundation_analysis(results)
+        },
+        'reinforcement': {
+            'main_steel': calculate_main_reinforcement(results),
+            'shear_steel': calculate_shear_reinforcement(results),
+            'development_length': calculate_development_lengths(results)
+        },
+        'load_analysis': {
+            'dead_loads': calculate_dead_loads(results),
+            'live_loads': calculate_live_loads_detailed(results),
+            'combinations': calculate_load_combinations(results)
+        }
+    }
+    return calculations
+
+def calculate_deck_slab_analysis(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Detailed deck slab structural analysis"""
+    span = results.get('project_info', {}).get('span_length', 12.0)
+    width = results.get('project_info', {}).get('bridge_width', 12.5)
+    thickness = 0.8  # m
     
-    <h3>PART I: PROJECT OVERVIEW & SPECIFICATIONS (Pages 1-25)</h3>
-    <ul>
-        <li>1.1 Project Introduction and Scope................................3</li>
-        <li>1.2 Design Standards and Codes...................................4</li>
-        <li>1.3 Material Specifications.....................................5</li>
-        <li>1.4 Site Conditions and Survey Data.............................6-8</li>
-        <li>1.5 Design Criteria and Parameters..............................9-12</li>
-        <li>1.6 Load Combinations and Safety Factors........................13-15</li>
-        <li>1.7 Quality Assurance Requirements..............................16-18</li>
-        <li>1.8 Environmental Considerations................................19-21</li>
-        <li>1.9 Construction Methodology Overview...........................22-25</li>
-    </ul>
+    # Material properties
+    fck = 25  # N/mm²
+    fy = 415  # N/mm²
     
-    <h3>PART II: HYDRAULIC ANALYSIS & DESIGN (Pages 26-55)</h3>
-    <ul>
-        <li>2.1 Hydrological Data and Analysis..............................26-30</li>
-        <li>2.2 Channel Characteristics and Flow Data.......................31-35</li>
-        <li>2.3 Hydraulic Design Calculations...............................36-42</li>
-        <li>2.4 Afflux Analysis and Waterway Design.........................43-47</li>
-        <li>2.5 Scour Analysis and Foundation Protection....................48-52</li>
-        <li>2.6 Hydraulic Model Studies and Verification....................53-55</li>
-    </ul>
+    # Load calculations
+    self_weight = 25 * thickness  # kN/m²
+    live_load = 12.0  # kN/m² (IRC loading)
     
-    <h3>PART III: STRUCTURAL ANALYSIS & DESIGN (Pages 56-120)</h3>
-    <ul>
-        <li>3.1 Bridge Configuration and Layout.............................56-60</li>
-        <li>3.2 Load Analysis - Dead Loads..................................61-65</li>
-        <li>3.3 Load Analysis - Live Loads (IRC Standards)..................66-75</li>
-        <li>3.4 Load Analysis - Environmental Loads.........................76-80</li>
-        <li>3.5 Structural Analysis - Deck Slab.............................81-90</li>
-        <li>3.6 Structural Analysis - Pier Design...........................91-105</li>
-        <li>3.7 Foundation Design and Analysis..............................106-115</li>
-        <li>3.8 Abutment Design (Type-1 and Type-2).........................116-120</li>
-    </ul>
+    # Moment calculations
+    total_load = self_weight + live_load
+    max_moment = total_load * span**2 / 8  # kNm/m
     
-    <h3>PART IV: DETAILED DESIGN & REINFORCEMENT (Pages 121-180)</h3>
-    <ul>
-        <li>4.1 Reinforcement Design - Deck Slab............................121-135</li>
-        <li>4.2 Reinforcement Design - Pier Components......................136-155</li>
-        <li>4.3 Reinforcement Design - Foundation...........................156-165</li>
-        <li>4.4 Reinforcement Design - Abutments............................166-175</li>
-        <li>4.5 Bar Bending Schedules and Details...........................176-180</li>
-    </ul>
-    
-    <h3>PART V: CONSTRUCTION DETAILS & SPECIFICATIONS (Pages 181-220)</h3>
-    <ul>
-        <li>5.1 Construction Sequence and Methodology.......................181-185</li>
-        <li>5.2 Formwork Design and Specifications..........................186-190</li>
-        <li>5.3 Concrete Mix Design and Quality Control.....................191-195</li>
-        <li>5.4 Steel Reinforcement Installation............................196-200</li>
-        <li>5.5 Quality Control and Testing Procedures......................201-210</li>
-        <li>5.6 Safety Specifications and Risk Assessment...................211-220</li>
-    </ul>
-    
-    <h3>PART VI: COST ANALYSIS & SCHEDULES (Pages 221-240)</h3>
-    <ul>
-        <li>6.1 Detailed Cost Estimation and BOQ............................221-230</li>
-        <li>6.2 Construction Schedule and Timeline...........................231-235</li>
-        <li>6.3 Resource Planning and Management.............................236-240</li>
-    </ul>
-    
-    <h3>PART VII: APPENDICES & REFERENCES (Pages 241-250+)</h3>
-    <ul>
-        <li>7.1 Design Calculations and Worksheets..........................241-245</li>
-        <li>7.2 Material Test Certificates and Approvals...................246-248</li>
-        <li>7.3 References and Bibliography.................................249-250</li>
-    </ul>
-    
-    <div class="page-number">Page 2 of 250+</div>
-</div>
-
-<!-- PART I: PROJECT OVERVIEW -->
-<div class="page">
-    <div class="section-title">PART I: PROJECT OVERVIEW & SPECIFICATIONS</div>
-    
-    <h3>1.1 PROJECT INTRODUCTION AND SCOPE</h3>
-    
-    <div class="subsection">
-        <h4>1.1.1 Project Background</h4>
-        <p>This comprehensive bridge design report presents the complete engineering analysis and design for a three-span reinforced concrete slab bridge. The project involves the design of a modern infrastructure solution to meet current and future traffic demands while ensuring compliance with all applicable Indian Standard codes and specifications.</p>
-        
-        <h4>1.1.2 Bridge Specifications</h4>
-        <table class="data-table">
-            <tr>
-                <th>Parameter</th>
-                <th>Value</th>
-                <th>Units</th>
-                <th>Remarks</th>
-            </tr>
-            <tr>
-                <td>Bridge Type</td>
-                <td>RCC Slab Bridge</td>
-                <td>-</td>
-                <td>Three-span continuous</td>
-            </tr>
-            <tr>
-                <td>Total Length</td>
-                <td>36.0</td>
-                <td>meters</td>
-                <td>3 spans × 12.0m each</td>
-            </tr>
-            <tr>
-                <td>Effective Span</td>
-                <td>12.0</td>
-                <td>meters</td>
-                <td>Center to center of supports</td>
-            </tr>
-            <tr>
-                <td>Total Width</td>
-                <td>12.5</td>
-                <td>meters</td>
-                <td>Including crash barriers</td>
-            </tr>
-            <tr>
-                <td>Carriageway Width</td>
-                <td>10.0</td>
-                <td>meters</td>
-                <td>Two-lane traffic</td>
-            </tr>
-            <tr>
-                <td>Footpath Width</td>
-                <td>1.25</td>
-                <td>meters</td>
-                <td>Each side</td>
-            </tr>
-            <tr>
-                <td>Skew Angle</td>
-                <td>{project_info.get('skew_angle', 10)}</td>
-                <td>degrees</td>
-                <td>Measured from perpendicular</td>
-            </tr>
-        </table>
-        
-        <h4>1.1.3 Design Philosophy</h4>
-        <p>The design philosophy adopted for this bridge follows the limit state method as prescribed in IS 456:2000. The design ensures:</p>
-        <ul>
-            <li>Adequate safety against collapse (Ultimate Limit State)</li>
-            <li>Satisfactory performance under service conditions (Serviceability Limit State)</li>
-            <li>Durability for the design life of 100 years</li>
-            <li>Economy in construction and maintenance</li>
-            <li>Environmental sustainability and minimal ecological impact</li>
-        </ul>
-        
-        <h4>1.1.4 Scope of Work</h4>
-        <p>This report covers the complete design and analysis of:</p>
-        <ul>
-            <li>Hydraulic analysis and waterway design</li>
-            <li>Structural analysis of deck slab, piers, and abutments</li>
-            <li>Foundation design including scour analysis</li>
-            <li>Reinforcement design for all components</li>
-            <li>Construction methodology and specifications</li>
-            <li>Quality control and testing procedures</li>
-            <li>Cost estimation and project scheduling</li>
-        </ul>
-    </div>
-    <div class="page-number">Page 3 of 250+</div>
-</div>
-
-<!-- DESIGN STANDARDS PAGE -->
-<div class="page">
-    <h3>1.2 DESIGN STANDARDS AND CODES</h3>
-    
-    <div class="subsection">
-        <h4>1.2.1 Primary Design Codes</h4>
-        <table class="data-table">
-            <tr>
-                <th>Code</th>
-                <th>Title</th>
-                <th>Version</th>
-                <th>Application</th>
-            </tr>
-            <tr>
-                <td>IS 456</td>
-                <td>Code for Plain and Reinforced Concrete</td>
-                <td>2000</td>
-                <td>Structural design of RCC elements</td>
-            </tr>
-            <tr>
-                <td>IRC:6</td>
-                <td>Loads and Load Combinations</td>
-                <td>2017</td>
-                <td>Loading standards for road bridges</td>
-            </tr>
-            <tr>
-                <td>IRC:21</td>
-                <td>Standard Specifications</td>
-                <td>2000</td>
-                <td>Construction specifications</td>
-            </tr>
-            <tr>
-                <td>IRC:78</td>
-                <td>Standard Specifications for Road Bridges</td>
-                <td>2014</td>
-                <td>General specifications</td>
-            </tr>
-            <tr>
-                <td>IS 1893</td>
-                <td>Earthquake Resistant Design</td>
-                <td>2016</td>
-                <td>Seismic analysis and design</td>
-            </tr>
-            <tr>
-                <td>IS 13920</td>
-                <td>Ductile Detailing of RCC</td>
-                <td>2016</td>
-                <td>Seismic detailing requirements</td>
-            </tr>
-            <tr>
-                <td>IS 875</td>
-                <td>Code of Practice for Design Loads</td>
-                <td>2015</td>
-                <td>Wind and other environmental loads</td>
-            </tr>
-        </table>
-        
-        <h4>1.2.2 Material Standards</h4>
-        <table class="data-table">
-            <tr>
-                <th>Material</th>
-                <th>Standard</th>
-                <th>Grade/Type</th>
-                <th>Specifications</th>
-            </tr>
-            <tr>
-                <td>Concrete</td>
-                <td>IS 456:2000</td>
-                <td>M25</td>
-                <td>fck = 25 N/mm²</td>
-            </tr>
-            <tr>
-                <td>Reinforcement Steel</td>
-                <td>IS 1786:2008</td>
-                <td>Fe 415</td>
-                <td>fy = 415 N/mm²</td>
-            </tr>
-            <tr>
-                <td>Structural Steel</td>
-                <td>IS 2062:2011</td>
-                <td>E 250</td>
-                <td>fy = 250 N/mm²</td>
-            </tr>
-            <tr>
-                <td>Cement</td>
-                <td>IS 12269:2013</td>
-                <td>OPC 53 Grade</td>
-                <td>Ordinary Portland Cement</td>
-            </tr>
-        </table>
-        
-        <h4>1.2.3 Load Factors and Safety Requirements</h4>
-        <div class="calculation-box">
-            <strong>Ultimate Limit State:</strong><br>
-            1.5 DL + 1.5 LL (Basic Combination)<br>
-            1.5 DL + 1.5 LL + 1.5 EL (With Environmental Loads)<br>
-            1.5 DL + 1.5 EQ (Seismic Combination)<br><br>
-            
-            <strong>Serviceability Limit State:</strong><br>
-            1.0 DL + 1.0 LL (Characteristic Combination)<br>
-            1.0 DL + 0.8 LL (Frequent Combination)<br>
-            1.0 DL + 0.5 LL (Quasi-permanent Combination)
-        </div>
-    </div>
-    <div class="page-number">Page 4 of 250+</div>
-</div>
-
-<!-- CONTINUE BUILDING MASSIVE CONTENT -->
-"""
-
-    # Add remaining massive content sections
-    html_content += generate_material_specifications_page()
-    html_content += generate_site_conditions_pages()
-    html_content += generate_hydraulic_analysis_pages(hydraulic)
-    html_content += generate_structural_analysis_pages(pier, detailed_pier)
-    html_content += generate_reinforcement_design_pages(detailed_calculations)
-    html_content += generate_construction_details_pages(construction_details)
-    html_content += generate_quality_specifications_pages(quality_specs)
-    html_content += generate_cost_analysis_pages(estimation)
-    html_content += generate_safety_analysis_pages(safety_analysis)
-    html_content += generate_appendices_pages()
-    
-    # Close HTML
-    html_content += """
-</body>
-</html>
-"""
-
-    # Write massive HTML file
-    with open(report_filepath, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
-    print(f"✅ Massive detailed report created: {report_filepath}")
-    
-    # Calculate approximate page count
-    content_length = len(html_content)
-    estimated_pages = max(250, content_length // 8000)  # Rough estimate
-    
-    print(f"\n📊 MASSIVE REPORT STATISTICS:")
-    print(f"• File size: {os.path.getsize(report_filepath) / 1024:.1f} KB")
-    print(f"• Estimated pages: {estimated_pages}+ A4 pages")
-    print(f"• Content length: {content_length:,} characters")
-    print(f"• Format: Professional engineering documentation")
-    print(f"• Ready for professional printing and submission")
-    
-    return report_filepath
-
-def generate_detailed_calculations(results: Dict[str, Any]) -> Dict[str, Any]:
-    """Generate detailed engineering calculations for all components"""
-    calculations = {
-        'structural_analysis': {
-            'deck_slab': calculate_deck_slab_analysis(results),
-            'pier_analysis': calculate_pier_analysis(results),
-            'foundation': calculate_foundation_analysis(results)
-        },
-        'reinforcement': {
-            'main_steel': calculate_main_reinforcement(results),
-            'shear_steel': calculate_shear_reinforcement(results),
-            'development_length': calculate_development_lengths(results)
-        },
-        'load_analysis': {
-            'dead_loads': calculate_dead_loads(results),
-            'live_loads': calculate_live_loads_detailed(results),
-            'combinations': calculate_load_combinations(results)
-        }
-    }
-    return calculations
-
-def calculate_deck_slab_analysis(results: Dict[str, Any]) -> Dict[str, Any]:
-    """Detailed deck slab structural analysis"""
-    span = results.get('project_info', {}).get('span_length', 12.0)
-    width = results.get('project_info', {}).get('bridge_width', 12.5)
-    thickness = 0.8  # m
-    
-    # Material properties
-    fck = 25  # N/mm²
-    fy = 415  # N/mm²
-    
-    # Load calculations
-    self_weight = 25 * thickness  # kN/m²
-    live_load = 12.0  # kN/m² (IRC loading)
-    
-    # Moment calculations
-    total_load = self_weight + live_load
-    max_moment = total_load * span**2 / 8  # kNm/m
-    
-    return {
-        'span': span,
-        'width': width,
-        'thickness': thickness,
-        'self_weight': self_weight,
-        'live_load': live_load,
-        'total_load': total_load,
-        'max_moment': max_moment,
-        'material': {'fck': fck, 'fy': fy}
-    }
-
-def calculate_pier_analysis(results: Dict[str, Any]) -> Dict[str, Any]:
-    """Detailed pier structural analysis"""
-    pier_data = results.get('pier_design', {})
-    height = pier_data.get('height', 8.0)
-    width = pier_data.get('width', 2.0)
-    thickness = pier_data.get('thickness', 1.5)
+    return {
+        'span': span,
+        'width': width,
+        'thickness': thickness,
+        'self_weight': self_weight,
+        'live_load': live_load,
+        'total_load': total_load,
+        'max_moment': max_moment,
+        'material': {'fck': fck, 'fy': fy}
+    }
+
+def calculate_pier_analysis(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Detailed pier structural analysis"""
+    pier_data = results.get('pier_design', {})
+    height = pier_data.get('height', 8.0)
+    width = pier_data.get('width', 2.0)
+    thickness = pier_data.get('thickness', 1.5)
     
     # Load from superstructure
     dead_load = 2500  # kN
@@ -649,15 +218,21 @@ def calculate_main_reinforcement(results: Dict[str, Any]) -> Dict[str, Any]:
         # Doubly reinforced section required
         ast_req = mu_lim / (fy * 0.87 * effective_depth)  # mm²
     
-    # Minimum steel requirement
-    ast_min = 0.12 * 1000 * 800 / 100  # 0.12% of gross area
-    ast_provided = max(ast_req, ast_min)
-    
-    # Bar selection
-    bar_dia = 16  # mm
-    bar_area = math.pi * bar_dia**2 / 4  # mm²
-    num_bars = math.ceil(ast_provided / bar_area)
-    spacing = 1000 / num_bars  # mm
+    # Bar arrangement: lightest of bar diameter x spacing x layers meeting
+    # strength, minimum steel, spacing and crack width (unfactored moment)
+    design = design_members([ReinforcedMember(
+        'Deck slab', 'deck', deck_analysis['thickness'], deck_analysis['span'], deck_analysis['width'],
+        moment_uls=deck_analysis['max_moment'], moment_sls=deck_analysis['max_moment'],
+        fck=fck, fy=fy, cover=80
+    )])
+    main = design['members']['Deck slab']['zones'][0]
+    ast_min = main['ast_min']
+    ast_provided = main['ast_provided']
+    
+    bar_dia = main['bar_diameter']
+    spacing = main['spacing']
+    num_bars = round(main['layers'] * 1000 / spacing)  # per metre width
+    layers = f" ({main['layers']} layers)" if main['layers'] > 1 else ''
     
     return {
         'design_moment': moment,
@@ -669,8 +244,10 @@ def calculate_main_reinforcement(results: Dict[str, Any]) -> Dict[str, Any]:
             'bar_diameter': bar_dia,
             'number_of_bars': num_bars,
             'spacing': spacing,
-            'description': f'{bar_dia}mm @ {spacing:.0f}mm c/c'
-        }
+            'description': f'{bar_dia}mm @ {spacing:.0f}mm c/c{layers}'
+        },
+        'bar_schedule': design['bar_schedule'],
+        'steel_weight_kg': design['total_steel_kg']
     }
 
 def calculate_shear_reinforcement(results: Dict[str, Any]) -> Dict[str, Any]:
@@ -1120,124 +697,590 @@ def generate_construction_details_pages(construction_details: Dict[str, Any]) ->
             • Bend test verification
         </div>
     </div>
-    <div class="page-number">Page 181-220 of 250+</div>
+    <div class="page-number">Page 181-220 of 250+</div>
+</div>
+"""
+
+def generate_quality_specifications_pages(quality_specs: Dict[str, Any]) -> str:
+    """Generate quality specifications pages"""
+    return """
+<div class="page">
+    <h3>QUALITY ASSURANCE & TESTING PROCEDURES</h3>
+    
+    <div class="subsection">
+        <h4>Quality Control Standards</h4>
+        <p>Comprehensive quality assurance program:</p>
+        
+        <table class="data-table">
+            <tr><th>Material</th><th>Test</th><th>Frequency</th><th>Standard</th><th>Acceptance Criteria</th></tr>
+            <tr><td>Concrete</td><td>Compressive Strength</td><td>1 set/50m³</td><td>IS 516</td><td>≥ 25 N/mm²</td></tr>
+            <tr><td>Steel</td><td>Tensile Test</td><td>1 sample/50T</td><td>IS 1786</td><td>≥ 415 N/mm²</td></tr>
+            <tr><td>Aggregate</td><td>Gradation</td><td>Daily</td><td>IS 383</td><td>Zone II</td></tr>
+            <tr><td>Cement</td><td>Setting Time</td><td>Each consignment</td><td>IS 4031</td><td>30 min - 600 min</td></tr>
+        </table>
+    </div>
+    <div class="page-number">Page 200+ of 250+</div>
+</div>
+"""
+
+def generate_cost_analysis_pages(estimation: Dict[str, Any]) -> str:
+    """Generate cost analysis pages"""
+    return f"""
+<div class="page">
+    <h3>PART VI: COST ANALYSIS & SCHEDULES</h3>
+    
+    <div class="subsection">
+        <h4>6.1 Detailed Cost Estimation</h4>
+        <p>Comprehensive cost breakdown for bridge construction:</p>
+        
+        <table class="data-table">
+            <tr><th>Item</th><th>Quantity</th><th>Unit</th><th>Rate (₹)</th><th>Amount (₹)</th></tr>
+            <tr><td>M25 Concrete</td><td>{estimation.get('concrete_volume', 450)}</td><td>m³</td><td>5,500</td><td>{estimation.get('concrete_cost', 2475000)}</td></tr>
+            <tr><td>Steel Reinforcement</td><td>{estimation.get('steel_weight', 7470)}</td><td>kg</td><td>65</td><td>{estimation.get('steel_cost', 485550)}</td></tr>
+            <tr><td>Formwork</td><td>{estimation.get('formwork_area', 850)}</td><td>m²</td><td>450</td><td>{estimation.get('formwork_cost', 382500)}</td></tr>
+            <tr><td>Earthwork</td><td>{estimation.get('earthwork_volume', 1200)}</td><td>m³</td><td>180</td><td>{estimation.get('earthwork_cost', 216000)}</td></tr>
+        </table>
+        
+        <div class="calculation-box">
+            Total Project Cost: ₹ {estimation.get('total_cost', 3559050):,}<br>
+            Cost per sq.m of deck: ₹ {int(estimation.get('total_cost', 3559050) / 450):,}<br>
+            Contingency (10%): ₹ {int(estimation.get('total_cost', 3559050) * 0.1):,}<br>
+            Final Project Cost: ₹ {int(estimation.get('total_cost', 3559050) * 1.1):,}
+        </div>
+    </div>
+    <div class="page-number">Page 221-240 of 250+</div>
+</div>
+"""
+
+def generate_safety_analysis_pages(safety_analysis: Dict[str, Any]) -> str:
+    """Generate safety analysis pages"""
+    return """
+<div class="page">
+    <h3>SAFETY ANALYSIS & RISK MANAGEMENT</h3>
+    
+    <div class="subsection">
+        <h4>Structural Safety Analysis</h4>
+        <p>Comprehensive safety assessment for bridge structure:</p>
+        
+        <table class="data-table">
+            <tr><th>Safety Aspect</th><th>Factor of Safety</th><th>Design Standard</th><th>Status</th></tr>
+            <tr><td>Ultimate Limit State</td><td>1.5</td><td>IRC:6-2017</td><td>✓ Satisfied</td></tr>
+            <tr><td>Serviceability Limit State</td><td>1.0</td><td>IRC:6-2017</td><td>✓ Satisfied</td></tr>
+            <tr><td>Foundation Bearing</td><td>3.0</td><td>IS 6403</td><td>✓ Satisfied</td></tr>
+            <tr><td>Scour Protection</td><td>1.5</td><td>IRC:78</td><td>✓ Provided</td></tr>
+        </table>
+        
+        <div class="calculation-box">
+            Risk Assessment Summary:<br>
+            • Structural failure risk: Very Low<br>
+            • Foundation settlement risk: Low<br>
+            • Scour risk: Low (protection provided)<br>
+            • Overall risk rating: ACCEPTABLE
+        </div>
+    </div>
+    <div class="page-number">Page 210+ of 250+</div>
 </div>
 """
 
-def generate_quality_specifications_pages(quality_specs: Dict[str, Any]) -> str:
-    """Generate quality specifications pages"""
+def generate_appendices_pages() -> str:
+    """Generate appendices pages"""
     return """
 <div class="page">
-    <h3>QUALITY ASSURANCE & TESTING PROCEDURES</h3>
+    <h3>PART VII: APPENDICES & REFERENCES</h3>
     
     <div class="subsection">
-        <h4>Quality Control Standards</h4>
-        <p>Comprehensive quality assurance program:</p>
+        <h4>7.1 Design Calculations and Worksheets</h4>
+        <p>Detailed calculation sheets for all design components are included in the following appendices:</p>
+        
+        <ul>
+            <li>Appendix A: Hydraulic calculations and waterway design</li>
+            <li>Appendix B: Structural analysis calculations</li>
+            <li>Appendix C: Reinforcement design calculations</li>
+            <li>Appendix D: Foundation design calculations</li>
+            <li>Appendix E: Construction drawings and details</li>
+            <li>Appendix F: Material test certificates</li>
+            <li>Appendix G: Quality control procedures</li>
+        </ul>
         
+        <h4>7.2 References and Bibliography</h4>
         <table class="data-table">
-            <tr><th>Material</th><th>Test</th><th>Frequency</th><th>Standard</th><th>Acceptance Criteria</th></tr>
-            <tr><td>Concrete</td><td>Compressive Strength</td><td>1 set/50m³</td><td>IS 516</td><td>≥ 25 N/mm²</td></tr>
-            <tr><td>Steel</td><td>Tensile Test</td><td>1 sample/50T</td><td>IS 1786</td><td>≥ 415 N/mm²</td></tr>
-            <tr><td>Aggregate</td><td>Gradation</td><td>Daily</td><td>IS 383</td><td>Zone II</td></tr>
-            <tr><td>Cement</td><td>Setting Time</td><td>Each consignment</td><td>IS 4031</td><td>30 min - 600 min</td></tr>
+            <tr><th>Code/Standard</th><th>Title</th><th>Version</th></tr>
+            <tr><td>IS 456</td><td>Code for Plain and Reinforced Concrete</td><td>2000</td></tr>
+            <tr><td>IRC:6</td><td>Loads and Load Combinations</td><td>2017</td></tr>
+            <tr><td>IRC:21</td><td>Standard Specifications</td><td>2000</td></tr>
+            <tr><td>IRC:78</td><td>Standard Specifications for Road Bridges</td><td>2014</td></tr>
+            <tr><td>IS 1893</td><td>Earthquake Resistant Design</td><td>2016</td></tr>
         </table>
     </div>
-    <div class="page-number">Page 200+ of 250+</div>
+    <div class="page-number">Page 241-250+ of 250+</div>
+</div>
+"""
+
+# ----------------------------------------------------------------------
+# Report templates and section order
+# ----------------------------------------------------------------------
+
+REPORT_HEAD = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Massive Bridge Design Report - 250+ Pages</title>
+    <style>
+        body {{
+            font-family: "Times New Roman", serif;
+            line-height: 1.4;
+            margin: 0;
+            padding: 15px;
+            font-size: 11pt;
+            color: #000;
+        }}
+        .page {{
+            width: 210mm;
+            min-height: 297mm;
+            margin: 0 auto 20px auto;
+            padding: 20mm;
+            background: white;
+            box-shadow: 0 0 10px rgba(0,0,0,0.1);
+            page-break-after: always;
+        }}
+        .page:last-child {{
+            page-break-after: auto;
+        }}
+        .header {{
+            text-align: center;
+            border-bottom: 2px solid #000;
+            padding-bottom: 15px;
+            margin-bottom: 20px;
+        }}
+        .header h1 {{
+            margin: 0;
+            font-size: 18pt;
+            font-weight: bold;
+        }}
+        .header h2 {{
+            margin: 5px 0;
+            font-size: 14pt;
+        }}
+        .section-title {{
+            background: #000;
+            color: white;
+            padding: 8px 15px;
+            margin: 20px 0 10px 0;
+            font-size: 14pt;
+            font-weight: bold;
+        }}
+        .subsection {{
+            margin: 15px 0;
+            padding: 10px;
+            border-left: 3px solid #333;
+        }}
+        .calculation-box {{
+            background: #f9f9f9;
+            border: 1px solid #ccc;
+            padding: 15px;
+            margin: 10px 0;
+            font-family: "Courier New", monospace;
+        }}
+        .data-table {{
+            width: 100%;
+            border-collapse: collapse;
+            margin: 15px 0;
+            font-size: 10pt;
+        }}
+        .data-table th, .data-table td {{
+            border: 1px solid #000;
+            padding: 6px;
+            text-align: left;
+        }}
+        .data-table th {{
+            background: #e0e0e0;
+            font-weight: bold;
+        }}
+        .formula {{
+            background: #fff8dc;
+            border: 1px dashed #000;
+            padding: 10px;
+            margin: 10px 0;
+            text-align: center;
+            font-style: italic;
+        }}
+        .drawing-placeholder {{
+            border: 2px solid #000;
+            height: 200px;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            margin: 20px 0;
+            background: #f0f0f0;
+        }}
+        .page-number {{
+            position: absolute;
+            bottom: 10mm;
+            right: 20mm;
+            font-size: 10pt;
+        }}
+        @media print {{
+            body {{ background: white; }}
+            .page {{ 
+                box-shadow: none; 
+                margin: 0;
+                page-break-after: always;
+            }}
+        }}
+    </style>
+</head>
+<body>
+
+""", 'head')
+
+COVER_PAGE = Template("""<!-- COVER PAGE -->
+<div class="page">
+    <div class="header">
+        <h1>COMPREHENSIVE BRIDGE DESIGN REPORT</h1>
+        <h2>Complete Engineering Documentation</h2>
+        <h2>250+ Pages Professional Design</h2>
+    </div>
+    
+    <div style="text-align: center; margin-top: 100px;">
+        <h2>PROJECT: {project_info.get('bridge_name', 'Advanced Bridge Design Project')}</h2>
+        <h3>LOCATION: {project_info.get('location', 'Professional Engineering Site')}</h3>
+        <p style="font-size: 14pt; margin-top: 50px;">
+            <strong>Design Standards:</strong><br>
+            IS 456:2000 - Code for Plain and Reinforced Concrete<br>
+            IRC:6-2017 - Loads and Load Combinations<br>
+            IRC:21-2000 - Standard Specifications<br>
+            IRC:78-2014 - Standard Specifications for Road Bridges
+        </p>
+        
+        <p style="margin-top: 80px;">
+            <strong>Prepared by:</strong> Professional Bridge Design Team<br>
+            <strong>Date:</strong> {datetime.now().strftime('%B %d, %Y')}<br>
+            <strong>Report Version:</strong> 3.0.0 - Complete Engineering Documentation
+        </p>
+    </div>
+    <div class="page-number">Page 1 of 250+</div>
+</div>
+
+""", 'cover')
+
+TABLE_OF_CONTENTS = Template("""<!-- TABLE OF CONTENTS -->
+<div class="page">
+    <div class="section-title">TABLE OF CONTENTS</div>
+    
+    <h3>PART I: PROJECT OVERVIEW & SPECIFICATIONS (Pages 1-25)</h3>
+    <ul>
+        <li>1.1 Project Introduction and Scope................................3</li>
+        <li>1.2 Design Standards and Codes...................................4</li>
+        <li>1.3 Material Specifications.....................................5</li>
+        <li>1.4 Site Conditions and Survey Data.............................6-8</li>
+        <li>1.5 Design Criteria and Parameters..............................9-12</li>
+        <li>1.6 Load Combinations and Safety Factors........................13-15</li>
+        <li>1.7 Quality Assurance Requirements..............................16-18</li>
+        <li>1.8 Environmental Considerations................................19-21</li>
+        <li>1.9 Construction Methodology Overview...........................22-25</li>
+    </ul>
+    
+    <h3>PART II: HYDRAULIC ANALYSIS & DESIGN (Pages 26-55)</h3>
+    <ul>
+        <li>2.1 Hydrological Data and Analysis..............................26-30</li>
+        <li>2.2 Channel Characteristics and Flow Data.......................31-35</li>
+        <li>2.3 Hydraulic Design Calculations...............................36-42</li>
+        <li>2.4 Afflux Analysis and Waterway Design.........................43-47</li>
+        <li>2.5 Scour Analysis and Foundation Protection....................48-52</li>
+        <li>2.6 Hydraulic Model Studies and Verification....................53-55</li>
+    </ul>
+    
+    <h3>PART III: STRUCTURAL ANALYSIS & DESIGN (Pages 56-120)</h3>
+    <ul>
+        <li>3.1 Bridge Configuration and Layout.............................56-60</li>
+        <li>3.2 Load Analysis - Dead Loads..................................61-65</li>
+        <li>3.3 Load Analysis - Live Loads (IRC Standards)..................66-75</li>
+        <li>3.4 Load Analysis - Environmental Loads.........................76-80</li>
+        <li>3.5 Structural Analysis - Deck Slab.............................81-90</li>
+        <li>3.6 Structural Analysis - Pier Design...........................91-105</li>
+        <li>3.7 Foundation Design and Analysis..............................106-115</li>
+        <li>3.8 Abutment Design (Type-1 and Type-2).........................116-120</li>
+    </ul>
+    
+    <h3>PART IV: DETAILED DESIGN & REINFORCEMENT (Pages 121-180)</h3>
+    <ul>
+        <li>4.1 Reinforcement Design - Deck Slab............................121-135</li>
+        <li>4.2 Reinforcement Design - Pier Components......................136-155</li>
+        <li>4.3 Reinforcement Design - Foundation...........................156-165</li>
+        <li>4.4 Reinforcement Design - Abutments............................166-175</li>
+        <li>4.5 Bar Bending Schedules and Details...........................176-180</li>
+    </ul>
+    
+    <h3>PART V: CONSTRUCTION DETAILS & SPECIFICATIONS (Pages 181-220)</h3>
+    <ul>
+        <li>5.1 Construction Sequence and Methodology.......................181-185</li>
+        <li>5.2 Formwork Design and Specifications..........................186-190</li>
+        <li>5.3 Concrete Mix Design and Quality Control.....................191-195</li>
+        <li>5.4 Steel Reinforcement Installation............................196-200</li>
+        <li>5.5 Quality Control and Testing Procedures......................201-210</li>
+        <li>5.6 Safety Specifications and Risk Assessment...................211-220</li>
+    </ul>
+    
+    <h3>PART VI: COST ANALYSIS & SCHEDULES (Pages 221-240)</h3>
+    <ul>
+        <li>6.1 Detailed Cost Estimation and BOQ............................221-230</li>
+        <li>6.2 Construction Schedule and Timeline...........................231-235</li>
+        <li>6.3 Resource Planning and Management.............................236-240</li>
+    </ul>
+    
+    <h3>PART VII: APPENDICES & REFERENCES (Pages 241-250+)</h3>
+    <ul>
+        <li>7.1 Design Calculations and Worksheets..........................241-245</li>
+        <li>7.2 Material Test Certificates and Approvals...................246-248</li>
+        <li>7.3 References and Bibliography.................................249-250</li>
+    </ul>
+    
+    <div class="page-number">Page 2 of 250+</div>
 </div>
-"""
 
-def generate_cost_analysis_pages(estimation: Dict[str, Any]) -> str:
-    """Generate cost analysis pages"""
-    return f"""
+""", 'contents')
+
+PROJECT_OVERVIEW_PAGE = Template("""<!-- PART I: PROJECT OVERVIEW -->
 <div class="page">
-    <h3>PART VI: COST ANALYSIS & SCHEDULES</h3>
+    <div class="section-title">PART I: PROJECT OVERVIEW & SPECIFICATIONS</div>
+    
+    <h3>1.1 PROJECT INTRODUCTION AND SCOPE</h3>
     
     <div class="subsection">
-        <h4>6.1 Detailed Cost Estimation</h4>
-        <p>Comprehensive cost breakdown for bridge construction:</p>
+        <h4>1.1.1 Project Background</h4>
+        <p>This comprehensive bridge design report presents the complete engineering analysis and design for a three-span reinforced concrete slab bridge. The project involves the design of a modern infrastructure solution to meet current and future traffic demands while ensuring compliance with all applicable Indian Standard codes and specifications.</p>
         
+        <h4>1.1.2 Bridge Specifications</h4>
         <table class="data-table">
-            <tr><th>Item</th><th>Quantity</th><th>Unit</th><th>Rate (₹)</th><th>Amount (₹)</th></tr>
-            <tr><td>M25 Concrete</td><td>{estimation.get('concrete_volume', 450)}</td><td>m³</td><td>5,500</td><td>{estimation.get('concrete_cost', 2475000)}</td></tr>
-            <tr><td>Steel Reinforcement</td><td>{estimation.get('steel_weight', 7470)}</td><td>kg</td><td>65</td><td>{estimation.get('steel_cost', 485550)}</td></tr>
-            <tr><td>Formwork</td><td>{estimation.get('formwork_area', 850)}</td><td>m²</td><td>450</td><td>{estimation.get('formwork_cost', 382500)}</td></tr>
-            <tr><td>Earthwork</td><td>{estimation.get('earthwork_volume', 1200)}</td><td>m³</td><td>180</td><td>{estimation.get('earthwork_cost', 216000)}</td></tr>
+            <tr>
+                <th>Parameter</th>
+                <th>Value</th>
+                <th>Units</th>
+                <th>Remarks</th>
+            </tr>
+            <tr>
+                <td>Bridge Type</td>
+                <td>RCC Slab Bridge</td>
+                <td>-</td>
+                <td>Three-span continuous</td>
+            </tr>
+            <tr>
+                <td>Total Length</td>
+                <td>36.0</td>
+                <td>meters</td>
+                <td>3 spans × 12.0m each</td>
+            </tr>
+            <tr>
+                <td>Effective Span</td>
+                <td>12.0</td>
+                <td>meters</td>
+                <td>Center to center of supports</td>
+            </tr>
+            <tr>
+                <td>Total Width</td>
+                <td>12.5</td>
+                <td>meters</td>
+                <td>Including crash barriers</td>
+            </tr>
+            <tr>
+                <td>Carriageway Width</td>
+                <td>10.0</td>
+                <td>meters</td>
+                <td>Two-lane traffic</td>
+            </tr>
+            <tr>
+                <td>Footpath Width</td>
+                <td>1.25</td>
+                <td>meters</td>
+                <td>Each side</td>
+            </tr>
+            <tr>
+                <td>Skew Angle</td>
+                <td>{project_info.get('skew_angle', 10)}</td>
+                <td>degrees</td>
+                <td>Measured from perpendicular</td>
+            </tr>
         </table>
         
-        <div class="calculation-box">
-            Total Project Cost: ₹ {estimation.get('total_cost', 3559050):,}<br>
-            Cost per sq.m of deck: ₹ {int(estimation.get('total_cost', 3559050) / 450):,}<br>
-            Contingency (10%): ₹ {int(estimation.get('total_cost', 3559050) * 0.1):,}<br>
-            Final Project Cost: ₹ {int(estimation.get('total_cost', 3559050) * 1.1):,}
-        </div>
+        <h4>1.1.3 Design Philosophy</h4>
+        <p>The design philosophy adopted for this bridge follows the limit state method as prescribed in IS 456:2000. The design ensures:</p>
+        <ul>
+            <li>Adequate safety against collapse (Ultimate Limit State)</li>
+            <li>Satisfactory performance under service conditions (Serviceability Limit State)</li>
+            <li>Durability for the design life of 100 years</li>
+            <li>Economy in construction and maintenance</li>
+            <li>Environmental sustainability and minimal ecological impact</li>
+        </ul>
+        
+        <h4>1.1.4 Scope of Work</h4>
+        <p>This report covers the complete design and analysis of:</p>
+        <ul>
+            <li>Hydraulic analysis and waterway design</li>
+            <li>Structural analysis of deck slab, piers, and abutments</li>
+            <li>Foundation design including scour analysis</li>
+            <li>Reinforcement design for all components</li>
+            <li>Construction methodology and specifications</li>
+            <li>Quality control and testing procedures</li>
+            <li>Cost estimation and project scheduling</li>
+        </ul>
     </div>
-    <div class="page-number">Page 221-240 of 250+</div>
+    <div class="page-number">Page 3 of 250+</div>
 </div>
-"""
 
-def generate_safety_analysis_pages(safety_analysis: Dict[str, Any]) -> str:
-    """Generate safety analysis pages"""
-    return """
+""", 'project_overview')
+
+DESIGN_STANDARDS_PAGE = Template("""<!-- DESIGN STANDARDS PAGE -->
 <div class="page">
-    <h3>SAFETY ANALYSIS & RISK MANAGEMENT</h3>
+    <h3>1.2 DESIGN STANDARDS AND CODES</h3>
     
     <div class="subsection">
-        <h4>Structural Safety Analysis</h4>
-        <p>Comprehensive safety assessment for bridge structure:</p>
+        <h4>1.2.1 Primary Design Codes</h4>
+        <table class="data-table">
+            <tr>
+                <th>Code</th>
+                <th>Title</th>
+                <th>Version</th>
+                <th>Application</th>
+            </tr>
+            <tr>
+                <td>IS 456</td>
+                <td>Code for Plain and Reinforced Concrete</td>
+                <td>2000</td>
+                <td>Structural design of RCC elements</td>
+            </tr>
+            <tr>
+                <td>IRC:6</td>
+                <td>Loads and Load Combinations</td>
+                <td>2017</td>
+                <td>Loading standards for road bridges</td>
+            </tr>
+            <tr>
+                <td>IRC:21</td>
+                <td>Standard Specifications</td>
+                <td>2000</td>
+                <td>Construction specifications</td>
+            </tr>
+            <tr>
+                <td>IRC:78</td>
+                <td>Standard Specifications for Road Bridges</td>
+                <td>2014</td>
+                <td>General specifications</td>
+            </tr>
+            <tr>
+                <td>IS 1893</td>
+                <td>Earthquake Resistant Design</td>
+                <td>2016</td>
+                <td>Seismic analysis and design</td>
+            </tr>
+            <tr>
+                <td>IS 13920</td>
+                <td>Ductile Detailing of RCC</td>
+                <td>2016</td>
+                <td>Seismic detailing requirements</td>
+            </tr>
+            <tr>
+                <td>IS 875</td>
+                <td>Code of Practice for Design Loads</td>
+                <td>2015</td>
+                <td>Wind and other environmental loads</td>
+            </tr>
+        </table>
         
+        <h4>1.2.2 Material Standards</h4>
         <table class="data-table">
-            <tr><th>Safety Aspect</th><th>Factor of Safety</th><th>Design Standard</th><th>Status</th></tr>
-            <tr><td>Ultimate Limit State</td><td>1.5</td><td>IRC:6-2017</td><td>✓ Satisfied</td></tr>
-            <tr><td>Serviceability Limit State</td><td>1.0</td><td>IRC:6-2017</td><td>✓ Satisfied</td></tr>
-            <tr><td>Foundation Bearing</td><td>3.0</td><td>IS 6403</td><td>✓ Satisfied</td></tr>
-            <tr><td>Scour Protection</td><td>1.5</td><td>IRC:78</td><td>✓ Provided</td></tr>
+            <tr>
+                <th>Material</th>
+                <th>Standard</th>
+                <th>Grade/Type</th>
+                <th>Specifications</th>
+            </tr>
+            <tr>
+                <td>Concrete</td>
+                <td>IS 456:2000</td>
+                <td>M25</td>
+                <td>fck = 25 N/mm²</td>
+            </tr>
+            <tr>
+                <td>Reinforcement Steel</td>
+                <td>IS 1786:2008</td>
+                <td>Fe 415</td>
+                <td>fy = 415 N/mm²</td>
+            </tr>
+            <tr>
+                <td>Structural Steel</td>
+                <td>IS 2062:2011</td>
+                <td>E 250</td>
+                <td>fy = 250 N/mm²</td>
+            </tr>
+            <tr>
+                <td>Cement</td>
+                <td>IS 12269:2013</td>
+                <td>OPC 53 Grade</td>
+                <td>Ordinary Portland Cement</td>
+            </tr>
         </table>
         
+        <h4>1.2.3 Load Factors and Safety Requirements</h4>
         <div class="calculation-box">
-            Risk Assessment Summary:<br>
-            • Structural failure risk: Very Low<br>
-            • Foundation settlement risk: Low<br>
-            • Scour risk: Low (protection provided)<br>
-            • Overall risk rating: ACCEPTABLE
+            <strong>Ultimate Limit State:</strong><br>
+            1.5 DL + 1.5 LL (Basic Combination)<br>
+            1.5 DL + 1.5 LL + 1.5 EL (With Environmental Loads)<br>
+            1.5 DL + 1.5 EQ (Seismic Combination)<br><br>
+            
+            <strong>Serviceability Limit State:</strong><br>
+            1.0 DL + 1.0 LL (Characteristic Combination)<br>
+            1.0 DL + 0.8 LL (Frequent Combination)<br>
+            1.0 DL + 0.5 LL (Quasi-permanent Combination)
         </div>
     </div>
-    <div class="page-number">Page 210+ of 250+</div>
+    <div class="page-number">Page 4 of 250+</div>
 </div>
-"""
 
-def generate_appendices_pages() -> str:
-    """Generate appendices pages"""
-    return """
-<div class="page">
-    <h3>PART VII: APPENDICES & REFERENCES</h3>
-    
-    <div class="subsection">
-        <h4>7.1 Design Calculations and Worksheets</h4>
-        <p>Detailed calculation sheets for all design components are included in the following appendices:</p>
-        
-        <ul>
-            <li>Appendix A: Hydraulic calculations and waterway design</li>
-            <li>Appendix B: Structural analysis calculations</li>
-            <li>Appendix C: Reinforcement design calculations</li>
-            <li>Appendix D: Foundation design calculations</li>
-            <li>Appendix E: Construction drawings and details</li>
-            <li>Appendix F: Material test certificates</li>
-            <li>Appendix G: Quality control procedures</li>
-        </ul>
-        
-        <h4>7.2 References and Bibliography</h4>
-        <table class="data-table">
-            <tr><th>Code/Standard</th><th>Title</th><th>Version</th></tr>
-            <tr><td>IS 456</td><td>Code for Plain and Reinforced Concrete</td><td>2000</td></tr>
-            <tr><td>IRC:6</td><td>Loads and Load Combinations</td><td>2017</td></tr>
-            <tr><td>IRC:21</td><td>Standard Specifications</td><td>2000</td></tr>
-            <tr><td>IRC:78</td><td>Standard Specifications for Road Bridges</td><td>2014</td></tr>
-            <tr><td>IS 1893</td><td>Earthquake Resistant Design</td><td>2016</td></tr>
-        </table>
-    </div>
-    <div class="page-number">Page 241-250+ of 250+</div>
-</div>
-"""
+<!-- CONTINUE BUILDING MASSIVE CONTENT -->
+""", 'design_standards')
+
+REPORT_TAIL = Template("""
+</body>
+</html>
+""", 'tail')
+
+# Result keys read by the detailed calculation sheets
+CALCULATION_INPUTS = ('project_info', 'pier_design', 'foundation_design')
+
+# Sections declare the result keys they read, so a re-run only re-renders the
+# sections whose inputs changed; the cover prints today's date and is always
+# rendered
+MASSIVE_REPORT = ReportEngine([
+    Section('head', REPORT_HEAD, ()),
+    Section('cover', COVER_PAGE),
+    Section('contents', TABLE_OF_CONTENTS, ()),
+    Section('project_overview', PROJECT_OVERVIEW_PAGE, ('project_info',)),
+    Section('design_standards', DESIGN_STANDARDS_PAGE, ()),
+    Section('material_specifications', lambda context: generate_material_specifications_page(), ()),
+    Section('site_conditions', lambda context: generate_site_conditions_pages(), ()),
+    Section('hydraulic_analysis', lambda context: generate_hydraulic_analysis_pages(context['hydraulic']),
+            ('hydraulic_analysis',)),
+    Section('structural_analysis', lambda context: generate_structural_analysis_pages(
+        context['pier'], context['detailed_pier']), ('pier_design', 'detailed_pier_geometry')),
+    Section('reinforcement_design', lambda context: generate_reinforcement_design_pages(
+        context['detailed_calculations']), CALCULATION_INPUTS),
+    Section('construction_details', lambda context: generate_construction_details_pages(
+        context['construction_details']), ()),
+    Section('quality_specifications', lambda context: generate_quality_specifications_pages(
+        context['quality_specs']), ()),
+    Section('cost_analysis', lambda context: generate_cost_analysis_pages(context['estimation']),
+            ('comprehensive_estimation',)),
+    Section('safety_analysis', lambda context: generate_safety_analysis_pages(context['safety_analysis']), ()),
+    Section('appendices', lambda context: generate_appendices_pages(), ()),
+    Section('tail', REPORT_TAIL, ()),
+], report_context, FragmentCache())
 
 if __name__ == "__main__":
-    generate_massive_detailed_report()
\ No newline at end of file
+    import sys
+    results_file = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'sample_slab_bridge_design_results.json')
+    if not os.path.exists(results_file):
+        print("❌ Bridge design results file not found!")
+    else:
+        generate_massive_detailed_report(load_results(results_file))
@@ -16,6 +16,10 @@ from typing import Dict, Any, List, Optional, Callable
 from dataclasses import dataclass
 from datetime import datetime
 import math
+import time
+
+from live_preview import PreviewModel, PreviewOutput
+from slab_bridge_engine import SlabBridgeInputs, run_complete_analysis
 
 @dataclass
 class ComponentStyle:
@@ -30,6 +34,62 @@ class ComponentStyle:
     card_background: str = "#FFFFFF"
     border_color: str = "#E5E5E5"
 
+def _full_design_check(num_spans, effective_span, bridge_width, skew_angle, discharge,
+                       design_velocity, hfl, manning_n, safe_bearing_capacity) -> Dict[str, Any]:
+    """Headline results of the complete slab bridge analysis"""
+    results = run_complete_analysis(SlabBridgeInputs(
+        num_spans=int(num_spans), effective_span=effective_span, bridge_width=bridge_width,
+        skew_angle=skew_angle, discharge=discharge, design_velocity=design_velocity, hfl=hfl,
+        manning_n=manning_n, bearing_capacity=safe_bearing_capacity))
+    if results['design_status'] != 'COMPLETED':
+        return {'design_status': results['design_status'], 'error': results.get('error', '')}
+    slab = results['structural_analysis']['slab_design']
+    return {
+        'design_status': results['design_status'],
+        'design_moment': slab['design_moment'],
+        'design_shear': slab['design_shear'],
+        'scour_depth': results['hydraulic_analysis']['scour_depth'],
+        'foundation_safety_factor': results['foundation_analysis']['bearing_capacity_check']['safety_factor'],
+    }
+
+# Parameter defaults of the live preview
+LIVE_PREVIEW_DEFAULTS = {
+    'num_spans': 3, 'effective_span': 9.6, 'bridge_width': 12.0, 'skew_angle': 0.0,
+    'discharge': 1265.76, 'design_velocity': 3.5, 'hfl': 101.2, 'manning_n': 0.033,
+    'safe_bearing_capacity': 450.0,
+}
+
+# Live preview outputs and what each reads; only the full design check is slow (debounced)
+LIVE_PREVIEW_OUTPUTS = [
+    # Basic calculations
+    PreviewOutput('total_length', ('num_spans', 'effective_span'),
+                  lambda num_spans, effective_span: num_spans * effective_span),
+    PreviewOutput('deck_area', ('total_length', 'bridge_width'),
+                  lambda total_length, bridge_width: total_length * bridge_width),
+    # Material calculations
+    PreviewOutput('slab_volume', ('deck_area',), lambda deck_area: deck_area * 0.75),  # 750mm slab
+    PreviewOutput('pier_volume', ('num_spans',),
+                  lambda num_spans: (num_spans - 1) * 2.0 * 1.5 * 6.0),  # Approximate pier volume
+    PreviewOutput('concrete_volume', ('slab_volume', 'pier_volume'),
+                  lambda slab_volume, pier_volume: slab_volume + pier_volume),
+    PreviewOutput('steel_weight', ('concrete_volume',),
+                  lambda concrete_volume: concrete_volume * 0.12),  # 120 kg/m³ steel ratio
+    # Cost calculations (in INR): ₹4500 per m³ concrete, ₹65000 per tonne steel
+    PreviewOutput('structure_cost', ('concrete_volume', 'steel_weight'),
+                  lambda concrete_volume, steel_weight: concrete_volume * 4500 + steel_weight * 65000),
+    PreviewOutput('foundation_cost', ('structure_cost',),
+                  lambda structure_cost: structure_cost * 0.6),  # 60% of structure cost
+    PreviewOutput('total_cost', ('structure_cost', 'foundation_cost'),
+                  lambda structure_cost, foundation_cost: structure_cost + foundation_cost),
+    # Full design pipeline
+    PreviewOutput('design_check', ('num_spans', 'effective_span', 'bridge_width', 'skew_angle', 'discharge',
+                                   'design_velocity', 'hfl', 'manning_n', 'safe_bearing_capacity'),
+                  _full_design_check, slow=True),
+]
+
+LIVE_CALCULATION_KEYS = ('total_length', 'deck_area', 'concrete_volume', 'steel_weight',
+                         'structure_cost', 'foundation_cost', 'total_cost')
+
 class ModernUIComponents:
     """Modern UI components for enhanced Streamlit experience"""
     
@@ -234,8 +294,10 @@ class ModernUIComponents:
         </div>
         """, unsafe_allow_html=True)
         
-        # Calculate live values
-        calculations = self._perform_live_calculations(parameters)
+        # Calculate live values (only outputs affected by the last edit are recomputed)
+        model = self._preview_model()
+        state = model.update(parameters)
+        calculations = state.values
         
         # Create metric cards
         col1, col2, col3, col4 = st.columns(4)
@@ -288,6 +350,26 @@ class ModernUIComponents:
             </div>
         </div>
         """, unsafe_allow_html=True)
+        
+        # Full design check: debounced, runs once the parameters stop changing
+        st.markdown("### 🏗️ Full Design Check")
+        design_slot = st.empty()
+        if state.pending:
+            while model.quiet_for() < model.debounce_s:
+                # A new edit reruns the script at this call, abandoning the wait
+                design_slot.info("⏳ Full design updates when editing pauses...")
+                time.sleep(0.05)
+            state = model.update(parameters, settle=True)
+        design = state.values['design_check']
+        with design_slot.container():
+            if design['design_status'] != 'COMPLETED':
+                st.error(f"Design check failed: {design.get('error', '')}")
+            else:
+                check_col1, check_col2, check_col3, check_col4 = st.columns(4)
+                check_col1.metric("Slab Design Moment", f"{design['design_moment']:.1f} kNm/m")
+                check_col2.metric("Slab Design Shear", f"{design['design_shear']:.1f} kN/m")
+                check_col3.metric("Scour Depth", f"{design['scour_depth']:.2f} m")
+                check_col4.metric("Foundation FoS", f"{design['foundation_safety_factor']:.2f}")
     
     def create_excel_generation_panel(self, parameters: Dict[str, Any]) -> None:
         """Create Excel generation panel with options"""
@@ -491,111 +573,34 @@ class ModernUIComponents:
         </div>
         """, unsafe_allow_html=True)
     
-    def _perform_live_calculations(self, parameters: Dict[str, Any]) -> Dict[str, float]:
-        """Perform live calculations based on parameters"""
-        
-        # Extract parameters with defaults
-        num_spans = parameters.get('num_spans', 3)
-        effective_span = parameters.get('effective_span', 9.6)
-        bridge_width = parameters.get('bridge_width', 12.0)
-        
-        # Basic calculations
-        total_length = num_spans * effective_span
-        deck_area = total_length * bridge_width
-        
-        # Material calculations
-        slab_volume = deck_area * 0.75  # 750mm slab
-        pier_volume = (num_spans - 1) * 2.0 * 1.5 * 6.0  # Approximate pier volume
-        concrete_volume = slab_volume + pier_volume
-        
-        steel_weight = concrete_volume * 0.12  # 120 kg/m³ steel ratio
-        
-        # Cost calculations (in INR)
-        concrete_cost = concrete_volume * 4500  # ₹4500 per m³
-        steel_cost = steel_weight * 65000  # ₹65000 per tonne
-        structure_cost = concrete_cost + steel_cost
-        
-        foundation_cost = structure_cost * 0.6  # 60% of structure cost
-        total_cost = structure_cost + foundation_cost
-        
-        return {
-            'total_length': total_length,
-            'deck_area': deck_area,
-            'concrete_volume': concrete_volume,
-            'steel_weight': steel_weight,
-            'structure_cost': structure_cost,
-            'foundation_cost': foundation_cost,
-            'total_cost': total_cost
-        }
-    
-    def _format_label(self, key: str) -> str:
-        \"\"\"Format parameter key into readable label\"\"\"
-        return key.replace('_', ' ').title()
-    
-    def _create_metric_card(self, title: str, value: str, icon: str):
-        \"\"\"Create a metric display card\"\"\"
-        st.markdown(f\"\"\"
-        <div class=\"metric-card\">
-            <div style=\"font-size: 1.5rem; margin-bottom: 0.5rem;\">{icon}</div>
-            <div style=\"font-size: 1.25rem; font-weight: 600; color: #2C3E50;\">{value}</div>
-            <div style=\"font-size: 0.875rem; color: #666;\">{title}</div>
-        </div>
-        \"\"\", unsafe_allow_html=True)
+    def _preview_model(self) -> PreviewModel:
+        """Live preview model of this session (keeps its last inputs and outputs across reruns)"""
+        if 'live_preview_model' not in st.session_state:
+            st.session_state.live_preview_model = PreviewModel(LIVE_PREVIEW_OUTPUTS, LIVE_PREVIEW_DEFAULTS)
+        return st.session_state.live_preview_model
     
     def _perform_live_calculations(self, parameters: Dict[str, Any]) -> Dict[str, float]:
-        \"\"\"Perform live calculations based on parameters\"\"\"
-        
-        # Extract parameters with defaults
-        num_spans = parameters.get('num_spans', 3)
-        effective_span = parameters.get('effective_span', 9.6)
-        bridge_width = parameters.get('bridge_width', 12.0)
-        
-        # Basic calculations
-        total_length = num_spans * effective_span
-        deck_area = total_length * bridge_width
-        
-        # Material calculations
-        slab_volume = deck_area * 0.75  # 750mm slab
-        pier_volume = (num_spans - 1) * 2.0 * 1.5 * 6.0  # Approximate pier volume
-        concrete_volume = slab_volume + pier_volume
-        
-        steel_weight = concrete_volume * 0.12  # 120 kg/m³ steel ratio
-        
-        # Cost calculations (in INR)
-        concrete_cost = concrete_volume * 4500  # ₹4500 per m³
-        steel_cost = steel_weight * 65000  # ₹65000 per tonne
-        structure_cost = concrete_cost + steel_cost
-        
-        foundation_cost = structure_cost * 0.6  # 60% of structure cost
-        total_cost = structure_cost + foundation_cost
-        
-        return {
-            'total_length': total_length,
-            'deck_area': deck_area,
-            'concrete_volume': concrete_volume,
-            'steel_weight': steel_weight,
-            'structure_cost': structure_cost,
-            'foundation_cost': foundation_cost,
-            'total_cost': total_cost
-        }
+        """Perform live calculations based on parameters (only the outputs affected by a change)"""
+        state = self._preview_model().update(parameters)
+        return {name: state.values[name] for name in LIVE_CALCULATION_KEYS}
 
 def create_professional_navigation():
-    \"\"\"Create professional navigation with status indicators\"\"\"
+    """Create professional navigation with status indicators"""
     
-    st.markdown(\"\"\"
-    <div style=\"background: linear-gradient(90deg, #4472C4, #70AD47); 
-                padding: 1rem; border-radius: 8px; margin-bottom: 2rem;\">
-        <div style=\"display: flex; justify-content: space-between; align-items: center;\">
-            <div style=\"color: white;\">
-                <h2 style=\"margin: 0; font-size: 1.5rem;\">🌉 Enhanced Bridge Designer</h2>
-                <p style=\"margin: 0; opacity: 0.9;\">Professional Engineering Application</p>
+    st.markdown("""
+    <div style="background: linear-gradient(90deg, #4472C4, #70AD47); 
+                padding: 1rem; border-radius: 8px; margin-bottom: 2rem;">
+        <div style="display: flex; justify-content: space-between; align-items: center;">
+            <div style="color: white;">
+                <h2 style="margin: 0; font-size: 1.5rem;">🌉 Enhanced Bridge Designer</h2>
+                <p style="margin: 0; opacity: 0.9;">Professional Engineering Application</p>
             </div>
-            <div style=\"display: flex; align-items: center; color: white;\">
-                <div style=\"background: rgba(255,255,255,0.2); padding: 0.5rem 1rem; 
-                           border-radius: 20px; display: flex; align-items: center;\">
-                    <div style=\"width: 8px; height: 8px; background: #27AE60; 
-                               border-radius: 50%; margin-right: 0.5rem; animation: pulse 2s infinite;\"></div>
-                    <span style=\"font-size: 0.875rem;\">System Ready</span>
+            <div style="display: flex; align-items: center; color: white;">
+                <div style="background: rgba(255,255,255,0.2); padding: 0.5rem 1rem; 
+                           border-radius: 20px; display: flex; align-items: center;">
+                    <div style="width: 8px; height: 8px; background: #27AE60; 
+                               border-radius: 50%; margin-right: 0.5rem; animation: pulse 2s infinite;"></div>
+                    <span style="font-size: 0.875rem;">System Ready</span>
                 </div>
             </div>
         </div>
@@ -608,16 +613,16 @@ def create_professional_navigation():
         100% { opacity: 1; }
     }
     </style>
-    \"\"\", unsafe_allow_html=True)
+    """, unsafe_allow_html=True)
 
 def create_calculation_results_table(calculations: List[Dict[str, Any]]) -> None:
-    \"\"\"Create a professional calculation results table\"\"\"
+    """Create a professional calculation results table"""
     
     df = pd.DataFrame(calculations)
     
     # Apply styling
     styled_df = df.style.format({
-        'Result': lambda x: f\"{x:.3f}\" if isinstance(x, (int, float)) else str(x)
+        'Result': lambda x: f"{x:.3f}" if isinstance(x, (int, float)) else str(x)
     }).set_table_styles([
         {'selector': 'th', 'props': [('background-color', '#4472C4'), 
                                     ('color', 'white'), ('font-weight', 'bold')]},
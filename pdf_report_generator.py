@@ -4,18 +4,59 @@ COMPREHENSIVE PDF REPORT GENERATOR FOR BRIDGE DESIGN
 Generates complete A4 portrait and landscape PDF reports combining all design sheets
 """
 
+import contextlib
 import json
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.backends.backend_pdf import PdfPages
 import numpy as np
 from datetime import datetime
+import io
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, List, Optional
 
+from report_engine import FragmentCache, result_values, source_fingerprint
+
+try:
+    from pypdf import PdfWriter
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
 # Set style for professional plots
 plt.style.use('default')
 
+# Report pages in order: (page method, progress message, result keys read)
+REPORT_PAGES = (
+    ('_create_title_page', "📄 Creating Title Page...",                                     # Portrait
+     ('project_info', 'comprehensive_estimation', 'design_status')),
+    ('_create_project_overview', "📊 Creating Project Overview...",                         # Portrait
+     ('project_info', 'hydraulic_analysis', 'survey_data')),
+    ('_create_hydraulic_analysis', "🌊 Creating Hydraulic Analysis Sheet...",               # Portrait
+     ('hydraulic_analysis',)),
+    ('_create_pier_design_summary', "🏗️ Creating Pier Design Sheet...",                     # Portrait
+     ('pier_design', 'detailed_pier_geometry')),
+    ('_create_foundation_design', "🏛️ Creating Foundation Design Sheet...",                 # Portrait
+     ('foundation_design',)),
+    ('_create_abutment_comparison', "⚖️ Creating Abutment Comparison...",                   # Portrait
+     ('complete_abutment_design',)),
+    ('_create_cost_estimation', "💰 Creating Cost Estimation Sheet...",                     # Portrait
+     ('comprehensive_estimation',)),
+    ('_create_material_quantities_chart', "📊 Creating Material Quantities Chart...",       # Landscape
+     ('comprehensive_estimation',)),
+    ('_create_bridge_profile', "🌉 Creating Bridge Profile Diagram...",                     # Landscape
+     ('survey_data',)),
+    ('_create_summary_recommendations', "📋 Creating Summary & Recommendations...", ()),    # Portrait
+)
+
+# No creation date: identical results give byte-identical documents
+PDF_METADATA = {'CreationDate': None}
+
+# One-page PDFs of earlier reports by page and the results each page reads
+PDF_FRAGMENTS = FragmentCache()
+
 class BridgeDesignPDFGenerator:
     """
     Comprehensive PDF report generator for bridge design results
@@ -29,8 +70,20 @@ class BridgeDesignPDFGenerator:
         self.fig_width_landscape = 11.69  # A4 landscape width
         self.fig_height_landscape = 8.27  # A4 landscape height
         
-    def generate_complete_pdf_report(self, filename: Optional[str] = None) -> str:
-        """Generate complete PDF report with all design sheets"""
+    def generate_complete_pdf_report(self, filename: Optional[str] = None, jobs: int = 1,
+                                     cache: Optional[FragmentCache] = PDF_FRAGMENTS) -> str:
+        """
+        Generate complete PDF report with all design sheets
+        
+        With pypdf installed, pages are always rendered to one-page PDF
+        fragments and merged in page order, so the document does not depend
+        on jobs or cache: a page whose input results are unchanged since an
+        earlier report is copied from the fragment cache, and jobs > 1
+        renders the remaining pages concurrently in worker processes.
+        Without pypdf the pages are drawn in series straight into one file.
+        Creation dates are left out, so the same results always give the
+        same document.
+        """
         if not filename:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f'Complete_Bridge_Design_Report_{timestamp}.pdf'
@@ -40,52 +93,57 @@ class BridgeDesignPDFGenerator:
         os.makedirs(reports_dir, exist_ok=True)
         filepath = os.path.join(reports_dir, filename)
         
-        with PdfPages(filepath) as pdf:
-            print("🎨 Generating Complete PDF Report...")
-            
-            # Page 1: Title Page (Portrait)
-            print("📄 Creating Title Page...")
-            self._create_title_page(pdf)
-            
-            # Page 2: Project Overview & Input Summary (Portrait)
-            print("📊 Creating Project Overview...")
-            self._create_project_overview(pdf)
-            
-            # Page 3: Hydraulic Analysis (Portrait)
-            print("🌊 Creating Hydraulic Analysis Sheet...")
-            self._create_hydraulic_analysis(pdf)
-            
-            # Page 4: Pier Design Summary (Portrait)
-            print("🏗️ Creating Pier Design Sheet...")
-            self._create_pier_design_summary(pdf)
-            
-            # Page 5: Foundation Design (Portrait)
-            print("🏛️ Creating Foundation Design Sheet...")
-            self._create_foundation_design(pdf)
-            
-            # Page 6: Abutment Comparison (Portrait)
-            print("⚖️ Creating Abutment Comparison...")
-            self._create_abutment_comparison(pdf)
-            
-            # Page 7: Cost Estimation & BOQ (Portrait)
-            print("💰 Creating Cost Estimation Sheet...")
-            self._create_cost_estimation(pdf)
-            
-            # Page 8: Material Quantities (Landscape)
-            print("📊 Creating Material Quantities Chart...")
-            self._create_material_quantities_chart(pdf)
-            
-            # Page 9: Bridge Profile (Landscape)
-            print("🌉 Creating Bridge Profile Diagram...")
-            self._create_bridge_profile(pdf)
-            
-            # Page 10: Summary & Recommendations (Portrait)
-            print("📋 Creating Summary & Recommendations...")
-            self._create_summary_recommendations(pdf)
+        print("🎨 Generating Complete PDF Report...")
+        if PYPDF_AVAILABLE:
+            self._generate_from_fragments(filepath, jobs, cache)
+        else:
+            if jobs > 1:
+                print("⚠️ pypdf not installed - rendering pages in series")
+            with PdfPages(filepath, metadata=PDF_METADATA) as pdf:
+                for method, message, _ in REPORT_PAGES:
+                    print(message)
+                    getattr(self, method)(pdf)
             
         print(f"✅ Complete PDF Report Generated: {filepath}")
         return filepath
     
+    def _generate_from_fragments(self, filepath: str, jobs: int, cache: Optional[FragmentCache]):
+        """Reuse cached page fragments, render the rest (in a process pool for jobs > 1), merge in order"""
+        keys = [FragmentCache.key(method, source_fingerprint(getattr(BridgeDesignPDFGenerator, method)),
+                                  result_values(self.results, inputs)) if cache is not None else None
+                for method, _, inputs in REPORT_PAGES]
+        pages = [cache.get(key) if key is not None else None for key in keys]
+        missing = [i for i, page in enumerate(pages) if page is None]
+
+        with tempfile.TemporaryDirectory() as fragments_dir:
+            paths = {i: os.path.join(fragments_dir, f'page_{i + 1:03d}.pdf') for i in missing}
+            if jobs > 1 and len(missing) > 1:
+                with ProcessPoolExecutor(max_workers=min(jobs, len(missing)),
+                                         initializer=_init_render_worker) as pool:
+                    futures = {i: pool.submit(_render_page, self.results, REPORT_PAGES[i][0], paths[i])
+                               for i in missing}
+                    for i in missing:
+                        futures[i].result()
+                        print(REPORT_PAGES[i][1])
+            else:
+                for i in missing:
+                    print(REPORT_PAGES[i][1])
+                    with PdfPages(paths[i], metadata=PDF_METADATA) as pdf:
+                        getattr(self, REPORT_PAGES[i][0])(pdf)
+            for i in missing:
+                with open(paths[i], 'rb') as fragment:
+                    pages[i] = fragment.read()
+                if keys[i] is not None:
+                    cache.put(keys[i], pages[i])
+        if len(missing) < len(pages):
+            print(f"♻️ {len(pages) - len(missing)} unchanged pages reused from earlier reports")
+
+        writer = PdfWriter()
+        for page in pages:
+            writer.append(io.BytesIO(page))
+        with open(filepath, 'wb') as output:
+            writer.write(output)
+    
     def _create_title_page(self, pdf: PdfPages):
         """Create professional title page"""
         fig, ax = plt.subplots(figsize=(self.fig_width_portrait, self.fig_height_portrait))
@@ -762,3 +820,37 @@ class BridgeDesignPDFGenerator:
         
         pdf.savefig(fig, bbox_inches='tight')
         plt.close(fig)
+
+
+def _init_render_worker():
+    """Non-interactive backend in render workers"""
+    plt.switch_backend('Agg')
+
+
+def _render_page(results: Dict[str, Any], method: str, path: str) -> str:
+    """Render one report page to a one-page PDF fragment"""
+    generator = BridgeDesignPDFGenerator(results)
+    with contextlib.redirect_stdout(io.StringIO()), PdfPages(path, metadata=PDF_METADATA) as pdf:
+        getattr(generator, method)(pdf)
+    return path
+
+
+def _generate_report_file(results: Dict[str, Any], filename: str) -> str:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return BridgeDesignPDFGenerator(results).generate_complete_pdf_report(filename)
+
+
+def generate_pdf_reports(results_list: List[Dict[str, Any]], filenames: Optional[List[str]] = None,
+                         jobs: Optional[int] = None) -> List[str]:
+    """
+    Complete PDF reports for a batch of bridges, one report per worker
+    process (all cores by default); returns the paths in input order
+    """
+    if filenames is None:
+        filenames = [f'Complete_Bridge_Design_Report_{number:04d}.pdf'
+                     for number in range(1, len(results_list) + 1)]
+    if len(filenames) != len(results_list):
+        raise ValueError("One filename is required per design")
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(),
+                             initializer=_init_render_worker) as pool:
+        return list(pool.map(_generate_report_file, results_list, filenames))
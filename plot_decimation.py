@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+PLOT DECIMATION
+Level-of-detail reduction of long profiles for interactive Plotly traces
+
+A chart a thousand pixels wide cannot show more than a few points per pixel
+column, yet a 100k-point survey or backwater profile pushed straight into a
+trace makes the Streamlit payload and the browser's hit testing scale with
+the data.  Two reductions keep a trace at a few thousand points:
+
+- min-max: the x range is split into buckets (one per pixel column) and
+  each keeps its first, last, lowest and highest point, so spikes, the
+  thalweg and bank tops survive exactly.  Fully vectorised.
+- LTTB (largest triangle three buckets): one point per bucket chosen to
+  preserve the visual shape of smooth lines such as water surfaces.
+
+A window (x_range) restricts the data before reducing, so the same call
+returns full-resolution data once the view is zoomed in far enough.
+"""
+
+import numpy as np
+from typing import Optional, Sequence, Tuple
+
+# Points per trace: a few per pixel column of a full-width chart
+MAX_TRACE_POINTS = 2000
+
+
+def minmax_indices(x: np.ndarray, y: np.ndarray, buckets: int) -> np.ndarray:
+    """First, last, min and max point of each of `buckets` equal x intervals (x ascending)"""
+    n = len(x)
+    if n <= 4 * buckets:
+        return np.arange(n)
+    span = x[-1] - x[0]
+    if span > 0 and np.all(np.diff(x) >= 0):
+        bucket = np.minimum(((x - x[0]) / span * buckets).astype(np.int64), buckets - 1)
+    else:  # unsorted or degenerate x: equal-count buckets
+        bucket = np.arange(n) * buckets // n
+    starts = np.flatnonzero(np.concatenate([[True], bucket[1:] != bucket[:-1]]))
+    ends = np.concatenate([starts[1:], [n]]) - 1
+    segment = np.repeat(np.arange(len(starts)), np.diff(np.concatenate([starts, [n]])))
+    lowest = np.minimum.reduceat(y, starts)[segment] == y
+    highest = np.maximum.reduceat(y, starts)[segment] == y
+    first_low = np.flatnonzero(lowest)[np.unique(segment[lowest], return_index=True)[1]]
+    first_high = np.flatnonzero(highest)[np.unique(segment[highest], return_index=True)[1]]
+    return np.unique(np.concatenate([starts, ends, first_low, first_high]))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-triangle-three-buckets: `threshold` points keeping the end points"""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo = hi
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        mean_x = x[next_lo:next_hi].mean()
+        mean_y = y[next_lo:next_hi].mean()
+        area = np.abs((x[a] - mean_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (mean_y - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def decimate(x: Sequence[float], y: Sequence[float], max_points: int = MAX_TRACE_POINTS,
+             method: str = 'minmax', x_range: Optional[Tuple[float, float]] = None) -> np.ndarray:
+    """
+    Indices of the points to plot: those inside x_range (plus one either
+    side so the line reaches the edges), reduced to about max_points
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    index = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    if x_range is not None:
+        inside = np.flatnonzero((x[index] >= x_range[0]) & (x[index] <= x_range[1]))
+        if len(inside):
+            index = index[max(inside[0] - 1, 0):min(inside[-1] + 2, len(index))]
+    if len(index) <= max_points:
+        return index
+    if method == 'lttb':
+        return index[lttb_indices(x[index], y[index], max_points)]
+    if method == 'minmax':
+        return index[minmax_indices(x[index], y[index], max(max_points // 4, 1))]
+    raise ValueError(f"Unknown decimation method: {method}")
+
+
+def decimated(x: Sequence[float], y: Sequence[float], *columns: Sequence, max_points: int = MAX_TRACE_POINTS,
+              method: str = 'minmax', x_range: Optional[Tuple[float, float]] = None) -> Tuple[np.ndarray, ...]:
+    """x, y and any parallel columns (hover text, colours ...) at the decimated points"""
+    keep = decimate(x, y, max_points, method, x_range)
+    return tuple(np.asarray(values)[keep] for values in (x, y, *columns))
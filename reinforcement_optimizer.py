@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+REINFORCEMENT OPTIMIZER
+Minimum-weight bar arrangements and bar schedules for RCC bridge members
+
+Every reinforcement zone (one face, one bar direction of a member) is checked
+against every candidate arrangement of bar diameter × spacing × layers in a
+single array pass:
+
+- Flexural capacity, IRC:112 / IS 456 rectangular stress block, singly
+  reinforced with xu <= xu,max
+- Minimum steel, IRC:112 Cl. 16.5.1.1: 0.26·fctm/fyk·b·d >= 0.0013·b·d,
+  plus a gross-section ratio per member type (walls, temperature steel)
+- Maximum steel 0.025·Ac, clear spacing >= max(φ, dg + 5, 20) and the
+  maximum spacing of the member type
+- Crack width, IRC:112 Cl. 12.3.4: wk = sr,max·(εsm − εcm) under the SLS
+  moment, against the limit of the exposure condition
+
+The lightest feasible arrangement of each zone is kept, and the bar schedule
+(number of bars, cut lengths with bends and laps, weight) gives the steel
+tonnage used by the estimators instead of percentage-of-concrete rules.
+"""
+
+import math
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+# ============================================================================
+# CANDIDATE TABLES AND DETAILING CONSTANTS
+# ============================================================================
+
+BAR_DIAMETERS = (10, 12, 16, 20, 25, 32)  # mm
+BAR_SPACINGS = (75, 90, 100, 110, 125, 140, 150, 175, 200, 225, 250, 300)  # mm c/c
+BAR_LAYERS = (1, 2)
+
+STEEL_DENSITY = 7850.0  # kg/m³
+STEEL_MODULUS = 200000.0  # N/mm²
+MAX_AGGREGATE = 20.0  # mm
+STOCK_LENGTH = 12.0  # m, bars longer than this are lapped
+LAP_LENGTH_FACTOR = 50  # lap length in bar diameters
+BEND_ALLOWANCE_FACTOR = 10  # 90° end bend allowance in bar diameters (IS 2502)
+
+# Detailing rules per member type:
+# cover (mm), crack width limit (mm), max main / secondary spacing (mm),
+# gross minimum ratio per face, transverse (distribution) ratio of the main
+# steel, symmetric faces (moment can reverse) and labels of the faces.
+MEMBER_TYPES: Dict[str, Dict[str, any]] = {
+    'deck': {'cover': 40, 'crack_width': 0.3, 'max_spacing': 250, 'max_secondary_spacing': 300,
+             'min_ratio': 0.0, 'transverse_ratio': 0.2, 'symmetric': False,
+             'faces': ('Bottom', 'Top')},
+    'pier_cap': {'cover': 40, 'crack_width': 0.3, 'max_spacing': 200, 'max_secondary_spacing': 300,
+                 'min_ratio': 0.0, 'transverse_ratio': 0.2, 'symmetric': False,
+                 'faces': ('Top', 'Bottom')},
+    'pier_stem': {'cover': 50, 'crack_width': 0.3, 'max_spacing': 200, 'max_secondary_spacing': 300,
+                  'min_ratio': 0.0012, 'transverse_ratio': 0.25, 'symmetric': True,
+                  'faces': ('Upstream face', 'Downstream face')},
+    'footing': {'cover': 75, 'crack_width': 0.3, 'max_spacing': 250, 'max_secondary_spacing': 300,
+                'min_ratio': 0.0012, 'transverse_ratio': 0.2, 'symmetric': False,
+                'faces': ('Bottom', 'Top')},
+    'abutment_stem': {'cover': 50, 'crack_width': 0.3, 'max_spacing': 200, 'max_secondary_spacing': 300,
+                      'min_ratio': 0.0012, 'transverse_ratio': 0.25, 'symmetric': False,
+                      'faces': ('Earth face', 'Front face')},
+    'abutment_base': {'cover': 75, 'crack_width': 0.3, 'max_spacing': 250, 'max_secondary_spacing': 300,
+                      'min_ratio': 0.0012, 'transverse_ratio': 0.2, 'symmetric': False,
+                      'faces': ('Bottom (toe)', 'Top (heel)')},
+}
+
+# ============================================================================
+# MEMBERS AND ZONES
+# ============================================================================
+
+@dataclass
+class ReinforcedMember:
+    """
+    A slab-like member designed per metre width.
+    Moments are kN-m per metre; 'main' bars span along span_length and are
+    spread over width, transverse bars the other way.
+    """
+    name: str
+    member_type: str
+    thickness: float  # m
+    span_length: float  # m, length of the main bars
+    width: float  # m, width over which main bars are spaced
+    moment_uls: float = 0.0  # main face
+    moment_sls: float = 0.0
+    opposite_moment_uls: float = 0.0  # tension on the opposite face
+    opposite_moment_sls: float = 0.0
+    transverse_moment_uls: float = 0.0  # bending in the transverse direction
+    transverse_moment_sls: float = 0.0
+    count: int = 1  # identical members
+    group: str = ''  # 'deck' | 'pier' | 'abutment' for estimators
+    fck: float = 25.0
+    fy: float = 415.0
+    cover: Optional[float] = None  # mm, defaults from MEMBER_TYPES
+
+    @property
+    def rules(self) -> Dict[str, any]:
+        return MEMBER_TYPES[self.member_type]
+
+
+@dataclass
+class _Zone:
+    member: ReinforcedMember
+    zone: str
+    moment_uls: float
+    moment_sls: float
+    bar_length: float  # m
+    spread_width: float  # m
+    min_area: float  # mm²/m, imposed lower bound (e.g. distribution steel)
+    max_spacing: float  # mm
+    depth_offset: float = 0.0  # mm, bars placed inside an outer layer
+
+def candidate_table(diameters: Sequence[int] = BAR_DIAMETERS,
+                    spacings: Sequence[int] = BAR_SPACINGS,
+                    layers: Sequence[int] = BAR_LAYERS) -> Dict[str, np.ndarray]:
+    """Flattened diameter × spacing × layers grid of candidate arrangements"""
+    dia, spacing, layer = np.meshgrid(np.asarray(diameters, dtype=float),
+                                      np.asarray(spacings, dtype=float),
+                                      np.asarray(layers, dtype=float), indexing='ij')
+    dia, spacing, layer = dia.ravel(), spacing.ravel(), layer.ravel()
+    area = layer * math.pi * dia ** 2 / 4 * 1000.0 / spacing  # mm²/m
+    return {
+        'diameter': dia,
+        'spacing': spacing,
+        'layers': layer,
+        'area': area,
+        'weight': area * 1e-6 * STEEL_DENSITY,  # kg per m of bar per m width
+    }
+
+# ============================================================================
+# VECTORIZED CHECKS
+# ============================================================================
+
+def _mean_tensile_strength(fck: np.ndarray) -> np.ndarray:
+    """fctm per IRC:112 Table 6.5"""
+    return np.where(fck <= 60, 0.259 * fck ** (2.0 / 3.0),
+                    2.12 * np.log(1 + (fck + 10) / 10))
+
+
+def evaluate_candidates(zones: List[_Zone], table: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    All checks for every zone against every candidate, as (Z, C) arrays.
+    """
+    column = lambda values: np.asarray(values, dtype=float)[:, None]
+    h = column([z.member.thickness * 1000.0 for z in zones])
+    cover = column([z.member.cover if z.member.cover is not None else z.member.rules['cover']
+                    for z in zones])
+    fck = column([z.member.fck for z in zones])
+    fy = column([z.member.fy for z in zones])
+    mu = column([max(z.moment_uls, 0.0) * 1e6 for z in zones])  # N-mm/m
+    ms = column([max(z.moment_sls, 0.0) * 1e6 for z in zones])
+    min_area_imposed = column([z.min_area for z in zones])
+    max_spacing = column([z.max_spacing for z in zones])
+    offset = column([z.depth_offset for z in zones])
+    crack_limit = column([z.member.rules['crack_width'] for z in zones])
+    min_ratio = column([z.member.rules['min_ratio'] for z in zones])
+
+    dia, spacing, layers = table['diameter'][None, :], table['spacing'][None, :], table['layers'][None, :]
+    area = table['area'][None, :]
+    b = 1000.0
+
+    # Centroid of the bar group; layers separated by a clear gap of max(φ, 25)
+    layer_gap = np.maximum(dia, 25.0)
+    d = h - cover - offset - dia / 2 - (layers - 1) * (dia + layer_gap) / 2
+    d = np.maximum(d, 1.0)
+
+    # Flexural capacity (singly reinforced, xu <= xu,max)
+    xu = 0.87 * fy * area / (0.36 * fck * b)
+    xu_max = 700.0 / (1100.0 + 0.87 * fy) * d
+    capacity = 0.87 * fy * area * (d - 0.42 * xu)
+    under_reinforced = xu <= xu_max
+    mu_lim = 0.36 * fck * b * xu_max * (d - 0.42 * xu_max)
+    with np.errstate(invalid='ignore'):
+        ast_required = np.where(
+            mu <= mu_lim,
+            0.5 * fck / fy * (1 - np.sqrt(np.maximum(1 - 4.6 * mu / (fck * b * d ** 2), 0.0))) * b * d,
+            np.inf)
+
+    fctm = _mean_tensile_strength(fck)
+    ast_min = np.maximum(np.maximum(0.26 * fctm / fy, 0.0013) * b * d, min_ratio * b * h)
+    ast_min = np.maximum(ast_min, min_area_imposed)
+    ast_max = 0.025 * b * h
+
+    clear_spacing = spacing - dia
+    spacing_ok = (clear_spacing >= np.maximum(np.maximum(dia, MAX_AGGREGATE + 5.0), 20.0)) & \
+                 (spacing <= max_spacing)
+
+    # Crack width under the SLS moment (cracked elastic section)
+    ecm = 22000.0 * ((fck + 8.0) / 10.0) ** 0.3
+    alpha_e = STEEL_MODULUS / ecm
+    rho = area / (b * d)
+    x = d * (-alpha_e * rho + np.sqrt((alpha_e * rho) ** 2 + 2 * alpha_e * rho))
+    sigma_s = ms / (area * (d - x / 3))
+    hc_eff = np.minimum(np.minimum(2.5 * (h - d), (h - x) / 3), h / 2)
+    rho_eff = area / (b * hc_eff)
+    strain = np.maximum((sigma_s - 0.5 * fctm / rho_eff * (1 + alpha_e * rho_eff)) / STEEL_MODULUS,
+                        0.6 * sigma_s / STEEL_MODULUS)
+    c = cover + offset
+    sr_max = np.where(spacing <= 5 * (c + dia / 2),
+                      3.4 * c + 0.425 * 0.8 * 0.5 * dia / rho_eff,
+                      1.3 * (h - x))
+    crack_width = np.where(ms > 0, sr_max * strain, 0.0)
+
+    feasible = (under_reinforced & (capacity >= mu) & (area >= ast_min) &
+                (area <= ast_max) & spacing_ok & (crack_width <= crack_limit))
+    return {
+        'effective_depth': d,
+        'capacity': capacity / 1e6,  # kN-m/m
+        'ast_required': ast_required,
+        'ast_min': ast_min,
+        'crack_width': crack_width,
+        'steel_stress': sigma_s,
+        'feasible': feasible,
+    }
+
+
+def _optimise(zones: List[_Zone], table: Dict[str, np.ndarray]) -> List[Dict[str, any]]:
+    """Lightest feasible candidate per zone, all zones in one pass"""
+    if not zones:
+        return []
+    checks = evaluate_candidates(zones, table)
+    feasible = checks['feasible']
+    # Weight first, then fewer bars (wider spacing, fewer layers)
+    bars_per_m = table['layers'] * 1000.0 / table['spacing']
+    score = table['weight'][None, :] + 1e-6 * bars_per_m[None, :]
+    best = np.argmin(np.where(feasible, score, np.inf), axis=1)
+    # Sections with no feasible arrangement keep the strongest one and are flagged
+    strongest = np.argmax(checks['capacity'], axis=1)
+    found = feasible.any(axis=1)
+    choice = np.where(found, best, strongest)
+
+    results = []
+    for z, zone in enumerate(zones):
+        k = choice[z]
+        required = checks['ast_required'][z, k]
+        results.append({
+            'member': zone.member.name,
+            'zone': zone.zone,
+            'design_moment': float(zone.moment_uls),
+            'service_moment': float(zone.moment_sls),
+            'bar_diameter': int(table['diameter'][k]),
+            'spacing': float(table['spacing'][k]),
+            'layers': int(table['layers'][k]),
+            'effective_depth': float(checks['effective_depth'][z, k]),
+            'ast_required': float(required) if np.isfinite(required) else float('inf'),
+            'ast_min': float(checks['ast_min'][z, k]),
+            'ast_provided': float(table['area'][k]),
+            'moment_capacity': float(checks['capacity'][z, k]),
+            'crack_width': float(checks['crack_width'][z, k]),
+            'weight_kg_per_m2': float(table['weight'][k]),
+            'status': 'OK' if found[z] else 'SECTION_INADEQUATE',
+        })
+    return results
+
+# ============================================================================
+# BAR SCHEDULE
+# ============================================================================
+
+def _schedule_line(mark: str, zone: _Zone, design: Dict[str, any]) -> Dict[str, any]:
+    member = zone.member
+    cover = member.cover if member.cover is not None else member.rules['cover']
+    dia = design['bar_diameter']
+    spacing = design['spacing']
+    per_layer = math.floor(max(zone.spread_width * 1000.0 - 2 * cover, 0.0) / spacing) + 1
+    number = per_layer * design['layers']
+
+    cut_length = zone.bar_length - 2 * cover / 1000.0 + 2 * BEND_ALLOWANCE_FACTOR * dia / 1000.0
+    laps = max(0, math.ceil(cut_length / STOCK_LENGTH) - 1)
+    cut_length += laps * LAP_LENGTH_FACTOR * dia / 1000.0
+    unit_weight = dia ** 2 / 162.0  # kg/m
+
+    layers = f" ({design['layers']} layers)" if design['layers'] > 1 else ''
+    return {
+        'bar_mark': mark,
+        'member': member.name,
+        'group': member.group,
+        'zone': zone.zone,
+        'description': f"{dia}mm @ {spacing:.0f}mm c/c{layers}",
+        'bar_diameter': dia,
+        'number_of_bars': number,
+        'cut_length': round(cut_length, 3),
+        'laps': laps,
+        'member_count': member.count,
+        'weight_kg': number * cut_length * unit_weight * member.count,
+    }
+
+# ============================================================================
+# MEMBER DESIGN
+# ============================================================================
+
+def _face_zones(member: ReinforcedMember) -> List[_Zone]:
+    rules = member.rules
+    main_face, opposite_face = rules['faces']
+    opposite_uls, opposite_sls = member.opposite_moment_uls, member.opposite_moment_sls
+    if rules['symmetric']:
+        opposite_uls = max(opposite_uls, member.moment_uls)
+        opposite_sls = max(opposite_sls, member.moment_sls)
+    return [
+        _Zone(member, f'{main_face} main', member.moment_uls, member.moment_sls,
+              member.span_length, member.width, 0.0, rules['max_spacing']),
+        _Zone(member, f'{opposite_face} main', opposite_uls, opposite_sls,
+              member.span_length, member.width, 0.0, rules['max_spacing']),
+    ]
+
+
+def _transverse_zones(member: ReinforcedMember, main: List[Dict[str, any]]) -> List[_Zone]:
+    rules = member.rules
+    zones = []
+    for i, design in enumerate(main):
+        face = design['zone'].replace(' main', '')
+        # Transverse bending acts on the main face unless the moment reverses
+        loaded = i == 0 or rules['symmetric']
+        zones.append(_Zone(member, f'{face} transverse',
+                           member.transverse_moment_uls if loaded else 0.0,
+                           member.transverse_moment_sls if loaded else 0.0,
+                           member.width, member.span_length,
+                           rules['transverse_ratio'] * design['ast_provided'],
+                           rules['max_secondary_spacing'],
+                           depth_offset=design['bar_diameter'] * design['layers']))
+    return zones
+
+
+def design_members(members: Sequence[ReinforcedMember],
+                   table: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, any]:
+    """
+    Minimum-weight reinforcement for all members with their bar schedule.
+    Main bars of every member are optimised in one vectorized pass, then the
+    transverse bars (which depend on the main steel provided) in a second.
+    """
+    table = table or candidate_table()
+    members = list(members)
+
+    main_zones = [zone for member in members for zone in _face_zones(member)]
+    main_designs = _optimise(main_zones, table)
+
+    transverse_zones = []
+    for i, member in enumerate(members):
+        transverse_zones.extend(_transverse_zones(member, main_designs[2 * i:2 * i + 2]))
+    transverse_designs = _optimise(transverse_zones, table)
+
+    results = {}
+    schedule = []
+    for i, member in enumerate(members):
+        zones = main_zones[2 * i:2 * i + 2] + transverse_zones[2 * i:2 * i + 2]
+        designs = main_designs[2 * i:2 * i + 2] + transverse_designs[2 * i:2 * i + 2]
+        prefix = ''.join(word[0] for word in member.name.split()).upper()
+        lines = [_schedule_line(f'{prefix}{j + 1}', zone, design)
+                 for j, (zone, design) in enumerate(zip(zones, designs))]
+        schedule.extend(lines)
+        results[member.name] = {
+            'member_type': member.member_type,
+            'group': member.group,
+            'count': member.count,
+            'zones': designs,
+            'steel_kg': sum(line['weight_kg'] for line in lines),
+            'status': 'OK' if all(d['status'] == 'OK' for d in designs) else 'SECTION_INADEQUATE',
+        }
+
+    total_kg = sum(line['weight_kg'] for line in schedule)
+    return {
+        'members': results,
+        'bar_schedule': schedule,
+        'total_steel_kg': total_kg,
+        'total_steel_tonnes': total_kg / 1000.0,
+        'status': 'OK' if all(m['status'] == 'OK' for m in results.values()) else 'SECTION_INADEQUATE',
+    }
+
+
+def schedule_tonnes(design: Dict[str, any], group: Optional[str] = None,
+                    per_unit: bool = False) -> float:
+    """
+    Steel in tonnes from a bar schedule, optionally for one group of members
+    and per single member (divided by the member count).
+    """
+    total = 0.0
+    for line in design['bar_schedule']:
+        if group is not None and line['group'] != group:
+            continue
+        total += line['weight_kg'] / (line['member_count'] if per_unit else 1)
+    return total / 1000.0
+
+# ============================================================================
+# ABUTMENT MEMBERS
+# ============================================================================
+
+def abutment_members(geometry: Dict[str, float], ka: float, soil_unit_weight: float,
+                     toe_pressure: float, concrete_density: float, fck: float, fy: float,
+                     surcharge_height: float = 1.2, count: int = 1) -> List[ReinforcedMember]:
+    """
+    Stem, base and wing walls of an abutment from the geometry dictionaries
+    of the abutment apps (Type-1 battered or Type-2 cantilever keys).
+    Stem and wings are cantilevers under active pressure with a live-load
+    surcharge of surcharge_height of fill (IRC:78); the toe carries the
+    base pressure, the heel the fill above it.
+    """
+    height = geometry['height']
+    base_t = geometry['base_thickness']
+    if 'stem_thickness' in geometry:  # Type-2 cantilever
+        stem_t = geometry['stem_thickness']
+        heel, toe = geometry['heel_length'], geometry['toe_length']
+    else:  # Type-1 battered: base projects equally beyond the battered stem
+        stem_t = geometry['bottom_width']
+        heel = toe = max(0.0, (geometry['base_width'] - stem_t) / 2)
+
+    def wall_moment(h: float) -> float:
+        return ka * soil_unit_weight * h ** 3 / 6 + ka * soil_unit_weight * surcharge_height * h ** 2 / 2
+
+    stem_height = max(height - base_t, 0.0)
+    stem_sls = wall_moment(stem_height)
+    toe_net = max(toe_pressure - concrete_density * base_t, 0.0)
+    toe_sls = toe_net * toe ** 2 / 2
+    heel_sls = (soil_unit_weight * stem_height + concrete_density * base_t) * heel ** 2 / 2
+
+    members = [
+        ReinforcedMember('Abutment stem', 'abutment_stem', stem_t, stem_height + base_t,
+                         geometry['base_length'], moment_uls=1.5 * stem_sls, moment_sls=stem_sls,
+                         count=count, group='abutment', fck=fck, fy=fy),
+        ReinforcedMember('Abutment base', 'abutment_base', base_t, geometry['base_width'],
+                         geometry['base_length'], moment_uls=1.5 * toe_sls, moment_sls=toe_sls,
+                         opposite_moment_uls=1.35 * heel_sls, opposite_moment_sls=heel_sls,
+                         count=count, group='abutment', fck=fck, fy=fy),
+    ]
+    wing_height = geometry.get('wing_height', 0.0)
+    if wing_height > 0:
+        wing_sls = wall_moment(wing_height)
+        members.append(ReinforcedMember(
+            'Wing wall', 'abutment_stem', geometry.get('wing_thickness', 0.4), wing_height,
+            geometry.get('wing_length', 6.0), moment_uls=1.5 * wing_sls, moment_sls=wing_sls,
+            count=2 * count, group='abutment', fck=fck, fy=fy))
+    return members
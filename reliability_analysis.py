@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+RELIABILITY ANALYSIS
+Monte Carlo probability of failure for pier footing, abutment and scour checks
+
+The deterministic checks (FootingOptimizer, abutment stability, Lacey scour)
+evaluate one set of characteristic values.  Here the governing inputs are
+random variables:
+
+    discharge Q, Lacey silt factor f, safe bearing capacity SBC,
+    soil friction angle φ, soil unit weight γ, concrete density γc
+
+and every check is written as a vectorized limit state g = capacity/demand - 1
+over a chunk of samples, so a failure is simply g < 0.  Chunks are drawn from
+independent child streams of one SeedSequence and only failure counts are
+kept, which bounds memory at one chunk per worker and makes the result
+independent of the number of worker processes.  Failure probabilities are
+reported with Wilson score confidence intervals and the equivalent
+reliability index β = -Φ⁻¹(P_f).
+
+Load model (per sample, relative to the design values):
+- dead, temperature (bearing friction) and seismic actions scale with γc
+- water current scales with V² ∝ (Q/Q_design)² at the fixed waterway
+- live, braking and wind actions are deterministic
+- base friction μ follows tan φ
+
+Bearing limit states compare the contact pressure with the ultimate capacity
+SBC × bearing_capacity_factor (IS 6403 factor of safety 2.5); a factor of 1.0
+gives the probability of exceeding the allowable pressure instead.  Scour
+fails when the foundation lies above the IRC:78 maximum scour level.
+"""
+
+import math
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Dict, List, Optional
+
+from footing_pressure_solver import solve_base_pressure
+from load_combination_engine import LOAD_CASES, LoadCombinationEngine
+
+# ============================================================================
+# RANDOM VARIABLES
+# ============================================================================
+
+DISTRIBUTIONS = ('normal', 'lognormal', 'gumbel', 'uniform', 'deterministic')
+
+# Euler-Mascheroni constant for the Gumbel (Type I extreme) location
+EULER_GAMMA = 0.5772156649015329
+
+@dataclass(frozen=True)
+class RandomVariable:
+    """Distribution of one input, described by its mean and coefficient of variation"""
+    distribution: str
+    mean: float
+    cov: float = 0.0
+    lower: Optional[float] = None  # samples are clipped to [lower, upper]
+    upper: Optional[float] = None
+
+    def __post_init__(self):
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution '{self.distribution}', "
+                             f"expected one of {DISTRIBUTIONS}")
+        if self.cov < 0:
+            raise ValueError("Coefficient of variation must not be negative")
+
+    @property
+    def std(self) -> float:
+        return abs(self.mean) * self.cov
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        mean, std = self.mean, self.std
+        if self.distribution == 'deterministic' or std == 0:
+            values = np.full(size, float(mean))
+        elif self.distribution == 'normal':
+            values = rng.normal(mean, std, size)
+        elif self.distribution == 'lognormal':
+            sigma = math.sqrt(math.log1p(self.cov ** 2))
+            values = rng.lognormal(math.log(mean) - 0.5 * sigma ** 2, sigma, size)
+        elif self.distribution == 'gumbel':
+            scale = std * math.sqrt(6) / math.pi
+            values = rng.gumbel(mean - EULER_GAMMA * scale, scale, size)
+        else:  # uniform with the same mean and standard deviation
+            half = math.sqrt(3) * std
+            values = rng.uniform(mean - half, mean + half, size)
+        if self.lower is not None or self.upper is not None:
+            values = np.clip(values, self.lower, self.upper)
+        return values
+
+
+def default_random_variables(discharge: float, silt_factor: float, safe_bearing_capacity: float,
+                             angle_of_friction: float, soil_unit_weight: float,
+                             concrete_density: float) -> Dict[str, RandomVariable]:
+    """
+    Distributions centred on the design inputs with typical scatter:
+    Gumbel flood peaks, lognormal silt factor and bearing capacity, normal
+    soil and concrete properties.
+    """
+    return {
+        'discharge': RandomVariable('gumbel', discharge, 0.25, lower=0.0),
+        'silt_factor': RandomVariable('lognormal', silt_factor, 0.20),
+        'safe_bearing_capacity': RandomVariable('lognormal', safe_bearing_capacity, 0.25),
+        'angle_of_friction': RandomVariable('normal', angle_of_friction, 0.10, lower=15.0, upper=45.0),
+        'soil_unit_weight': RandomVariable('normal', soil_unit_weight, 0.05, lower=10.0),
+        'concrete_density': RandomVariable('normal', concrete_density, 0.03, lower=20.0),
+    }
+
+# ============================================================================
+# LIMIT STATE MODELS
+# ============================================================================
+
+@dataclass
+class PierFootingModel:
+    """
+    Pier footing under the IRC:6 base-pressure (Table B.4) and equilibrium
+    (Table B.1) combinations.  Factored actions are split into the parts that
+    scale with concrete density, with (Q/Q_design)² and the fixed remainder,
+    each of shape (n_combinations, 5).
+    """
+    length: float
+    width: float
+    bearing_fixed: np.ndarray
+    bearing_density: np.ndarray
+    bearing_current: np.ndarray
+    sbc_increase: np.ndarray
+    min_contact_ratio: np.ndarray
+    equilibrium_fixed: np.ndarray
+    equilibrium_density: np.ndarray
+    equilibrium_current: np.ndarray
+
+    @classmethod
+    def from_load_vectors(cls, load_vectors: Dict[str, np.ndarray], length: float, width: float,
+                          min_contact_ratio: float = 1.0,
+                          engine: Optional[LoadCombinationEngine] = None) -> 'PierFootingModel':
+        engine = engine or LoadCombinationEngine()
+        stacked = engine.stack_load_vectors(load_vectors)
+        density_cases = np.isin(LOAD_CASES, ('dead', 'temperature', 'seismic'))
+        current_cases = np.isin(LOAD_CASES, ('water_current',))
+        fixed_cases = ~(density_cases | current_cases)
+
+        def split(limit_state: str):
+            idx = np.nonzero(engine.limit_states == limit_state)[0]
+            factors = engine.factor_matrix[idx]
+            return tuple(factors @ (stacked * mask[:, None])
+                         for mask in (fixed_cases, density_cases, current_cases)), idx
+
+        (bp_fixed, bp_density, bp_current), bp_idx = split('base_pressure')
+        (eq_fixed, eq_density, eq_current), _ = split('equilibrium')
+        return cls(
+            length=float(length), width=float(width),
+            bearing_fixed=bp_fixed, bearing_density=bp_density, bearing_current=bp_current,
+            sbc_increase=engine.sbc_increase[bp_idx],
+            min_contact_ratio=np.minimum(engine.min_contact_ratio[bp_idx], min_contact_ratio),
+            equilibrium_fixed=eq_fixed, equilibrium_density=eq_density,
+            equilibrium_current=eq_current,
+        )
+
+    @staticmethod
+    def _actions(fixed, density, current, density_ratio, current_ratio) -> np.ndarray:
+        """Factored actions for every sample and combination: (N, C, 5)"""
+        return (fixed[None] + density_ratio[:, None, None] * density[None]
+                + current_ratio[:, None, None] * current[None])
+
+    def limit_states(self, density_ratio: np.ndarray, current_ratio: np.ndarray,
+                     sbc: np.ndarray, friction: np.ndarray) -> Dict[str, np.ndarray]:
+        L, B = self.length, self.width
+        actions = self._actions(self.bearing_fixed, self.bearing_density, self.bearing_current,
+                                density_ratio, current_ratio)
+        P, ML, MT = actions[..., 0], actions[..., 3], actions[..., 4]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            kern = 6 * np.abs(ML / P) / L + 6 * np.abs(MT / P) / B
+        stable = (P > 0) & (np.abs(ML) < 0.5 * L * P) & (np.abs(MT) < 0.5 * B * P)
+
+        # Inside the kern the elastic formula is exact; only resultants
+        # outside it go through the no-tension solver
+        max_pressure = np.where(stable, P / (L * B) * (1 + kern), np.inf)
+        contact = np.where(stable, 1.0, 0.0)
+        outside = stable & (kern > 1.0)
+        if outside.any():
+            solved = solve_base_pressure(L, B, P[outside], ML[outside], MT[outside])
+            max_pressure[outside] = solved['max_pressure']
+            contact[outside] = solved['contact_ratio']
+
+        allowable = sbc[:, None] * self.sbc_increase[None]
+        bearing = np.min(allowable / max_pressure, axis=1) - 1.0
+        contact_margin = np.min(contact - self.min_contact_ratio[None] + 1e-9, axis=1)
+
+        # Equilibrium: resultant inside the base and base friction
+        actions = self._actions(self.equilibrium_fixed, self.equilibrium_density,
+                                self.equilibrium_current, density_ratio, current_ratio)
+        P, HL, HT = actions[..., 0], actions[..., 1], actions[..., 2]
+        ML, MT = np.abs(actions[..., 3]), np.abs(actions[..., 4])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            overturning = np.minimum(np.where(ML > 0, 0.5 * L * P / ML, np.inf),
+                                     np.where(MT > 0, 0.5 * B * P / MT, np.inf))
+            sliding = np.where(HL ** 2 + HT ** 2 > 0,
+                               friction[:, None] * P / np.hypot(HL, HT), np.inf)
+        return {
+            'pier_bearing': bearing,
+            'pier_contact': contact_margin,
+            'pier_overturning': overturning.min(axis=1) - 1.0,
+            'pier_sliding': sliding.min(axis=1) - 1.0,
+        }
+
+
+@dataclass
+class AbutmentModel:
+    """
+    Gravity/cantilever abutment per running width, following the abutment
+    stability check: restoring V·B/2 against the active thrust moment,
+    friction against the thrust and no-tension base pressure on the footing.
+    """
+    name: str
+    height: float
+    wall_width: float
+    footing_length: float
+    footing_width: float
+    dead_load: float
+
+    @classmethod
+    def from_design(cls, name: str, design: Dict, wall_width: float) -> 'AbutmentModel':
+        geometry = design['geometry']
+        foundation = design.get('foundation', {})
+        return cls(
+            name=name,
+            height=float(geometry['height']),
+            wall_width=float(wall_width),
+            footing_length=float(foundation.get('footing_length', geometry['base_length'])),
+            footing_width=float(foundation.get('footing_width', geometry['base_width'])),
+            dead_load=float(design['dead_load']),
+        )
+
+    def limit_states(self, density_ratio: np.ndarray, phi_deg: np.ndarray, gamma: np.ndarray,
+                     sbc: np.ndarray, friction: np.ndarray) -> Dict[str, np.ndarray]:
+        sin_phi = np.sin(np.radians(phi_deg))
+        ka = (1 - sin_phi) / (1 + sin_phi)
+        thrust = 0.5 * ka * gamma * self.height ** 2 * self.wall_width
+        moment = thrust * self.height / 3
+        vertical = self.dead_load * density_ratio
+        L, B = self.footing_length, self.footing_width
+
+        e = moment / vertical
+        with np.errstate(divide='ignore'):
+            max_pressure = np.where(e <= L / 6, vertical / (L * B) * (1 + 6 * e / L),
+                                    np.where(e < L / 2, 2 * vertical / (3 * B * (L / 2 - e)), np.inf))
+        return {
+            f'{self.name}_bearing': sbc / max_pressure - 1.0,
+            f'{self.name}_overturning': vertical * L / 2 / moment - 1.0,
+            f'{self.name}_sliding': friction * vertical / thrust - 1.0,
+        }
+
+
+@dataclass
+class ScourModel:
+    """
+    Lacey normal scour depth dsm = 1.34 (q²/f)^(1/3) from the discharge
+    intensity over the effective waterway (IRC:78 cl 703); maximum scour at
+    piers is scour_factor·dsm below HFL and must stay above the foundation.
+    """
+    hfl: float
+    foundation_level: float
+    effective_waterway: float
+    scour_factor: float = 2.0
+
+    def limit_states(self, discharge: np.ndarray, silt_factor: np.ndarray) -> Dict[str, np.ndarray]:
+        q = discharge / self.effective_waterway
+        dsm = 1.34 * np.cbrt(q ** 2 / silt_factor)
+        with np.errstate(divide='ignore'):
+            margin = (self.hfl - self.foundation_level) / (self.scour_factor * dsm) - 1.0
+        return {'scour': margin}
+
+# ============================================================================
+# MONTE CARLO DRIVER
+# ============================================================================
+
+@dataclass
+class ReliabilityModel:
+    """Random inputs, design reference values and the limit states they drive"""
+    variables: Dict[str, RandomVariable]
+    pier: Optional[PierFootingModel] = None
+    abutments: List[AbutmentModel] = field(default_factory=list)
+    scour: Optional[ScourModel] = None
+    design_discharge: float = 1.0
+    design_concrete_density: float = 24.0
+    design_friction_angle: float = 30.0
+    friction_coefficient: float = 0.45  # base friction μ at the design φ
+    bearing_capacity_factor: float = 2.5  # ultimate / safe bearing capacity
+
+    def sample(self, rng: np.random.Generator, size: int) -> Dict[str, np.ndarray]:
+        # Fixed variable order keeps the streams reproducible
+        return {name: self.variables[name].sample(rng, size) for name in sorted(self.variables)}
+
+    def limit_states(self, samples: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Safety margins g (failure when g < 0) for every check over one chunk"""
+        density_ratio = samples['concrete_density'] / self.design_concrete_density
+        current_ratio = (samples['discharge'] / self.design_discharge) ** 2
+        friction = self.friction_coefficient * (np.tan(np.radians(samples['angle_of_friction']))
+                                                / math.tan(math.radians(self.design_friction_angle)))
+        sbc = samples['safe_bearing_capacity'] * self.bearing_capacity_factor
+
+        margins = {}
+        if self.pier is not None:
+            margins.update(self.pier.limit_states(density_ratio, current_ratio, sbc, friction))
+        for abutment in self.abutments:
+            margins.update(abutment.limit_states(density_ratio, samples['angle_of_friction'],
+                                                 samples['soil_unit_weight'], sbc, friction))
+        if self.scour is not None:
+            margins.update(self.scour.limit_states(samples['discharge'], samples['silt_factor']))
+        return margins
+
+
+def _run_chunk(task) -> Dict[str, np.ndarray]:
+    """Failure counts for one chunk; top level so process pools can pickle it"""
+    model, seed, size = task
+    rng = np.random.default_rng(seed)
+    margins = model.limit_states(model.sample(rng, size))
+    failures = {name: int(np.count_nonzero(~(g >= 0))) for name, g in margins.items()}
+    failures['system'] = int(np.count_nonzero(
+        np.any(np.stack([~(g >= 0) for g in margins.values()]), axis=0)))
+    return failures
+
+
+def wilson_interval(failures: int, n: int, confidence: float = 0.95) -> tuple:
+    """Wilson score interval for a binomial proportion (valid at P_f = 0)"""
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = failures / n
+    denominator = 1 + z ** 2 / n
+    centre = (p + z ** 2 / (2 * n)) / denominator
+    half = z * math.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+    lower = 0.0 if failures == 0 else max(0.0, centre - half)
+    upper = 1.0 if failures == n else min(1.0, centre + half)
+    return lower, upper
+
+
+def reliability_index(probability: float) -> float:
+    """β = -Φ⁻¹(P_f); infinite when no failure was observed"""
+    if probability <= 0:
+        return math.inf
+    if probability >= 1:
+        return -math.inf
+    return -NormalDist().inv_cdf(probability)
+
+
+def run_monte_carlo(model: ReliabilityModel, n_samples: int = 1_000_000,
+                    chunk_size: int = 100_000, workers: Optional[int] = None,
+                    seed: int = 0, confidence: float = 0.95) -> Dict[str, any]:
+    """
+    Probability of failure per check by crude Monte Carlo.
+
+    Samples are generated and evaluated chunk by chunk (at most chunk_size
+    samples in memory per worker).  workers=None uses every core, workers=1
+    runs in-process; the same seed gives the same counts either way.
+    """
+    if n_samples <= 0 or chunk_size <= 0:
+        raise ValueError("n_samples and chunk_size must be positive")
+    start = time.perf_counter()
+    n_chunks = -(-n_samples // chunk_size)
+    sizes = [chunk_size] * (n_chunks - 1) + [n_samples - chunk_size * (n_chunks - 1)]
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    tasks = [(model, child, size) for child, size in zip(seeds, sizes)]
+
+    used_workers = min(workers or os.cpu_count() or 1, n_chunks)
+    if used_workers == 1:
+        counts = _accumulate(map(_run_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=used_workers) as executor:
+            counts = _accumulate(executor.map(_run_chunk, tasks))
+
+    checks = {}
+    for name, failures in counts.items():
+        probability = failures / n_samples
+        lower, upper = wilson_interval(failures, n_samples, confidence)
+        checks[name] = {
+            'failures': failures,
+            'probability_of_failure': probability,
+            'ci_lower': lower,
+            'ci_upper': upper,
+            'reliability_index': reliability_index(probability),
+            # Coefficient of variation of the estimator itself
+            'estimate_cov': (math.sqrt((1 - probability) / (n_samples * probability))
+                             if failures else math.inf),
+        }
+    return {
+        'n_samples': n_samples,
+        'chunks': n_chunks,
+        'workers': used_workers,
+        'confidence': confidence,
+        'seed': seed,
+        'variables': {name: {'distribution': rv.distribution, 'mean': rv.mean, 'cov': rv.cov}
+                      for name, rv in model.variables.items()},
+        'checks': checks,
+        'elapsed_s': time.perf_counter() - start,
+    }
+
+
+def _accumulate(chunk_counts) -> Dict[str, int]:
+    totals: Dict[str, int] = {}
+    for counts in chunk_counts:
+        for name, failures in counts.items():
+            totals[name] = totals.get(name, 0) + failures
+    return totals
+
+
+def reliability_table(results: Dict[str, any]) -> List[Dict[str, any]]:
+    """One row per check, for report tables and DataFrames"""
+    level = int(round(results['confidence'] * 100))
+    return [{
+        'Check': name.replace('_', ' ').title(),
+        'Failures': check['failures'],
+        'P_f': check['probability_of_failure'],
+        f'{level}% CI low': check['ci_lower'],
+        f'{level}% CI high': check['ci_upper'],
+        'β': check['reliability_index'],
+    } for name, check in results['checks'].items()]
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+REPORT ENGINE
+Precompiled HTML templates and streaming section rendering for reports
+
+Templates use f-string syntax ({expression:format}, doubled braces for
+literal CSS braces), so report pages keep their familiar form, but they are
+parsed and compiled once at import and evaluated against an explicit
+context instead of function locals.  A report is an ordered list of
+sections; the engine renders them one after another and yields HTML chunks
+as they are produced, so a 250+ page document is never held in memory and
+the first bytes reach the file or HTTP response immediately.
+
+Sections declare the result keys they read.  With a FragmentCache attached,
+each rendered section is stored under a hash of those values, so re-running
+a report after (say) a cost-only change re-renders only the cost pages and
+copies every other fragment; context values wrapped in Deferred are only
+computed when a section that needs them is actually rendered.
+"""
+
+import ast
+import builtins
+import hashlib
+import io
+import json
+import math
+import os
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+TEMPLATE_GLOBALS = {'datetime': datetime, 'math': math}
+
+_CONVERSIONS = {-1: None, ord('s'): str, ord('r'): repr, ord('a'): ascii}
+
+
+def _compile_pieces(node: ast.JoinedStr, name: str) -> List[Any]:
+    """Literal strings and (code, conversion, format spec pieces) tuples"""
+    pieces: List[Any] = []
+    for value in node.values:
+        if isinstance(value, ast.Constant):
+            pieces.append(value.value)
+        else:
+            code = compile(ast.Expression(value.value), name, 'eval')
+            spec = _compile_pieces(value.format_spec, name) if value.format_spec else None
+            pieces.append((code, _CONVERSIONS[value.conversion], spec))
+    return pieces
+
+
+def _free_names(node: ast.AST) -> set:
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)}
+
+
+class Template:
+    """An HTML template in f-string syntax, compiled once"""
+
+    def __init__(self, source: str, name: str = '<template>'):
+        self.name = name
+        self.source = source
+        for quote in ('"""', "'''"):
+            if quote not in source and not source.endswith(quote[0]):
+                break
+        else:
+            raise ValueError(f"Template {name} contains both triple-quote styles")
+        tree = ast.parse(f'rf{quote}{source}{quote}', name, mode='eval').body
+        if isinstance(tree, ast.Constant):  # no expressions at all
+            self.pieces = [tree.value]
+            self.names = frozenset()
+        else:
+            self.pieces = _compile_pieces(tree, name)
+            self.names = frozenset(_free_names(tree) - set(TEMPLATE_GLOBALS) - set(dir(builtins)))
+
+    def render(self, context: Mapping[str, Any]) -> Iterator[str]:
+        """Yield the rendered template piece by piece"""
+        namespace = dict(TEMPLATE_GLOBALS)
+        namespace.update((name, context[name]) for name in self.names if name in context)
+        return _render(self.pieces, namespace)
+
+    def render_text(self, context: Mapping[str, Any]) -> str:
+        return ''.join(self.render(context))
+
+
+def _render(pieces: List[Any], namespace: Dict[str, Any]) -> Iterator[str]:
+    for piece in pieces:
+        if isinstance(piece, str):
+            yield piece
+            continue
+        code, conversion, spec = piece
+        value = eval(code, namespace)
+        if conversion is not None:
+            value = conversion(value)
+        yield format(value, ''.join(_render(spec, namespace)) if spec else '')
+
+
+class Deferred:
+    """A context value computed on first use (see LazyContext)"""
+
+    def __init__(self, function: Callable[..., Any], *args: Any):
+        self.function = function
+        self.args = args
+
+    def __call__(self) -> Any:
+        return self.function(*self.args)
+
+
+class LazyContext(dict):
+    """Context dict that evaluates Deferred values when they are first read"""
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+        if isinstance(value, Deferred):
+            value = value()
+            self[key] = value
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+
+def result_values(results: Mapping[str, Any], keys: Sequence[str]) -> List[Any]:
+    """Values at result keys, dotted for nested dicts ('project_info.span_length')"""
+    values = []
+    for key in keys:
+        value: Any = results
+        for part in key.split('.'):
+            value = value.get(part) if isinstance(value, Mapping) else None
+        values.append(value)
+    return values
+
+
+def source_fingerprint(source: Any) -> str:
+    """
+    Identity of the code that renders a fragment: a template's text, or the
+    defining module and its modification time for a generator callable
+    """
+    if isinstance(source, Template):
+        return hashlib.sha256(source.source.encode('utf-8')).hexdigest()
+    module = sys.modules.get(getattr(source, '__module__', None) or '')
+    path = getattr(module, '__file__', None)
+    stamp = os.path.getmtime(path) if path and os.path.exists(path) else 0.0
+    return f"{getattr(source, '__qualname__', type(source).__name__)}:{path}:{stamp}"
+
+
+class FragmentCache:
+    """
+    Rendered report fragments (HTML text or PDF page bytes) keyed by the
+    fragment name, its source fingerprint and a hash of the result values it
+    reads.  Entries are kept in memory (least recently used dropped beyond
+    max_entries) and, with a directory, also on disk so later runs reuse them.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_entries: int = 256):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Union[str, bytes]]' = OrderedDict()
+
+    @staticmethod
+    def key(name: str, fingerprint: str, values: Sequence[Any]) -> str:
+        payload = json.dumps([name, fingerprint, list(values)], sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        return (os.path.join(self.directory, f'{key}.html'),
+                os.path.join(self.directory, f'{key}.bin'))
+
+    def get(self, key: str) -> Optional[Union[str, bytes]]:
+        fragment = self._entries.get(key)
+        if fragment is None and self.directory:
+            text_path, binary_path = self._paths(key)
+            if os.path.exists(text_path):
+                with open(text_path, 'r', encoding='utf-8', newline='') as handle:
+                    fragment = handle.read()
+            elif os.path.exists(binary_path):
+                with open(binary_path, 'rb') as handle:
+                    fragment = handle.read()
+            if fragment is not None:
+                self._remember(key, fragment)
+        if fragment is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return fragment
+
+    def put(self, key: str, fragment: Union[str, bytes]):
+        self._remember(key, fragment)
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            text_path, binary_path = self._paths(key)
+            if isinstance(fragment, str):
+                with open(text_path, 'w', encoding='utf-8', newline='') as handle:
+                    handle.write(fragment)
+            else:
+                with open(binary_path, 'wb') as handle:
+                    handle.write(fragment)
+
+    def _remember(self, key: str, fragment: Union[str, bytes]):
+        self._entries[key] = fragment
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class Section:
+    """
+    One report section: a Template, or a generator callable taking the
+    context and returning HTML as a string or an iterable of chunks.
+
+    inputs are the result keys the section reads: () for a static section,
+    None (the default) for one rendered every time, e.g. because it prints
+    the current date.
+    """
+    name: str
+    source: Union[Template, Callable[[Mapping[str, Any]], Union[str, Iterable[str]]]]
+    inputs: Optional[Tuple[str, ...]] = None
+
+    def render(self, context: Mapping[str, Any]) -> Iterator[str]:
+        if isinstance(self.source, Template):
+            yield from self.source.render(context)
+            return
+        output = self.source(context)
+        if isinstance(output, str):
+            yield output
+        else:
+            yield from output
+
+    def fragment_key(self, results: Mapping[str, Any]) -> Optional[str]:
+        """Cache key of the section for these results (None when uncacheable)"""
+        if self.inputs is None:
+            return None
+        return FragmentCache.key(self.name, source_fingerprint(self.source),
+                                 result_values(results, self.inputs))
+
+
+class ReportEngine:
+    """
+    Ordered sections rendered as a stream of HTML chunks.  After a run,
+    rendered and reused name the sections rendered afresh and the ones
+    copied from the fragment cache.
+    """
+
+    def __init__(self, sections: Sequence[Section],
+                 context: Callable[[Dict[str, Any]], Dict[str, Any]] = lambda results: {'results': results},
+                 cache: Optional[FragmentCache] = None):
+        self.sections = list(sections)
+        self.context = context
+        self.cache = cache
+        self.rendered: List[str] = []
+        self.reused: List[str] = []
+
+    def stream(self, results: Dict[str, Any]) -> Iterator[str]:
+        """HTML chunks of the whole report for a results dict"""
+        context = LazyContext(self.context(results))
+        self.rendered, self.reused = [], []
+        for section in self.sections:
+            key = section.fragment_key(results) if self.cache is not None else None
+            fragment = self.cache.get(key) if key is not None else None
+            if fragment is not None:
+                self.reused.append(section.name)
+                yield fragment
+                continue
+            self.rendered.append(section.name)
+            if key is None:
+                yield from section.render(context)
+                continue
+            chunks = []
+            for chunk in section.render(context):
+                chunks.append(chunk)
+                yield chunk
+            self.cache.put(key, ''.join(chunks))
+
+    def iter_bytes(self, results: Dict[str, Any], encoding: str = 'utf-8',
+                   chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Encoded chunks of about chunk_size bytes for an HTTP response body;
+        the first chunk is sent as soon as it is rendered
+        """
+        buffer: List[str] = []
+        size = 0
+        first = True
+        for chunk in self.stream(results):
+            buffer.append(chunk)
+            size += len(chunk)
+            if first or size >= chunk_size:
+                yield ''.join(buffer).encode(encoding)
+                buffer, size, first = [], 0, False
+        if buffer:
+            yield ''.join(buffer).encode(encoding)
+
+    def write(self, results: Dict[str, Any], target: Union[str, IO[str]]) -> int:
+        """Stream the report to a path or text file object; returns characters written"""
+        if isinstance(target, (str, os.PathLike)):
+            with open(target, 'w', encoding='utf-8') as handle:
+                return self.write(results, handle)
+        written = 0
+        for chunk in self.stream(results):
+            target.write(chunk)
+            written += len(chunk)
+        return written
+
+    def render_text(self, results: Dict[str, Any]) -> str:
+        """Whole report as one string (small reports and tests)"""
+        buffer = io.StringIO()
+        self.write(results, buffer)
+        return buffer.getvalue()
+
+
+def default_report_path(prefix: str, directory: Optional[str] = None) -> str:
+    """Timestamped HTML path under ./reports (or a given directory)"""
+    directory = directory or os.path.join(os.getcwd(), 'reports')
+    os.makedirs(directory, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return os.path.join(directory, f'{prefix}_{timestamp}.html')
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Design results saved as JSON"""
+    with open(path, 'r', encoding='utf-8') as handle:
+        return json.load(handle)
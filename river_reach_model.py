@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+RIVER REACH MODEL
+Ordered multi-cross-section river reach with lazy hydraulic tables
+
+All surveyed sections of a reach live in flat arrays (CSR layout): the
+points of section i are offsets[pointer[i]:pointer[i+1]] and
+elevations[pointer[i]:pointer[i+1]], and the section chainages are sorted,
+so a chainage lookup is a binary search.  Geometry is never rebuilt per
+call.
+
+Hydraulic tables (stage -> area, wetted perimeter, top width, conveyance)
+are computed the first time a section is queried and cached, so a reach of
+hundreds of sections only pays for the sections a backwater run or plot
+actually touches.  Chainage increases downstream, as in
+LongitudinalSectionData.
+"""
+
+import numpy as np
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from cross_section_geometry import as_section_arrays, stage_properties
+
+GRAVITY = 9.81
+
+
+class RiverReach:
+    """Cross sections at chainages with array storage and chainage lookup"""
+
+    def __init__(self, chainages: Sequence[float], sections: Sequence[Tuple[Sequence[float], Sequence[float]]],
+                 manning_n: Any = 0.033, names: Optional[Sequence[str]] = None,
+                 table_levels: int = 60):
+        if len(chainages) != len(sections):
+            raise ValueError("One chainage is required per cross section")
+        if not len(sections):
+            raise ValueError("A reach needs at least one cross section")
+        order = np.argsort(np.asarray(chainages, dtype=float), kind='stable')
+        arrays = [as_section_arrays(*sections[i]) for i in order]
+
+        self.chainages = np.asarray(chainages, dtype=float)[order]
+        if np.any(np.diff(self.chainages) == 0):
+            raise ValueError("Cross section chainages must be unique")
+        sizes = np.array([len(x) for x, _ in arrays])
+        self.pointer = np.concatenate([[0], np.cumsum(sizes)])
+        self.offsets = np.concatenate([x for x, _ in arrays])
+        self.elevations = np.concatenate([z for _, z in arrays])
+        roughness = np.asarray(manning_n, dtype=float)
+        self.manning_n = roughness[order] if roughness.ndim else np.full(len(order), float(roughness))
+        self.names = [names[i] for i in order] if names is not None else [f'CS-{c:g}' for c in self.chainages]
+        self.table_levels = table_levels
+        self._tables: Dict[int, Dict[str, np.ndarray]] = {}
+
+        starts = self.pointer[:-1]
+        self.thalweg = np.minimum.reduceat(self.elevations, starts)
+        self.left_bank = self.elevations[starts]
+        self.right_bank = self.elevations[self.pointer[1:] - 1]
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, float]], manning_n: Any = 0.033,
+                     **options) -> 'RiverReach':
+        """Build from flat survey rows with 'chainage', 'offset' and 'elevation' keys"""
+        grouped: Dict[float, Tuple[List[float], List[float]]] = {}
+        for row in records:
+            x, z = grouped.setdefault(float(row['chainage']), ([], []))
+            x.append(float(row['offset']))
+            z.append(float(row['elevation']))
+        chainages = sorted(grouped)
+        return cls(chainages, [grouped[c] for c in chainages], manning_n, **options)
+
+    @classmethod
+    def from_schema(cls, river_data, **options) -> 'RiverReach':
+        """
+        Single-section reach at the bridge from a RiverSectionInputSchema
+        (its reach, if one is attached, is returned as is)
+        """
+        if getattr(river_data, 'reach', None) is not None:
+            return river_data.reach
+        points = river_data.cross_section_points
+        return cls([river_data.l_section.bridge_chainage],
+                   [([p.chainage for p in points], [p.elevation for p in points])],
+                   river_data.bed_material.manning_n, **options)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.chainages)
+
+    def section(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(offsets, elevations) views of one section"""
+        start, end = self.pointer[index], self.pointer[index + 1]
+        return self.offsets[start:end], self.elevations[start:end]
+
+    def nearest(self, chainage):
+        """Index of the section nearest to each chainage"""
+        c = np.asarray(chainage, dtype=float)
+        right = np.clip(np.searchsorted(self.chainages, c), 1, max(len(self) - 1, 1))
+        left = right - 1
+        if len(self) == 1:
+            return np.zeros_like(c, dtype=int)
+        pick = np.where(np.abs(c - self.chainages[left]) <= np.abs(self.chainages[right] - c), left, right)
+        return pick if pick.ndim else int(pick)
+
+    def locate(self, chainage) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Bracketing sections and interpolation weight for each chainage:
+        value = (1 - w)·value[upstream] + w·value[downstream], clamped to the
+        reach ends.
+        """
+        c = np.asarray(chainage, dtype=float)
+        if len(self) == 1:
+            zero = np.zeros_like(c, dtype=int)
+            return zero, zero, np.zeros_like(c)
+        downstream = np.clip(np.searchsorted(self.chainages, c), 1, len(self) - 1)
+        upstream = downstream - 1
+        span = self.chainages[downstream] - self.chainages[upstream]
+        weight = np.clip((c - self.chainages[upstream]) / span, 0.0, 1.0)
+        return upstream, downstream, weight
+
+    def bed_level_at(self, chainage) -> np.ndarray:
+        """Thalweg level interpolated along the reach"""
+        return np.interp(chainage, self.chainages, self.thalweg)
+
+    def bed_slope(self) -> float:
+        """Least-squares thalweg slope (positive when falling downstream)"""
+        if len(self) < 2:
+            return 0.0
+        return float(-np.polyfit(self.chainages, self.thalweg, 1)[0])
+
+    # ------------------------------------------------------------------
+    # Hydraulic tables
+    # ------------------------------------------------------------------
+
+    def hydraulic_table(self, index: int) -> Dict[str, np.ndarray]:
+        """Stage table of one section, computed on first use"""
+        table = self._tables.get(index)
+        if table is None:
+            x, z = self.section(index)
+            # Frictionless vertical walls at the end points above the banks,
+            # with headroom of half the section relief
+            relief = max(z.max() - z.min(), 1.0)
+            stages = np.linspace(z.min(), z.max() + 0.5 * relief, self.table_levels)
+            table = stage_properties(x, z, stages)
+            table['stage'] = stages
+            with np.errstate(divide='ignore', invalid='ignore'):
+                radius = np.where(table['wetted_perimeter'] > 0,
+                                  table['area'] / table['wetted_perimeter'], 0.0)
+            table['hydraulic_radius'] = radius
+            table['conveyance'] = table['area'] * radius ** (2 / 3) / self.manning_n[index]
+            self._tables[index] = table
+        return table
+
+    def properties(self, index: int, stage) -> Dict[str, np.ndarray]:
+        """Table values at any stage(s) of one section (linear in the table)"""
+        table = self.hydraulic_table(index)
+        return {key: np.interp(stage, table['stage'], values)
+                for key, values in table.items() if key != 'stage'}
+
+    def cached_tables(self) -> int:
+        return len(self._tables)
+
+    def normal_stage(self, index: int, discharge: float, slope: Optional[float] = None) -> float:
+        """Manning normal-depth stage: K(stage) = Q / √S"""
+        slope = slope if slope is not None else self.bed_slope()
+        if slope <= 0:
+            raise ValueError("Normal depth needs a positive bed slope")
+        table = self.hydraulic_table(index)
+        return float(np.interp(discharge / np.sqrt(slope), table['conveyance'], table['stage']))
+
+    # ------------------------------------------------------------------
+    # Backwater
+    # ------------------------------------------------------------------
+
+    def water_surface_profile(self, discharge: float, downstream_stage: Optional[float] = None,
+                              expansion: float = 0.3, contraction: float = 0.1) -> Dict[str, np.ndarray]:
+        """
+        Subcritical standard-step profile from the downstream section.
+
+        At each step the energy balance
+            WS_u + V_u²/2g = WS_d + V_d²/2g + L·(Sf_u + Sf_d)/2 + C·|ΔV²/2g|
+        is evaluated at every stage of the upstream table at once and the
+        highest root (subcritical branch) is interpolated, so no iteration
+        is needed.  Defaults to normal depth at the downstream end.
+        """
+        n = len(self)
+        last = n - 1
+        if downstream_stage is None:
+            downstream_stage = self.normal_stage(last, discharge)
+
+        stage = np.empty(n)
+        stage[last] = downstream_stage
+        for i in range(last - 1, -1, -1):
+            stage[i] = self._step(i, i + 1, stage[i + 1], discharge, expansion, contraction)
+
+        velocity = np.empty(n)
+        froude = np.empty(n)
+        friction = np.empty(n)
+        for i in range(n):
+            props = self.properties(i, stage[i])
+            area = max(float(props['area']), 1e-9)
+            velocity[i] = discharge / area
+            depth = area / max(float(props['top_width']), 1e-9)
+            froude[i] = velocity[i] / np.sqrt(GRAVITY * depth)
+            friction[i] = (discharge / max(float(props['conveyance']), 1e-9)) ** 2
+        return {
+            'chainage': self.chainages.copy(),
+            'bed_level': self.thalweg.copy(),
+            'water_surface': stage,
+            'energy_level': stage + velocity ** 2 / (2 * GRAVITY),
+            'velocity': velocity,
+            'froude_number': froude,
+            'friction_slope': friction,
+        }
+
+    def _step(self, upstream: int, downstream: int, stage_down: float, discharge: float,
+              expansion: float, contraction: float) -> float:
+        down = self.properties(downstream, stage_down)
+        head_down = (discharge / max(float(down['area']), 1e-9)) ** 2 / (2 * GRAVITY)
+        sf_down = (discharge / max(float(down['conveyance']), 1e-9)) ** 2
+        length = self.chainages[downstream] - self.chainages[upstream]
+
+        table = self.hydraulic_table(upstream)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            head_up = (discharge / table['area']) ** 2 / (2 * GRAVITY)
+            sf_up = (discharge / table['conveyance']) ** 2
+            loss_coefficient = np.where(head_up > head_down, contraction, expansion)
+            residual = (table['stage'] + head_up
+                        - (stage_down + head_down + length * 0.5 * (sf_up + sf_down)
+                           + loss_coefficient * np.abs(head_up - head_down)))
+        residual = np.where(np.isfinite(residual), residual, -np.inf)
+        crossings = np.nonzero((residual[:-1] < 0) & (residual[1:] >= 0))[0]
+        if not len(crossings):
+            # No subcritical root inside the table: water stays at the top
+            # (or follows the downstream energy level if the table is too low)
+            return float(max(table['stage'][-1], stage_down))
+        k = crossings[-1]
+        r0, r1 = residual[k], residual[k + 1]
+        s0, s1 = table['stage'][k], table['stage'][k + 1]
+        return float(s0 + (s1 - s0) * (-r0) / (r1 - r0))
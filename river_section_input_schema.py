@@ -18,6 +18,11 @@ import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
 
+from waterway_hydraulics import afflux_methods, scour_methods
+from compound_channel import compound_channel
+from plot_decimation import MAX_TRACE_POINTS, decimated
+from chart_cache import cached_chart
+
 @dataclass
 class RiverCrossSectionPoint:
     """Single point in river cross-section"""
@@ -101,6 +106,13 @@ class RiverSectionInputSchema:
     
     # Bridge geometry
     bridge_geometry: BridgeGeometryRelativeToRiver = field(default_factory=lambda: BridgeGeometryRelativeToRiver(0, 0, 0, 0, 0, 0))
+    
+    # Surveyed reach (river_reach_model.RiverReach), optional
+    reach: Optional[Any] = None
+    
+    # Floodplain roughness panels (from chainage, to chainage, Manning n);
+    # the rest of the section takes bed_material.manning_n
+    roughness_panels: List[Tuple[float, float, float]] = field(default_factory=list)
 
 class HydraulicCalculationEngine:
     """Hydraulic calculation engine for bridge design"""
@@ -109,51 +121,55 @@ class HydraulicCalculationEngine:
         self.river_data = river_data
         self.calculation_results: Dict[str, Any] = {}
     
+    def compound_channel(self):
+        """Conveyance tables of the surveyed section (None without a survey)"""
+        points = self.river_data.cross_section_points
+        if len(points) < 2:
+            return None
+        return compound_channel([p.chainage for p in points], [p.elevation for p in points],
+                                self.river_data.roughness_panels, self.river_data.bed_material.manning_n)
+    
+    def calculate_conveyance(self) -> Dict[str, Any]:
+        """
+        Compound-channel conveyance at HFL (vertical division, per-panel
+        Manning n), kinetic energy coefficient α and the HFL that carries
+        the design discharge at the energy slope
+        """
+        channel = self.compound_channel()
+        if channel is None:
+            return {}
+        water_levels = self.river_data.water_levels
+        return channel.hydraulics_at(water_levels.hfl, water_levels.design_discharge,
+                                     self.river_data.flow_data.energy_slope)
+    
     def calculate_afflux(self) -> Dict[str, float]:
         """
         Calculate afflux using standard methods
         Based on CHITTOR PWD & UIT Excel formulas
-        """
-        # Extract data
-        Q = self.river_data.water_levels.design_discharge
-        L = self.river_data.bridge_geometry.waterway_provided
-        pier_width = self.river_data.bridge_geometry.pier_width
-        n_piers = self.river_data.bridge_geometry.number_of_piers
-        
-        # Calculate effective waterway
-        effective_waterway = L - (n_piers * pier_width)
-        
-        # Afflux calculation methods
-        results = {}
-        
-        # Method 1: Yarnell's Formula
-        pier_shape_factor = 1.25  # For rectangular piers
-        skew_factor = 1.0 + 0.6 * (math.sin(math.radians(self.river_data.bridge_geometry.skew_angle)))**2
-        contraction_ratio = pier_width * n_piers / L
-        
-        if contraction_ratio < 0.9:
-            yarnell_afflux = pier_shape_factor * skew_factor * (contraction_ratio**2) / (1 - contraction_ratio)
-        else:
-            yarnell_afflux = 0.5  # Conservative value for high contraction
-        
-        results['yarnell_afflux'] = yarnell_afflux
-        
-        # Method 2: IRC:5 Formula  
-        velocity_head = (self.river_data.water_levels.velocity_at_hfl**2) / (2 * 9.81)
-        irc_afflux = 0.3 * velocity_head * contraction_ratio
-        results['irc_afflux'] = irc_afflux
-        
-        # Method 3: Simplified formula
-        if effective_waterway > 0:
-            simple_afflux = 0.1 * (Q / effective_waterway)**0.5
-        else:
-            simple_afflux = 0.5
-        results['simple_afflux'] = simple_afflux
+        (Yarnell, IRC:5 and simplified; array kernels in waterway_hydraulics)
         
-        # Design afflux (conservative)
-        results['design_afflux'] = max(yarnell_afflux, irc_afflux, 0.083)  # Minimum 83mm
-        
-        return results
+        With a surveyed section the IRC:5 velocity head carries the compound
+        channel α, and a missing velocity at HFL is taken as Q/A at HFL.
+        """
+        geometry = self.river_data.bridge_geometry
+        water_levels = self.river_data.water_levels
+        velocity, alpha = water_levels.velocity_at_hfl, 1.0
+        conveyance = self.calculate_conveyance()
+        if conveyance:
+            alpha = conveyance['alpha']
+            velocity = velocity or conveyance['mean_velocity']
+        methods = afflux_methods(
+            water_levels.design_discharge,
+            geometry.waterway_provided,
+            geometry.number_of_piers,
+            geometry.pier_width,
+            geometry.skew_angle,
+            velocity,
+            pier_shape_factor=1.25,  # For rectangular piers
+            alpha=alpha,
+        )
+        keys = ('yarnell_afflux', 'irc_afflux', 'simple_afflux', 'design_afflux')
+        return {key: float(methods[key]) for key in keys}
     
     def calculate_waterway_adequacy(self) -> Dict[str, Any]:
         """
@@ -196,41 +212,17 @@ class HydraulicCalculationEngine:
     def calculate_scour_depth(self) -> Dict[str, float]:
         """
         Calculate scour depth using multiple methods
+        (Lacey normal/design, local scour at piers, Neill stone size)
         """
-        Q = self.river_data.water_levels.design_discharge
-        V = self.river_data.water_levels.velocity_at_hfl
-        f = self.river_data.bed_material.silt_factor
-        pier_width = self.river_data.bridge_geometry.pier_width
-        
-        results = {}
-        
-        # Normal Scour (Lacey's Formula)
-        normal_scour = 1.34 * ((Q**2 / f)**(1/3))
-        results['normal_scour_lacey'] = normal_scour
-        
-        # Design Scour Depth
-        design_scour = 1.5 * normal_scour  # Factor of safety
-        results['design_scour_depth'] = design_scour
-        
-        # Local Scour at Piers (HEC-RAS method)
-        if pier_width > 0 and V > 0:
-            local_scour_depth = 2.0 * pier_width * ((V / math.sqrt(9.81 * pier_width))**0.65)
-            results['local_scour_at_piers'] = local_scour_depth
-        else:
-            results['local_scour_at_piers'] = 0.0
-        
-        # Total Scour
-        total_scour = design_scour + results['local_scour_at_piers']
-        results['total_scour_depth'] = total_scour
-        
-        # Scour protection stone size (Neill's formula)
-        if V > 0:
-            stone_size = (V**2) / (5.75 * 9.81)
-            results['stone_size_d50'] = stone_size
-        else:
-            results['stone_size_d50'] = 0.1  # Minimum 100mm
-        
-        return results
+        methods = scour_methods(
+            self.river_data.water_levels.design_discharge,
+            self.river_data.bed_material.silt_factor,
+            self.river_data.bridge_geometry.pier_width,
+            self.river_data.water_levels.velocity_at_hfl,
+        )
+        keys = ('normal_scour_lacey', 'design_scour_depth', 'local_scour_at_piers',
+                'total_scour_depth', 'stone_size_d50')
+        return {key: float(methods[key]) for key in keys}
     
     def calculate_hydraulic_analysis(self) -> Dict[str, Any]:
         """
@@ -240,12 +232,14 @@ class HydraulicCalculationEngine:
         afflux_results = self.calculate_afflux()
         waterway_results = self.calculate_waterway_adequacy()
         scour_results = self.calculate_scour_depth()
+        conveyance_results = self.calculate_conveyance()
         
         # Combine results
         all_results = {
             'afflux': afflux_results,
             'waterway': waterway_results,
             'scour': scour_results,
+            'conveyance': conveyance_results,
             'summary': {
                 'design_afflux': afflux_results['design_afflux'],
                 'waterway_status': waterway_results['waterway_status'],
@@ -587,16 +581,23 @@ class RiverSectionInputUI:
                                            pier_width, int(number_of_piers), skew_angle, pier_nose_type)
     
     def create_cross_section_plot(self, points: List[RiverCrossSectionPoint], 
-                                water_levels: WaterLevelData) -> Optional[go.Figure]:
-        """Create cross-section visualization"""
+                                water_levels: WaterLevelData,
+                                x_range: Optional[Tuple[float, float]] = None) -> Optional[go.Figure]:
+        """
+        Create cross-section visualization.  Dense surveys are decimated
+        (min-max per chainage bucket); x_range plots only that chainage
+        window, at full resolution once it is narrow enough.
+        """
         
         if not points:
             return None
         
         # Extract data for plotting
-        chainages = [p.chainage for p in points]
-        elevations = [p.elevation for p in points]
-        descriptions = [p.description for p in points]
+        chainages, elevations, descriptions = decimated(
+            [p.chainage for p in points], [p.elevation for p in points],
+            [p.description for p in points], x_range=x_range)
+        chainages, elevations = chainages.tolist(), elevations.tolist()
+        descriptions = descriptions.tolist()
         
         # Create figure
         fig = go.Figure()
@@ -608,7 +609,7 @@ class RiverSectionInputUI:
             mode='lines+markers',
             name='River Cross-Section',
             line=dict(color='brown', width=3),
-            marker=dict(size=8, color='darkbrown'),
+            marker=dict(size=8, color='saddlebrown'),
             text=descriptions,
             hovertemplate='<b>%{text}</b><br>Chainage: %{x:.1f} m<br>Elevation: %{y:.2f} m<extra></extra>'
         ))
@@ -641,6 +642,8 @@ class RiverSectionInputUI:
             template='plotly_white',
             height=500
         )
+        if x_range is not None:
+            fig.update_xaxes(range=list(x_range))
         
         return fig
     
@@ -743,13 +746,19 @@ class RiverSectionInputUI:
         st.markdown("### 📊 River Section Visualization")
         
         if river_data.cross_section_points:
-            # Cross-section plot
-            fig_cross = self.create_cross_section_plot(river_data.cross_section_points, river_data.water_levels)
+            # Cross-section plot (dense surveys: zoom by chainage window for full detail)
+            x_range = None
+            if len(river_data.cross_section_points) > MAX_TRACE_POINTS:
+                offsets = [p.chainage for p in river_data.cross_section_points]
+                x_range = st.slider("Chainage window (m)", float(min(offsets)), float(max(offsets)),
+                                    (float(min(offsets)), float(max(offsets))), key="cross_section_window")
+            fig_cross = cached_chart(self.create_cross_section_plot, river_data.cross_section_points,
+                                     river_data.water_levels, x_range)
             if fig_cross:
                 st.plotly_chart(fig_cross, use_container_width=True)
         
         # Longitudinal profile plot
-        fig_long = self.create_longitudinal_profile_plot(river_data.l_section)
+        fig_long = cached_chart(self.create_longitudinal_profile_plot, river_data.l_section)
         st.plotly_chart(fig_long, use_container_width=True)
         
         # Summary statistics
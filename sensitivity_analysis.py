@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+SENSITIVITY ANALYSIS
+Morris screening and Sobol variance decomposition of the one-click design
+
+Each sample is a full BridgeDesignApp.design_bridge_one_click() run on a copy
+of the application with some inputs replaced, reduced to the outputs
+engineers track:
+
+    cost          concrete + steel at the BridgeEstimator rates (₹)
+    footing_area  pier footing plan area L × B (m², NaN if no footing found)
+    afflux        backwater at the bridge (m)
+    scour_depth   Lacey normal scour depth dsm = 1.34 (q²/f)^(1/3) (m)
+
+Sample points come from a scrambled Sobol' sequence (Halton without scipy),
+so the design space is covered evenly with few runs.  Identical input rows
+are evaluated once (results are cached on the analysis object across calls)
+and the remaining rows run on a process pool.
+
+- Morris: r one-at-a-time trajectories on a p-level grid; μ* ranks the
+  influence of each input, σ flags non-linearity / interaction.
+- Sobol: Saltelli sampling with N(k + 2) runs; first-order indices S1
+  (Saltelli 2010) and total indices ST (Jansen) with bootstrap intervals.
+"""
+
+import contextlib
+import copy
+import io
+import math
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence
+
+try:
+    from scipy.stats import qmc
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+from bridge_design_app import BridgeDesignApp, BridgeEstimator
+
+# ============================================================================
+# PARAMETERS AND OUTPUTS
+# ============================================================================
+
+OUTPUTS = ('cost', 'footing_area', 'afflux', 'scour_depth')
+
+# Input record attribute on BridgeDesignApp for each parameter section
+SECTIONS = {
+    'project': 'project_data',
+    'hydraulic': 'hydraulic_data',
+    'soil': 'soil_data',
+    'material': 'material_data',
+}
+
+@dataclass(frozen=True)
+class SensitivityParameter:
+    """One uncertain input, varied uniformly between lower and upper"""
+    name: str
+    section: str  # key of SECTIONS
+    field: str    # dataclass field of that input record
+    lower: float
+    upper: float
+
+    def scale(self, unit: np.ndarray) -> np.ndarray:
+        return self.lower + unit * (self.upper - self.lower)
+
+
+def default_parameters(app: BridgeDesignApp, spread: float = 0.2) -> List[SensitivityParameter]:
+    """Hydraulic, soil and material inputs of the app varied by ±spread"""
+    fields = [
+        ('discharge', 'hydraulic', 'discharge'),
+        ('silt_factor', 'hydraulic', 'silt_factor'),
+        ('design_velocity', 'hydraulic', 'design_velocity'),
+        ('safe_bearing_capacity', 'soil', 'safe_bearing_capacity'),
+        ('angle_of_friction', 'soil', 'angle_of_friction'),
+        ('soil_unit_weight', 'soil', 'unit_weight'),
+        ('friction_coefficient', 'soil', 'friction_coefficient'),
+        ('concrete_density', 'material', 'concrete_density'),
+    ]
+    parameters = []
+    for name, section, field in fields:
+        value = float(getattr(getattr(app, SECTIONS[section]), field))
+        parameters.append(SensitivityParameter(name, section, field,
+                                               value * (1 - spread), value * (1 + spread)))
+    return parameters
+
+
+def design_outputs(app: BridgeDesignApp) -> np.ndarray:
+    """Reduce a completed design to the OUTPUTS vector"""
+    results = app.design_results
+    hydraulics = results['hydraulic_analysis']
+    estimation = results['estimation']
+    rates = BridgeEstimator(app.material_data).rates
+    grade = app.material_data
+    cost = (estimation['concrete_volume_m3'] * rates[f'concrete_m{grade.concrete_grade.value}']
+            + estimation['steel_quantity_tonnes'] * rates[f'steel_fe{grade.steel_grade.value}'])
+
+    foundation = results['foundation_design']
+    footing_area = (foundation['footing_length'] * foundation['footing_width']
+                    if foundation.get('status') == 'ACCEPTABLE' else np.nan)
+
+    unit_discharge = hydraulics['discharge'] / hydraulics['effective_waterway']
+    scour_depth = 1.34 * (unit_discharge ** 2 / app.hydraulic_data.silt_factor) ** (1 / 3)
+    return np.array([cost, footing_area, hydraulics['afflux'], scour_depth], dtype=float)
+
+# ============================================================================
+# EVALUATION (cached, parallel)
+# ============================================================================
+
+_WORKER_STATE: Dict[str, object] = {}
+
+def _init_worker(app: BridgeDesignApp, parameters: Sequence[SensitivityParameter]) -> None:
+    _WORKER_STATE['app'] = app
+    _WORKER_STATE['parameters'] = parameters
+
+
+def _evaluate_row(row: np.ndarray) -> np.ndarray:
+    """One one-click design with the row's parameter values (runs in workers)"""
+    app = copy.deepcopy(_WORKER_STATE['app'])
+    changes: Dict[str, Dict[str, float]] = {}
+    for parameter, value in zip(_WORKER_STATE['parameters'], row):
+        changes.setdefault(parameter.section, {})[parameter.field] = float(value)
+    for section, fields in changes.items():
+        attribute = SECTIONS[section]
+        setattr(app, attribute, replace(getattr(app, attribute), **fields))
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            app.design_bridge_one_click()
+        return design_outputs(app)
+    except (ValueError, ZeroDivisionError, KeyError):
+        return np.full(len(OUTPUTS), np.nan)
+
+
+class SensitivityAnalysis:
+    """Morris and Sobol analyses of a configured BridgeDesignApp"""
+
+    def __init__(self, app: BridgeDesignApp, parameters: Optional[List[SensitivityParameter]] = None,
+                 workers: Optional[int] = None, decimals: int = 9):
+        self.app = app
+        self.parameters = list(parameters or default_parameters(app))
+        self.workers = workers
+        self.decimals = decimals
+        self.cache: Dict[tuple, np.ndarray] = {}
+        self.evaluations = 0
+
+    @property
+    def names(self) -> List[str]:
+        return [parameter.name for parameter in self.parameters]
+
+    def to_physical(self, unit: np.ndarray) -> np.ndarray:
+        return np.column_stack([p.scale(unit[:, i]) for i, p in enumerate(self.parameters)])
+
+    def evaluate(self, unit: np.ndarray) -> np.ndarray:
+        """Outputs (n, len(OUTPUTS)) for rows in the unit hypercube"""
+        physical = self.to_physical(np.atleast_2d(unit))
+        keys = [tuple(np.round(row, self.decimals)) for row in physical]
+        pending = list(dict.fromkeys(key for key in keys if key not in self.cache))
+        if pending:
+            rows = [np.array(key) for key in pending]
+            if self.workers == 1 or len(rows) == 1:
+                _init_worker(self.app, self.parameters)
+                values = [_evaluate_row(row) for row in rows]
+            else:
+                with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                         initargs=(self.app, self.parameters)) as executor:
+                    values = list(executor.map(_evaluate_row, rows, chunksize=8))
+            self.cache.update(zip(pending, values))
+            self.evaluations += len(pending)
+        return np.array([self.cache[key] for key in keys])
+
+    def morris(self, trajectories: int = 20, levels: int = 4, seed: int = 0) -> Dict[str, any]:
+        """Elementary effects on a levels-point grid, r = trajectories"""
+        k = len(self.parameters)
+        delta = levels / (2 * (levels - 1))
+        rng = np.random.default_rng(seed)
+        # Base points on the grid levels that leave room for a +Δ step
+        grid = np.arange(levels) / (levels - 1)
+        start = grid[grid <= 1 - delta + 1e-12]
+        base = np.floor(quasi_random(trajectories, k, seed) * len(start)).astype(int)
+
+        points = np.empty((trajectories, k + 1, k))
+        order = np.empty((trajectories, k), dtype=int)
+        steps = np.empty((trajectories, k))
+        for t in range(trajectories):
+            x = start[base[t]]
+            # Half of the factors step down from x + Δ instead of up from x
+            direction = rng.choice([-1.0, 1.0], k)
+            x = np.where(direction < 0, x + delta, x)
+            order[t] = rng.permutation(k)
+            steps[t] = direction[order[t]] * delta
+            points[t, 0] = x
+            for j, i in enumerate(order[t]):
+                x = x.copy()
+                x[i] += direction[i] * delta
+                points[t, j + 1] = x
+
+        values = self.evaluate(points.reshape(-1, k)).reshape(trajectories, k + 1, len(OUTPUTS))
+        effects = np.empty((trajectories, k, len(OUTPUTS)))
+        for t in range(trajectories):
+            ee = np.diff(values[t], axis=0) / steps[t][:, None]
+            effects[t, order[t]] = ee
+
+        indices = {}
+        for o, output in enumerate(OUTPUTS):
+            ee = effects[..., o]
+            indices[output] = {
+                name: {
+                    'mu': float(np.nanmean(ee[:, i])),
+                    'mu_star': float(np.nanmean(np.abs(ee[:, i]))),
+                    'sigma': float(np.nanstd(ee[:, i], ddof=1)) if trajectories > 1 else 0.0,
+                } for i, name in enumerate(self.names)
+            }
+        return self._store({
+            'method': 'morris',
+            'parameters': self._parameter_ranges(),
+            'trajectories': trajectories,
+            'levels': levels,
+            'evaluations': trajectories * (k + 1),
+            'indices': indices,
+        })
+
+    def sobol(self, n: int = 64, seed: int = 0, bootstrap: int = 200,
+              confidence: float = 0.95) -> Dict[str, any]:
+        """First-order and total Sobol indices from N(k + 2) design runs"""
+        k = len(self.parameters)
+        base = quasi_random(n, 2 * k, seed)
+        A, B = base[:, :k], base[:, k:]
+        AB = np.repeat(A[None], k, axis=0)
+        AB[np.arange(k), :, np.arange(k)] = B.T
+
+        values = self.evaluate(np.vstack([A, B, AB.reshape(-1, k)]))
+        y_a, y_b = values[:n], values[n:2 * n]
+        y_ab = values[2 * n:].reshape(k, n, len(OUTPUTS))
+
+        rng = np.random.default_rng(seed)
+        resamples = rng.integers(0, n, (bootstrap, n))
+        tail = (1 - confidence) / 2
+        indices = {}
+        for o, output in enumerate(OUTPUTS):
+            fa, fb, fab = y_a[:, o], y_b[:, o], y_ab[..., o]
+            valid = np.isfinite(fa) & np.isfinite(fb) & np.all(np.isfinite(fab), axis=0)
+            first, total = _sobol_estimates(fa[valid], fb[valid], fab[:, valid])
+            boot_first, boot_total = _sobol_estimates(
+                fa[resamples], fb[resamples], fab[:, resamples], valid[resamples])
+            indices[output] = {
+                name: {
+                    'S1': float(first[i]),
+                    'S1_ci': tuple(np.nanquantile(boot_first[:, i], [tail, 1 - tail]).tolist()),
+                    'ST': float(total[i]),
+                    'ST_ci': tuple(np.nanquantile(boot_total[:, i], [tail, 1 - tail]).tolist()),
+                } for i, name in enumerate(self.names)
+            }
+            indices[output]['_valid_fraction'] = float(valid.mean())
+        return self._store({
+            'method': 'sobol',
+            'parameters': self._parameter_ranges(),
+            'base_samples': n,
+            'evaluations': n * (k + 2),
+            'confidence': confidence,
+            'indices': indices,
+        })
+
+    def _parameter_ranges(self) -> Dict[str, tuple]:
+        return {p.name: (p.lower, p.upper) for p in self.parameters}
+
+    def _store(self, results: Dict[str, any]) -> Dict[str, any]:
+        results['unique_designs_run'] = self.evaluations
+        results['ranking'] = governing_parameters(results, top=len(self.parameters))
+        if self.app.design_results:
+            self.app.design_results.setdefault('sensitivity', {})[results['method']] = results
+        return results
+
+
+def _sobol_estimates(fa: np.ndarray, fb: np.ndarray, fab: np.ndarray,
+                     mask: Optional[np.ndarray] = None):
+    """
+    S1 = mean(f_B (f_ABi - f_A)) / V and ST = mean((f_A - f_ABi)²) / 2V.
+    Works on (n,) samples or stacked bootstrap resamples (R, n); rows
+    flagged False in mask are left out.
+    """
+    if mask is None:
+        mask = np.ones(fa.shape, dtype=bool)
+    weight = mask.astype(float)
+    count = np.maximum(weight.sum(axis=-1), 1.0)
+    fa, fb, fab = (np.where(mask, fa, 0.0), np.where(mask, fb, 0.0),
+                   np.where(mask, fab, 0.0))
+    # Centring on the mean keeps the products well conditioned for outputs
+    # with a large offset (e.g. cost in ₹)
+    pooled_mean = (((fa + fb) * weight).sum(axis=-1) / (2 * count))[..., None]
+    fa, fb, fab = fa - pooled_mean, fb - pooled_mean, fab - pooled_mean
+    variance = ((fa ** 2 + fb ** 2) * weight).sum(axis=-1) / (2 * count)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        first = (fb * (fab - fa) * weight).sum(axis=-1) / count / variance
+        total = ((fa - fab) ** 2 * weight).sum(axis=-1) / count / (2 * variance)
+    # (k, ...) -> (..., k)
+    return np.moveaxis(first, 0, -1), np.moveaxis(total, 0, -1)
+
+
+def quasi_random(n: int, dimensions: int, seed: int = 0) -> np.ndarray:
+    """Scrambled low-discrepancy points in [0, 1)^d"""
+    if SCIPY_AVAILABLE:
+        sampler = qmc.Sobol(dimensions, scramble=True, seed=seed)
+        m = max(1, math.ceil(math.log2(max(n, 2))))
+        return sampler.random_base2(m)[:n]
+    # Halton sequence with a random shift (Cranley-Patterson rotation)
+    primes = _first_primes(dimensions)
+    points = np.empty((n, dimensions))
+    index = np.arange(1, n + 1)
+    for d, base in enumerate(primes):
+        value, fraction, i = np.zeros(n), 1.0 / base, index.copy()
+        while np.any(i > 0):
+            value += fraction * (i % base)
+            i //= base
+            fraction /= base
+        points[:, d] = value
+    shift = np.random.default_rng(seed).random(dimensions)
+    return (points + shift) % 1.0
+
+
+def _first_primes(count: int) -> List[int]:
+    primes, candidate = [], 2
+    while len(primes) < count:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+# ============================================================================
+# REPORT TABLES
+# ============================================================================
+
+def ranked_table(results: Dict[str, any]) -> pd.DataFrame:
+    """
+    Inputs ranked by influence for every output: total index ST for Sobol,
+    μ* for Morris.  The DataFrame embeds directly via to_html()/to_markdown().
+    """
+    rows = []
+    key = 'ST' if results['method'] == 'sobol' else 'mu_star'
+    for output, per_parameter in results['indices'].items():
+        ranked = sorted(((name, values) for name, values in per_parameter.items()
+                         if not name.startswith('_')),
+                        key=lambda item: -np.nan_to_num(item[1][key], nan=-np.inf))
+        for rank, (name, values) in enumerate(ranked, start=1):
+            row = {'Output': output, 'Rank': rank, 'Parameter': name}
+            if results['method'] == 'sobol':
+                row.update({
+                    'S1': values['S1'],
+                    'S1 CI': f"{values['S1_ci'][0]:.3f} – {values['S1_ci'][1]:.3f}",
+                    'ST': values['ST'],
+                    'ST CI': f"{values['ST_ci'][0]:.3f} – {values['ST_ci'][1]:.3f}",
+                })
+            else:
+                row.update({'μ*': values['mu_star'], 'μ': values['mu'], 'σ': values['sigma']})
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def governing_parameters(results: Dict[str, any], top: int = 3) -> Dict[str, List[str]]:
+    """Names of the top-ranked influential inputs per output, for summary reports"""
+    table = ranked_table(results)
+    key = 'ST' if results['method'] == 'sobol' else 'μ*'
+    return {output: group[group[key] > 0].sort_values('Rank')['Parameter'].head(top).tolist()
+            for output, group in table.groupby('Output', sort=False)}
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+SLAB BRIDGE ENGINE
+Session-independent calculation core of the complete slab bridge design
+
+The design inputs are one immutable record (SlabBridgeInputs) and every
+analysis is a plain function of it, so the engine runs without Streamlit:
+in scripts, in tests, in worker processes and under a benchmark.  Because
+the record is frozen and hashable, a complete analysis is memoized per
+input state; the Streamlit app (complete_slab_bridge_design.py) only builds
+the record from st.session_state and stores the results back.
+"""
+
+import copy
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from deck_slab_analysis import DeckSlabGeometry, analyse_deck
+
+
+@dataclass(frozen=True)
+class SlabBridgeInputs:
+    """All inputs of a complete slab bridge analysis (defaults as in the design app)"""
+    # Project information
+    project_name: str = ''
+    location: str = ''
+    engineer_name: str = ''
+    design_date: str = ''
+    bridge_type: str = 'RCC Slab Bridge'
+    effective_span: float = 9.6
+    bridge_width: float = 12.0
+    num_spans: int = 3
+    selected_template: Optional[str] = 'None'
+
+    # Hydraulic parameters
+    discharge: float = 1265.76
+    design_velocity: float = 3.5
+    hfl: float = 101.2
+    manning_n: float = 0.033
+    bed_level: float = 95.0
+
+    # Structural parameters
+    slab_thickness: float = 0.6
+    skew_angle: float = 0.0
+    deck_analysis_method: str = 'effective_width'
+    pier_height: float = 8.0
+    pier_cap_length: float = 15.0
+    pier_cap_width: float = 2.5
+    pier_cap_thickness: float = 1.5
+
+    # Abutment ('Type-1' battered, anything else cantilever)
+    abutment_type: Optional[str] = 'Type-1'
+    type1_stem_height: float = 6.0
+    type1_batter_ratio: float = 0.1
+    type1_stem_top_width: float = 0.5
+    type1_foundation_length: float = 8.0
+    type1_foundation_width: float = 4.0
+    type1_foundation_thickness: float = 1.5
+    type2_stem_height: float = 6.0
+    type2_stem_width: float = 0.6
+    type2_stem_length: float = 12.0
+    type2_heel_length: float = 3.0
+    type2_toe_length: float = 1.5
+    type2_foundation_thickness: float = 1.2
+
+    # Geotechnical
+    bearing_capacity: float = 450.0
+
+    @classmethod
+    def from_mapping(cls, values: Mapping[str, Any]) -> 'SlabBridgeInputs':
+        """Record from a mapping such as st.session_state; keys it does not know are ignored"""
+        record = {spec.name: values[spec.name] for spec in fields(cls) if spec.name in values}
+        record['design_date'] = str(record.get('design_date', date.today()))
+        return cls(**record)
+
+
+def project_info(inputs: SlabBridgeInputs) -> Dict:
+    return {
+        'bridge_name': inputs.project_name,
+        'location': inputs.location,
+        'design_engineer': inputs.engineer_name,
+        'design_date': inputs.design_date or str(date.today()),
+        'bridge_type': inputs.bridge_type,
+        'effective_span': inputs.effective_span,
+        'bridge_width': inputs.bridge_width,
+        'number_of_spans': inputs.num_spans,
+        'selected_template': inputs.selected_template
+    }
+
+
+def hydraulic_analysis(inputs: SlabBridgeInputs) -> Dict:
+    discharge = inputs.discharge
+    velocity = inputs.design_velocity
+
+    # Calculate derived parameters
+    regime_width = 4.75 * (discharge ** 0.5)
+    effective_waterway = inputs.num_spans * inputs.effective_span
+    afflux = (velocity ** 2) / (2 * 9.81) * 0.1
+    scour_depth = 1.35 * (discharge / 1000) ** 0.61
+
+    return {
+        'discharge': discharge,
+        'design_velocity': velocity,
+        'hfl': inputs.hfl,
+        'regime_width': regime_width,
+        'effective_waterway': effective_waterway,
+        'afflux': afflux,
+        'scour_depth': scour_depth,
+        'waterway_ratio': effective_waterway / regime_width if regime_width > 0 else 0,
+        'manning_coefficient': inputs.manning_n,
+        'bed_level': inputs.bed_level,
+        'analysis_status': 'COMPLETED'
+    }
+
+
+def structural_analysis(inputs: SlabBridgeInputs) -> Dict:
+    span = inputs.effective_span
+    width = inputs.bridge_width
+    thickness = inputs.slab_thickness
+
+    # Slab analysis
+    slab_area = span * width
+    slab_volume = slab_area * thickness
+    slab_weight = slab_volume * 25.0  # kN/m3
+
+    # Pier analysis
+    pier_cap_volume = inputs.pier_cap_length * inputs.pier_cap_width * inputs.pier_cap_thickness
+    pier_weight = pier_cap_volume * 25.0
+
+    # Deck moments and shears per strip
+    deck = DeckSlabGeometry(
+        span_lengths=(span,) * int(inputs.num_spans),
+        width=width,
+        thickness=thickness,
+        skew_angle=inputs.skew_angle,
+        concrete_density=25.0,
+    )
+    deck_analysis = analyse_deck(deck, inputs.deck_analysis_method)
+
+    return {
+        'slab_design': {
+            'span': span,
+            'width': width,
+            'thickness': thickness,
+            'area': slab_area,
+            'volume': slab_volume,
+            'self_weight': slab_weight,
+            'design_moment': deck_analysis['max_design_moment'],
+            'design_shear': deck_analysis['max_design_shear']
+        },
+        'deck_analysis': deck_analysis,
+        'pier_design': {
+            'height': inputs.pier_height,
+            'cap_dimensions': {
+                'length': inputs.pier_cap_length,
+                'width': inputs.pier_cap_width,
+                'thickness': inputs.pier_cap_thickness
+            },
+            'cap_volume': pier_cap_volume,
+            'total_load': pier_weight
+        },
+        'analysis_status': 'COMPLETED'
+    }
+
+
+def abutment_analysis(inputs: SlabBridgeInputs) -> Dict:
+    if inputs.abutment_type == 'Type-1':
+        return {
+            'type': 'Type-1 Battered Abutment',
+            'design_based_on': 'UIT Bridges Excel sheets',
+            'stem_height': inputs.type1_stem_height,
+            'batter_ratio': inputs.type1_batter_ratio,
+            'stem_top_width': inputs.type1_stem_top_width,
+            'foundation_length': inputs.type1_foundation_length,
+            'foundation_width': inputs.type1_foundation_width,
+            'foundation_thickness': inputs.type1_foundation_thickness,
+            'stability_ok': True,
+            'analysis_status': 'COMPLETED'
+        }
+    return {
+        'type': 'Type-2 Cantilever Abutment',
+        'design_based_on': 'Chittorgarh Excel sheets',
+        'stem_height': inputs.type2_stem_height,
+        'stem_width': inputs.type2_stem_width,
+        'stem_length': inputs.type2_stem_length,
+        'heel_length': inputs.type2_heel_length,
+        'toe_length': inputs.type2_toe_length,
+        'foundation_thickness': inputs.type2_foundation_thickness,
+        'stability_ok': True,
+        'analysis_status': 'COMPLETED'
+    }
+
+
+def foundation_analysis(inputs: SlabBridgeInputs) -> Dict:
+    bearing_capacity = inputs.bearing_capacity
+
+    # Simplified foundation analysis
+    total_load = 5000.0  # kN (simplified)
+    foundation_area = total_load / bearing_capacity
+    foundation_length = math.sqrt(foundation_area * 1.5)
+    foundation_width = foundation_area / foundation_length
+
+    return {
+        'foundation_area': foundation_area,
+        'foundation_length': foundation_length,
+        'foundation_width': foundation_width,
+        'foundation_thickness': 1.5,
+        'bearing_capacity_check': {
+            'applied_pressure': total_load / foundation_area,
+            'allowable_pressure': bearing_capacity,
+            'safety_factor': bearing_capacity / (total_load / foundation_area),
+            'check': 'PASS'
+        },
+        'analysis_status': 'COMPLETED'
+    }
+
+
+def cost_analysis(inputs: SlabBridgeInputs) -> Dict:
+    span = inputs.effective_span
+    width = inputs.bridge_width
+
+    # Calculate quantities
+    concrete_volume = span * width * inputs.slab_thickness + 50.0  # Slab + other components
+    steel_weight = concrete_volume * 100  # kg (100 kg/m3 ratio)
+    formwork_area = concrete_volume * 6  # m2 (surface area approximation)
+
+    # Apply rates
+    concrete_cost = concrete_volume * 5000.0  # Rs/m3
+    steel_cost = steel_weight * 60.0  # Rs/kg
+    formwork_cost = formwork_area * 250.0  # Rs/m2
+
+    total_cost = concrete_cost + steel_cost + formwork_cost
+
+    return {
+        'concrete_volume': concrete_volume,
+        'steel_weight': steel_weight,
+        'formwork_area': formwork_area,
+        'concrete_cost': concrete_cost,
+        'steel_cost': steel_cost,
+        'formwork_cost': formwork_cost,
+        'total_cost': total_cost,
+        'cost_per_sqm': total_cost / (span * width),
+        'analysis_status': 'COMPLETED'
+    }
+
+
+@lru_cache(maxsize=128)
+def _analysis(inputs: SlabBridgeInputs) -> Dict:
+    return {
+        'project_info': project_info(inputs),
+        'hydraulic_analysis': hydraulic_analysis(inputs),
+        'structural_analysis': structural_analysis(inputs),
+        'abutment_analysis': abutment_analysis(inputs),
+        'foundation_analysis': foundation_analysis(inputs),
+        'cost_analysis': cost_analysis(inputs),
+    }
+
+
+def run_complete_analysis(inputs: SlabBridgeInputs) -> Dict:
+    """
+    Complete analysis of one input record, memoized per record (each call
+    gets its own copy of the results).  Failures are returned as a FAILED
+    result rather than raised, as the design app reports them.
+    """
+    try:
+        results = {'timestamp': datetime.now().isoformat(), **copy.deepcopy(_analysis(inputs))}
+        results['design_status'] = 'COMPLETED'
+        return results
+    except Exception as e:
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'error': str(e),
+            'design_status': 'FAILED'
+        }
+
+
+def run_batch(records: Sequence[SlabBridgeInputs], jobs: Optional[int] = None) -> List[Dict]:
+    """
+    Complete analyses of many input records, in order, in jobs worker
+    processes (all cores by default; jobs=1 runs in this process)
+    """
+    records = list(records)
+    jobs = min(jobs or os.cpu_count() or 1, len(records))
+    if jobs <= 1:
+        return [run_complete_analysis(inputs) for inputs in records]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(run_complete_analysis, records, chunksize=max(1, len(records) // (4 * jobs))))
+
+
+def clear_cache():
+    _analysis.cache_clear()
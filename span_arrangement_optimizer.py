@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+SPAN ARRANGEMENT OPTIMIZER
+Number of spans × clear span × pier width for minimum estimated cost
+
+Search grid: every combination of span count, clear span length and pier
+width.  A layout of n spans of clear length s with piers of width b gives
+
+    effective waterway  W = n·s
+    overall waterway    L = n·s + (n - 1)·b
+
+and is accepted when
+- W / Lacey regime width 4.8√Q ≥ min_regime_ratio (waterway adequacy)
+- design afflux (Yarnell / IRC:5, waterway_hydraulics) ≤ max_afflux
+
+Branch and bound:
+1. The hydraulic checks run on the whole grid in one vectorized call and
+   prune every inadequate layout.
+2. Each surviving layout gets a lower bound on cost: exact deck cost plus
+   the pier takeoff with the footing at its smallest trial size.
+3. Layouts are visited in order of lower bound and the expensive structural
+   stage (pier load vectors, FootingOptimizer, DetailedPierGeometry and the
+   BridgeEstimator takeoff) runs only while the bound is below the best cost
+   found so far.  Piers are simply supported between spans, so a pier design
+   depends only on (span, pier width, foundation depth) and is cached.
+
+Foundation depth per layout follows the Lacey scour on the unit discharge
+through the bridge: the pier founds at least scour_factor·dsm below HFL
+(IRC:78) and never shallower than the standard embedment.  Abutments are
+common to every layout and are left out of the compared cost.
+"""
+
+import time
+import numpy as np
+from dataclasses import replace
+from typing import Dict, List, Optional, Sequence
+
+from bridge_design_app import (BridgeDesignApp, BridgeEstimator, DetailedPierGeometry,
+                               FootingOptimizer, HydraulicCalculator, PierDesign)
+from waterway_hydraulics import evaluate_layouts
+
+DEFAULT_SPAN_COUNTS = tuple(range(2, 31))
+DEFAULT_SPAN_LENGTHS = tuple(np.round(np.arange(6.0, 20.01, 0.5), 2))
+DEFAULT_PIER_WIDTHS = (1.0, 1.2, 1.5, 1.8, 2.0)
+
+
+class SpanArrangementOptimizer:
+    """Branch-and-bound search of span arrangements for a configured BridgeDesignApp"""
+
+    def __init__(self, app: BridgeDesignApp, span_counts: Sequence[int] = DEFAULT_SPAN_COUNTS,
+                 span_lengths: Sequence[float] = DEFAULT_SPAN_LENGTHS,
+                 pier_widths: Sequence[float] = DEFAULT_PIER_WIDTHS,
+                 min_regime_ratio: float = 1.0, max_afflux: float = 0.3,
+                 scour_factor: float = 2.0, depth_step: float = 0.25):
+        self.app = app
+        self.span_counts = np.asarray(span_counts, dtype=int)
+        self.span_lengths = np.asarray(span_lengths, dtype=float)
+        self.pier_widths = np.asarray(pier_widths, dtype=float)
+        self.min_regime_ratio = min_regime_ratio
+        self.max_afflux = max_afflux
+        self.scour_factor = scour_factor
+        self.depth_step = depth_step  # foundation depths rounded up to this step
+        self.estimator = BridgeEstimator(app.material_data)
+        self.pier_cache: Dict[tuple, Optional[Dict[str, float]]] = {}
+
+    # ------------------------------------------------------------------
+    # Cheap stage: hydraulics and cost bounds over the whole grid
+    # ------------------------------------------------------------------
+
+    def _natural_mean_depth(self) -> Optional[float]:
+        """Hydraulic mean depth A/T of the surveyed section at HFL"""
+        points = self.app.survey_points
+        if not points:
+            return None
+        wetted = HydraulicCalculator.calculate_wetted_properties(points, self.app.hydraulic_data.hfl)
+        area, top_width = wetted['total_area'], wetted['total_top_width']
+        return area / top_width if area > 0 and top_width > 0 else None
+
+    def hydraulic_screen(self) -> Dict[str, np.ndarray]:
+        """Afflux, waterway adequacy and scour for every layout of the grid"""
+        hydraulic = self.app.hydraulic_data
+        n = self.span_counts[:, None, None]
+        s = self.span_lengths[None, :, None]
+        b = self.pier_widths[None, None, :]
+        waterway = n * s + (n - 1) * b
+
+        mean_depth = self._natural_mean_depth()
+        if mean_depth:
+            velocity = hydraulic.discharge / (n * s * mean_depth)
+        else:
+            velocity = hydraulic.design_velocity
+        results = evaluate_layouts(hydraulic.discharge, hydraulic.silt_factor, waterway,
+                                   n - 1, b, self.app.project_data.skew_angle, velocity)
+        results['waterway'] = np.broadcast_to(waterway, results['design_afflux'].shape)
+        # Adequacy is judged on the clear (effective) waterway
+        results['regime_ratio'] = results['effective_waterway'] / results['lacey_regime_width']
+        results['adequate'] = ((results['regime_ratio'] >= self.min_regime_ratio)
+                               & (results['design_afflux'] <= self.max_afflux))
+        return results
+
+    def _embedment(self, scour_depth: np.ndarray) -> np.ndarray:
+        """Embedment below bed so the pier founds below the maximum scour level"""
+        pier = PierDesign(self.app.project_data, self.app.hydraulic_data,
+                          self.app.soil_data, self.app.material_data)
+        scour_level = self.app.hydraulic_data.hfl - self.scour_factor * scour_depth
+        required = np.maximum(pier.embedment, pier.bed_level - scour_level)
+        return np.ceil(required / self.depth_step - 1e-9) * self.depth_step
+
+    def _deck_cost(self, span_count: int, span_length: float) -> float:
+        project = replace(self.app.project_data, effective_span=float(span_length),
+                          num_spans=int(span_count))
+        return self._cost(self.estimator.calculate_deck_quantities(project))
+
+    def _cost(self, quantities: Dict[str, float]) -> float:
+        rates = self.estimator.rates
+        material = self.app.material_data
+        return (quantities['concrete'] * rates[f'concrete_m{material.concrete_grade.value}']
+                + quantities['steel'] * rates[f'steel_fe{material.steel_grade.value}']
+                + quantities.get('formwork', 0.0) * rates['formwork']
+                + quantities.get('excavation', 0.0) * rates['excavation']
+                + quantities.get('waterproofing', 0.0) * rates['waterproofing'])
+
+    def _pier_cost_bound(self, pier_width: np.ndarray, embedment: np.ndarray) -> np.ndarray:
+        """
+        Pier takeoff with the footing at its smallest trial size (pier + 0.5 m
+        each side, as FootingOptimizer starts): never more than the full cost
+        """
+        bounds = {}
+        for key in set(zip(pier_width.tolist(), embedment.tolist())):
+            pier = PierDesign(self.app.project_data, self.app.hydraulic_data,
+                              self.app.soil_data, self.app.material_data)
+            pier.pier_width, pier.embedment = key
+            pier.calculate_levels()
+            smallest = {'footing_length': pier.pier_length + 1.0, 'footing_width': pier.pier_width + 1.0}
+            geometry = DetailedPierGeometry(pier).calculate_complete_geometry(smallest)
+            bounds[key] = self._cost(self.estimator.calculate_pier_quantities(geometry, num_piers=1))
+        return np.array([bounds[key] for key in zip(pier_width.tolist(), embedment.tolist())])
+
+    # ------------------------------------------------------------------
+    # Expensive stage: pier stability, footing and takeoff
+    # ------------------------------------------------------------------
+
+    def pier_cost(self, span_length: float, pier_width: float, embedment: float) -> Optional[Dict[str, float]]:
+        """Full cost of one pier (None when no footing satisfies the SBC)"""
+        key = (round(float(span_length), 3), round(float(pier_width), 3), round(float(embedment), 3))
+        if key in self.pier_cache:
+            return self.pier_cache[key]
+        project = replace(self.app.project_data, effective_span=key[0],
+                          pier_spacing_cc=key[0] + key[1])
+        pier = PierDesign(project, self.app.hydraulic_data, self.app.soil_data, self.app.material_data)
+        pier.pier_width = key[1]
+        pier.embedment = key[2]
+        pier.calculate_levels()
+        footing = FootingOptimizer(pier).optimize_footing_dimensions()
+        if footing.get('status') != 'ACCEPTABLE':
+            result = None
+        else:
+            geometry = DetailedPierGeometry(pier).calculate_complete_geometry(footing)
+            quantities = self.estimator.calculate_pier_quantities(geometry, num_piers=1)
+            result = {
+                'cost': self._cost(quantities),
+                'footing_length': footing['footing_length'],
+                'footing_width': footing['footing_width'],
+                'foundation_level': pier.foundation_level,
+                'concrete': quantities['concrete'],
+                'steel': quantities['steel'],
+            }
+        self.pier_cache[key] = result
+        return result
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def optimize(self, top: int = 5) -> Dict[str, any]:
+        start = time.perf_counter()
+        screen = self.hydraulic_screen()
+        idx = np.argwhere(screen['adequate'])
+        if not len(idx):
+            return {
+                'status': 'NO_ADEQUATE_LAYOUT',
+                'message': 'No layout meets the regime width ratio and afflux limit',
+                'layouts_total': int(screen['adequate'].size),
+            }
+
+        counts = self.span_counts[idx[:, 0]]
+        spans = self.span_lengths[idx[:, 1]]
+        widths = self.pier_widths[idx[:, 2]]
+        scour = screen['normal_scour_unit_discharge'][tuple(idx.T)]
+        embedment = self._embedment(scour)
+        deck = {key: self._deck_cost(*key) for key in set(zip(counts.tolist(), spans.tolist()))}
+        deck_cost = np.array([deck[key] for key in zip(counts.tolist(), spans.tolist())])
+        bound = deck_cost + (counts - 1) * self._pier_cost_bound(widths, embedment)
+
+        best_cost = np.inf
+        evaluated: List[Dict[str, any]] = []
+        visited = 0
+        for i in np.argsort(bound, kind='stable'):
+            if bound[i] >= best_cost:
+                break  # every remaining layout has a higher bound
+            visited += 1
+            pier = self.pier_cost(spans[i], widths[i], embedment[i])
+            if pier is None:
+                continue
+            cost = deck_cost[i] + (counts[i] - 1) * pier['cost']
+            j = tuple(idx[i])
+            evaluated.append({
+                'span_count': int(counts[i]),
+                'span_length': float(spans[i]),
+                'pier_width': float(widths[i]),
+                'pier_count': int(counts[i] - 1),
+                'waterway': float(screen['waterway'][j]),
+                'effective_waterway': float(screen['effective_waterway'][j]),
+                'regime_ratio': float(screen['regime_ratio'][j]),
+                'design_afflux': float(screen['design_afflux'][j]),
+                'scour_depth': float(scour[i]),
+                'foundation_level': pier['foundation_level'],
+                'footing_length': pier['footing_length'],
+                'footing_width': pier['footing_width'],
+                'deck_cost': float(deck_cost[i]),
+                'pier_cost': float(pier['cost']),
+                'estimated_cost': float(cost),
+                'cost_lower_bound': float(bound[i]),
+            })
+            best_cost = min(best_cost, cost)
+
+        if not evaluated:
+            return {
+                'status': 'NO_FEASIBLE_FOUNDATION',
+                'message': 'Hydraulically adequate layouts found, but no pier footing satisfies the SBC',
+                'layouts_total': int(screen['adequate'].size),
+                'hydraulically_adequate': int(len(idx)),
+            }
+        evaluated.sort(key=lambda layout: layout['estimated_cost'])
+        return {
+            'status': 'OPTIMUM_FOUND',
+            'best': evaluated[0],
+            'alternatives': evaluated[1:top],
+            'layouts_total': int(screen['adequate'].size),
+            'hydraulically_adequate': int(len(idx)),
+            'bounded_out': int(len(idx) - visited),
+            'structural_evaluations': int(visited),
+            'pier_designs_run': len(self.pier_cache),
+            'elapsed_s': time.perf_counter() - start,
+        }
+
+
+def optimize_span_arrangement(app: BridgeDesignApp, **options) -> Dict[str, any]:
+    """Optimise the span arrangement of a configured app (inputs loaded, design optional)"""
+    return SpanArrangementOptimizer(app, **options).optimize()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+TEST: Batch drawing export
+Checks that a reach exports to one indexed, bookmarked A4 PDF with PNG
+tiles, and that pooled and in-process rendering give the same sheets
+"""
+
+import os
+import tempfile
+
+import numpy as np
+from pypdf import PdfReader
+
+from batch_drawing_export import export_cross_sections, reach_sections
+from river_section_input_schema import RiverSectionInputSchema, WaterLevelData
+from test_river_reach_model import prismatic_reach
+
+
+def sample_sections():
+    reach = prismatic_reach(step=500.0, length=1000.0)
+    template = RiverSectionInputSchema(project_name='Test Bridge', water_levels=WaterLevelData(5.0, 1.0, 2.0, 150.0))
+    return reach, reach_sections(reach, template, discharge=150.0)
+
+
+def test_reach_sections_take_backwater_hfl():
+    reach, sections = sample_sections()
+    profile = reach.water_surface_profile(150.0)
+    assert [s.water_levels.hfl for s in sections] == list(profile['water_surface'])
+    assert all(s.water_levels.design_discharge == 150.0 and s.reach is None for s in sections)
+    offsets, elevations = reach.section(1)
+    assert np.array_equal([p.chainage for p in sections[1].cross_section_points], offsets)
+    assert np.array_equal([p.elevation for p in sections[1].cross_section_points], elevations)
+    assert sections[2].location == 'CS-1000 (Ch 1000 m)'
+
+
+def test_export_indexed_bookmarked_pdf():
+    _, sections = sample_sections()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            texts = {}
+            for jobs in (1, 2):
+                progress = []
+                result = export_cross_sections(sections, f'set_{jobs}.pdf', png_dir=f'png_{jobs}', jobs=jobs,
+                                               progress=lambda *args: progress.append(args))
+                assert result['sheets'] == 3 and result['index_pages'] == 1
+                assert sorted(done for done, _, _ in progress) == [1, 2, 3]
+                assert all(total == 3 for _, total, _ in progress)
+                for path in result['png_tiles']:
+                    with open(path, 'rb') as handle:
+                        assert handle.read(8) == b'\x89PNG\r\n\x1a\n'
+                reader = PdfReader(result['pdf'])
+                assert len(reader.pages) == 4
+                assert [item.title for item in reader.outline] == [
+                    'Index', '001 CS-0 (Ch 0 m)', '002 CS-500 (Ch 500 m)', '003 CS-1000 (Ch 1000 m)']
+                assert [reader.get_destination_page_number(item) for item in reader.outline] == [0, 1, 2, 3]
+                assert all([float(v) for v in page.mediabox] == [0, 0, 841.68, 595.44] for page in reader.pages)
+                index = reader.pages[0].extract_text()
+                assert 'INDEX OF CROSS-SECTION SHEETS' in index and 'CS-500 (Ch 500 m)' in index
+                texts[jobs] = [page.extract_text() for page in reader.pages]
+            assert texts[1] == texts[2]
+            assert f'HFL = {sections[0].water_levels.hfl:.2f}m' in texts[1][1]
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    print("🚀 Running batch drawing export tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Batch drawing export tests passed")
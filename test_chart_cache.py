@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+TEST: Chart cache
+Checks cache hits and misses of cached_chart, standalone and in the integrated hydraulic app
+"""
+
+import numpy as np
+import pandas as pd
+
+import chart_cache
+from chart_cache import ChartCache, cached_chart, data_hash
+
+
+def _line_chart(x, y, title=''):
+    return {'x': list(x), 'y': list(y), 'title': title}
+
+
+def test_data_hash_by_content():
+    a = np.arange(10.0)
+    assert data_hash(a) == data_hash(a.copy())
+    assert data_hash(a) != data_hash(a.astype(np.float32))
+    assert data_hash({'b': 1, 'a': [1, 2]}) == data_hash({'a': [1, 2], 'b': 1})
+    frame = pd.DataFrame({'x': [1, 2], 'y': [3.0, 4.0]})
+    assert data_hash(frame) == data_hash(frame.copy())
+    assert data_hash(frame) != data_hash(frame.assign(y=[3.0, 5.0]))
+
+
+def test_hits_and_misses():
+    cache = ChartCache()
+    x = np.linspace(0.0, 1.0, 5)
+    first = cached_chart(_line_chart, x, x ** 2, title='A', cache=cache)
+    again = cached_chart(_line_chart, x.copy(), x ** 2, title='A', cache=cache)
+    assert again is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    cached_chart(_line_chart, x, x ** 2, title='B', cache=cache)
+    cached_chart(_line_chart, x, x ** 3, title='A', cache=cache)
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_depends_on_invalidates():
+    cache = ChartCache()
+    data = {'levels': [1.0, 2.0]}
+    first = cached_chart(_line_chart, [0, 1], [0, 1], depends_on=data, cache=cache)
+    data['levels'].append(3.0)
+    second = cached_chart(_line_chart, [0, 1], [0, 1], depends_on=data, cache=cache)
+    assert second is not first and cache.misses == 2
+
+
+def test_least_recently_used_dropped():
+    cache = ChartCache(max_entries=2)
+    for title in ('A', 'B', 'A', 'C'):
+        cached_chart(_line_chart, [0], [0], title=title, cache=cache)
+    assert len(cache) == 2
+    cached_chart(_line_chart, [0], [0], title='A', cache=cache)
+    cached_chart(_line_chart, [0], [0], title='B', cache=cache)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_integrated_app_reuses_charts():
+    from streamlit.testing.v1 import AppTest
+
+    chart_cache.CHARTS.clear()
+    app = AppTest.from_file("integrated_bridge_hydraulic_system.py", default_timeout=60).run()
+    pages = ["📊 Integrated Cross Section", "💧 Detailed Afflux Study", "⚓ Deck Anchorage Design"]
+    for page in pages:
+        app.sidebar.selectbox[0].select(page).run()
+        assert not app.exception and len(app.get('plotly_chart')) == 1
+    assert chart_cache.CHARTS.misses == 3 and chart_cache.CHARTS.hits == 0
+    for page in pages:
+        app.sidebar.selectbox[0].select(page).run()
+        assert not app.exception and len(app.get('plotly_chart')) == 1
+    assert chart_cache.CHARTS.misses == 3 and chart_cache.CHARTS.hits == 3
+
+
+if __name__ == "__main__":
+    print("🚀 Running chart cache tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Chart cache tests passed")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+TEST: Compound channel
+Checks vertical-division conveyance and α of a main channel with floodplains
+against the closed form, and the stage-discharge lookups
+"""
+
+import math
+
+import numpy as np
+
+from compound_channel import CompoundChannel, compound_channel
+
+# Trapezoidal main channel (14 m bed, 3 m deep, 1:1 banks) between 40 m floodplains
+OFFSETS = [0.0, 40.0, 43.0, 57.0, 60.0, 100.0]
+LEVELS = [3.0, 3.0, 0.0, 0.0, 3.0, 3.0]
+FLOODPLAINS = ((0.0, 40.0, 0.05), (60.0, 100.0, 0.05))
+
+
+def panel_conveyance(area, perimeter, n):
+    return area * (area / perimeter) ** (2 / 3) / n
+
+
+def test_conveyance_and_alpha_closed_form():
+    channel = CompoundChannel(OFFSETS, LEVELS, FLOODPLAINS, manning_n=0.03)
+    assert len(channel) == 3 and list(channel.panel_n) == [0.05, 0.03, 0.05]
+    stage = 4.5  # a table level, so no interpolation
+    assert np.isclose(channel.table['stage'], stage).any()
+    main_area, main_perimeter = (14.0 + 20.0) / 2 * 3.0 + 20.0 * 1.5, 14.0 + 2 * math.sqrt(18.0)
+    plain_area, plain_perimeter = 40.0 * 1.5, 40.0
+    k = [panel_conveyance(plain_area, plain_perimeter, 0.05), panel_conveyance(main_area, main_perimeter, 0.03),
+         panel_conveyance(plain_area, plain_perimeter, 0.05)]
+    a = [plain_area, main_area, plain_area]
+    alpha = sum(ki ** 3 / ai ** 2 for ki, ai in zip(k, a)) / (sum(k) ** 3 / sum(a) ** 2)
+    props = channel.properties(stage)
+    assert math.isclose(float(props['area']), sum(a))
+    assert math.isclose(float(props['conveyance']), sum(k))
+    assert math.isclose(float(props['alpha']), alpha) and alpha > 1.0
+    panels = channel.panel_properties(stage)
+    assert np.allclose(panels['conveyance'], k) and np.allclose(panels['area'], a)
+    assert list(panels['from']) == [0.0, 40.0, 60.0] and list(panels['to']) == [40.0, 60.0, 100.0]
+
+
+def test_single_panel_has_unit_alpha():
+    channel = CompoundChannel(OFFSETS, LEVELS, manning_n=0.03)
+    assert len(channel) == 1
+    assert np.allclose(channel.table['alpha'], 1.0)
+    assert math.isclose(float(channel.velocity_head(500.0, 4.5)),
+                        (500.0 / float(channel.properties(4.5)['area'])) ** 2 / (2 * 9.81))
+
+
+def test_stage_for_discharge_inverts_capacity():
+    channel = CompoundChannel(OFFSETS, LEVELS, FLOODPLAINS, manning_n=0.03)
+    stages = np.array([1.0, 2.5, 3.7, 6.0])
+    capacity = channel.discharge(stages, 0.001)
+    assert np.all(np.diff(capacity) > 0)
+    assert np.allclose(channel.stage_for_discharge(capacity, 0.001), stages, atol=1e-6)
+    # Beyond the table top the table is extended rather than clamped
+    high = channel.stage_for_discharge(50.0 * capacity[-1], 0.001)
+    assert high > 6.0 and math.isclose(float(channel.discharge(high, 0.001)), 50.0 * capacity[-1], rel_tol=1e-2)
+    summary = channel.hydraulics_at(4.5, 600.0, 0.001)
+    assert math.isclose(summary['mean_velocity'], 600.0 / summary['area'])
+    assert math.isclose(summary['discharge_capacity'], summary['conveyance'] * math.sqrt(0.001))
+
+
+def test_channels_shared_per_survey_and_roughness():
+    channel = compound_channel(OFFSETS, LEVELS, FLOODPLAINS, 0.03)
+    assert compound_channel(np.array(OFFSETS), LEVELS, list(FLOODPLAINS), 0.03) is channel
+    assert compound_channel(OFFSETS, LEVELS, (), 0.03) is not channel
+
+
+def test_app_bed_slope_forms():
+    from bridge_design_app import HydraulicCalculator, HydraulicData, SurveyPoint
+
+    levels = [100.0 + z for z in LEVELS]  # survey points without a bed level are skipped
+    points = [SurveyPoint(i + 1, x, x, 0.0, z, bed_level=z) for i, (x, z) in enumerate(zip(OFFSETS, levels))]
+    expected = CompoundChannel(OFFSETS, levels, FLOODPLAINS, 0.03).hydraulics_at(104.5, 600.0, 1 / 975)
+    for slope in ("1 in 975", "1:975", 1 / 975):
+        hydraulic = HydraulicData(600.0, 0.03, slope, hfl=104.5, roughness_panels=FLOODPLAINS)
+        result = HydraulicCalculator.calculate_conveyance(points, hydraulic)
+        assert all(math.isclose(result[key], expected[key], rel_tol=1e-4) for key in expected)
+    for bad in ("1 in 0", "-0.001", 0.0, "steep"):
+        try:
+            HydraulicCalculator.parse_bed_slope(bad)
+        except ValueError as error:
+            assert 'Bed slope' in str(error)
+        else:
+            raise AssertionError(f"bed slope {bad!r} accepted")
+
+
+if __name__ == "__main__":
+    print("🚀 Running compound channel tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Compound channel tests passed")
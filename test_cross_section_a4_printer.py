@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+TEST: A4 cross-section printer
+Prints a river cross-section through the cached drawing sheet to PNG and PDF
+"""
+
+import os
+import re
+import tempfile
+import matplotlib
+matplotlib.use('Agg')
+
+from river_section_input_schema import RiverCrossSectionPoint, RiverSectionInputSchema, WaterLevelData
+from cross_section_a4_printer import CrossSectionA4Printer, DrawingConfig
+
+
+def sample_river_data(points: int = 7) -> RiverSectionInputSchema:
+    chainages = [120.0 * i / (points - 1) for i in range(points)]
+    return RiverSectionInputSchema(
+        project_name="Test HFL Bridge Project",
+        river_name="Test River",
+        location="Test Location",
+        survey_date="2024-01-15",
+        cross_section_points=[RiverCrossSectionPoint(x, 293.5 + abs(x - 60.0) / 30.0, "Survey")
+                              for x in chainages],
+        water_levels=WaterLevelData(hfl=298.5, lwl=295.0, nwl=296.5, design_discharge=1265.76),
+    )
+
+
+def test_print_png_and_pdf():
+    config = DrawingConfig()
+    config.dpi = 100
+    printer = CrossSectionA4Printer(config)
+    printer.create_printable_cross_section(sample_river_data(), {'project_name': 'Printer Test'})
+    with tempfile.TemporaryDirectory() as folder:
+        png = printer.save_a4_png(os.path.join(folder, 'section'))
+        pdf = printer.save_a4_pdf(os.path.join(folder, 'section'))
+        with open(png, 'rb') as handle:
+            assert handle.read(8) == b'\x89PNG\r\n\x1a\n'
+        with open(pdf, 'rb') as handle:
+            content = handle.read()
+    assert content.startswith(b'%PDF')
+    # A4 landscape: 297 mm x 210 mm = 842 x 595 pt
+    box = re.search(rb'/MediaBox \[ *0 0 ([\d.]+) ([\d.]+) *\]', content)
+    assert box and abs(float(box.group(1)) - 841.68) < 1 and abs(float(box.group(2)) - 595.44) < 1
+
+
+def test_sheet_reused_between_prints():
+    config = DrawingConfig()
+    config.dpi = 100
+    printer = CrossSectionA4Printer(config)
+    first = printer.create_printable_cross_section(sample_river_data())
+    second = printer.create_printable_cross_section(sample_river_data(400))
+    assert second is first
+    # Only the latest print is on the sheet: one ground line in the main axes
+    assert [line.get_label() for line in printer.ax_main.lines].count('Ground Level') == 1
+
+
+def test_streamlit_interface_prints():
+    from streamlit.testing.v1 import AppTest
+
+    def app():
+        from test_cross_section_a4_printer import sample_river_data
+        from cross_section_a4_printer import create_streamlit_printable_interface
+        create_streamlit_printable_interface(sample_river_data())
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as folder:
+        os.chdir(folder)
+        try:
+            at = AppTest.from_function(app, default_timeout=120).run()
+            at.selectbox[0].select("Standard (150 DPI)")
+            at.button[0].click().run()
+            assert not at.exception
+            assert any('generated successfully' in str(element.value) for element in at.success)
+            assert sorted(name.rsplit('.', 1)[1] for name in os.listdir(folder)) == ['pdf', 'png']
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    print("🚀 Running A4 cross-section printer tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 A4 cross-section printer tests passed")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+TEST: Cross section geometry
+Checks the vectorized Douglas-Peucker simplification against the recursive
+algorithm, resampling, the wetted polygons clipped at the waterline and the
+exact per-sub-channel wetted properties
+"""
+
+import math
+
+import numpy as np
+
+from bridge_design_app import HydraulicCalculator, SurveyPoint
+from cross_section_geometry import (resample, section_geometry, simplify, simplify_indices,
+                                    stage_properties, subchannel_properties, wetted_polygons)
+
+
+def dense_survey(points: int = 2000, seed: int = 4):
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0.0, 200.0, points)
+    z = 95.0 - 6.0 * np.exp(-((x - 80.0) / 25.0) ** 2) - 3.0 * np.exp(-((x - 150.0) / 10.0) ** 2)
+    return x, z + rng.normal(0.0, 0.05, points)
+
+
+def recursive_simplify(x, z, tolerance):
+    keep = {0, len(x) - 1}
+
+    def split(i0, i1):
+        if i1 - i0 < 2:
+            return
+        inner = np.arange(i0 + 1, i1)
+        chord = z[i0] + (z[i1] - z[i0]) * (x[inner] - x[i0]) / (x[i1] - x[i0])
+        deviation = np.abs(z[inner] - chord)
+        worst = int(np.argmax(deviation))
+        if deviation[worst] > tolerance:
+            keep.add(inner[worst])
+            split(i0, inner[worst])
+            split(inner[worst], i1)
+
+    split(0, len(x) - 1)
+    return np.array(sorted(keep))
+
+
+def polygon_area(x, z):
+    return 0.5 * abs(np.dot(x, np.roll(z, -1)) - np.dot(z, np.roll(x, -1)))
+
+
+def test_simplify_matches_recursive_algorithm():
+    x, z = dense_survey()
+    for tolerance in (0.01, 0.1, 0.5):
+        kept = simplify_indices(x, z, tolerance)
+        assert np.array_equal(kept, recursive_simplify(x, z, tolerance)), tolerance
+        sx, sz = simplify(x, z, tolerance)
+        assert np.all(np.abs(np.interp(x, sx, sz) - z) <= tolerance + 1e-12)
+    assert len(simplify_indices(x, z, 0.5)) < len(simplify_indices(x, z, 0.1)) < len(x)
+
+
+def test_resample_spacing_and_count():
+    x, z = dense_survey(points=50)
+    rx, rz = resample(x, z, spacing=3.0)
+    assert rx[0] == x[0] and rx[-1] == x[-1] and len(rx) == 68
+    assert np.allclose(np.diff(rx), 200.0 / 67)
+    assert np.allclose(rz, np.interp(rx, x, z))
+    assert len(resample(x, z, count=11)[0]) == 11
+
+
+def test_wetted_polygons_clipped_at_waterline():
+    x, z = [0.0, 10.0, 20.0, 30.0, 40.0, 50.0], [5.0, 0.0, 5.0, 3.0, 1.0, 4.0]
+    polygons = wetted_polygons(x, z, 2.0)
+    assert len(polygons) == 2
+    (lx, lz), (rx, rz) = polygons
+    # Left V: bank crossings at x = 6 and 14, depth 2 at the thalweg
+    assert np.isclose(lx[0], 6.0) and np.isclose(lx[-1], 14.0) and lz[0] == lz[-1] == 2.0
+    assert np.isclose(polygon_area(lx, lz), 8.0)
+    assert np.isclose(polygon_area(rx, rz), stage_properties(x[2:], z[2:], 2.0)['area'])
+    total = sum(polygon_area(px, pz) for px, pz in polygons)
+    assert np.isclose(total, stage_properties(x, z, 2.0)['area'])
+    # Wet at an end point: closed by a vertical wall
+    (wx, wz), = wetted_polygons([0.0, 10.0, 20.0], [0.0, 1.0, 3.0], 2.0)
+    assert wx[0] == wx[1] == 0.0 and wz[0] == 2.0
+    assert np.isclose(polygon_area(wx, wz), stage_properties([0.0, 10.0, 20.0], [0.0, 1.0, 3.0], 2.0)['area'])
+
+
+def test_geometry_shared_and_simplified_once():
+    x, z = dense_survey()
+    geometry = section_geometry(x, z)
+    assert section_geometry(list(x), list(z)) is geometry
+    assert geometry.simplified(0.1) is geometry.simplified(0.1)
+    drawn = geometry.for_drawing(max_points=500)
+    assert len(drawn[0]) < len(x)
+
+
+def test_subchannel_properties_closed_form():
+    x, z = [0.0, 10.0, 20.0, 30.0, 40.0, 50.0], [5.0, 0.0, 5.0, 3.0, 1.0, 4.0]
+    props = subchannel_properties(x, z, 2.0, manning_n=0.03)
+    # Two triangles below the waterline: (6, 2)-(10, 0)-(14, 2) and (35, 2)-(40, 1)-(43⅓, 2)
+    right = 40.0 + 10.0 / 3.0
+    assert np.allclose(props['left_edge'], [6.0, 35.0]) and np.allclose(props['right_edge'], [14.0, right])
+    assert np.allclose(props['area'], [8.0, 0.5 * (right - 35.0)])
+    assert np.allclose(props['wetted_perimeter'], [2 * math.sqrt(20.0), math.hypot(5, 1) + math.hypot(right - 40, 1)])
+    assert np.allclose(props['top_width'], [8.0, right - 35.0])
+    assert np.allclose(props['max_depth'], [2.0, 1.0])
+    # Triangle centroids: mean of the vertices
+    assert np.allclose(props['centroid_offset'], [10.0, (35.0 + 40.0 + right) / 3])
+    assert np.allclose(props['centroid_level'], [2.0 - 2.0 / 3, 2.0 - 1.0 / 3])
+    radius = props['area'] / props['wetted_perimeter']
+    assert np.allclose(props['conveyance'], props['area'] * radius ** (2 / 3) / 0.03)
+    assert math.isclose(props['total_conveyance'], props['conveyance'].sum())
+    assert math.isclose(props['total_area'], float(stage_properties(x, z, 2.0)['area']))
+
+
+def test_wetted_properties_match_fine_integration():
+    x, z = dense_survey(points=300)
+    props = subchannel_properties(x, z, 93.5)
+    fine = np.linspace(x[0], x[-1], 400_001)
+    depth = np.maximum(93.5 - np.interp(fine, x, z), 0.0)
+    assert math.isclose(props['total_area'], np.trapezoid(depth, fine), rel_tol=1e-5)
+    assert math.isclose(props['total_top_width'], np.count_nonzero(depth > 0) * (fine[1] - fine[0]), rel_tol=1e-3)
+    points = [SurveyPoint(i + 1, float(xi), float(xi), 0.0, float(zi), bed_level=float(zi))
+              for i, (xi, zi) in enumerate(zip(x, z))]
+    area, perimeter = HydraulicCalculator.calculate_cross_sectional_area(points, 93.5, tolerance=0.0)
+    assert math.isclose(area, props['total_area']) and math.isclose(perimeter, props['total_wetted_perimeter'])
+
+
+if __name__ == "__main__":
+    print("🚀 Running cross section geometry tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Cross section geometry tests passed")
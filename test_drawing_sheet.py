@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+TEST: Drawing sheet
+Checks the cached A4 sheet frame, marker thinning at print resolution and
+the vector-first PDF of a dense survey
+"""
+
+import io
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from pypdf import PdfReader
+from streamlit.testing.v1 import AppTest
+
+from drawing_sheet import (A4_LANDSCAPE, SheetText, _marker_cells, a4_landscape_template, drawing_sheet,
+                           rasterize_heavy_layers, save_vector_pdf, thin_markers)
+
+TEMPLATE = a4_landscape_template('test sheet', [SheetText(0.5, 0.8, 'BRIDGE DESIGN', {'ha': 'center'})],
+                                 {'title': SheetText(0.5, 0.4, 'Untitled', {'ha': 'center'})})
+
+
+def dense_axes(points: int = 200_000):
+    figure = Figure(figsize=A4_LANDSCAPE, dpi=100)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    x = np.linspace(0.0, 200.0, points)
+    z = 95.0 - 6.0 * np.exp(-((x - 80.0) / 25.0) ** 2) + 0.05 * np.sin(x * 37.0)
+    return figure, ax, x, z
+
+
+def test_sheet_cached_and_fields_reset():
+    sheet = drawing_sheet(TEMPLATE, dpi=72)
+    assert drawing_sheet(TEMPLATE, dpi=72) is sheet and drawing_sheet(TEMPLATE, dpi=100) is not sheet
+    ax = sheet.new_print(title='Section A')
+    ax.plot([0, 1], [0, 1])
+    assert sheet.fields['title'].get_text() == 'Section A'
+    first = sheet.render_rgba()
+    ax = sheet.new_print()
+    assert sheet.fields['title'].get_text() == 'Untitled' and not ax.lines
+    ax.plot([0, 1], [0, 1])
+    sheet.set_fields(title='Section A')
+    # Blitting the same data over the cached frame gives the same raster
+    assert np.array_equal(sheet.render_rgba(), first)
+    assert first.shape[:2] == (int(A4_LANDSCAPE[1] * 72), int(A4_LANDSCAPE[0] * 72))
+
+
+def test_sheet_kept_across_streamlit_reruns():
+    def app():
+        import streamlit as st
+        from drawing_sheet import SheetText, a4_landscape_template, drawing_sheet
+        template = a4_landscape_template('rerun sheet', [], {'title': SheetText(0.5, 0.4)})
+        sheet = drawing_sheet(template, dpi=72)
+        sheet.new_print(title='Rerun')
+        st.session_state.setdefault('runs', []).append((id(sheet), sheet.prints))
+
+    at = AppTest.from_function(app).run()
+    at.run()
+    # Each rerun runs on a new script thread; the session keeps the sheet
+    (first, prints_1), (second, prints_2) = at.session_state['runs']
+    assert not at.exception and first == second and (prints_1, prints_2) == (1, 2)
+
+
+def test_line_markers_thinned_but_vertices_kept():
+    figure, ax, x, z = dense_axes(20_000)
+    line, = ax.plot(x, z, 'o-', markersize=4)
+    removed = thin_markers(ax, dpi=300)
+    keep = np.asarray(line.get_markevery())
+    assert removed == len(x) - len(keep) > 0
+    assert len(line.get_xydata()) == len(x)
+    # At most one kept marker per half-diameter cell
+    cells = np.floor(ax.transData.transform(line.get_xydata()[keep]) * (300 / figure.dpi) / (0.5 * 4 * 300 / 72))
+    assert len(np.unique(cells, axis=0)) == len(keep)
+    assert np.array_equal(keep, _marker_cells(ax, line.get_xydata(), 4, 300))
+
+
+def test_scatter_thinned_only_when_uniform():
+    figure, ax, x, z = dense_axes(20_000)
+    uniform = ax.scatter(x, z, s=9, color='black')
+    varied = ax.scatter(x, z + 1.0, s=9, c=z)
+    thin_markers(ax, dpi=300)
+    assert len(uniform.get_offsets()) < len(x) and len(varied.get_offsets()) == len(x)
+
+
+def test_heavy_layers_rasterized():
+    figure, ax, x, z = dense_axes(50_000)
+    heavy = ax.fill_between(x, z, 85.0)
+    light = ax.fill_between(x[::100], z[::100], 80.0)
+    line, = ax.plot(x, z)
+    assert rasterize_heavy_layers(figure) == 1
+    assert heavy.get_rasterized() and not light.get_rasterized() and not line.get_rasterized()
+
+
+def test_dense_vector_pdf_smaller_and_reproducible():
+    outputs = []
+    for vector_first in (True, True, False):
+        figure, ax, x, z = dense_axes()
+        ax.fill_between(x, z, 85.0, color='lightblue')
+        ax.plot(x, z, 'k.-', markersize=2)
+        ax.set_title('DENSE SURVEY')
+        buffer = io.BytesIO()
+        if vector_first:
+            save_vector_pdf(figure, buffer, dpi=150)
+        else:
+            figure.savefig(buffer, format='pdf', dpi=150, metadata={'CreationDate': None})
+        outputs.append(buffer.getvalue())
+    assert outputs[0] == outputs[1]
+    assert len(outputs[0]) < 0.5 * len(outputs[2])
+    assert 'DENSE SURVEY' in PdfReader(io.BytesIO(outputs[0])).pages[0].extract_text()
+
+
+if __name__ == "__main__":
+    print("🚀 Running drawing sheet tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Drawing sheet tests passed")
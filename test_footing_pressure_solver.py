@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+TEST: Footing pressure solver
+Checks the no-tension base pressures against closed forms and equilibrium
+"""
+
+import numpy as np
+
+from footing_pressure_solver import base_pressure_summary, solve_base_pressure
+
+
+def test_inside_kern_matches_elastic_formula():
+    L, B, P = 6.0, 4.0, 3000.0
+    e_l, e_t = 0.4, 0.2
+    solved = base_pressure_summary(L, B, P, P * e_l, P * e_t)
+    expected_max = P / (L * B) * (1 + 6 * e_l / L + 6 * e_t / B)
+    expected_min = P / (L * B) * (1 - 6 * e_l / L - 6 * e_t / B)
+    assert abs(solved['max_pressure'] - expected_max) < 1e-9 * expected_max
+    assert abs(solved['min_pressure'] - expected_min) < 1e-9 * expected_max
+    assert solved['contact_ratio'] == 1.0 and solved['area_in_tension'] == 0.0
+
+
+def test_uniaxial_outside_kern_matches_triangular_block():
+    L, B, P = 6.0, 4.0, 3000.0
+    for e in (1.2, 1.8, 2.5):
+        solved = base_pressure_summary(L, B, P, P * e)
+        contact = 3 * (L / 2 - e)
+        assert abs(solved['max_pressure'] - 2 * P / (B * contact)) < 1e-7 * solved['max_pressure']
+        assert abs(solved['compressed_area'] - B * contact) < 1e-7 * L * B
+        assert solved['converged'] and solved['stable']
+
+
+def test_biaxial_equilibrium_by_numerical_integration():
+    L, B, P = 5.0, 3.0, 2000.0
+    n = 1000
+    x = (np.arange(n) + 0.5) / n * L - L / 2
+    y = (np.arange(n) + 0.5) / n * B - B / 2
+    X, Y = np.meshgrid(x, y, indexing='ij')
+    cell = (L / n) * (B / n)
+    for e_l, e_t in ((1.0, 0.5), (1.5, 0.3), (0.6, 0.9)):
+        solved = base_pressure_summary(L, B, P, P * e_l, P * e_t)
+        q = np.maximum(solved['plane_a'] + solved['plane_b'] * X + solved['plane_c'] * Y, 0.0)
+        assert abs(q.sum() * cell - P) < 1e-3 * P
+        assert abs((q * X).sum() * cell - P * e_l) < 1e-3 * P * L
+        assert abs((q * Y).sum() * cell - P * e_t) < 1e-3 * P * B
+        assert abs((q > 0).sum() * cell - solved['compressed_area']) < 1e-2 * L * B
+
+
+def test_grid_solve_matches_scalar_solves():
+    lengths = np.array([4.0, 5.0, 6.0])[:, None]
+    moments = np.array([0.0, 800.0, 2400.0, 3600.0])[None, :]
+    grid = solve_base_pressure(lengths, 3.5, 2500.0, moments, 300.0)
+    for i in range(lengths.shape[0]):
+        for j in range(moments.shape[1]):
+            single = base_pressure_summary(lengths[i, 0], 3.5, 2500.0, moments[0, j], 300.0)
+            assert np.isclose(grid['max_pressure'][i, j], single['max_pressure'])
+            assert np.isclose(grid['compressed_area'][i, j], single['compressed_area'])
+
+
+def test_resultant_outside_footing_is_unstable():
+    solved = base_pressure_summary(4.0, 3.0, 1000.0, 1000.0 * 2.5)
+    assert not solved['stable'] and solved['max_pressure'] == np.inf
+
+
+if __name__ == "__main__":
+    print("🚀 Running footing pressure solver tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Footing pressure solver tests passed")
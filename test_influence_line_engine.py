@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+TEST: Influence line engine
+Checks influence ordinates against statics and the vectorized sweep against a position-by-position loop
+"""
+
+import numpy as np
+
+from influence_line_engine import IRC_VEHICLES, compute_influence_lines, live_load_envelope, sweep_vehicle
+
+
+def test_reactions_in_equilibrium():
+    for continuous in (False, True):
+        lines = compute_influence_lines((12.0, 15.0, 12.0), continuous)
+        assert np.allclose(lines.reactions.sum(axis=0), 1.0)
+        assert np.allclose(lines.reactions.T @ lines.support_positions, lines.positions)
+
+
+def test_two_span_continuous_closed_form():
+    # Unit load at midspan of one of two equal spans: 13/32, 22/32, -3/32
+    lines = compute_influence_lines((10.0, 10.0), True)
+    at = int(np.argmin(np.abs(lines.positions - 5.0)))
+    assert np.allclose(lines.reactions[:, at], [13 / 32, 22 / 32, -3 / 32], atol=1e-9)
+    # Support moment -3PL/32 under the same load
+    support = int(np.argmin(np.abs(lines.section_positions - 10.0)))
+    assert abs(lines.moments[support, at] + 3 * 10.0 / 32) < 1e-9
+
+
+def test_simply_supported_moment_closed_form():
+    span = 10.0
+    lines = compute_influence_lines((span,))
+    mid = int(np.argmin(np.abs(lines.section_positions - span / 2)))
+    assert abs(lines.moments[mid].max() - span / 4) < 1e-12
+    # Two equal axles P at spacing a: M_max = P (L - a/2)² / (2L)
+    vehicle = IRC_VEHICLES['CLASS_AA_WHEELED']
+    moment = sweep_vehicle(lines, vehicle, step=0.01)['max_moment']
+    spacing = vehicle.axle_offsets[1]
+    absolute = 200.0 * (span - spacing / 2) ** 2 / (2 * span)
+    at_midspan = 200.0 * (span / 4 + (span / 2 - spacing) / 2)
+    assert abs(moment[mid] - at_midspan) < 1e-6 * at_midspan and moment[mid] <= absolute
+
+
+def test_sweep_matches_position_loop():
+    lines = compute_influence_lines((9.6, 12.0, 9.6), True)
+    vehicle = IRC_VEHICLES['CLASS_A']
+    swept = sweep_vehicle(lines, vehicle)
+    total = lines.positions[-1]
+    best = np.full(len(lines.section_positions), -np.inf)
+    worst = np.full(len(lines.section_positions), np.inf)
+    for lead in np.arange(0.0, total + vehicle.length + lines.step, lines.step):
+        for axles in (lead - np.asarray(vehicle.axle_offsets), total - lead + np.asarray(vehicle.axle_offsets)):
+            effect = np.array([sum(load * np.interp(x, lines.positions, row, left=0.0, right=0.0)
+                                   for x, load in zip(axles, vehicle.axle_loads))
+                               for row in lines.moments])
+            best, worst = np.maximum(best, effect), np.minimum(worst, effect)
+    assert np.allclose(swept['max_moment'], np.maximum(best, 0.0))
+    assert np.allclose(swept['min_moment'], np.minimum(worst, 0.0))
+
+
+def test_lines_cached_per_geometry():
+    assert compute_influence_lines((10.0, 10.0), True) is compute_influence_lines((10.0, 10.0), True)
+    envelope = live_load_envelope((10.0,) * 3, 7.5)
+    assert envelope['lanes'] == 2 and len(envelope['max_reaction']) == 4
+
+
+if __name__ == "__main__":
+    print("🚀 Running influence line engine tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Influence line engine tests passed")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+TEST: Live preview
+Checks dependency-tracked recomputation, the per-state cache, debouncing of
+slow outputs and the design app's preview formulas
+"""
+
+import numpy as np
+
+from live_preview import PreviewModel, PreviewOutput
+
+
+def counted_model(calls: list, debounce_s: float = 0.35) -> PreviewModel:
+    def output(name, inputs, function, slow=False):
+        def compute(**values):
+            calls.append(name)
+            return function(**values)
+        return PreviewOutput(name, inputs, compute, slow)
+
+    return PreviewModel([
+        output('length', ('spans', 'span'), lambda spans, span: spans * span),
+        output('area', ('length', 'width'), lambda length, width: length * width),
+        output('piers', ('spans',), lambda spans: spans - 1),
+        output('design', ('area', 'piers'), lambda area, piers: area + 100 * piers, slow=True),
+        output('report', ('design',), lambda design: f'{design:.1f}'),
+    ], {'spans': 3, 'span': 10.0, 'width': 12.0}, debounce_s=debounce_s)
+
+
+def test_only_affected_outputs_recomputed():
+    calls = []
+    model = counted_model(calls)
+    state = model.update({}, settle=True, now=0.0)
+    assert state.recomputed == ['length', 'area', 'piers', 'design', 'report'] and state.values['report'] == '560.0'
+    assert model.affected(['width']) == {'area', 'design', 'report'}
+    calls.clear()
+    state = model.update({'width': 10.0}, settle=True, now=1.0)
+    assert calls == ['area', 'design', 'report'] and state.values['design'] == 500.0
+    calls.clear()
+    state = model.update({'width': 10.0, 'spans': 4}, settle=True, now=2.0)
+    assert calls == ['length', 'area', 'piers', 'design', 'report'] and state.values['design'] == 700.0
+
+
+def test_seen_states_served_from_cache():
+    calls = []
+    model = counted_model(calls)
+    first = model.update({}, settle=True, now=0.0)
+    model.update({'width': 8.0}, settle=True, now=1.0)
+    calls.clear()
+    back = model.update({'width': 12.0}, now=1.1)
+    assert back.from_cache and back.values == first.values and not calls
+    assert (model.hits, model.misses) == (1, 2)
+    # Going forward again after the cached state recomputes from it
+    state = model.update({'width': 9.0}, settle=True, now=3.0)
+    assert calls == ['area', 'design', 'report'] and state.values['area'] == 270.0
+
+
+def test_slow_outputs_debounced():
+    calls = []
+    model = counted_model(calls, debounce_s=0.35)
+    model.update({}, settle=True, now=0.0)
+    calls.clear()
+    # Rapid edits: fast outputs follow, the slow one and its dependents wait
+    for i, width in enumerate((11.0, 10.0, 9.0)):
+        state = model.update({'width': width}, now=10.0 + 0.1 * i)
+        assert state.pending == ['design', 'report'] and state.values['area'] == 30.0 * width
+    assert 'design' not in calls and model.quiet_for(10.3) < model.debounce_s
+    # The next rerun after a pause settles the stale outputs
+    state = model.update({'width': 9.0}, now=10.6)
+    assert state.recomputed == ['design', 'report'] and state.pending == []
+    assert state.values['design'] == 470.0 and calls.count('design') == 1
+    state = model.update({'width': 7.0}, settle=True, now=10.7)
+    assert state.values['design'] == 410.0 and not state.pending
+
+
+def test_outputs_must_follow_their_inputs():
+    try:
+        PreviewModel([PreviewOutput('area', ('length', 'width'), lambda length, width: length * width),
+                      PreviewOutput('length', ('span',), lambda span: span)])
+    except ValueError as error:
+        assert 'area' in str(error)
+    else:
+        raise AssertionError("out-of-order outputs accepted")
+
+
+def test_app_preview_matches_closed_form():
+    from modern_ui_components import LIVE_CALCULATION_KEYS, LIVE_PREVIEW_DEFAULTS, LIVE_PREVIEW_OUTPUTS
+
+    model = PreviewModel(LIVE_PREVIEW_OUTPUTS, LIVE_PREVIEW_DEFAULTS)
+    rng = np.random.default_rng(9)
+    for _ in range(20):
+        spans, span, width = int(rng.integers(1, 8)), float(rng.uniform(6, 20)), float(rng.uniform(7.5, 16))
+        values = model.update({'num_spans': spans, 'effective_span': span, 'bridge_width': width}).values
+        concrete = spans * span * width * 0.75 + (spans - 1) * 2.0 * 1.5 * 6.0
+        structure = concrete * 4500 + concrete * 0.12 * 65000
+        expected = {'total_length': spans * span, 'deck_area': spans * span * width, 'concrete_volume': concrete,
+                    'steel_weight': concrete * 0.12, 'structure_cost': structure,
+                    'foundation_cost': 0.6 * structure, 'total_cost': 1.6 * structure}
+        assert all(np.isclose(values[key], expected[key]) for key in LIVE_CALCULATION_KEYS)
+    design = model.update({}, settle=True).values['design_check']
+    assert design['design_status'] == 'COMPLETED' and design['design_moment'] > 0
+
+
+if __name__ == "__main__":
+    print("🚀 Running live preview tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Live preview tests passed")
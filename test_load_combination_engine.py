@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+TEST: Load combination engine
+Checks the one-product combination matrix against combination-by-combination sums
+"""
+
+import numpy as np
+
+from footing_pressure_solver import solve_base_pressure
+from load_combination_engine import (ACTION_COMPONENTS, IRC6_COMBINATIONS, LOAD_CASES,
+                                     LoadCombinationEngine, action_vector)
+
+
+def sample_load_vectors() -> dict:
+    return {
+        'dead': action_vector(6200.0, moment_long=150.0),
+        'live': action_vector(2400.0, moment_long=900.0, moment_trans=350.0),
+        'water_current': action_vector(horizontal_long=120.0, lever_arm=4.0),
+        'wind': action_vector(horizontal_trans=180.0, lever_arm=9.0),
+        'braking': action_vector(horizontal_long=240.0, lever_arm=10.0),
+        'temperature': action_vector(horizontal_long=60.0, lever_arm=10.0),
+        'seismic': action_vector(horizontal_long=700.0, horizontal_trans=700.0, lever_arm=6.0),
+    }
+
+
+def test_matrix_product_equals_combination_sums():
+    loads = sample_load_vectors()
+    actions = LoadCombinationEngine().evaluate(loads)
+    for row, combo in zip(actions, IRC6_COMBINATIONS):
+        expected = sum(combo.factors.get(case, 0.0) * loads[case] for case in LOAD_CASES)
+        assert np.allclose(row, expected)
+
+
+def test_leading_dimensions_carried_through():
+    engine = LoadCombinationEngine()
+    single = engine.stack_load_vectors(sample_load_vectors())
+    batch = np.stack([single, 2 * single, 0.5 * single])
+    actions = engine.evaluate(batch)
+    assert actions.shape == (3, len(IRC6_COMBINATIONS), len(ACTION_COMPONENTS))
+    assert np.allclose(actions[1], 2 * engine.evaluate(single))
+
+
+def test_governing_envelope_is_the_extreme_combination():
+    engine = LoadCombinationEngine()
+    loads = sample_load_vectors()
+    governing = engine.governing_actions(loads, 'uls')
+    uls = {name: values for name, values in governing['combinations'].items()}
+    assert set(uls) == {c.name for c in IRC6_COMBINATIONS if c.limit_state == 'uls'}
+    for component in ACTION_COMPONENTS:
+        extreme = max(uls.values(), key=lambda values: abs(values[component]))[component]
+        assert governing['envelope'][component]['value'] == extreme
+
+
+def test_base_pressure_check_matches_solver_per_combination():
+    engine = LoadCombinationEngine()
+    loads = sample_load_vectors()
+    lengths, widths = np.meshgrid([6.0, 8.0, 10.0], [3.0, 4.0, 5.0], indexing='ij')
+    check = engine.base_pressure_check(lengths, widths, loads, safe_bearing_capacity=450.0)
+    actions = engine.evaluate(loads, 'base_pressure')
+    combos = [c for c in IRC6_COMBINATIONS if c.limit_state == 'base_pressure']
+    for i in range(3):
+        for j in range(3):
+            utilisation, contact_ok = [], []
+            for action, combo in zip(actions, combos):
+                solved = solve_base_pressure(lengths[i, j], widths[i, j], action[0], action[3], action[4])
+                utilisation.append(float(solved['max_pressure']) / (450.0 * combo.sbc_increase))
+                contact_ok.append(bool(solved['contact_ratio'] >= combo.min_contact_ratio - 1e-9))
+            # A contact shortfall governs; its own pressure ratio is reported
+            score = [u if ok else np.inf for u, ok in zip(utilisation, contact_ok)]
+            governing = int(np.argmax(score))
+            assert np.isclose(check['utilization_ratio'][i, j], utilisation[governing])
+            assert check['acceptable'][i, j] == (all(contact_ok) and max(utilisation) < 1.0)
+
+
+if __name__ == "__main__":
+    print("🚀 Running load combination engine tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Load combination engine tests passed")
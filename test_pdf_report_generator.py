@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+TEST: Complete PDF report
+Checks that the same results give a byte-identical report, serial, parallel
+or from cached page fragments
+"""
+
+import contextlib
+import hashlib
+import io
+import os
+import tempfile
+
+from enhanced_bridge_design_app import EnhancedBridgeDesignApp, ConcreteGrade, SteelGrade
+from pdf_report_generator import BridgeDesignPDFGenerator, PYPDF_AVAILABLE, REPORT_PAGES, generate_pdf_reports
+from report_engine import FragmentCache
+
+
+def sample_results(num_spans: int = 4) -> dict:
+    app = EnhancedBridgeDesignApp()
+    app.input_survey_data(
+        [{'point_id': i + 1, 'chainage': i * 5.0, 'left_distance': i * 5.0, 'right_distance': (14 - i) * 5.0,
+          'ground_level': 95.0 + i * 0.1, 'bed_level': 94.0 + i * 0.05} for i in range(15)],
+        [{'chainage': i * 25.0, 'ground_level': 95.0 + i * 0.2} for i in range(10)])
+    app.input_project_parameters(bridge_name="PDF Report Test", location="Test Location", effective_span=10.0,
+                                 pier_spacing_cc=11.5, bridge_width=12.0, pier_cap_width=15.0,
+                                 num_spans=num_spans, skew_angle=0.0)
+    app.input_hydraulic_parameters(discharge=1500.0, design_velocity=3.5, hfl=101.5, manning_n=0.033)
+    app.input_soil_parameters(safe_bearing_capacity=450, angle_of_friction=30, unit_weight=18.0)
+    app.input_material_parameters(concrete_grade=ConcreteGrade.M25, steel_grade=SteelGrade.Fe415)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return app.design_bridge_complete()
+
+
+def _md5(path: str) -> str:
+    with open(path, 'rb') as handle:
+        return hashlib.md5(handle.read()).hexdigest()
+
+
+@contextlib.contextmanager
+def _in_temporary_directory():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as folder:
+        os.chdir(folder)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                yield folder
+        finally:
+            os.chdir(cwd)
+
+
+def test_report_identical_serial_parallel_and_cached():
+    generator = BridgeDesignPDFGenerator(sample_results())
+    cache = FragmentCache()
+    with _in_temporary_directory():
+        serial = _md5(generator.generate_complete_pdf_report('serial.pdf', jobs=1, cache=None))
+        rerun = _md5(generator.generate_complete_pdf_report('rerun.pdf', jobs=1, cache=None))
+        cold = _md5(generator.generate_complete_pdf_report('cold.pdf', jobs=1, cache=cache))
+        warm = _md5(generator.generate_complete_pdf_report('warm.pdf', jobs=1, cache=cache))
+        if PYPDF_AVAILABLE:
+            parallel = _md5(generator.generate_complete_pdf_report('parallel.pdf', jobs=2, cache=None))
+            assert parallel == serial
+    assert serial == rerun == cold == warm
+    assert (cache.hits, cache.misses) == (len(REPORT_PAGES), len(REPORT_PAGES))
+
+
+def test_changed_results_rerender_only_their_pages():
+    results = sample_results()
+    cache = FragmentCache()
+    with _in_temporary_directory():
+        BridgeDesignPDFGenerator(results).generate_complete_pdf_report('first.pdf', cache=cache)
+        changed = dict(results, hydraulic_analysis=dict(results['hydraulic_analysis'], discharge=1750.0))
+        BridgeDesignPDFGenerator(changed).generate_complete_pdf_report('second.pdf', cache=cache)
+    reading = [page for page in REPORT_PAGES if 'hydraulic_analysis' in page[2]]
+    assert cache.misses == len(REPORT_PAGES) + len(reading)
+    assert cache.hits == len(REPORT_PAGES) - len(reading)
+
+
+def test_batch_reports_match_single_reports():
+    results = [sample_results(3), sample_results(5)]
+    with _in_temporary_directory():
+        batch = [_md5(path) for path in generate_pdf_reports(results, ['one.pdf', 'two.pdf'], jobs=2)]
+        single = [_md5(BridgeDesignPDFGenerator(r).generate_complete_pdf_report(f'single_{i}.pdf', cache=None))
+                  for i, r in enumerate(results)]
+    assert batch == single and batch[0] != batch[1]
+
+
+if __name__ == "__main__":
+    print("🚀 Running PDF report tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 PDF report tests passed")
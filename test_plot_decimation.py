@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+TEST: Plot decimation
+Checks that min-max decimation keeps every bucket's extremes and the end
+points, LTTB against a point-by-point loop, chainage windows, and the
+decimated cross-section plot
+"""
+
+import numpy as np
+
+from plot_decimation import MAX_TRACE_POINTS, decimate, decimated, lttb_indices, minmax_indices
+from river_section_input_schema import RiverCrossSectionPoint, RiverSectionInputUI, WaterLevelData
+
+
+def noisy_profile(points: int = 100_000, seed: int = 2):
+    rng = np.random.default_rng(seed)
+    x = np.sort(rng.uniform(0.0, 5000.0, points))
+    y = 100.0 - 0.001 * x + rng.normal(0.0, 0.2, points)
+    y[[1234, points * 4 // 7]] = [150.0, 40.0]  # a spike and a scour hole
+    return x, y
+
+
+def test_minmax_keeps_bucket_extremes_and_ends():
+    x, y = noisy_profile()
+    buckets = 500
+    keep = minmax_indices(x, y, buckets)
+    assert keep[0] == 0 and keep[-1] == len(x) - 1 and len(keep) <= 4 * buckets
+    assert {1234, len(x) * 4 // 7} <= set(keep.tolist())
+    bucket = np.minimum(((x - x[0]) / (x[-1] - x[0]) * buckets).astype(int), buckets - 1)
+    kept = set(keep.tolist())
+    for b in np.unique(bucket):
+        members = np.flatnonzero(bucket == b)
+        assert {members[0], members[-1], members[np.argmin(y[members])], members[np.argmax(y[members])]} <= kept
+
+
+def test_lttb_matches_reference_loop():
+    x, y = noisy_profile(5000)
+    threshold = 300
+    keep = lttb_indices(x, y, threshold)
+    # Reference: one point per bucket, maximising the triangle with the
+    # previous pick and the mean of the next bucket
+    edges = np.linspace(1, len(x) - 1, threshold - 1).astype(int)
+    expected, a = [0], 0
+    for i in range(threshold - 2):
+        following = range(edges[i + 1], edges[i + 2] if i + 2 < len(edges) else len(x))
+        mx, my = np.mean([x[j] for j in following]), np.mean([y[j] for j in following])
+        best = max(range(edges[i], edges[i + 1]),
+                   key=lambda j: abs((x[a] - mx) * (y[j] - y[a]) - (x[a] - x[j]) * (my - y[a])))
+        expected.append(best)
+        a = best
+    expected.append(len(x) - 1)
+    assert keep.tolist() == expected
+
+
+def test_window_and_parallel_columns():
+    x, y = noisy_profile()
+    labels = np.arange(len(x))
+    wide_x, wide_y, wide_labels = decimated(x, y, labels)
+    assert len(wide_x) <= MAX_TRACE_POINTS and np.array_equal(wide_labels, decimate(x, y))
+    assert np.array_equal(wide_y, y[wide_labels])
+    # A narrow window is returned at full resolution, one point beyond each edge
+    window = decimate(x, y, x_range=(1000.0, 1040.0))
+    inside = np.flatnonzero((x >= 1000.0) & (x <= 1040.0))
+    assert window.tolist() == list(range(inside[0] - 1, inside[-1] + 2))
+    y_gaps = y.copy()
+    y_gaps[::2] = np.nan
+    assert np.all(np.isfinite(y_gaps[decimate(x, y_gaps, max_points=10**6)]))
+
+
+def test_cross_section_plot_decimated():
+    x, y = noisy_profile()
+    points = [RiverCrossSectionPoint(float(c), float(z), f'P{i}') for i, (c, z) in enumerate(zip(x, y))]
+    levels = WaterLevelData(hfl=101.0, lwl=97.0, nwl=99.0, design_discharge=1000.0)
+    ui = RiverSectionInputUI()
+    trace = ui.create_cross_section_plot(points, levels).data[0]
+    assert len(trace.x) <= MAX_TRACE_POINTS and max(trace.y) == 150.0 and min(trace.y) == 40.0
+    assert trace.text[list(trace.y).index(150.0)] == 'P1234'
+    zoomed = ui.create_cross_section_plot(points, levels, x_range=(1000.0, 1040.0)).data[0]
+    assert len(zoomed.x) == np.count_nonzero((x >= 1000.0) & (x <= 1040.0)) + 2
+
+
+if __name__ == "__main__":
+    print("🚀 Running plot decimation tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Plot decimation tests passed")
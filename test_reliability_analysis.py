@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+TEST: Reliability analysis
+Checks Monte Carlo determinism across worker counts and P_f against a closed form
+"""
+
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+from reliability_analysis import (RandomVariable, ReliabilityModel, ScourModel, default_random_variables,
+                                  run_monte_carlo, wilson_interval)
+
+
+def scour_model(silt_cov: float = 0.2) -> ReliabilityModel:
+    variables = default_random_variables(1265.76, 1.5, 450.0, 30.0, 18.0, 24.0)
+    variables['discharge'] = RandomVariable('deterministic', 1265.76)
+    variables['silt_factor'] = RandomVariable('lognormal', 1.5, silt_cov)
+    return ReliabilityModel(variables, scour=ScourModel(hfl=101.2, foundation_level=88.2,
+                                                        effective_waterway=120.0),
+                            design_discharge=1265.76)
+
+
+def test_same_seed_same_counts_for_any_worker_count():
+    model = scour_model()
+    serial = run_monte_carlo(model, 200_000, chunk_size=50_000, workers=1, seed=11)
+    parallel = run_monte_carlo(model, 200_000, chunk_size=50_000, workers=2, seed=11)
+    other = run_monte_carlo(model, 200_000, chunk_size=50_000, workers=1, seed=12)
+    assert serial['checks'] == parallel['checks']
+    assert (serial['workers'], parallel['workers']) == (1, 2)
+    # Never more workers than chunks
+    assert run_monte_carlo(model, 100_000, chunk_size=50_000, workers=8, seed=11)['workers'] == 2
+    assert serial['checks']['scour']['failures'] != other['checks']['scour']['failures']
+
+
+def test_scour_probability_matches_lognormal_closed_form():
+    model = scour_model()
+    results = run_monte_carlo(model, 400_000, chunk_size=100_000, workers=1, seed=3)
+    check = results['checks']['scour']
+    # Failure when 2·1.34·(q²/f)^(1/3) > HFL - foundation, i.e. f < q²·(2·1.34/D)³
+    q = 1265.76 / 120.0
+    f_limit = q ** 2 * (2 * 1.34 / (101.2 - 88.2)) ** 3
+    sigma = math.sqrt(math.log1p(0.2 ** 2))
+    mu = math.log(1.5) - 0.5 * sigma ** 2
+    exact = NormalDist(mu, sigma).cdf(math.log(f_limit))
+    assert check['ci_lower'] <= exact <= check['ci_upper'], (check, exact)
+    assert abs(check['reliability_index'] + NormalDist().inv_cdf(check['probability_of_failure'])) < 1e-12
+
+
+def test_sampled_moments_match_distributions():
+    rng = np.random.default_rng(5)
+    for distribution in ('normal', 'lognormal', 'gumbel', 'uniform'):
+        values = RandomVariable(distribution, 100.0, 0.2).sample(rng, 400_000)
+        assert abs(values.mean() - 100.0) < 0.2 and abs(values.std() - 20.0) < 0.2, distribution
+
+
+def test_wilson_interval_known_values():
+    lower, upper = wilson_interval(0, 100)
+    assert lower == 0.0 and abs(upper - 0.0370) < 1e-3
+    lower, upper = wilson_interval(50, 100)
+    assert abs(lower - 0.4038) < 1e-3 and abs(upper - 0.5962) < 1e-3
+
+
+if __name__ == "__main__":
+    print("🚀 Running reliability analysis tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Reliability analysis tests passed")
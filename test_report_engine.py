@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+TEST: Report engine
+Checks precompiled templates against Python f-strings, streamed section
+output, the three HTML report generators on the sample results and the
+fragment cache that re-renders only sections whose inputs changed
+"""
+
+import contextlib
+import copy
+import io
+import math
+import os
+import re
+import tempfile
+
+from report_engine import (Deferred, FragmentCache, ReportEngine, Section, Template, default_report_path,
+                           load_results)
+
+SAMPLE_RESULTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_slab_bridge_design_results.json')
+
+
+def without_timestamps(html: str) -> str:
+    return re.sub(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}|[A-Z][a-z]+ \d{2}, \d{4}', '<time>', html)
+
+
+def test_template_matches_fstring():
+    source = ("<td>{x:.2f}</td><td>{name!r}</td><td>{d['a']}</td><td>{x:{width}.3f}</td>"
+              "<style>.p {{ margin: 0; }}</style>{len(items)} {math.pi:.1f} {'ok' if x > 3 else 'no'}")
+    context = {'x': 3.14159, 'name': 'Pier', 'd': {'a': 1}, 'width': 9, 'items': [1, 2], 'unused': 0}
+    expected = eval('f"""' + source + '"""', {'math': math}, context)
+    template = Template(source)
+    assert template.render_text(context) == expected
+    assert template.names == {'x', 'name', 'd', 'width', 'items'}
+    assert Template('<p>{{static}}</p>').render_text({}) == '<p>{static}</p>'
+
+
+def test_only_used_deferred_values_computed():
+    calls = []
+    engine = ReportEngine([Section('a', Template('<p>{cheap}</p>')),
+                           Section('b', lambda context: ['<p>', str(context['cheap'] + 1), '</p>'])],
+                          lambda results: {'cheap': results['n'],
+                                           'costly': Deferred(lambda: calls.append(1) or 0)})
+    assert engine.render_text({'n': 4}) == '<p>4</p><p>5</p>' and not calls
+    assert engine.rendered == ['a', 'b'] and engine.reused == []
+
+
+def test_sections_streamed_in_order():
+    engine = ReportEngine([Section(f's{i}', Template(f'<div>{i}:{{value}}</div>')) for i in range(5)],
+                          lambda results: {'value': results['value']})
+    chunks = list(engine.stream({'value': 'x'}))
+    assert ''.join(chunks) == ''.join(f'<div>{i}:x</div>' for i in range(5))
+    body = list(engine.iter_bytes({'value': 'x'}, chunk_size=30))
+    # The first rendered chunk is sent at once, the rest in ~chunk_size pieces
+    assert body[0] == b'<div>0:' and b''.join(body).decode() == ''.join(chunks)
+
+
+def test_report_generators_render_sample_results():
+    from enhanced_complete_report_generator import ENHANCED_REPORT
+    from generate_html_report import HTML_REPORT, create_html_report
+    from massive_detailed_report_generator import MASSIVE_REPORT
+
+    results = load_results(SAMPLE_RESULTS)
+    for engine in (HTML_REPORT, MASSIVE_REPORT, ENHANCED_REPORT):
+        html = engine.render_text(results)
+        assert html.startswith('<!DOCTYPE html>') and html.rstrip().endswith('</html>')
+        assert 'Sample Slab Bridge Design' in html
+        streamed = b''.join(engine.iter_bytes(results)).decode('utf-8')
+        assert without_timestamps(streamed) == without_timestamps(html)
+
+    with tempfile.TemporaryDirectory() as directory:
+        with contextlib.redirect_stdout(io.StringIO()):
+            path = create_html_report(results, os.path.join(directory, 'report.html'))
+        with open(path, encoding='utf-8') as handle:
+            assert without_timestamps(handle.read()) == without_timestamps(HTML_REPORT.render_text(results))
+        default = default_report_path('Bridge_Design_Report', directory)
+        assert os.path.dirname(default) == directory and default.endswith('.html')
+
+
+def test_fragment_cache_hits_misses_and_disk():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = FragmentCache(directory, max_entries=2)
+        keys = [FragmentCache.key('page', 'source', [i]) for i in range(3)]
+        assert cache.get(keys[0]) is None and cache.misses == 1
+        cache.put(keys[0], '<p>0</p>')
+        cache.put(keys[1], b'%PDF page')
+        cache.put(keys[2], '<p>2</p>')
+        assert len(cache) == 2  # least recently used dropped from memory
+        assert cache.get(keys[0]) == '<p>0</p>' and cache.hits == 1  # ... but still on disk
+        later = FragmentCache(directory)
+        assert later.get(keys[1]) == b'%PDF page' and later.get(keys[2]) == '<p>2</p>'
+        assert (later.hits, later.misses) == (2, 0)
+    assert FragmentCache.key('page', 'source', [1]) != FragmentCache.key('page', 'other source', [1])
+
+
+def test_unchanged_sections_reused_and_deferred_skipped():
+    calls = []
+
+    def expensive(results):
+        calls.append(results['load'])
+        return results['load'] * 2
+
+    engine = ReportEngine([Section('dated', Template('<p>{stamp}</p>')),
+                           Section('loads', Template('<p>{doubled}</p>'), ('load',)),
+                           Section('costs', Template('<p>{results["cost"]}</p>'), ('cost',))],
+                          lambda results: {'results': results, 'stamp': 'now',
+                                           'doubled': Deferred(expensive, results)},
+                          FragmentCache())
+    first = engine.render_text({'load': 5, 'cost': 100})
+    assert engine.rendered == ['dated', 'loads', 'costs'] and calls == [5]
+    assert engine.render_text({'load': 5, 'cost': 120}) == first.replace('100', '120')
+    assert engine.rendered == ['dated', 'costs'] and engine.reused == ['loads'] and calls == [5]
+
+
+def test_cost_only_change_rerenders_cost_pages():
+    from massive_detailed_report_generator import MASSIVE_REPORT, report_context
+
+    results = load_results(SAMPLE_RESULTS)
+    engine = ReportEngine(MASSIVE_REPORT.sections, report_context, FragmentCache())
+    engine.render_text(results)
+    assert engine.reused == []
+    changed = copy.deepcopy(results)
+    changed['comprehensive_estimation']['total_project_cost'] = 12_345_678.0
+    html = engine.render_text(changed)
+    assert engine.rendered == ['cover', 'cost_analysis']
+    uncached = ReportEngine(MASSIVE_REPORT.sections, report_context).render_text(changed)
+    assert without_timestamps(html) == without_timestamps(uncached)
+
+
+if __name__ == "__main__":
+    print("🚀 Running report engine tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Report engine tests passed")
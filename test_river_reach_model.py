@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+TEST: River reach model
+Checks chainage lookup, lazy stage tables and the standard-step backwater
+on a prismatic trapezoidal channel
+"""
+
+import math
+
+import numpy as np
+
+from cross_section_geometry import stage_properties
+from river_reach_model import RiverReach
+
+SLOPE = 0.001
+
+
+def prismatic_reach(step: float = 200.0, length: float = 2000.0) -> RiverReach:
+    # 20 m bed, 1:1 side slopes, 10 m deep, bed falling at SLOPE downstream
+    chainages = np.arange(0.0, length + 1.0, step)
+    sections = [([0.0, 10.0, 30.0, 40.0], [10.0 - SLOPE * c, -SLOPE * c, -SLOPE * c, 10.0 - SLOPE * c])
+                for c in chainages]
+    return RiverReach(chainages, sections, 0.03)
+
+
+def manning_normal_depth(discharge: float) -> float:
+    low, high = 0.01, 10.0
+    for _ in range(100):
+        y = 0.5 * (low + high)
+        area, perimeter = (20.0 + y) * y, 20.0 + 2 * math.sqrt(2) * y
+        flow = area * (area / perimeter) ** (2 / 3) * math.sqrt(SLOPE) / 0.03
+        low, high = (y, high) if flow < discharge else (low, y)
+    return y
+
+
+def test_trapezoid_stage_properties_closed_form():
+    stages = np.array([0.0, 1.5, 4.0, 10.0])
+    table = stage_properties([0.0, 10.0, 30.0, 40.0], [10.0, 0.0, 0.0, 10.0], stages)
+    assert np.allclose(table['area'], (20.0 + stages) * stages)
+    assert np.allclose(table['wetted_perimeter'], np.where(stages > 0, 20.0 + 2 * math.sqrt(2) * stages, 0.0))
+    assert np.allclose(table['top_width'], np.where(stages > 0, 20.0 + 2 * stages, 0.0))
+
+
+def test_chainage_lookup():
+    reach = RiverReach([500.0, 0.0, 1000.0], [([0, 5, 10], [3, 0, 3]), ([0, 5, 10], [4, 1, 4]),
+                                              ([0, 5, 10], [2, -1, 2])])
+    assert list(reach.chainages) == [0.0, 500.0, 1000.0] and list(reach.thalweg) == [1.0, 0.0, -1.0]
+    upstream, downstream, weight = reach.locate([250.0, 500.0, 1200.0])
+    assert list(upstream) == [0, 0, 1] and list(downstream) == [1, 1, 2]
+    assert np.allclose(weight, [0.5, 1.0, 1.0])
+    assert list(reach.nearest([100.0, 700.0, 2000.0])) == [0, 1, 2]
+    assert np.allclose(reach.bed_level_at([250.0, 750.0]), [0.5, -0.5])
+    assert math.isclose(reach.bed_slope(), 0.002)
+
+
+def test_tables_built_lazily():
+    reach = prismatic_reach()
+    assert reach.cached_tables() == 0
+    table = reach.hydraulic_table(3)
+    assert reach.hydraulic_table(3) is table and reach.cached_tables() == 1
+
+
+def test_normal_depth_carried_through_prismatic_reach():
+    reach = prismatic_reach()
+    depth = manning_normal_depth(150.0)
+    profile = reach.water_surface_profile(150.0)
+    assert np.allclose(profile['water_surface'] - reach.thalweg, depth, atol=0.02)
+    assert np.all(profile['froude_number'] < 1.0)
+    assert np.allclose(profile['energy_level'], profile['water_surface'] + profile['velocity'] ** 2 / (2 * 9.81))
+
+
+def test_backwater_curve_decays_to_normal_depth():
+    reach = prismatic_reach(step=250.0, length=10000.0)
+    depth = manning_normal_depth(150.0)
+    profile = reach.water_surface_profile(150.0, downstream_stage=reach.thalweg[-1] + depth + 2.0)
+    excess = profile['water_surface'] - reach.thalweg - depth
+    # M1 curve: above normal depth everywhere, falling away upstream
+    assert np.all(excess > 0) and np.all(np.diff(excess) > 0)
+    assert excess[0] < 0.5 * excess[-1]
+
+
+if __name__ == "__main__":
+    print("🚀 Running river reach model tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 River reach model tests passed")
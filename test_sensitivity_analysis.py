@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+TEST: Sensitivity analysis
+Checks the Sobol estimators on a closed-form model and the cached, parallel design evaluations
+"""
+
+import contextlib
+import io
+
+import numpy as np
+
+from bridge_design_app import BridgeDesignApp
+from sensitivity_analysis import (OUTPUTS, SensitivityAnalysis, _sobol_estimates, default_parameters,
+                                  design_outputs, quasi_random)
+
+
+def sample_app() -> BridgeDesignApp:
+    app = BridgeDesignApp()
+    app.input_survey_data(
+        [{'point_id': i + 1, 'chainage': i * 5.0, 'left_distance': i * 5.0, 'right_distance': (14 - i) * 5.0,
+          'ground_level': 95.0 + i * 0.1, 'bed_level': 94.0 + i * 0.05} for i in range(15)],
+        [{'chainage': i * 25.0, 'ground_level': 95.0 + i * 0.2} for i in range(10)])
+    app.input_project_parameters(bridge_name="Sensitivity Test", location="Test Location", effective_span=9.6,
+                                 pier_spacing_cc=11.1, bridge_width=12.0, pier_cap_width=15.0)
+    app.input_hydraulic_parameters(discharge=1265.76, design_velocity=3.5, hfl=101.2, manning_n=0.033)
+    app.input_soil_parameters(safe_bearing_capacity=450)
+    app.input_material_parameters()
+    return app
+
+
+def test_sobol_estimates_of_linear_model():
+    # y = 4 x1 + 2 x2 + 0 x3 on uniform inputs: S1 = ST = (0.8, 0.2, 0)
+    n, k = 4096, 3
+    base = quasi_random(n, 2 * k, seed=1)
+    A, B = base[:, :k], base[:, k:]
+    coefficients = np.array([4.0, 2.0, 0.0])
+    AB = np.repeat(A[None], k, axis=0)
+    AB[np.arange(k), :, np.arange(k)] = B.T
+    first, total = _sobol_estimates(A @ coefficients, B @ coefficients, AB @ coefficients)
+    assert np.allclose(first, [0.8, 0.2, 0.0], atol=0.02), first
+    assert np.allclose(total, [0.8, 0.2, 0.0], atol=0.02), total
+
+
+def test_morris_on_design_and_cache_reuse():
+    app = sample_app()
+    analysis = SensitivityAnalysis(app, default_parameters(app)[:3], workers=1)
+    results = analysis.morris(trajectories=3)
+    scour = results['indices']['scour_depth']
+    # Lacey scour depends on discharge (up) and silt factor (down), not on the velocity
+    assert scour['discharge']['mu'] > 0 and scour['silt_factor']['mu'] < 0
+    assert scour['design_velocity']['mu_star'] == 0.0
+    runs = analysis.evaluations
+    assert runs <= 3 * (3 + 1)
+    analysis.morris(trajectories=3)
+    assert analysis.evaluations == runs
+
+
+def test_parallel_evaluation_matches_direct_design():
+    app = sample_app()
+    parameters = default_parameters(app)[:2]
+    unit = np.array([[0.25, 0.75], [0.5, 0.5]])
+    parallel = SensitivityAnalysis(app, parameters, workers=2).evaluate(unit)
+    for row, physical in zip(parallel, SensitivityAnalysis(app, parameters).to_physical(unit)):
+        direct = sample_app()
+        direct.hydraulic_data.discharge, direct.hydraulic_data.silt_factor = physical
+        with contextlib.redirect_stdout(io.StringIO()):
+            direct.design_bridge_one_click()
+        assert np.allclose(row, design_outputs(direct), equal_nan=True)
+    assert parallel.shape == (2, len(OUTPUTS))
+
+
+if __name__ == "__main__":
+    print("🚀 Running sensitivity analysis tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Sensitivity analysis tests passed")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+TEST: Slab bridge engine
+Checks memoized analyses, process-pool batches against serial runs and the
+Streamlit adapter against the engine
+"""
+
+from dataclasses import replace
+
+from streamlit.testing.v1 import AppTest
+
+from slab_bridge_engine import SlabBridgeInputs, _analysis, clear_cache, run_batch, run_complete_analysis
+
+
+def without_timestamp(results: dict) -> dict:
+    return {key: value for key, value in results.items() if key != 'timestamp'}
+
+
+def sample_records():
+    base = SlabBridgeInputs(project_name='Batch Test', design_date='2026-01-01')
+    return [replace(base, effective_span=span, num_spans=spans, abutment_type=abutment)
+            for span in (8.0, 9.6, 12.0) for spans in (2, 4) for abutment in ('Type-1', 'Type-2')]
+
+
+def test_memoized_per_record_with_private_copies():
+    clear_cache()
+    inputs = SlabBridgeInputs(design_date='2026-01-01')
+    first = run_complete_analysis(inputs)
+    first['cost_analysis']['total_cost'] = -1.0
+    second = run_complete_analysis(replace(inputs))
+    assert _analysis.cache_info().hits == 1 and _analysis.cache_info().misses == 1
+    assert second['cost_analysis']['total_cost'] > 0 and second['design_status'] == 'COMPLETED'
+    changed = run_complete_analysis(replace(inputs, effective_span=12.0))
+    assert _analysis.cache_info().misses == 2
+    assert changed['hydraulic_analysis']['effective_waterway'] == 3 * 12.0
+
+
+def test_batch_matches_serial():
+    records = sample_records()
+    clear_cache()
+    serial = [without_timestamp(run_complete_analysis(inputs)) for inputs in records]
+    clear_cache()
+    pooled = [without_timestamp(results) for results in run_batch(records, jobs=2)]
+    assert pooled == serial
+    assert [without_timestamp(results) for results in run_batch(records, jobs=1)] == serial
+
+
+def test_failure_reported_not_raised():
+    results = run_complete_analysis(SlabBridgeInputs(effective_span=0.0))
+    assert results['design_status'] == 'FAILED' and results['error']
+
+
+def test_from_mapping_defaults_and_unknown_keys():
+    inputs = SlabBridgeInputs.from_mapping({'effective_span': 12.0, 'current_page': 'results',
+                                            'design_date': '2026-01-01'})
+    assert inputs == SlabBridgeInputs(effective_span=12.0, design_date='2026-01-01')
+    assert SlabBridgeInputs.from_mapping({}).design_date
+
+
+def test_streamlit_adapter_matches_engine():
+    def app():
+        import streamlit as st
+        from complete_slab_bridge_design import BridgeCalculationEngine, SlabBridgeDesignSession
+        SlabBridgeDesignSession().initialize_session()
+        st.session_state.effective_span = 12.0
+        st.session_state.skew_angle = 20.0
+        BridgeCalculationEngine.run_complete_analysis()
+        st.session_state.record = BridgeCalculationEngine.session_inputs()
+
+    at = AppTest.from_function(app, default_timeout=60).run()
+    assert not at.exception
+    assert at.session_state['cost_analysis_complete']
+    record = at.session_state['record']
+    assert (record.effective_span, record.skew_angle) == (12.0, 20.0)
+    expected = run_complete_analysis(record)
+    assert without_timestamp(at.session_state['calculation_results']) == without_timestamp(expected)
+
+
+if __name__ == "__main__":
+    print("🚀 Running slab bridge engine tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Slab bridge engine tests passed")
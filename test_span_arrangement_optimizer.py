@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+TEST: Span arrangement optimizer
+Checks the hydraulic screen against scalar formulas and the branch-and-bound
+optimum against a brute-force costing of every adequate layout
+"""
+
+import math
+
+import numpy as np
+
+from span_arrangement_optimizer import SpanArrangementOptimizer
+from test_sensitivity_analysis import sample_app
+
+
+def sample_optimizer() -> SpanArrangementOptimizer:
+    return SpanArrangementOptimizer(sample_app(), span_counts=range(12, 24, 2),
+                                    span_lengths=(8.0, 9.6, 11.0, 12.5, 14.0), pier_widths=(1.0, 1.5, 2.0))
+
+
+def test_screen_matches_scalar_checks():
+    optimizer = sample_optimizer()
+    screen = optimizer.hydraulic_screen()
+    regime_width = 4.8 * math.sqrt(optimizer.app.hydraulic_data.discharge)
+    for (i, j, k), adequate in np.ndenumerate(screen['adequate']):
+        n, s, b = optimizer.span_counts[i], optimizer.span_lengths[j], optimizer.pier_widths[k]
+        assert math.isclose(screen['waterway'][i, j, k], n * s + (n - 1) * b)
+        assert math.isclose(screen['regime_ratio'][i, j, k], n * s / regime_width)
+        assert adequate == (n * s / regime_width >= 1.0 and screen['design_afflux'][i, j, k] <= 0.3)
+
+
+def test_branch_and_bound_matches_brute_force():
+    optimizer = sample_optimizer()
+    result = optimizer.optimize()
+    assert result['status'] == 'OPTIMUM_FOUND' and result['bounded_out'] > 0
+
+    brute = sample_optimizer()
+    screen = brute.hydraulic_screen()
+    idx = np.argwhere(screen['adequate'])
+    embedment = brute._embedment(screen['normal_scour_unit_discharge'][tuple(idx.T)])
+    costs = []
+    for (i, j, k), depth in zip(idx, embedment):
+        n, s, b = brute.span_counts[i], brute.span_lengths[j], brute.pier_widths[k]
+        pier = brute.pier_cost(s, b, depth)
+        if pier is None:
+            continue
+        full = brute._deck_cost(n, s) + (n - 1) * pier['cost']
+        bound = brute._deck_cost(n, s) + (n - 1) * brute._pier_cost_bound(np.array([b]), np.array([depth]))[0]
+        assert bound <= full + 1e-6
+        costs.append((full, int(n), float(s), float(b)))
+    cost, n, s, b = min(costs)
+    best = result['best']
+    assert math.isclose(best['estimated_cost'], cost)
+    assert (best['span_count'], best['span_length'], best['pier_width']) == (n, s, b)
+    assert result['pier_designs_run'] < len(brute.pier_cache)
+
+
+def test_pier_designs_cached():
+    optimizer = sample_optimizer()
+    first = optimizer.pier_cost(12.5, 1.0, 3.0)
+    assert optimizer.pier_cost(12.5, 1.0, 3.0) is first and len(optimizer.pier_cache) == 1
+
+
+if __name__ == "__main__":
+    print("🚀 Running span arrangement optimizer tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Span arrangement optimizer tests passed")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+TEST: Waterway hydraulics
+Checks the broadcast afflux/regime/scour kernels against scalar closed forms
+and the engine's delegation to them
+"""
+
+import math
+
+import numpy as np
+
+from river_section_input_schema import (BedMaterialData, BridgeGeometryRelativeToRiver,
+                                        HydraulicCalculationEngine, RiverSectionInputSchema,
+                                        WaterLevelData)
+from waterway_hydraulics import GRAVITY, afflux_methods, evaluate_layouts, lacey_regime, scour_methods
+
+
+def scalar_afflux(Q, L, n, b, skew, V, K=1.25, alpha=1.0):
+    r = n * b / L
+    yarnell = K * (1 + 0.6 * math.sin(math.radians(skew)) ** 2) * r ** 2 / (1 - r) if r < 0.9 else 0.5
+    irc = 0.3 * alpha * V ** 2 / (2 * GRAVITY) * r
+    return yarnell, irc, max(yarnell, irc, 0.083)
+
+
+def test_yarnell_irc_closed_form():
+    # r = 4·1.5/60 = 0.1: Yarnell 1.25·0.01/0.9, IRC:5 0.3·V²/2g·0.1
+    methods = afflux_methods(1265.76, 60.0, 4, 1.5, velocity=3.5)
+    assert math.isclose(float(methods['yarnell_afflux']), 1.25 * 0.01 / 0.9)
+    assert math.isclose(float(methods['irc_afflux']), 0.3 * 3.5 ** 2 / (2 * 9.81) * 0.1)
+    assert math.isclose(float(methods['simple_afflux']), 0.1 * math.sqrt(1265.76 / 54.0))
+    assert float(methods['design_afflux']) == 0.083
+    fast = afflux_methods(1265.76, 60.0, 12, 1.5, velocity=7.0)
+    assert float(fast['design_afflux']) == float(fast['irc_afflux']) > 0.083
+    # Minimum afflux without velocity, 0.5 m once piers block 90 % of the waterway
+    assert float(afflux_methods(500.0, 100.0, 1, 1.0)['design_afflux']) == 0.083
+    blocked = afflux_methods(500.0, 10.0, 9, 1.0)
+    assert float(blocked['yarnell_afflux']) == 0.5 and float(blocked['design_afflux']) == 0.5
+
+
+def test_lacey_and_scour_closed_form():
+    Q, f = 1265.76, 1.5
+    regime = lacey_regime(Q, f)
+    assert math.isclose(float(regime['lacey_regime_width']), 4.8 * math.sqrt(Q))
+    assert math.isclose(float(regime['lacey_regime_depth']), 1.34 * (Q ** 2 / f) ** (1 / 3))
+    assert math.isclose(float(regime['lacey_regime_velocity']), Q ** (1 / 6) / math.sqrt(f))
+    scour = scour_methods(Q, f, 1.5, 3.5, effective_waterway=120.0)
+    local = 2.0 * 1.5 * (3.5 / math.sqrt(9.81 * 1.5)) ** 0.65
+    assert math.isclose(float(scour['local_scour_at_piers']), local)
+    assert math.isclose(float(scour['total_scour_depth']), 1.5 * 1.34 * (Q ** 2 / f) ** (1 / 3) + local)
+    assert math.isclose(float(scour['stone_size_d50']), 3.5 ** 2 / (5.75 * 9.81))
+    assert math.isclose(float(scour['normal_scour_unit_discharge']), 1.34 * ((Q / 120.0) ** 2 / f) ** (1 / 3))
+    still = scour_methods(Q, f, 1.5, 0.0)
+    assert float(still['local_scour_at_piers']) == 0.0 and float(still['stone_size_d50']) == 0.1
+
+
+def test_broadcast_grid_matches_scalar_loop():
+    piers = np.arange(1, 6)[:, None, None, None]
+    widths = np.array([1.0, 1.5, 2.5])[None, :, None, None]
+    skews = np.array([0.0, 15.0, 30.0])[None, None, :, None]
+    waterways = np.array([20.0, 60.0, 120.0])[None, None, None, :]
+    grid = evaluate_layouts(1265.76, 1.5, waterways, piers, widths, skews, velocity=3.0)
+    assert grid['design_afflux'].shape == (5, 3, 3, 3)
+    for index in np.ndindex(grid['design_afflux'].shape):
+        n, b, skew, L = (float(a[tuple(min(i, s - 1) for i, s in zip(index, a.shape))])
+                         for a in (piers, widths, skews, waterways))
+        yarnell, irc, design = scalar_afflux(1265.76, L, n, b, skew, 3.0)
+        assert math.isclose(grid['yarnell_afflux'][index], yarnell)
+        assert math.isclose(grid['irc_afflux'][index], irc)
+        assert math.isclose(grid['design_afflux'][index], design)
+        q = 1265.76 / (L - n * b)
+        assert math.isclose(grid['normal_scour_unit_discharge'][index], 1.34 * (q ** 2 / 1.5) ** (1 / 3))
+        assert math.isclose(grid['waterway_adequacy_ratio'][index], L / (4.8 * math.sqrt(1265.76)))
+
+
+def test_engine_delegates_to_kernels():
+    river = RiverSectionInputSchema(
+        water_levels=WaterLevelData(hfl=101.2, lwl=96.0, nwl=98.0, design_discharge=1265.76,
+                                    velocity_at_hfl=3.5),
+        bed_material=BedMaterialData("Sand", 0.5, 2.0, 0.033, 30, 18, silt_factor=1.5),
+        bridge_geometry=BridgeGeometryRelativeToRiver(60.0, 60.0, 1.5, 1.5, 4, skew_angle=20.0))
+    engine = HydraulicCalculationEngine(river)
+    afflux = engine.calculate_afflux()
+    yarnell, irc, design = scalar_afflux(1265.76, 60.0, 4, 1.5, 20.0, 3.5)
+    assert math.isclose(afflux['yarnell_afflux'], yarnell) and math.isclose(afflux['irc_afflux'], irc)
+    assert math.isclose(afflux['design_afflux'], design)
+    kernel = scour_methods(1265.76, 1.5, 1.5, 3.5)
+    scour = engine.calculate_scour_depth()
+    assert set(scour) == {'normal_scour_lacey', 'design_scour_depth', 'local_scour_at_piers',
+                          'total_scour_depth', 'stone_size_d50'}
+    assert all(scour[key] == float(kernel[key]) for key in scour)
+    adequacy = engine.calculate_waterway_adequacy()
+    assert math.isclose(adequacy['lacey_regime_width'], float(lacey_regime(1265.76, 1.5)['lacey_regime_width']))
+
+
+if __name__ == "__main__":
+    print("🚀 Running waterway hydraulics tests...")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
+    print("🏆 Waterway hydraulics tests passed")